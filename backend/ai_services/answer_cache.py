@@ -0,0 +1,182 @@
+"""
+Answer Cache - Reuses policy chatbot answers for repeated questions
+
+A question is answered from the cache when it matches a stored one either
+exactly after normalisation (case, punctuation, whitespace) or by cosine
+similarity of the question embeddings above a threshold. Entries belong to
+one index version: when policies are re-indexed the cache starts empty, so
+answers never outlive the documents they were generated from. Entries expire
+after a TTL and the least recently used ones are evicted at capacity.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    text = _PUNCTUATION_RE.sub(" ", question.lower())
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+class SemanticAnswerCache:
+    """In-process LRU/TTL cache of answers, matched by text or embedding"""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        similarity_threshold: float,
+        enabled: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.enabled = enabled
+        self.index_version: Optional[str] = None
+        # normalised question -> {"answer", "vector", "created_at"}
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _sync_version(self, index_version: Optional[str]) -> None:
+        """Drop everything when the index changed (caller holds the lock)"""
+        if index_version != self.index_version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.index_version = index_version
+
+    def _expire(self, now: float) -> None:
+        """Remove entries older than the TTL (caller holds the lock)"""
+        expired = [
+            key for key, entry in self._entries.items()
+            if now - entry["created_at"] > self.ttl_seconds
+        ]
+        for key in expired:
+            del self._entries[key]
+        self.evictions += len(expired)
+
+    def get(
+        self,
+        question: str,
+        index_version: Optional[str],
+        embed: Callable[[str], List[float]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return `{"answer": ..., "match": "exact"|"semantic", "similarity": float}`
+        for a cached answer, or None.
+
+        `embed` is only called when there is no exact match and the cache
+        holds at least one entry.
+        """
+        if not self.enabled:
+            return None
+
+        key = normalize_question(question)
+        now = time.time()
+        with self._lock:
+            self._sync_version(index_version)
+            self._expire(now)
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.exact_hits += 1
+                return {"answer": entry["answer"], "match": "exact", "similarity": 1.0}
+
+            if not self._entries:
+                self.misses += 1
+                return None
+            keys = list(self._entries)
+            matrix = np.array([self._entries[k]["vector"] for k in keys], dtype=np.float32)
+
+        # Embedding happens outside the lock (it may call the provider)
+        vector = np.asarray(embed(question), dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm:
+            vector = vector / norm
+        similarities = matrix @ vector
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+
+        with self._lock:
+            entry = self._entries.get(keys[best])
+            if (
+                entry is not None
+                and similarity >= self.similarity_threshold
+                and self.index_version == index_version
+            ):
+                self._entries.move_to_end(keys[best])
+                self.semantic_hits += 1
+                return {
+                    "answer": entry["answer"],
+                    "match": "semantic",
+                    "similarity": round(similarity, 4),
+                }
+            self.misses += 1
+        return None
+
+    def put(
+        self,
+        question: str,
+        index_version: Optional[str],
+        answer: Dict[str, Any],
+        vector: List[float],
+    ) -> None:
+        """Store an answer for `question` (vector is its embedding)"""
+        if not self.enabled:
+            return
+
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm:
+            vector = vector / norm
+
+        key = normalize_question(question)
+        with self._lock:
+            self._sync_version(index_version)
+            self._entries[key] = {
+                "answer": answer,
+                "vector": vector,
+                "created_at": time.time(),
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for this process"""
+        with self._lock:
+            hits = self.exact_hits + self.semantic_hits
+            lookups = hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "similarity_threshold": self.similarity_threshold,
+                "index_version": self.index_version,
+                "exact_hits": self.exact_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,250 @@
+"""
+Embedding Cache - Persistent, batched embeddings for policy ingestion
+
+`CachedEmbeddings` wraps any LangChain `Embeddings` implementation:
+
+ - vectors are stored in a SQLite file keyed by (model, SHA-256 of the text),
+   as packed float32 blobs, so re-indexing after a restart or a chunking
+   change only embeds text that was never seen before,
+ - cache misses are sent to the provider in batches of `batch_size`, with up
+   to `concurrency` batches in flight,
+ - `FakeEmbeddings` is a deterministic local embedder (no network) used to
+   run and benchmark the pipeline offline.
+"""
+import hashlib
+import logging
+import math
+import os
+import random
+import sqlite3
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger("embedding_cache")
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 of the exact text that is embedded"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingStore:
+    """SQLite store of float32 vectors keyed by (model, text hash)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, model: str, hashes: Sequence[str]) -> Dict[str, List[float]]:
+        """Return the stored vectors for the given hashes (missing ones are omitted)"""
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(hashes))
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(unique), 500):
+            part = unique[start:start + 500]
+            placeholders = ",".join("?" * len(part))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *part],
+                ).fetchall()
+            for hash_value, blob in rows:
+                vector = array("f")
+                vector.frombytes(blob)
+                found[hash_value] = vector.tolist()
+        return found
+
+    def put_many(self, model: str, items: Dict[str, List[float]]) -> None:
+        """Store vectors by text hash; existing entries are kept"""
+        now = time.time()
+        rows = [
+            (model, hash_value, len(vector), array("f", vector).tobytes(), now)
+            for hash_value, vector in items.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (model, text_hash, dim, vector, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def count(self, model: Optional[str] = None) -> int:
+        with self._lock:
+            if model is None:
+                row = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM embeddings WHERE model = ?", (model,)
+                ).fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper with a persistent cache and batched, concurrent misses"""
+
+    def __init__(
+        self,
+        base: Embeddings,
+        model_name: str,
+        store: Optional[EmbeddingStore] = None,
+        batch_size: int = 100,
+        concurrency: int = 4,
+    ):
+        self.base = base
+        self.model_name = model_name
+        self.store = store
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.hits = 0
+        self.misses = 0
+        self.provider_calls = 0
+        self._lock = threading.Lock()
+
+    def _count(self, hits: int = 0, misses: int = 0, calls: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.provider_calls += calls
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        self._count(calls=1)
+        return self.base.embed_documents(texts)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed document chunks, serving repeats from the cache"""
+        if not texts:
+            return []
+
+        hashes = [text_hash(text) for text in texts]
+        model_key = f"{self.model_name}#document"
+        vectors: Dict[str, List[float]] = (
+            self.store.get_many(model_key, hashes) if self.store else {}
+        )
+
+        # Each distinct missing text is embedded once, even if repeated in `texts`
+        missing: Dict[str, str] = {}
+        for hash_value, text in zip(hashes, texts):
+            if hash_value not in vectors:
+                missing.setdefault(hash_value, text)
+        self._count(hits=sum(h in vectors for h in hashes), misses=len(missing))
+
+        if missing:
+            missing_hashes = list(missing)
+            batches = [
+                missing_hashes[i:i + self.batch_size]
+                for i in range(0, len(missing_hashes), self.batch_size)
+            ]
+            if len(batches) == 1 or self.concurrency == 1:
+                results = [self._embed_batch([missing[h] for h in batch]) for batch in batches]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.concurrency, len(batches)),
+                    thread_name_prefix="embed",
+                ) as executor:
+                    results = list(
+                        executor.map(
+                            lambda batch: self._embed_batch([missing[h] for h in batch]),
+                            batches,
+                        )
+                    )
+
+            new_vectors: Dict[str, List[float]] = {}
+            for batch, batch_vectors in zip(batches, results):
+                new_vectors.update(zip(batch, batch_vectors))
+            if self.store:
+                self.store.put_many(model_key, new_vectors)
+            vectors.update(new_vectors)
+
+        return [vectors[hash_value] for hash_value in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a search query (cached separately from document embeddings)"""
+        hash_value = text_hash(text)
+        model_key = f"{self.model_name}#query"
+        if self.store:
+            cached = self.store.get_many(model_key, [hash_value]).get(hash_value)
+            if cached is not None:
+                self._count(hits=1)
+                return cached
+
+        self._count(misses=1, calls=1)
+        vector = self.base.embed_query(text)
+        if self.store:
+            self.store.put_many(model_key, {hash_value: vector})
+        return vector
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process and stored vector count"""
+        with self._lock:
+            hits, misses, calls = self.hits, self.misses, self.provider_calls
+        lookups = hits + misses
+        return {
+            "enabled": self.store is not None,
+            "model": self.model_name,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "provider_calls": calls,
+            "batch_size": self.batch_size,
+            "concurrency": self.concurrency,
+            "stored_vectors": self.store.count() if self.store else 0,
+        }
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    Deterministic local embedder for offline runs and benchmarks.
+
+    The vector is derived from a hash of the text, so identical text always
+    gets the identical unit vector. `latency_seconds` is slept per call to
+    imitate a remote provider.
+    """
+
+    def __init__(self, size: int = 768, latency_seconds: float = 0.0):
+        self.size = size
+        self.latency_seconds = latency_seconds
+
+    def _vector(self, text: str) -> List[float]:
+        rng = random.Random(int(text_hash(text)[:16], 16))
+        values = [rng.gauss(0.0, 1.0) for _ in range(self.size)]
+        norm = math.sqrt(sum(v * v for v in values)) or 1.0
+        return [v / norm for v in values]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return self._vector(text)
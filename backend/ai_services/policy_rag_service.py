@@ -4,11 +4,24 @@ Auto-indexes policies when uploaded via Policies API
 """
 
 import os
+import re
+import json
+import uuid
+import shutil
+import hashlib
 import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialised within a process
+    fcntl = None
+
 # Check if required libraries are available
 try:
     from langchain_google_genai import (
@@ -23,6 +36,9 @@ try:
     from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
     from langchain_core.messages import HumanMessage, AIMessage
 
+    from ai_services.embedding_cache import CachedEmbeddings, EmbeddingStore, FakeEmbeddings
+    from ai_services.answer_cache import SemanticAnswerCache
+
     LANGCHAIN_AVAILABLE = True
 except ImportError:
     LANGCHAIN_AVAILABLE = False
@@ -32,6 +48,43 @@ from config import settings
 logger = logging.getLogger("policy_rag_service")
 load_dotenv()
 
+# Index layout inside POLICY_RAG_INDEX_DIR:
+#   CURRENT               name of the live version directory
+#   versions/<version>/   index.faiss, index.pkl and registry.json
+# A write builds a complete new version in a temp directory, renames it into
+# `versions/` and then swaps CURRENT with os.replace, so a reader always
+# loads either the old or the new index, never a partially written one.
+# Writers in all worker processes take an exclusive flock on WRITE_LOCK_FILE
+# and reload CURRENT under it, so each write builds on the latest version.
+CURRENT_FILE = "CURRENT"
+WRITE_LOCK_FILE = ".write.lock"
+VERSIONS_DIR = "versions"
+REGISTRY_FILE = "registry.json"
+KEEP_VERSIONS = 3
+
+# Uploaded policy files are stored as "<policy_id>_<random>_<original name>"
+_POLICY_FILE_RE = re.compile(r"^(\d+)_[0-9a-f]{8}_")
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 of a file's contents, read in blocks"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def document_key(file_path: str, policy_id: Optional[int] = None) -> str:
+    """Registry key for a policy document: the policy id when known, else the file name"""
+    if policy_id is None:
+        match = _POLICY_FILE_RE.match(Path(file_path).name)
+        if match:
+            policy_id = int(match.group(1))
+    if policy_id is not None:
+        return f"policy:{policy_id}"
+    return f"file:{Path(file_path).name}"
+
 
 class PolicyRAGService:
     """
@@ -56,13 +109,20 @@ class PolicyRAGService:
         self.index_dir = settings.POLICY_RAG_INDEX_DIR
         self.vectorstore = None
         self.chain = None
+        # document key -> {"hash", "chunk_ids", "policy_title", "source", "indexed_at"}
+        self.registry: Dict[str, Dict[str, Any]] = {}
+        self.index_version: Optional[str] = None
+        self._write_lock = threading.RLock()
+        self.answer_cache = SemanticAnswerCache(
+            max_entries=settings.POLICY_RAG_ANSWER_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.POLICY_RAG_ANSWER_CACHE_TTL_SECONDS,
+            similarity_threshold=settings.POLICY_RAG_ANSWER_CACHE_SIMILARITY,
+            enabled=settings.POLICY_RAG_ANSWER_CACHE_ENABLED,
+        )
 
         # Initialize components
         try:
-            self.embeddings = GoogleGenerativeAIEmbeddings(
-                model=settings.GEMINI_EMBEDDING_MODEL,
-                transport="rest",
-            )
+            self.embeddings = self._create_embeddings()
 
             self.llm = ChatGoogleGenerativeAI(
                 model=settings.GEMINI_MODEL,
@@ -75,93 +135,314 @@ class PolicyRAGService:
             logger.error(f"Failed to initialize Policy RAG Service: {e}")
             raise
 
+    @staticmethod
+    def _create_embeddings() -> "CachedEmbeddings":
+        """Gemini (or the offline fake) embedder behind the persistent embedding cache"""
+        if settings.POLICY_RAG_FAKE_EMBEDDINGS:
+            base = FakeEmbeddings()
+            model_name = f"fake-{base.size}"
+        else:
+            base = GoogleGenerativeAIEmbeddings(
+                model=settings.GEMINI_EMBEDDING_MODEL,
+                transport="rest",
+            )
+            model_name = settings.GEMINI_EMBEDDING_MODEL
+
+        store = (
+            EmbeddingStore(settings.POLICY_RAG_EMBEDDING_CACHE_PATH)
+            if settings.POLICY_RAG_EMBEDDING_CACHE_ENABLED
+            else None
+        )
+        return CachedEmbeddings(
+            base,
+            model_name=model_name,
+            store=store,
+            batch_size=settings.POLICY_RAG_EMBED_BATCH_SIZE,
+            concurrency=settings.POLICY_RAG_EMBED_CONCURRENCY,
+        )
+
     def load_index(self) -> bool:
         """
-        Load existing FAISS index from disk
+        Load the current FAISS index and document registry from disk
 
         Returns:
             bool: True if loaded successfully, False otherwise
         """
         try:
-            if os.path.exists(self.index_dir) and os.path.isdir(self.index_dir):
-                self.vectorstore = FAISS.load_local(
-                    self.index_dir,
-                    self.embeddings,
-                    allow_dangerous_deserialization=True,
-                )
-                self._setup_chain()
-                logger.info(f"Loaded existing policy index from {self.index_dir}")
-                return True
-            else:
+            version_dir = self._current_version_dir()
+            if version_dir is None:
                 logger.info("No existing policy index found")
                 return False
+
+            vectorstore = FAISS.load_local(
+                version_dir,
+                self.embeddings,
+                allow_dangerous_deserialization=True,
+            )
+            registry_path = os.path.join(version_dir, REGISTRY_FILE)
+            if os.path.exists(registry_path):
+                with open(registry_path, "r", encoding="utf-8") as f:
+                    registry = json.load(f).get("documents", {})
+            else:
+                # Index written before the registry existed
+                registry = self._registry_from_docstore(vectorstore)
+
+            self.vectorstore = vectorstore
+            self.registry = registry
+            self.index_version = (
+                Path(version_dir).name if version_dir != self.index_dir else "legacy"
+            )
+            self._setup_chain()
+            logger.info(f"Loaded existing policy index from {version_dir}")
+            return True
         except Exception as e:
             logger.error(f"Error loading policy index: {e}")
             return False
 
-    def index_policy_document(self, file_path: str, policy_title: str = "") -> bool:
+    def _current_version_dir(self) -> Optional[str]:
+        """Directory of the live index, or None if nothing has been saved yet"""
+        current_path = os.path.join(self.index_dir, CURRENT_FILE)
+        if os.path.exists(current_path):
+            with open(current_path, "r", encoding="utf-8") as f:
+                version = f.read().strip()
+            version_dir = os.path.join(self.index_dir, VERSIONS_DIR, version)
+            if version and os.path.isdir(version_dir):
+                return version_dir
+        if os.path.exists(os.path.join(self.index_dir, "index.faiss")):
+            # Older layout: index saved directly in index_dir
+            return self.index_dir
+        return None
+
+    def _read_current_version(self) -> Optional[str]:
+        try:
+            with open(os.path.join(self.index_dir, CURRENT_FILE), "r", encoding="utf-8") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _reload_if_stale(self) -> None:
+        """Pick up an index version saved by another worker process"""
+        version = self._read_current_version()
+        if version and version != self.index_version:
+            with self._write_lock:
+                if version != self.index_version:
+                    self.load_index()
+
+    @contextmanager
+    def _index_write(self):
+        """
+        Hold the index for a read-modify-write across threads and worker processes.
+
+        Inside, the in-memory store is the current version on disk, so an
+        upsert or removal followed by `_save_index()` keeps the other
+        workers' changes.
+        """
+        with self._write_lock:
+            os.makedirs(self.index_dir, exist_ok=True)
+            with open(os.path.join(self.index_dir, WRITE_LOCK_FILE), "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    version = self._read_current_version()
+                    if self.vectorstore is None or (version and version != self.index_version):
+                        if not self.load_index() and version:
+                            raise RuntimeError(f"Could not load current policy index version {version}")
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _registry_from_docstore(vectorstore) -> Dict[str, Dict[str, Any]]:
+        """
+        Rebuild registry entries from chunk metadata of an index that has none.
+
+        Hashes are unknown, so the next upload of each policy replaces its
+        chunks instead of adding duplicates.
+        """
+        registry: Dict[str, Dict[str, Any]] = {}
+        for chunk_id in vectorstore.index_to_docstore_id.values():
+            doc = vectorstore.docstore.search(chunk_id)
+            source = getattr(doc, "metadata", {}).get("source", "")
+            key = document_key(source) if source else "file:unknown"
+            entry = registry.setdefault(
+                key,
+                {
+                    "hash": "",
+                    "chunk_ids": [],
+                    "policy_title": doc.metadata.get("policy_title", ""),
+                    "source": source,
+                    "indexed_at": None,
+                },
+            )
+            entry["chunk_ids"].append(chunk_id)
+        return registry
+
+    def _save_index(self) -> None:
+        """Write the vector store and registry as a new version and make it current"""
+        os.makedirs(os.path.join(self.index_dir, VERSIONS_DIR), exist_ok=True)
+        version = f"{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}-{uuid.uuid4().hex[:8]}"
+        temp_dir = os.path.join(self.index_dir, f".tmp-{version}")
+        version_dir = os.path.join(self.index_dir, VERSIONS_DIR, version)
+
+        try:
+            self.vectorstore.save_local(temp_dir)
+            with open(os.path.join(temp_dir, REGISTRY_FILE), "w", encoding="utf-8") as f:
+                json.dump({"version": version, "documents": self.registry}, f)
+            os.rename(temp_dir, version_dir)
+        except Exception:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+        current_tmp = os.path.join(self.index_dir, f".{CURRENT_FILE}-{version}")
+        with open(current_tmp, "w", encoding="utf-8") as f:
+            f.write(version)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(current_tmp, os.path.join(self.index_dir, CURRENT_FILE))
+
+        self.index_version = version
+        logger.info(f"Saved policy index version {version}")
+        self._prune_versions(keep=version)
+
+    def _prune_versions(self, keep: str) -> None:
+        """Remove old versions, leaving a few for readers that are still loading them"""
+        versions_dir = os.path.join(self.index_dir, VERSIONS_DIR)
+        versions = sorted(os.listdir(versions_dir))
+        stale = [v for v in versions[:-KEEP_VERSIONS] if v != keep]
+        for version in stale:
+            shutil.rmtree(os.path.join(versions_dir, version), ignore_errors=True)
+
+    def index_policy_document(
+        self,
+        file_path: str,
+        policy_title: str = "",
+        policy_id: Optional[int] = None,
+    ) -> bool:
         """
-        Index a single policy document
+        Index (or re-index) a single policy document
+
+        The document's chunks are tracked in the registry under the policy id,
+        so uploading an unchanged file is a no-op and a changed file replaces
+        only that policy's vectors.
 
         Args:
             file_path: Path to the policy PDF file
             policy_title: Title of the policy (for metadata)
+            policy_id: Policy ID (parsed from the stored file name if omitted)
 
         Returns:
-            bool: True if indexed successfully
+            bool: True if indexed successfully (or already up to date)
         """
         try:
-            logger.info(f"Indexing policy document: {file_path}")
+            with self._index_write():
+                if self._upsert_document(file_path, policy_title, policy_id):
+                    self._save_index()
+                    self._setup_chain()
+            return True
 
-            # Load document
-            if file_path.endswith(".pdf"):
-                loader = PyPDFLoader(file_path)
-            else:
-                loader = TextLoader(file_path, encoding="utf-8")
+        except Exception as e:
+            logger.error(f"Error indexing policy document: {e}")
+            return False
 
-            documents = loader.load()
+    def _upsert_document(
+        self, file_path: str, policy_title: str, policy_id: Optional[int]
+    ) -> bool:
+        """
+        Replace a document's chunks in the in-memory store and registry.
 
-            # Add metadata
-            for doc in documents:
-                doc.metadata["policy_title"] = policy_title or Path(file_path).stem
-                doc.metadata["source"] = file_path
+        Caller holds `_index_write()` and saves afterwards.
 
-            # Split into chunks
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=settings.POLICY_RAG_CHUNK_SIZE,
-                chunk_overlap=settings.POLICY_RAG_CHUNK_OVERLAP,
-                length_function=len,
-                separators=["\n\n", "\n", " ", ""],
-            )
+        Returns:
+            bool: True if the store changed, False if the file was unchanged
+        """
+        key = document_key(file_path, policy_id)
+        content_hash = file_sha256(file_path)
 
-            chunks = text_splitter.split_documents(documents)
-            logger.info(f"Split policy into {len(chunks)} chunks")
+        existing = self.registry.get(key)
+        if existing and existing.get("hash") == content_hash:
+            logger.info(f"Policy document {key} unchanged, skipping re-index")
+            return False
 
-            # Create or update vector store
-            if self.vectorstore is None:
-                # Create new vector store
-                self.vectorstore = FAISS.from_documents(
-                    documents=chunks, embedding=self.embeddings
-                )
-                logger.info("Created new policy vector store")
-            else:
-                # Add to existing vector store
-                self.vectorstore.add_documents(chunks)
-                logger.info("Added policy to existing vector store")
+        logger.info(f"Indexing policy document: {file_path}")
+        chunks = self._load_chunks(file_path, policy_title)
+        logger.info(f"Split policy into {len(chunks)} chunks")
 
-            # Save to disk
-            self.vectorstore.save_local(self.index_dir)
-            logger.info(f"Saved policy index to {self.index_dir}")
+        chunk_ids = [f"{key}:{content_hash[:16]}:{i}" for i in range(len(chunks))]
 
-            # Setup chain
-            self._setup_chain()
+        if self.vectorstore is None:
+            self.vectorstore = FAISS.from_documents(
+                documents=chunks, embedding=self.embeddings, ids=chunk_ids
+            )
+            logger.info("Created new policy vector store")
+        else:
+            # Embed first so a failed embedding call leaves the old vectors in place
+            self.vectorstore.add_documents(chunks, ids=chunk_ids)
+            if existing and existing.get("chunk_ids"):
+                self.vectorstore.delete(existing["chunk_ids"])
+                logger.info(f"Replaced previous vectors for {key}")
+
+        self.registry[key] = {
+            "hash": content_hash,
+            "chunk_ids": chunk_ids,
+            "policy_title": policy_title or Path(file_path).stem,
+            "source": file_path,
+            "indexed_at": datetime.utcnow().isoformat(),
+        }
+        return True
+
+    def remove_policy_document(self, policy_id: int) -> bool:
+        """
+        Remove a policy's vectors from the index
+
+        Args:
+            policy_id: Policy ID
+
+        Returns:
+            bool: True if vectors were removed, False if the policy was not indexed
+        """
+        key = document_key("", policy_id)
+        try:
+            with self._index_write():
+                entry = self.registry.get(key)
+                if self.vectorstore is None or entry is None:
+                    return False
+
+                if entry.get("chunk_ids"):
+                    self.vectorstore.delete(entry["chunk_ids"])
+                del self.registry[key]
+                self._save_index()
+                self._setup_chain()
 
+            logger.info(f"Removed policy document {key} from index")
             return True
 
         except Exception as e:
-            logger.error(f"Error indexing policy document: {e}")
+            logger.error(f"Error removing policy document: {e}")
             return False
 
+    def _load_chunks(self, file_path: str, policy_title: str) -> list:
+        """Load a policy file and split it into chunks with metadata"""
+        if file_path.endswith(".pdf"):
+            loader = PyPDFLoader(file_path)
+        else:
+            loader = TextLoader(file_path, encoding="utf-8")
+
+        documents = loader.load()
+
+        # Add metadata
+        for doc in documents:
+            doc.metadata["policy_title"] = policy_title or Path(file_path).stem
+            doc.metadata["source"] = file_path
+
+        text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=settings.POLICY_RAG_CHUNK_SIZE,
+            chunk_overlap=settings.POLICY_RAG_CHUNK_OVERLAP,
+            length_function=len,
+            separators=["\n\n", "\n", " ", ""],
+        )
+        return text_splitter.split_documents(documents)
+
     def index_all_policies(self, policy_dir: str) -> Dict[str, Any]:
         """
         Index all policy documents in a directory
@@ -192,22 +473,42 @@ class PolicyRAGService:
             logger.info(f"Found {len(policy_files)} policy files to index")
 
             indexed = 0
+            unchanged = 0
             failed = []
 
-            for policy_file in policy_files:
-                try:
-                    if self.index_policy_document(str(policy_file), policy_file.stem):
+            with self._index_write():
+                changed = False
+
+                for policy_file in policy_files:
+                    try:
+                        entry = self.registry.get(document_key(str(policy_file)), {})
+                        title = entry.get("policy_title") or policy_file.stem
+                        if self._upsert_document(str(policy_file), title, None):
+                            changed = True
+                        else:
+                            unchanged += 1
                         indexed += 1
-                    else:
+                    except Exception as e:
+                        logger.error(f"Failed to index {policy_file.name}: {e}")
                         failed.append(policy_file.name)
-                except Exception as e:
-                    logger.error(f"Failed to index {policy_file.name}: {e}")
-                    failed.append(policy_file.name)
+
+                # Drop documents whose files are gone
+                for key, entry in list(self.registry.items()):
+                    source = entry.get("source")
+                    if source and not os.path.exists(source) and self.vectorstore is not None:
+                        self.vectorstore.delete(entry["chunk_ids"])
+                        del self.registry[key]
+                        changed = True
+
+                if changed:
+                    self._save_index()
+                    self._setup_chain()
 
             return {
                 "success": True,
                 "total": len(policy_files),
                 "indexed": indexed,
+                "unchanged": unchanged,
                 "failed": failed,
             }
 
@@ -291,9 +592,14 @@ class PolicyRAGService:
             question: The question to ask
             chat_history: Previous chat messages (optional)
 
+        Standalone questions (no chat history) are answered from the answer
+        cache when an equivalent question was already answered against the
+        current index version.
+
         Returns:
-            dict: Contains 'answer' and 'sources'
+            dict: Contains 'answer', 'sources' and 'cached'
         """
+        self._reload_if_stale()
         if not self.chain:
             # Try to load index
             if not self.load_index():
@@ -302,7 +608,19 @@ class PolicyRAGService:
                     "error": "No policies indexed yet. Please upload policies first.",
                 }
 
+        # Follow-up questions depend on the conversation, so only cache standalone ones
+        use_cache = not chat_history
+        index_version = self.index_version
+
         try:
+            if use_cache:
+                cached = self.answer_cache.get(
+                    question, index_version, self.embeddings.embed_query
+                )
+                if cached is not None:
+                    logger.info(f"Answered from cache ({cached['match']} match)")
+                    return {**cached["answer"], "question": question, "cached": True}
+
             # Convert chat history to LangChain format
             lc_chat_history = []
             if chat_history:
@@ -330,12 +648,21 @@ class PolicyRAGService:
                         }
                     )
 
-            return {
+            result = {
                 "success": True,
                 "answer": response["answer"],
                 "sources": sources,
-                "question": question,
             }
+            if use_cache:
+                # Already embedded by the retriever, so this is an embedding cache hit
+                self.answer_cache.put(
+                    question,
+                    index_version,
+                    result,
+                    self.embeddings.embed_query(question),
+                )
+
+            return {**result, "question": question, "cached": False}
 
         except Exception as e:
             logger.error(f"Error answering question: {e}")
@@ -357,6 +684,7 @@ class PolicyRAGService:
     def get_index_status(self) -> Dict[str, Any]:
         """Get status of the policy index"""
         try:
+            self._reload_if_stale()
             if self.vectorstore is None:
                 self.load_index()
 
@@ -377,11 +705,31 @@ class PolicyRAGService:
             return {
                 "indexed": True,
                 "total_vectors": index_stats,
+                "total_policies": len(self.registry),
+                "index_version": self.index_version,
                 "index_location": self.index_dir,
                 "model": settings.GEMINI_MODEL,
-                "embedding_model": settings.GEMINI_EMBEDDING_MODEL,
+                "embedding_model": self.embeddings.model_name,
+                "embedding_cache": self.embeddings.stats(),
+                "answer_cache": self.answer_cache.stats(),
             }
 
         except Exception as e:
             logger.error(f"Error getting index status: {e}")
             return {"indexed": False, "error": str(e)}
+
+
+# Shared instance so uploads, deletes and the Q&A routes use one index and registry
+_policy_rag_service: Optional[PolicyRAGService] = None
+_policy_rag_service_lock = threading.Lock()
+
+
+def get_policy_rag_service() -> PolicyRAGService:
+    """Get or create the process-wide Policy RAG service (loads the saved index)"""
+    global _policy_rag_service
+    with _policy_rag_service_lock:
+        if _policy_rag_service is None:
+            service = PolicyRAGService()
+            service.load_index()
+            _policy_rag_service = service
+    return _policy_rag_service
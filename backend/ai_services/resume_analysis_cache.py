@@ -0,0 +1,119 @@
+"""
+Resume Analysis Cache - Reuses analyses of unchanged (resume, job description) pairs
+
+An analysis is identified by a SHA-256 over the resume text hash, the job
+description hash, the model and the prompt version. Re-running a screening
+for the same job only sends new or changed resumes to Gemini. Entries live
+in the `resume_analysis_cache` table; lookups open their own session so they
+can run in worker threads alongside a screening run.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import logging
+
+from sqlalchemy.exc import IntegrityError
+
+from config import settings
+from database import SessionLocal
+from models import ResumeAnalysisCacheEntry
+
+logger = logging.getLogger("resume_analysis_cache")
+
+# Bump when the analysis prompt in ResumeScreenerService.analyze_resume changes
+RESUME_ANALYSIS_PROMPT_VERSION = "1"
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResumeAnalysisCache:
+    """Looks up and stores resume analyses by input hash"""
+
+    def __init__(self, enabled: bool, max_age_days: int):
+        self.enabled = enabled
+        self.max_age_days = max_age_days
+
+    @staticmethod
+    def make_key(resume_text_hash: str, job_description_hash: str, model: str) -> str:
+        payload = "|".join(
+            [resume_text_hash, job_description_hash, model, RESUME_ANALYSIS_PROMPT_VERSION]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored analysis for this key (and record the hit) or None"""
+        if not self.enabled:
+            return None
+
+        oldest = datetime.utcnow() - timedelta(days=self.max_age_days)
+        db = SessionLocal()
+        try:
+            entry = (
+                db.query(ResumeAnalysisCacheEntry)
+                .filter(
+                    ResumeAnalysisCacheEntry.cache_key == cache_key,
+                    ResumeAnalysisCacheEntry.created_at >= oldest,
+                )
+                .first()
+            )
+            if entry is None:
+                return None
+
+            analysis = json.loads(entry.analysis)
+            entry.hit_count = (entry.hit_count or 0) + 1
+            entry.last_hit_at = datetime.utcnow()
+            db.commit()
+            return analysis
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Resume analysis cache lookup failed: {str(e)}")
+            return None
+        finally:
+            db.close()
+
+    def put(
+        self,
+        cache_key: str,
+        resume_text_hash: str,
+        job_description_hash: str,
+        model: str,
+        analysis: Dict[str, Any],
+    ) -> None:
+        """Store an analysis; replaces an expired entry with the same key"""
+        if not self.enabled:
+            return
+
+        db = SessionLocal()
+        try:
+            db.query(ResumeAnalysisCacheEntry).filter(
+                ResumeAnalysisCacheEntry.cache_key == cache_key
+            ).delete(synchronize_session=False)
+            db.add(
+                ResumeAnalysisCacheEntry(
+                    cache_key=cache_key,
+                    resume_text_hash=resume_text_hash,
+                    job_description_hash=job_description_hash,
+                    ai_model=model,
+                    prompt_version=RESUME_ANALYSIS_PROMPT_VERSION,
+                    analysis=json.dumps(analysis, default=str),
+                )
+            )
+            db.commit()
+        except IntegrityError:
+            # Another run stored the same analysis first
+            db.rollback()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Could not store resume analysis in cache: {str(e)}")
+        finally:
+            db.close()
+
+
+# Shared cache for the process
+resume_analysis_cache = ResumeAnalysisCache(
+    enabled=settings.RESUME_ANALYSIS_CACHE_ENABLED,
+    max_age_days=settings.RESUME_ANALYSIS_CACHE_MAX_AGE_DAYS,
+)
@@ -3,30 +3,28 @@ Resume Screener Service - AI-powered resume analysis
 Screens resumes against job descriptions with permanent storage
 """
 
-import os
 import json
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-from pathlib import Path
+from typing import List, Dict, Any, Optional, AsyncIterator, Iterable, Tuple
 from datetime import datetime
-import uuid
 
 # Check if required libraries are available
 try:
     from langchain_google_genai import ChatGoogleGenerativeAI
-    import PyPDF2
+    from ai_services import resume_text_extractor
+    from ai_services.resume_analysis_cache import resume_analysis_cache, text_sha256
 
-    try:
-        import docx2txt
-
-        DOCX_AVAILABLE = True
-    except ImportError:
-        DOCX_AVAILABLE = False
     LANGCHAIN_AVAILABLE = True
 except ImportError:
     LANGCHAIN_AVAILABLE = False
 
+from sqlalchemy.orm import Session
+
 from config import settings
+from models import ResumeScreeningRun
+from services.ai_worker_pool import ai_worker_pool
+from services.screening_history_service import ScreeningHistoryService
 
 logger = logging.getLogger("resume_screener_service")
 
@@ -36,7 +34,7 @@ class ResumeScreenerService:
     Resume Screener Service
 
     AI-powered resume analysis against job descriptions
-    Stores results permanently for future reference
+    Stores results permanently (resume_screening_runs tables) for future reference
     """
 
     def __init__(self):
@@ -54,10 +52,6 @@ class ResumeScreenerService:
             raise ValueError("GOOGLE_API_KEY is required for Resume Screener service")
 
         self.api_key = settings.GOOGLE_API_KEY
-        self.storage_dir = settings.RESUME_SCREENER_STORAGE_DIR
-
-        # Create storage directory
-        os.makedirs(self.storage_dir, exist_ok=True)
 
         # Initialize LLM
         try:
@@ -65,6 +59,7 @@ class ResumeScreenerService:
                 model=settings.GEMINI_MODEL,
                 temperature=0.2,  # Lower for more consistent analysis
                 google_api_key=self.api_key,
+                timeout=settings.AI_PROVIDER_TIMEOUT_SECONDS,
             )
 
             logger.info("Resume Screener Service initialized successfully")
@@ -75,40 +70,22 @@ class ResumeScreenerService:
     def extract_text_from_pdf(self, file_path: str) -> str:
         """Extract text from PDF file"""
         try:
-            text = ""
-            with open(file_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            return text.strip()
+            return resume_text_extractor.extract_text_from_pdf(file_path)
         except Exception as e:
             logger.error(f"Error extracting text from PDF {file_path}: {e}")
             raise
 
     def extract_text_from_docx(self, file_path: str) -> str:
         """Extract text from DOCX file"""
-        if not DOCX_AVAILABLE:
-            raise ImportError(
-                "docx2txt not installed. Install with: pip install docx2txt"
-            )
-
         try:
-            text = docx2txt.process(file_path)
-            return text.strip()
+            return resume_text_extractor.extract_text_from_docx(file_path)
         except Exception as e:
             logger.error(f"Error extracting text from DOCX {file_path}: {e}")
             raise
 
     def extract_resume_text(self, file_path: str) -> str:
-        """Extract text from resume (PDF or DOCX)"""
-        file_ext = Path(file_path).suffix.lower()
-
-        if file_ext == ".pdf":
-            return self.extract_text_from_pdf(file_path)
-        elif file_ext in [".docx", ".doc"]:
-            return self.extract_text_from_docx(file_path)
-        else:
-            raise ValueError(f"Unsupported file format: {file_ext}")
+        """Extract text from resume (PDF or DOCX), reusing previously extracted text"""
+        return resume_text_extractor.get_or_extract_text(file_path)
 
     def analyze_resume(
         self, resume_text: str, job_description: str, candidate_name: str = "Unknown"
@@ -226,183 +203,266 @@ Instructions:
             logger.error(f"Error analyzing resume: {e}")
             raise
 
-    def screen_resumes(
+    async def _screen_one(
+        self,
+        resume_file: Dict[str, Any],
+        job_description: str,
+        llm_slots: asyncio.Semaphore,
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Extract (process pool) and analyse (AI worker pool) one resume.
+
+        An analysis of the same resume text against the same job description
+        (same model and prompt version) is reused unless `force_refresh`.
+        """
+        candidate_name = resume_file.get("candidate_name", "Unknown")
+        try:
+            resume_text = await resume_text_extractor.extract_in_process_pool(
+                resume_file["path"]
+            )
+
+            resume_hash = text_sha256(resume_text)
+            job_hash = text_sha256(job_description)
+            cache_key = resume_analysis_cache.make_key(resume_hash, job_hash, settings.GEMINI_MODEL)
+            analysis = None
+            if not force_refresh:
+                analysis = await asyncio.to_thread(resume_analysis_cache.get, cache_key)
+
+            if analysis is not None:
+                analysis["candidate_name"] = candidate_name
+                analysis["from_cache"] = True
+            else:
+                async with llm_slots:
+                    analysis = await ai_worker_pool.run(
+                        "resume_screener",
+                        self.analyze_resume,
+                        resume_text,
+                        job_description,
+                        candidate_name,
+                    )
+                if not analysis.get("error"):
+                    await asyncio.to_thread(
+                        resume_analysis_cache.put,
+                        cache_key,
+                        resume_hash,
+                        job_hash,
+                        settings.GEMINI_MODEL,
+                        analysis,
+                    )
+                analysis["from_cache"] = False
+
+            # Add application_id if provided
+            if "application_id" in resume_file:
+                analysis["application_id"] = resume_file["application_id"]
+            return analysis
+
+        except Exception as e:
+            logger.error(f"Error screening resume {candidate_name}: {e}")
+            return {
+                "candidate_name": candidate_name,
+                "application_id": resume_file.get("application_id"),
+                "overall_fit_score": 0,
+                "skill_matches": [],
+                "experience_matches": [],
+                "education_match": {
+                    "requirement": "",
+                    "has_match": False,
+                    "details": "",
+                },
+                "strengths": [],
+                "gaps": ["Analysis failed"],
+                "summary": f"Error analyzing resume: {str(e)}",
+                "analysis_date": datetime.utcnow().isoformat(),
+                "error": str(e),
+            }
+
+    async def iter_screening(
         self,
         resume_files: List[Dict[str, Any]],
         job_description: str,
+        force_refresh: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Screen resumes concurrently, yielding each analysis as soon as it finishes
+
+        Text extraction runs in the resume extraction process pool and at most
+        `RESUME_SCREENER_LLM_CONCURRENCY` analyses are in flight (also bounded
+        by the shared AI worker pool). Results come in completion order. If
+        the consumer stops early, pending work is cancelled. Cached analyses
+        (`from_cache`) skip the LLM unless `force_refresh`.
+        """
+        llm_slots = asyncio.Semaphore(settings.RESUME_SCREENER_LLM_CONCURRENCY)
+        tasks = [
+            asyncio.create_task(
+                self._screen_one(resume_file, job_description, llm_slots, force_refresh)
+            )
+            for resume_file in resume_files
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def screen_resumes(
+        self,
+        db: Session,
+        resume_files: List[Dict[str, Any]],
+        job_description: str,
         job_id: int,
         job_title: str = "",
+        continue_analysis_id: Optional[int] = None,
+        force_refresh: bool = False,
     ) -> Dict[str, Any]:
         """
         Screen multiple resumes against a job description
 
         Args:
+            db: Database session
             resume_files: List of dicts with 'path' and 'candidate_name'
             job_description: Job description text
             job_id: Job listing ID
             job_title: Job title (optional)
+            continue_analysis_id: Interrupted run to complete (its finished
+                results are kept and those resumes are not screened again)
+            force_refresh: Re-analyse every resume instead of reusing cached analyses
 
         Returns:
-            dict: Screening results with analysis for all resumes
+            dict: Screening results with analysis for all resumes and
+                `served_from_cache` (analyses reused in this call)
+
+        Raises:
+            ValueError: If `continue_analysis_id` cannot be continued
         """
         try:
-            logger.info(f"Screening {len(resume_files)} resumes for job {job_id}")
-
-            results = []
-            total_score = 0
-
-            for resume_file in resume_files:
-                try:
-                    # Extract resume text
-                    resume_text = self.extract_resume_text(resume_file["path"])
-
-                    # Analyze resume
-                    analysis = self.analyze_resume(
-                        resume_text=resume_text,
-                        job_description=job_description,
-                        candidate_name=resume_file.get("candidate_name", "Unknown"),
-                    )
-
-                    # Add application_id if provided
-                    if "application_id" in resume_file:
-                        analysis["application_id"] = resume_file["application_id"]
-
-                    results.append(analysis)
-                    total_score += analysis.get("overall_fit_score", 0)
-
-                except Exception as e:
-                    logger.error(
-                        f"Error screening resume {resume_file.get('candidate_name')}: {e}"
-                    )
-                    # Add error result
-                    results.append(
-                        {
-                            "candidate_name": resume_file.get(
-                                "candidate_name", "Unknown"
-                            ),
-                            "application_id": resume_file.get("application_id"),
-                            "overall_fit_score": 0,
-                            "skill_matches": [],
-                            "experience_matches": [],
-                            "education_match": {
-                                "requirement": "",
-                                "has_match": False,
-                                "details": "",
-                            },
-                            "strengths": [],
-                            "gaps": ["Analysis failed"],
-                            "summary": f"Error analyzing resume: {str(e)}",
-                            "analysis_date": datetime.utcnow().isoformat(),
-                            "error": str(e),
-                        }
-                    )
-
-            # Calculate average score
-            average_score = total_score / len(results) if results else 0
-
-            # Find top candidate
-            top_candidate = None
-            if results:
-                top_result = max(results, key=lambda x: x.get("overall_fit_score", 0))
-                top_candidate = top_result.get("candidate_name")
-
-            # Generate analysis ID
-            analysis_id = int(uuid.uuid4().hex[:12], 16)
+            run = self.start_screening_run(db, job_id, job_title, continue_analysis_id)
+            pending = self.pending_resume_files(db, run, resume_files)
+            logger.info(
+                f"Screening {len(pending)} resumes for job {job_id} "
+                f"({len(resume_files) - len(pending)} already screened)"
+            )
 
-            # Save results to storage
-            screening_data = {
-                "analysis_id": analysis_id,
-                "job_id": job_id,
-                "job_title": job_title,
-                "timestamp": datetime.utcnow().isoformat(),
-                "total_analyzed": len(results),
-                "average_score": average_score,
-                "top_candidate": top_candidate,
-                "results": results,
-            }
+            served_from_cache = 0
+            async for analysis in self.iter_screening(pending, job_description, force_refresh):
+                self.record_screening_result(db, run, analysis)
+                served_from_cache += bool(analysis.get("from_cache"))
 
-            self._save_screening_results(analysis_id, screening_data)
+            summary = self.complete_screening_run(db, run)
 
             return {
                 "success": True,
-                "analysis_id": analysis_id,
+                "analysis_id": run.id,
                 "job_id": job_id,
                 "job_title": job_title,
-                "results": results,
-                "total_analyzed": len(results),
-                "average_score": round(average_score, 2),
-                "top_candidate": top_candidate,
+                "results": ScreeningHistoryService.get_results(db, run.id),
+                "total_analyzed": summary["total_analyzed"],
+                "average_score": round(summary["average_score"], 2),
+                "top_candidate": summary["top_candidate"],
+                "served_from_cache": served_from_cache,
             }
 
+        except ValueError:
+            # Invalid continue_analysis_id; reported to the client as a bad request
+            raise
         except Exception as e:
             logger.error(f"Error in batch resume screening: {e}")
             return {"success": False, "error": str(e)}
 
-    def _save_screening_results(self, analysis_id: str, data: Dict[str, Any]):
-        """Save screening results to storage"""
-        try:
-            file_path = os.path.join(self.storage_dir, f"{analysis_id}.json")
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2)
-
-            logger.info(f"Saved screening results to {file_path}")
-        except Exception as e:
-            logger.error(f"Error saving screening results: {e}")
-            raise
-
-    def get_screening_results(self, analysis_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve saved screening results"""
-        try:
-            file_path = os.path.join(self.storage_dir, f"{analysis_id}.json")
+    # ==================== Screening runs (resumable) ====================
 
-            if not os.path.exists(file_path):
-                return None
+    def start_screening_run(
+        self,
+        db: Session,
+        job_id: int,
+        job_title: str = "",
+        continue_analysis_id: Optional[int] = None,
+    ) -> ResumeScreeningRun:
+        """
+        Start a new screening run, or reopen an interrupted one.
 
-            with open(file_path, "r") as f:
-                data = json.load(f)
+        Each finished analysis is stored as it completes, so a run cut short
+        (client disconnect, restart) can be continued with its ID.
 
-            return data
+        Raises:
+            ValueError: If the run to continue does not exist, is already
+                complete or belongs to another job
+        """
+        if continue_analysis_id is None:
+            return ScreeningHistoryService.create_run(db, job_id, job_title)
+
+        run = ScreeningHistoryService.get_run(db, continue_analysis_id)
+        if run is None:
+            raise ValueError(f"Screening run {continue_analysis_id} not found")
+        if run.status == "completed":
+            raise ValueError(f"Screening run {continue_analysis_id} is already complete")
+        if run.job_id != job_id:
+            raise ValueError(
+                f"Screening run {continue_analysis_id} belongs to job {run.job_id}"
+            )
+        return run
 
-        except Exception as e:
-            logger.error(f"Error retrieving screening results: {e}")
+    @staticmethod
+    def pending_resume_files(
+        db: Session, run: ResumeScreeningRun, resume_files: Iterable[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Resume files whose application has no successful result in this run yet"""
+        done = ScreeningHistoryService.completed_application_ids(db, run.id)
+        return [f for f in resume_files if f.get("application_id") not in done]
+
+    @staticmethod
+    def record_screening_result(
+        db: Session, run: ResumeScreeningRun, analysis: Dict[str, Any]
+    ) -> None:
+        """Store a finished analysis (a retried application replaces its failed result)"""
+        ScreeningHistoryService.add_result(db, run.id, analysis)
+
+    @staticmethod
+    def complete_screening_run(db: Session, run: ResumeScreeningRun) -> Dict[str, Any]:
+        """Mark the run completed; returns the summary stats"""
+        run = ScreeningHistoryService.complete_run(db, run)
+        return {
+            "total_analyzed": run.total_analyzed,
+            "average_score": run.average_score,
+            "top_candidate": run.top_candidate,
+        }
+
+    def get_screening_results(
+        self, db: Session, analysis_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve saved screening results"""
+        run_id = ScreeningHistoryService.parse_analysis_id(analysis_id)
+        run = ScreeningHistoryService.get_run(db, run_id) if run_id is not None else None
+        if run is None:
             return None
 
+        return {
+            "analysis_id": run.id,
+            "job_id": run.job_id,
+            "job_title": run.job_title,
+            "timestamp": run.created_at.isoformat(),
+            "status": run.status,
+            "total_analyzed": run.total_analyzed,
+            "average_score": run.average_score or 0,
+            "top_candidate": run.top_candidate,
+            "results": ScreeningHistoryService.get_results(db, run.id),
+        }
+
     def list_screening_history(
-        self, job_id: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        """List all screening analyses, optionally filtered by job_id"""
-        try:
-            history = []
-
-            # Get all JSON files in storage directory
-            for file_path in Path(self.storage_dir).glob("*.json"):
-                try:
-                    with open(file_path, "r") as f:
-                        data = json.load(f)
-
-                    # Filter by job_id if provided
-                    if job_id is None or data.get("job_id") == job_id:
-                        # Add summary to history
-                        history.append(
-                            {
-                                "analysis_id": data["analysis_id"],
-                                "job_id": data["job_id"],
-                                "job_title": data.get("job_title", ""),
-                                "timestamp": data["timestamp"],
-                                "total_analyzed": data["total_analyzed"],
-                                "average_score": data["average_score"],
-                                "top_candidate": data.get("top_candidate"),
-                            }
-                        )
-                except Exception as e:
-                    logger.warning(f"Error reading screening file {file_path}: {e}")
-                    continue
-
-            # Sort by timestamp (newest first)
-            history.sort(key=lambda x: x["timestamp"], reverse=True)
-
-            return history
+        self,
+        db: Session,
+        job_id: Optional[int] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], int]:
+        """
+        List completed screening analyses (newest first), optionally filtered by job_id
 
-        except Exception as e:
-            logger.error(f"Error listing screening history: {e}")
-            return []
+        Returns:
+            Tuple of (history page, next cursor or None, total matching runs)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return ScreeningHistoryService.list_runs(db, job_id=job_id, limit=limit, cursor=cursor)
@@ -0,0 +1,162 @@
+"""
+Resume Text Extractor - PDF/DOCX text extraction in worker processes
+
+PDF parsing is CPU-bound pure Python, so a thread pool would still serialise
+on the GIL. `extract_in_process_pool` runs the extraction in a shared process
+pool of `RESUME_SCREENER_MAX_WORKERS` processes. This module only imports the
+parsers, keeping worker start-up cheap.
+
+Extracted text is normalised and stored under `RESUME_TEXT_STORE_DIR`, keyed
+by the SHA-256 of the file contents, so a resume is parsed once (on upload)
+no matter how many jobs it is screened against.
+"""
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import PyPDF2
+
+try:
+    import docx2txt
+
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+from config import settings
+
+logger = logging.getLogger("resume_text_extractor")
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_SPACES_RE = re.compile(r"[ \t\f\v\u00a0]+")
+
+
+def extract_text_from_pdf(file_path: str) -> str:
+    """Extract text from PDF file"""
+    with open(file_path, "rb") as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        pages = [page.extract_text() or "" for page in pdf_reader.pages]
+    return "\n".join(pages).strip()
+
+
+def extract_text_from_docx(file_path: str) -> str:
+    """Extract text from DOCX file"""
+    if not DOCX_AVAILABLE:
+        raise ImportError("docx2txt not installed. Install with: pip install docx2txt")
+    return docx2txt.process(file_path).strip()
+
+
+def extract_resume_text(file_path: str) -> str:
+    """Extract text from resume (PDF or DOCX)"""
+    file_ext = Path(file_path).suffix.lower()
+
+    if file_ext == ".pdf":
+        return extract_text_from_pdf(file_path)
+    elif file_ext in [".docx", ".doc"]:
+        return extract_text_from_docx(file_path)
+    else:
+        raise ValueError(f"Unsupported file format: {file_ext}")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of spaces and blank lines, drop NULs and trailing spaces"""
+    text = text.replace("\x00", "").replace("\r\n", "\n").replace("\r", "\n")
+    lines = [_SPACES_RE.sub(" ", line).strip() for line in text.split("\n")]
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(lines)).strip()
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 of a file's contents, read in blocks"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _store_path(content_hash: str) -> str:
+    return os.path.join(
+        settings.RESUME_TEXT_STORE_DIR, content_hash[:2], f"{content_hash}.txt"
+    )
+
+
+def load_stored_text(content_hash: str) -> Optional[str]:
+    """Previously extracted text for this file hash, or None"""
+    try:
+        with open(_store_path(content_hash), "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def store_text(content_hash: str, text: str) -> None:
+    """Write extracted text atomically (concurrent writers produce the same content)"""
+    path = _store_path(content_hash)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def get_or_extract_text(file_path: str, content_hash: Optional[str] = None) -> str:
+    """Normalised resume text, from the store if this file content was seen before"""
+    content_hash = content_hash or file_sha256(file_path)
+    text = load_stored_text(content_hash)
+    if text is None:
+        text = normalize_text(extract_resume_text(file_path))
+        store_text(content_hash, text)
+    return text
+
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """Shared process pool (spawned, so worker processes never inherit server threads)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.RESUME_SCREENER_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+async def extract_in_process_pool(file_path: str, content_hash: Optional[str] = None) -> str:
+    """
+    Normalised resume text without blocking the event loop.
+
+    The file is hashed (unless the caller already knows its hash) and looked
+    up in a thread; only texts that were never extracted are parsed in the
+    process pool.
+    """
+    if content_hash is None:
+        content_hash = await asyncio.to_thread(file_sha256, file_path)
+    text = await asyncio.to_thread(load_stored_text, content_hash)
+    if text is not None:
+        return text
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_extraction_pool(), get_or_extract_text, file_path, content_hash
+    )
+
+
+def shutdown_extraction_pool() -> None:
+    """Stop the worker processes (called on application shutdown)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,182 @@
+"""
+Benchmark: latency and SQL query counts of the main API endpoints.
+
+Usage (from the backend folder):
+    python seed_scale.py --reset --database-url sqlite:///./scale.db
+    python -m benchmarks.bench_api_endpoints --database-url sqlite:///./scale.db --output before.json
+    # ...change code...
+    python -m benchmarks.bench_api_endpoints --database-url sqlite:///./scale.db --output after.json --compare before.json
+
+Runs the app in-process with FastAPI's TestClient (startup/shutdown events
+included) against the given database, logs in as the HR head, a manager and
+an employee created by `seed_scale.py`, and calls each endpoint `--requests`
+times after `--warmup` untimed calls. Records p50/p95/mean latency and the
+number of SQL statements per request (counted on the engine) and writes them
+to a JSON baseline. `--compare` prints the change against an earlier baseline.
+
+Writes are included (punch-in, payslip generation for far-future months), so
+run it against a throw-away copy of the database. Settings such as
+HR_DASHBOARD_SNAPSHOT_ENABLED can be changed through the environment as usual.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import time
+from datetime import date, datetime, timedelta
+
+PASSWORD = "pass123"
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def build_endpoints(args):
+    """(name, role, method, path or path factory, json body factory) per endpoint"""
+    today = date.today()
+    quarter_start = (today - timedelta(days=90)).isoformat()
+    payslip_month = iter(range(10_000))
+
+    def next_payslip_period(_):
+        # A month nobody has payslips for yet, different on every call
+        n = next(payslip_month)
+        return {"month": n % 12 + 1, "year": 2090 + n // 12, "chunk_size": 1000}
+
+    return [
+        ("dashboard hr", "hr", "GET", "/dashboard/hr", None),
+        ("dashboard manager", "manager", "GET", "/dashboard/me", None),
+        ("dashboard employee", "employee", "GET", "/dashboard/me", None),
+        ("attendance today", "employee", "GET", "/attendance/today", None),
+        ("attendance my history", "employee", "GET", "/attendance/me", None),
+        ("attendance team", "manager", "GET", "/attendance/team", None),
+        ("attendance all (quarter)", "hr", "GET",
+         f"/attendance/all?start_date={quarter_start}&end_date={today.isoformat()}", None),
+        ("attendance punch-in", "employee", "POST", "/attendance/punch-in", lambda _: {"status": "present"}),
+        ("leaves my requests", "employee", "GET", "/leaves/me", None),
+        ("leaves all", "hr", "GET", "/leaves/all", None),
+        ("leave balance", "employee", "GET", "/leaves/balance/me", None),
+        ("org chart", "hr", "GET", "/organization/org-chart", None),
+        ("org hierarchy", "hr", "GET", "/organization/hierarchy", None),
+        ("employees list", "hr", "GET", "/employees", None),
+        ("employees search", "hr", "GET", "/employees?search=employee1", None),
+        ("payslip generation (bulk)", "hr", "POST", "/payslips/generate/bulk", next_payslip_period),
+    ]
+
+
+def run(args) -> dict:
+    # Settings are read at import time, so the database is chosen before importing the app
+    os.environ["DATABASE_URL"] = args.database_url
+    # SQL_ECHO logs every SQL statement, which would dominate the timings
+    os.environ.setdefault("SQL_ECHO", "false")
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    from database import engine
+    from main import app
+
+    statements = {"count": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(*_):
+        statements["count"] += 1
+
+    api = "/api/v1"
+    results = {}
+    with TestClient(app) as client:
+        headers = {}
+        for role, email in (("hr", args.hr_email), ("manager", args.manager_email), ("employee", args.employee_email)):
+            response = client.post(f"{api}/auth/login", json={"email": email, "password": PASSWORD})
+            response.raise_for_status()
+            headers[role] = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        for name, role, method, path, body in build_endpoints(args):
+            timings, queries, codes = [], [], set()
+            for i in range(args.warmup + args.requests):
+                payload = body(i) if body else None
+                before = statements["count"]
+                started = time.perf_counter()
+                response = client.request(method, f"{api}{path}", headers=headers[role], json=payload)
+                elapsed = (time.perf_counter() - started) * 1000
+                codes.add(response.status_code)
+                if i >= args.warmup:
+                    timings.append(elapsed)
+                    queries.append(statements["count"] - before)
+
+            results[name] = {
+                "method": method,
+                "path": path,
+                "status": sorted(codes),
+                "p50_ms": round(percentile(timings, 50), 2),
+                "p95_ms": round(percentile(timings, 95), 2),
+                "mean_ms": round(statistics.fmean(timings), 2),
+                "queries": round(statistics.fmean(queries), 1),
+            }
+            r = results[name]
+            print(f"{name:<28} p50 {r['p50_ms']:9.2f} ms  p95 {r['p95_ms']:9.2f} ms  "
+                  f"queries {r['queries']:7.1f}  status {r['status']}")
+
+    return {
+        "meta": {
+            "git_revision": git_revision(),
+            "generated_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "database_url": args.database_url,
+            "requests": args.requests,
+            "warmup": args.warmup,
+        },
+        "endpoints": results,
+    }
+
+
+def compare(current: dict, baseline: dict) -> None:
+    print(f"\nChange vs {baseline['meta'].get('git_revision')} "
+          f"({baseline['meta'].get('generated_at')}):")
+    print(f"{'endpoint':<28} {'p50 ms':>21} {'p95 ms':>21} {'queries':>17}")
+    for name, now in current["endpoints"].items():
+        before = baseline["endpoints"].get(name)
+        if before is None:
+            print(f"{name:<28} (new)")
+            continue
+        print(
+            f"{name:<28} {before['p50_ms']:>9.2f} -> {now['p50_ms']:<9.2f}"
+            f"{before['p95_ms']:>9.2f} -> {now['p95_ms']:<9.2f}"
+            f"{before['queries']:>7.1f} -> {now['queries']:<7.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True, help="Database seeded by seed_scale.py")
+    parser.add_argument("--requests", type=int, default=30, help="Timed requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--hr-email", default="hr.head@scale.example.com")
+    parser.add_argument("--manager-email", default="manager1@scale.example.com")
+    parser.add_argument("--employee-email", default="employee1@scale.example.com")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Earlier JSON results to diff against")
+    args = parser.parse_args()
+
+    current = run(args)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"\n[OK] Results written to {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(current, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Benchmark: simultaneous punch-ins against SQLite, driver-default engine vs
+the tuned engine from `database.create_db_engine` (WAL, synchronous=NORMAL,
+busy_timeout, cache/mmap pragmas, explicit pool sizing).
+
+Usage (from the backend folder):
+    python -m benchmarks.bench_concurrent_punch_in
+    python -m benchmarks.bench_concurrent_punch_in --employees 1000 --concurrency 40 --readers 8
+
+For each engine a throw-away SQLite file is seeded with employees and some
+attendance history. Then `--concurrency` threads (40 is the size of the
+threadpool sync routes run in) punch every employee in at once through
+`AttendanceService.punch_in`, one session per punch-in as in a request,
+while `--readers` threads keep reading attendance history like the
+dashboards do. Prints throughput, p50/p95/max punch-in latency and the
+number of failed punch-ins ("database is locked" and the like), and checks
+that no employee ended up with two attendance rows for the day.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+from database import create_db_engine
+from models import Attendance, Base
+from pydantic_models import PunchInRequest
+from services.attendance_service import AttendanceService
+
+DEPARTMENTS = 10
+
+
+def seed(engine, employees: int, history_days: int) -> None:
+    """Departments, employees and `history_days` of attendance ending yesterday"""
+    Base.metadata.create_all(engine)
+    start = date.today() - timedelta(days=history_days)
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.executemany(
+            "INSERT INTO departments (id, name, code, is_active) VALUES (?, ?, ?, 1)",
+            ((d, f"Department {d}", f"D{d}") for d in range(1, DEPARTMENTS + 1)),
+        )
+        cursor.executemany(
+            "INSERT INTO users (id, name, email, password_hash, role, department_id, is_active) "
+            "VALUES (?, ?, ?, 'x', 'EMPLOYEE', ?, 1)",
+            ((i, f"Employee {i}", f"employee{i}@bench.local", i % DEPARTMENTS + 1) for i in range(1, employees + 1)),
+        )
+        cursor.executemany(
+            "INSERT INTO attendance (employee_id, date, status, hours_worked) VALUES (?, ?, 'PRESENT', 8.0)",
+            (
+                (emp, (start + timedelta(days=offset)).isoformat())
+                for offset in range(history_days)
+                for emp in range(1, employees + 1)
+            ),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def failure_reason(error: SQLAlchemyError) -> str:
+    if isinstance(error, DBAPIError):
+        return str(error.orig)
+    # e.g. the pool's "QueuePool limit ... reached, connection timed out"
+    return str(error).split(" (Background")[0]
+
+
+def run_profile(label: str, tuned: bool, args) -> dict:
+    fd, db_path = tempfile.mkstemp(suffix=".db", prefix="bench_punch_in_")
+    os.close(fd)
+    engine = create_db_engine(f"sqlite:///{db_path}", tuned=tuned)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    try:
+        seed(engine, args.employees, args.history_days)
+        engine.dispose()
+
+        latencies, failures = [], {}
+        lock = threading.Lock()
+        stop_readers = threading.Event()
+        reads = [0]
+        history_start = date.today() - timedelta(days=args.history_days)
+
+        def punch_in(employee_id: int) -> None:
+            started = time.perf_counter()
+            db = session_factory()
+            try:
+                AttendanceService.punch_in(db, employee_id, PunchInRequest())
+                elapsed = time.perf_counter() - started
+                with lock:
+                    latencies.append(elapsed * 1000)
+            except SQLAlchemyError as e:
+                reason = failure_reason(e)
+                with lock:
+                    failures[reason] = failures.get(reason, 0) + 1
+            finally:
+                db.close()
+
+        def read_history() -> None:
+            while not stop_readers.is_set():
+                db = session_factory()
+                try:
+                    AttendanceService._get_department_stats(db, history_start, date.today())
+                    reads[0] += 1
+                except SQLAlchemyError as e:
+                    reason = f"reader: {failure_reason(e)}"
+                    with lock:
+                        failures[reason] = failures.get(reason, 0) + 1
+                finally:
+                    db.close()
+
+        readers = [threading.Thread(target=read_history, daemon=True) for _ in range(args.readers)]
+        for reader in readers:
+            reader.start()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(punch_in, range(1, args.employees + 1)))
+        wall = time.perf_counter() - started
+        stop_readers.set()
+        for reader in readers:
+            reader.join()
+
+        db = session_factory()
+        try:
+            rows, employees = db.query(
+                func.count(Attendance.id), func.count(func.distinct(Attendance.employee_id))
+            ).filter(Attendance.date == date.today()).one()
+        finally:
+            db.close()
+    finally:
+        engine.dispose()
+        if not args.keep:
+            for suffix in ("", "-wal", "-shm", "-journal"):
+                if os.path.exists(db_path + suffix):
+                    os.remove(db_path + suffix)
+
+    ok = len(latencies)
+    result = {
+        "label": label,
+        "ok": ok,
+        "failed": sum(failures.values()),
+        "failures": failures,
+        "rows": rows,
+        "duplicates": rows - employees,
+        "wall_s": wall,
+        "throughput": ok / wall if wall else 0,
+        "reads": reads[0],
+        "p50_ms": statistics.median(latencies) if latencies else 0,
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else 0,
+        "max_ms": max(latencies, default=0),
+    }
+    print(
+        f"{label:<16} {ok:>5} ok {result['failed']:>5} failed  {wall:7.2f}s  "
+        f"{result['throughput']:8.1f} punch-ins/s  p50 {result['p50_ms']:8.1f} ms  "
+        f"p95 {result['p95_ms']:8.1f} ms  max {result['max_ms']:8.1f} ms  reads {reads[0]}"
+    )
+    for reason, count in sorted(failures.items()):
+        print(f"{'':<16} {count:>5} x {reason}")
+    if rows != employees:
+        print(f"[FAIL] {rows - employees} duplicate attendance rows for today")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employees", type=int, default=500, help="Punch-ins (one per employee)")
+    parser.add_argument("--concurrency", type=int, default=40, help="Punch-in threads")
+    parser.add_argument("--readers", type=int, default=4, help="Threads reading attendance meanwhile")
+    parser.add_argument("--history-days", type=int, default=30, help="Attendance history seeded per employee")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded database files")
+    args = parser.parse_args()
+
+    print(f"[INFO] {args.employees} punch-ins on {args.concurrency} threads, {args.readers} readers")
+    print("=" * 64)
+    for label, tuned in (("driver defaults", False), ("tuned engine", True)):
+        run_profile(label, tuned, args)
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Benchmark: department attendance statistics, per-department ORM loops vs the
+single grouped query in `AttendanceService._get_department_stats`.
+
+Usage (from the backend folder):
+    python -m benchmarks.bench_department_attendance_stats
+    python -m benchmarks.bench_department_attendance_stats --employees 2000 --days 30
+
+Seeds a throw-away SQLite file with the real schema (default 10k employees in
+20 departments x 90 days, i.e. a quarter), then runs both implementations
+over the full range. Prints wall time and peak Python memory (tracemalloc)
+for each, and checks that both return the same statistics.
+"""
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import Attendance, AttendanceStatus, Base, Department, User
+from pydantic_models import DepartmentAttendanceStats
+from services.attendance_service import AttendanceService
+
+ATTENDANCE_STATUSES = ["PRESENT"] * 7 + ["WFH", "WFH", "LEAVE", "ABSENT"]
+DEPARTMENTS = 20
+BATCH_SIZE = 50_000
+
+
+def seed(engine, employees: int, days: int, seed_value: int) -> date:
+    """Bulk-insert departments, employees and attendance; returns the first day"""
+    rng = random.Random(seed_value)
+    Base.metadata.create_all(engine)
+    start = date.today() - timedelta(days=days - 1)
+
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.executemany(
+            "INSERT INTO departments (id, name, code, is_active) VALUES (?, ?, ?, 1)",
+            ((d, f"Department {d}", f"D{d}") for d in range(1, DEPARTMENTS + 1)),
+        )
+        # Every 50th employee has left; their history must not be counted
+        cursor.executemany(
+            "INSERT INTO users (id, name, email, password_hash, role, department_id, is_active) "
+            "VALUES (?, ?, ?, 'x', 'EMPLOYEE', ?, ?)",
+            (
+                (i, f"Employee {i}", f"employee{i}@bench.local", i % DEPARTMENTS + 1, int(i % 50 != 0))
+                for i in range(1, employees + 1)
+            ),
+        )
+        batch = []
+        for offset in range(days):
+            day = (start + timedelta(days=offset)).isoformat()
+            for emp in range(1, employees + 1):
+                batch.append((emp, day, rng.choice(ATTENDANCE_STATUSES), 8.0))
+            if len(batch) >= BATCH_SIZE:
+                cursor.executemany("INSERT INTO attendance (employee_id, date, status, hours_worked) VALUES (?, ?, ?, ?)", batch)
+                batch = []
+        if batch:
+            cursor.executemany("INSERT INTO attendance (employee_id, date, status, hours_worked) VALUES (?, ?, ?, ?)", batch)
+        conn.commit()
+    finally:
+        conn.close()
+    return start
+
+
+def legacy_department_stats(db, start_date: date, end_date: date):
+    """The previous implementation: one employee and one attendance load per department"""
+    stats = []
+    for dept in db.query(Department).filter(Department.is_active == True).all():
+        employees = db.query(User).filter(
+            User.department_id == dept.id,
+            User.is_active == True
+        ).all()
+        if not employees:
+            continue
+
+        records = db.query(Attendance).filter(
+            Attendance.employee_id.in_([e.id for e in employees]),
+            Attendance.date >= start_date,
+            Attendance.date <= end_date
+        ).all()
+        present = sum(1 for r in records if r.status == AttendanceStatus.PRESENT)
+        absent = sum(1 for r in records if r.status == AttendanceStatus.ABSENT)
+        on_leave = sum(1 for r in records if r.status == AttendanceStatus.LEAVE)
+        wfh = sum(1 for r in records if r.status == AttendanceStatus.WFH)
+
+        expected = len(employees) * ((end_date - start_date).days + 1)
+        stats.append(DepartmentAttendanceStats(
+            department_id=dept.id,
+            department_name=dept.name,
+            total_employees=len(employees),
+            present=present,
+            absent=absent,
+            on_leave=on_leave,
+            wfh=wfh,
+            attendance_percentage=round((present + wfh) / expected * 100, 2) if expected > 0 else 0
+        ))
+    return stats
+
+
+def measure(session_factory, func, start_date: date, end_date: date):
+    """Return (result, seconds, peak MiB) for one run in a fresh session"""
+    gc.collect()
+    db = session_factory()
+    try:
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = func(db, start_date, end_date)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        db.close()
+    return result, elapsed, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employees", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded database file")
+    args = parser.parse_args()
+
+    fd, db_path = tempfile.mkstemp(suffix=".db", prefix="bench_dept_stats_")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{db_path}")
+    session_factory = sessionmaker(bind=engine)
+    try:
+        print(f"[INFO] Seeding {args.employees} employees x {args.days} days into {db_path}")
+        started = time.perf_counter()
+        start_date = seed(engine, args.employees, args.days, args.seed)
+        end_date = start_date + timedelta(days=args.days - 1)
+        print(f"[OK] Seeded in {time.perf_counter() - started:.1f}s")
+
+        runs = [
+            ("per-department ORM loops", legacy_department_stats),
+            ("grouped aggregation", AttendanceService._get_department_stats),
+        ]
+        results = []
+        print("\n" + "=" * 64)
+        for label, func in runs:
+            result, elapsed, peak_mib = measure(session_factory, func, start_date, end_date)
+            results.append(result)
+            print(f"{label:<28} {elapsed:8.3f}s   peak memory {peak_mib:9.1f} MiB")
+        print("=" * 64)
+
+        same = [s.model_dump() for s in results[0]] == [s.model_dump() for s in results[1]]
+        print(f"[{'OK' if same else 'FAIL'}] Results {'match' if same else 'differ'} ({len(results[1])} departments)")
+    finally:
+        engine.dispose()
+        if not args.keep:
+            os.remove(db_path)
+
+
+if __name__ == "__main__":
+    main()
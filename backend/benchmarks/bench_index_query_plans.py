@@ -0,0 +1,181 @@
+"""
+Benchmark: query plans and latency of the hot lookups before/after the
+composite indexes from `migrate_add_indexes.py`.
+
+Usage (from the backend folder):
+    python -m benchmarks.bench_index_query_plans
+    python -m benchmarks.bench_index_query_plans --employees 2000 --days 100
+
+Seeds a throw-away SQLite file (default 10k employees x 300 days = 3M
+attendance rows), runs each hot query without the indexes, applies the
+indexes and runs them again. Prints EXPLAIN QUERY PLAN and the mean time
+per query for both runs. Only the columns the queries touch are created.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+
+from migrate_add_indexes import apply_indexes
+
+
+SCHEMA = """
+CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(100), department_id INTEGER, is_active BOOLEAN);
+CREATE TABLE attendance (
+    id INTEGER PRIMARY KEY, employee_id INTEGER NOT NULL, date DATE NOT NULL,
+    status VARCHAR(7) NOT NULL, hours_worked FLOAT
+);
+CREATE TABLE leave_requests (
+    id INTEGER PRIMARY KEY, employee_id INTEGER NOT NULL, leave_type VARCHAR(9),
+    status VARCHAR(8), requested_date DATETIME
+);
+CREATE TABLE payslips (
+    id INTEGER PRIMARY KEY, employee_id INTEGER NOT NULL, pay_period_start DATE NOT NULL,
+    pay_period_end DATE NOT NULL, pay_date DATE NOT NULL, net_salary FLOAT
+);
+CREATE TABLE skill_module_enrollments (
+    id INTEGER PRIMARY KEY, employee_id INTEGER NOT NULL, module_id INTEGER NOT NULL,
+    status VARCHAR(11), enrolled_date DATE
+);
+"""
+
+ATTENDANCE_STATUSES = ["PRESENT"] * 7 + ["WFH", "WFH", "LEAVE", "ABSENT"]
+LEAVE_STATUSES = ["PENDING", "APPROVED", "REJECTED"]
+MODULE_STATUSES = ["NOT_STARTED", "PENDING", "COMPLETED"]
+BATCH_SIZE = 50_000
+
+
+def seed(conn: sqlite3.Connection, employees: int, days: int, seed_value: int) -> None:
+    """Bulk-insert deterministic rows for the benchmark"""
+    rng = random.Random(seed_value)
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO users (id, name, department_id, is_active) VALUES (?, ?, ?, 1)",
+        ((i, f"Employee {i}", i % 20 + 1) for i in range(1, employees + 1)),
+    )
+
+    start = date.today() - timedelta(days=days)
+    batch = []
+    for offset in range(days):
+        day = (start + timedelta(days=offset)).isoformat()
+        for emp in range(1, employees + 1):
+            batch.append((emp, day, rng.choice(ATTENDANCE_STATUSES), 8.0))
+        if len(batch) >= BATCH_SIZE:
+            conn.executemany("INSERT INTO attendance (employee_id, date, status, hours_worked) VALUES (?, ?, ?, ?)", batch)
+            batch = []
+    if batch:
+        conn.executemany("INSERT INTO attendance (employee_id, date, status, hours_worked) VALUES (?, ?, ?, ?)", batch)
+
+    conn.executemany(
+        "INSERT INTO leave_requests (employee_id, leave_type, status, requested_date) VALUES (?, 'CASUAL', ?, ?)",
+        (
+            (emp, rng.choice(LEAVE_STATUSES), (start + timedelta(days=rng.randrange(days))).isoformat() + " 09:00:00")
+            for emp in range(1, employees + 1) for _ in range(10)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO payslips (employee_id, pay_period_start, pay_period_end, pay_date, net_salary) VALUES (?, ?, ?, ?, 42000)",
+        (
+            (emp, date(2024, m, 1).isoformat(), date(2024, m, 28).isoformat(), date(2024, m, 28).isoformat())
+            for emp in range(1, employees + 1) for m in range(1, 13)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO skill_module_enrollments (employee_id, module_id, status, enrolled_date) VALUES (?, ?, ?, ?)",
+        (
+            (emp, rng.randrange(1, 50), rng.choice(MODULE_STATUSES), (start + timedelta(days=rng.randrange(days))).isoformat())
+            for emp in range(1, employees + 1) for _ in range(5)
+        ),
+    )
+    conn.commit()
+
+
+def build_queries(employees: int, days: int):
+    """(label, sql, params) for each hot lookup in the services"""
+    today = date.today().isoformat()
+    range_start = (date.today() - timedelta(days=min(days, 90))).isoformat()
+    emp = employees // 2
+    return [
+        ("attendance punch-in/today lookup",
+         "SELECT id FROM attendance WHERE employee_id = ? AND date = ? LIMIT 1",
+         (emp, (date.today() - timedelta(days=1)).isoformat())),
+        ("attendance status counts in date range",
+         "SELECT status, COUNT(*) FROM attendance WHERE date >= ? AND date <= ? GROUP BY status",
+         (today, today)),
+        ("attendance my history (90 days)",
+         "SELECT id FROM attendance WHERE employee_id = ? AND date >= ? AND date <= ? ORDER BY date DESC LIMIT 30",
+         (emp, range_start, today)),
+        ("payslip duplicate-period check",
+         "SELECT id FROM payslips WHERE employee_id = ? AND pay_period_start = ? AND pay_period_end = ? LIMIT 1",
+         (emp, "2024-06-01", "2024-06-28")),
+        ("leave list by employee + status",
+         "SELECT id FROM leave_requests WHERE employee_id = ? AND status = ? ORDER BY requested_date DESC LIMIT 20",
+         (emp, "PENDING")),
+        ("leave list by status (HR)",
+         "SELECT id FROM leave_requests WHERE status = ? ORDER BY requested_date DESC LIMIT 20",
+         ("PENDING",)),
+        ("enrollment list by employee + status",
+         "SELECT id FROM skill_module_enrollments WHERE employee_id = ? AND status = ? ORDER BY enrolled_date DESC LIMIT 20",
+         (emp, "COMPLETED")),
+    ]
+
+
+def measure(conn: sqlite3.Connection, sql: str, params, repeat: int):
+    """Return (plan lines, mean milliseconds)"""
+    plan = [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        conn.execute(sql, params).fetchall()
+    elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+    return plan, elapsed_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employees", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded database file")
+    args = parser.parse_args()
+
+    fd, db_path = tempfile.mkstemp(suffix=".db", prefix="bench_indexes_")
+    os.close(fd)
+    conn = sqlite3.connect(db_path)
+    try:
+        print(f"[INFO] Seeding {args.employees} employees x {args.days} days into {db_path}")
+        started = time.perf_counter()
+        seed(conn, args.employees, args.days, args.seed)
+        print(f"[OK] Seeded in {time.perf_counter() - started:.1f}s")
+
+        queries = build_queries(args.employees, args.days)
+        before = {label: measure(conn, sql, params, args.repeat) for label, sql, params in queries}
+
+        print("[INFO] Applying indexes")
+        started = time.perf_counter()
+        apply_indexes(conn)
+        print(f"[OK] Indexes built in {time.perf_counter() - started:.1f}s")
+
+        after = {label: measure(conn, sql, params, args.repeat) for label, sql, params in queries}
+
+        print("\n" + "=" * 78)
+        for label, _, _ in queries:
+            plan_before, ms_before = before[label]
+            plan_after, ms_after = after[label]
+            speedup = ms_before / ms_after if ms_after else float("inf")
+            print(f"\n{label}")
+            print(f"  before: {ms_before:9.3f} ms  | {'; '.join(plan_before)}")
+            print(f"  after:  {ms_after:9.3f} ms  | {'; '.join(plan_after)}")
+            print(f"  speedup: x{speedup:.1f}")
+        print("=" * 78)
+    finally:
+        conn.close()
+        if not args.keep:
+            os.remove(db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark: password verification throughput and event-loop responsiveness.
+
+Usage (from the backend folder):
+    python -m benchmarks.bench_login_throughput
+    python -m benchmarks.bench_login_throughput --logins 64 --rounds 12 --workers 8
+    python -m benchmarks.bench_login_throughput --url http://localhost:8000/api/v1 \\
+        --email john.anderson@company.com --password pass123 --logins 64 --clients 16
+
+Offline mode (default) fires `--logins` concurrent bcrypt checks on one event
+loop two ways:
+
+ - inline: `verify_password` called directly in the coroutine (old login path),
+ - pool:   `PasswordHasher.verify` with `--workers` threads.
+
+While they run, a heartbeat task sleeps 10 ms in a loop; its worst lateness
+shows how long other requests on the same worker would have been stalled.
+
+With `--url`, logs in against a running server from `--clients` threads and
+prints logins per second and latency percentiles.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.password_hasher import PasswordHasher
+from utils.password_utils import hash_password, verify_password
+
+
+async def heartbeat(stop: asyncio.Event, lags: list) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - start - 0.01)
+
+
+async def run_offline(label: str, logins: int, check) -> None:
+    stop = asyncio.Event()
+    lags: list = []
+    beat = asyncio.create_task(heartbeat(stop, lags))
+    await asyncio.sleep(0.02)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(check() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+
+    assert all(results)
+    print(
+        f"{label:<10} {elapsed:7.2f}s  {logins / elapsed:7.1f} logins/s  "
+        f"max loop stall={max(lags) * 1000:8.1f} ms"
+    )
+
+
+def offline(args) -> None:
+    hashed = hash_password(args.password, rounds=args.rounds)
+    hasher = PasswordHasher(max_workers=args.workers, max_pending=args.logins)
+
+    async def inline_check():
+        return verify_password(args.password, hashed)
+
+    async def pool_check():
+        return await hasher.verify(args.password, hashed)
+
+    print(f"{args.logins} concurrent bcrypt checks, cost {args.rounds}, {args.workers} workers")
+    asyncio.run(run_offline("inline", args.logins, inline_check))
+    asyncio.run(run_offline("pool", args.logins, pool_check))
+    hasher.shutdown()
+
+
+def live(args) -> None:
+    import requests
+
+    def login(_):
+        start = time.perf_counter()
+        response = requests.post(
+            f"{args.url}/auth/login",
+            json={"email": args.email, "password": args.password},
+            timeout=60,
+        )
+        return response.status_code, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as executor:
+        results = list(executor.map(login, range(args.logins)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for _, latency in results)
+    codes: dict = {}
+    for code, _ in results:
+        codes[code] = codes.get(code, 0) + 1
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) > 1 else latencies[0]
+    print(f"{args.logins} logins from {args.clients} clients in {elapsed:.2f}s "
+          f"({args.logins / elapsed:.1f}/s)")
+    print(f"latency p50={statistics.median(latencies) * 1000:.0f} ms "
+          f"p95={p95 * 1000:.0f} ms  status codes={codes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Login throughput benchmark")
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost (offline mode)")
+    parser.add_argument("--workers", type=int, default=4, help="Hasher threads (offline mode)")
+    parser.add_argument("--url", help="API base URL of a running server (live mode)")
+    parser.add_argument("--email", default="john.anderson@company.com")
+    parser.add_argument("--password", default="pass123")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent clients (live mode)")
+    args = parser.parse_args()
+
+    if args.url:
+        live(args)
+    else:
+        offline(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: policy ingestion with the embedding cache and batched embedding.
+
+Usage (from the backend folder):
+    python -m benchmarks.bench_policy_embedding
+    python -m benchmarks.bench_policy_embedding --policies 50 --latency 0.2 --batch-size 32 --concurrency 8
+
+Runs offline with the deterministic `FakeEmbeddings` (each provider call
+sleeps `--latency` seconds to imitate a remote API). Generates synthetic
+policy text, splits it with the same settings as `PolicyRAGService`, and
+builds a FAISS index three ways:
+
+ - one chunk per call, no cache (old behaviour: one request per chunk),
+ - batched + concurrent, cold cache,
+ - same again with a warm cache (a re-index after a restart).
+
+Prints wall time and provider calls for each run.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from ai_services.embedding_cache import CachedEmbeddings, EmbeddingStore, FakeEmbeddings
+from config import settings
+
+WORDS = (
+    "employee leave policy annual casual sick approval manager days notice "
+    "reimbursement claim travel expense remote work office hours benefits "
+    "insurance probation resignation payroll holiday eligible request"
+).split()
+
+
+def make_policies(count: int, paragraphs: int, seed_value: int) -> list:
+    """Synthetic policy documents of a few thousand words each"""
+    rng = random.Random(seed_value)
+    documents = []
+    for i in range(count):
+        text = "\n\n".join(
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(60, 140)))
+            for _ in range(paragraphs)
+        )
+        documents.append(Document(page_content=text, metadata={"policy_title": f"Policy {i}"}))
+    return documents
+
+
+def run(label: str, chunks: list, embeddings: CachedEmbeddings) -> None:
+    start = time.perf_counter()
+    store = FAISS.from_documents(chunks, embeddings)
+    elapsed = time.perf_counter() - start
+    stats = embeddings.stats()
+    print(
+        f"{label:<34} {elapsed:8.2f}s  provider calls={stats['provider_calls']:<5} "
+        f"cache hits={stats['hits']:<6} vectors={store.index.ntotal}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--policies", type=int, default=20)
+    parser.add_argument("--paragraphs", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per provider call")
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--batch-size", type=int, default=settings.POLICY_RAG_EMBED_BATCH_SIZE)
+    parser.add_argument("--concurrency", type=int, default=settings.POLICY_RAG_EMBED_CONCURRENCY)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=settings.POLICY_RAG_CHUNK_SIZE,
+        chunk_overlap=settings.POLICY_RAG_CHUNK_OVERLAP,
+    )
+    chunks = splitter.split_documents(make_policies(args.policies, args.paragraphs, args.seed))
+    print(f"{args.policies} policies -> {len(chunks)} chunks, {args.latency}s per provider call\n")
+
+    base = FakeEmbeddings(size=args.dim, latency_seconds=args.latency)
+    model_name = f"fake-{args.dim}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run(
+            "per-chunk calls, no cache",
+            chunks,
+            CachedEmbeddings(base, model_name, store=None, batch_size=1, concurrency=1),
+        )
+
+        store = EmbeddingStore(os.path.join(tmp, "embeddings.sqlite3"))
+        options = dict(store=store, batch_size=args.batch_size, concurrency=args.concurrency)
+        run(
+            f"batch={args.batch_size} x{args.concurrency}, cold cache",
+            chunks,
+            CachedEmbeddings(base, model_name, **options),
+        )
+        run(
+            f"batch={args.batch_size} x{args.concurrency}, warm cache",
+            chunks,
+            CachedEmbeddings(base, model_name, **options),
+        )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -30,9 +30,51 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # Verified access tokens and their principal are reused for this long;
+    # updating or deactivating an employee drops their entries immediately
+    AUTH_PRINCIPAL_CACHE_ENABLED: bool = True
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    # bcrypt cost factor for new hashes; stored hashes with another cost are
+    # re-hashed on the user's next successful login
+    BCRYPT_ROUNDS: int = 12
+    # Password hashing/verification runs in this many threads (bcrypt releases
+    # the GIL); callers beyond PASSWORD_HASH_MAX_PENDING get 503
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
 
     # Database
     DATABASE_URL: str = "sqlite:///./hr_system.db"
+    # Log every SQL statement (very verbose; the per-request counters below
+    # are usually enough)
+    SQL_ECHO: bool = False
+    # Per-request SQL counters (X-DB-Queries / X-DB-Time headers and
+    # /api/v1/admin/metrics/db). Statements slower than SLOW_QUERY_MS are
+    # logged with their route; a statement repeated more than
+    # N_PLUS_ONE_THRESHOLD times in one request is logged as a likely N+1
+    QUERY_METRICS_ENABLED: bool = True
+    SLOW_QUERY_MS: int = 200
+    N_PLUS_ONE_THRESHOLD: int = 10
+    # Connection pool (file SQLite and server databases). Sync routes run in a
+    # threadpool of 40, so requests beyond POOL_SIZE + MAX_OVERFLOW wait up to
+    # DB_POOL_TIMEOUT_SECONDS for a connection
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    # Server databases only: check connections before use and replace them
+    # before the server's idle timeout closes them
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # SQLite pragmas applied to every new connection. WAL lets readers run
+    # alongside the writer and, with synchronous=NORMAL, makes commits cheap;
+    # writers wait up to SQLITE_BUSY_TIMEOUT_MS for the lock instead of
+    # failing with "database is locked"
+    SQLITE_PRAGMAS_ENABLED: bool = True
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 15000
+    SQLITE_CACHE_SIZE_KB: int = 65536  # Per connection
+    SQLITE_MMAP_SIZE_MB: int = 256
 
     # CORS
     CORS_ORIGINS: List[str] = [
@@ -64,21 +106,63 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
 
+    # Organization chart snapshot cache (0 disables caching).
+    # Invalidated on commit of ORM changes (including query.update()/delete());
+    # raw SQL writes and other processes/workers are only picked up after the TTL.
+    ORG_CHART_CACHE_TTL_SECONDS: int = 300
+
+    # HR dashboard snapshot: served from memory while younger than MAX_AGE.
+    # Commits touching attendance, enrollments, applications, users or
+    # departments mark it stale; a stale snapshot is recomputed in the
+    # background every REFRESH seconds while the dashboard is being viewed.
+    HR_DASHBOARD_SNAPSHOT_ENABLED: bool = True
+    HR_DASHBOARD_REFRESH_SECONDS: int = 30
+    HR_DASHBOARD_MAX_AGE_SECONDS: int = 300
+
     # AI Services (Google Gemini)
     GOOGLE_API_KEY: str = ""
     GEMINI_MODEL: str = "gemini-2.5-flash"
     GEMINI_EMBEDDING_MODEL: str = "models/gemini-embedding-001"
     GEMINI_TEMPERATURE: float = 0.2
 
+    # AI worker pool: blocking provider calls run in threads, not on the event loop
+    AI_WORKER_POOL_SIZE: int = 8
+    AI_PROVIDER_MAX_CONCURRENCY: int = 4  # Per API key
+    AI_PROVIDER_TIMEOUT_SECONDS: float = 120.0
+
+    # AI performance report cache (content-addressed on the report inputs)
+    AI_REPORT_CACHE_ENABLED: bool = True
+    AI_REPORT_CACHE_MAX_AGE_DAYS: int = 30
+
     # Policy RAG Configuration
     POLICY_RAG_CHUNK_SIZE: int = 1000
     POLICY_RAG_CHUNK_OVERLAP: int = 200
     POLICY_RAG_RETRIEVAL_K: int = 3
     POLICY_RAG_INDEX_DIR: str = "ai_data/policy_index"
+    # Embedding cache keyed by (model, chunk text hash); batches of misses are
+    # embedded with up to POLICY_RAG_EMBED_CONCURRENCY requests in flight
+    POLICY_RAG_EMBEDDING_CACHE_ENABLED: bool = True
+    POLICY_RAG_EMBEDDING_CACHE_PATH: str = "ai_data/embedding_cache.sqlite3"
+    POLICY_RAG_EMBED_BATCH_SIZE: int = 100
+    POLICY_RAG_EMBED_CONCURRENCY: int = 4
+    # Use the deterministic local embedder instead of Gemini (offline runs/benchmarks)
+    POLICY_RAG_FAKE_EMBEDDINGS: bool = False
+    # Chatbot answer cache: exact (normalised) or embedding-similar questions
+    # reuse an answer; scoped to the index version, so re-indexing clears it
+    POLICY_RAG_ANSWER_CACHE_ENABLED: bool = True
+    POLICY_RAG_ANSWER_CACHE_MAX_ENTRIES: int = 1000
+    POLICY_RAG_ANSWER_CACHE_TTL_SECONDS: int = 86400
+    POLICY_RAG_ANSWER_CACHE_SIMILARITY: float = 0.95
 
     # Resume Screener Configuration
-    RESUME_SCREENER_MAX_WORKERS: int = 4
+    RESUME_SCREENER_MAX_WORKERS: int = 4  # Text extraction processes
+    RESUME_SCREENER_LLM_CONCURRENCY: int = 4  # Analyses in flight per screening run
     RESUME_SCREENER_STORAGE_DIR: str = "ai_data/resume_analysis"
+    # Analyses keyed by (resume text, job description, model, prompt version)
+    RESUME_ANALYSIS_CACHE_ENABLED: bool = True
+    RESUME_ANALYSIS_CACHE_MAX_AGE_DAYS: int = 90
+    # Normalised resume text keyed by file SHA-256 (filled on upload)
+    RESUME_TEXT_STORE_DIR: str = "ai_data/resume_text"
 
     # Job Description Generator Configuration
     JD_GENERATOR_ENABLED: bool = True
@@ -117,6 +201,7 @@ def create_upload_directories():
         "ai_data",
         settings.POLICY_RAG_INDEX_DIR,
         settings.RESUME_SCREENER_STORAGE_DIR,
+        settings.RESUME_TEXT_STORE_DIR,
         os.path.join("ai_data", "temp"),
     ]
 
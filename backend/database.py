@@ -1,18 +1,81 @@
 """
 Database connection and session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 from config import settings
 
+
+def _is_in_memory_sqlite(url) -> bool:
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def sqlite_pragmas() -> dict:
+    """Pragmas applied to every new SQLite connection (see config)"""
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        # Negative cache_size is in KiB rather than pages
+        "cache_size": -settings.SQLITE_CACHE_SIZE_KB,
+        "mmap_size": settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024,
+        "temp_store": "MEMORY",
+    }
+
+
+def create_db_engine(database_url: str, tuned: bool = True, **kwargs) -> Engine:
+    """
+    Create an engine for `database_url`.
+
+    With `tuned` (the default) SQLite connections get the pragmas from
+    `sqlite_pragmas()` and pooled engines get explicit pool sizing; server
+    databases also get pre-ping and recycling. `tuned=False` gives the plain
+    driver defaults (used by benchmarks as the baseline). Extra keyword
+    arguments are passed to `create_engine`.
+    """
+    url = make_url(database_url)
+    is_sqlite = url.get_backend_name() == "sqlite"
+    options = {"echo": settings.SQL_ECHO}  # Log every SQL statement
+    if is_sqlite:
+        options["connect_args"] = {"check_same_thread": False}
+    if tuned and not (is_sqlite and _is_in_memory_sqlite(url)):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        )
+        if not is_sqlite:
+            options.update(
+                pool_pre_ping=settings.DB_POOL_PRE_PING,
+                pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            )
+    options.update(kwargs)
+    db_engine = create_engine(database_url, **options)
+
+    if tuned and is_sqlite and settings.SQLITE_PRAGMAS_ENABLED:
+        pragmas = sqlite_pragmas()
+        if _is_in_memory_sqlite(url):
+            # WAL and mmap need a database file
+            pragmas.pop("journal_mode")
+            pragmas.pop("mmap_size")
+
+        @event.listens_for(db_engine, "connect")
+        def _apply_sqlite_pragmas(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
+    return db_engine
+
+
 # Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    echo=settings.DEBUG  # Log SQL queries in debug mode
-)
+engine = create_db_engine(settings.DATABASE_URL)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
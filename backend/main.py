@@ -13,7 +13,12 @@ import logging
 import os
 
 from config import settings, create_upload_directories
-from database import engine, create_tables
+from database import engine, create_tables, SessionLocal
+from services.hierarchy_service import HierarchyService
+from services.ai_worker_pool import ai_worker_pool
+from utils.password_hasher import password_hasher, PasswordHasherBusyError
+from services.hr_dashboard_snapshot import hr_dashboard_snapshot
+from utils.query_metrics import query_metrics
 
 # Configure logging
 logging.basicConfig(
@@ -121,6 +126,7 @@ All endpoints follow consistent error response format with proper HTTP status co
         {"name": "Departments", "description": "Department management"},
         {"name": "Organization/Hierarchy", "description": "Organization structure"},
         {"name": "Team Requests", "description": "Various employee requests (WFH, equipment, etc.)"},
+        {"name": "Admin Metrics", "description": "Per-route SQL query statistics"},
         {"name": "AI - Policy RAG", "description": "**[GenAI]** AI-powered policy Q&A chatbot - **User Stories: Policy Access, Policy Queries**"},
         {"name": "AI - Resume Screener", "description": "**[GenAI]** AI-powered resume screening - **User Story: Resume Screening**"},
         {"name": "AI - Job Description Generator", "description": "**[GenAI]** AI-powered JD generation - **User Story: Job Description Management**"},
@@ -147,6 +153,38 @@ async def add_process_time_header(request: Request, call_next):
     response.headers["X-Process-Time"] = str(process_time)
     return response
 
+# SQL statement counting middleware
+@app.middleware("http")
+async def add_db_metrics_headers(request: Request, call_next):
+    """Add the request's SQL statement count and DB time (ms) to response headers"""
+    if not query_metrics.enabled:
+        return await call_next(request)
+    stats, token = query_metrics.begin(request.scope)
+    try:
+        response = await call_next(request)
+    finally:
+        query_metrics.end(token)
+    response.headers["X-DB-Queries"] = str(stats.count)
+    response.headers["X-DB-Time"] = f"{stats.duration * 1000:.2f}"
+
+    if "content-length" in response.headers:
+        query_metrics.record(stats)
+        return response
+
+    # Streamed bodies (e.g. bulk payslip generation) still run statements
+    # after the headers are sent; record the route metrics after the last chunk
+    body_iterator = response.body_iterator
+
+    async def record_after_body():
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            query_metrics.record(stats)
+
+    response.body_iterator = record_after_body()
+    return response
+
 # Global exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -178,6 +216,22 @@ async def database_exception_handler(request: Request, exc: SQLAlchemyError):
         }
     )
 
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusyError):
+    """Shed password checks beyond the hasher's queue limit"""
+    logger.warning(f"Password hasher busy: {str(exc)}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+        content={
+            "success": False,
+            "error": {
+                "code": "SERVICE_BUSY",
+                "message": "Too many requests in progress, please retry shortly"
+            }
+        }
+    )
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle all other exceptions"""
@@ -210,12 +264,32 @@ async def startup_event():
         logger.info("Database tables created/verified")
     except Exception as e:
         logger.error(f"Error creating database tables: {str(e)}")
+    
+    # Backfill the hierarchy closure table for databases seeded outside the API
+    try:
+        with SessionLocal() as db:
+            if HierarchyService.ensure_built(db):
+                logger.info("User hierarchy closure rebuilt")
+    except Exception as e:
+        logger.error(f"Error building user hierarchy closure: {str(e)}")
+
+    # Keep the HR dashboard snapshot warm while it is being read
+    hr_dashboard_snapshot.start()
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown"""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    hr_dashboard_snapshot.stop()
+    ai_worker_pool.shutdown()
+    password_hasher.shutdown()
+    try:
+        from ai_services.resume_text_extractor import shutdown_extraction_pool
+        shutdown_extraction_pool()
+    except ImportError:
+        # Resume screener dependencies not installed; no pool was started
+        pass
 
 # Root endpoint
 @app.get("/", tags=["Root"])
@@ -296,6 +370,7 @@ async def api_v1_root():
                 "holidays": "/api/v1/holidays",
                 "departments": "/api/v1/departments",
                 "organization": "/api/v1/organization",
+                "admin_metrics": "/api/v1/admin/metrics",
                 "ai_policy_rag": "/api/v1/ai/policy-rag",
                 "ai_resume_screener": "/api/v1/ai/resume-screener",
                 "ai_job_description": "/api/v1/ai/job-description",
@@ -329,6 +404,7 @@ from routes.leaves import router as leaves_router
 from routes.skills import router as skills_router
 from routes.requests import router as requests_router
 from routes.goals import router as goals_router
+from routes.admin_metrics import router as admin_metrics_router
 
 # Import AI routers (optional - will load if dependencies available)
 try:
@@ -362,6 +438,7 @@ app.include_router(leaves_router, prefix="/api/v1")
 app.include_router(skills_router, prefix="/api/v1")
 app.include_router(requests_router, prefix="/api/v1")
 app.include_router(goals_router, prefix="/api/v1")
+app.include_router(admin_metrics_router, prefix="/api/v1")
 
 # Include AI routers if available
 if AI_ROUTES_AVAILABLE:
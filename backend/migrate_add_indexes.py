@@ -0,0 +1,130 @@
+"""
+Add the composite indexes declared in `models.py` to an existing SQLite DB.
+
+Usage:
+    python migrate_add_indexes.py [--dedupe-attendance]
+
+What it does:
+ - Reads `DATABASE_URL` the same way as `fix_db_schema.py`.
+ - Creates every index in `INDEXES` with `CREATE INDEX IF NOT EXISTS`, so it is
+   safe to run repeatedly.
+ - Before creating the unique `(employee_id, date)` index on `attendance` it
+   checks for duplicate rows. Duplicates are reported and the unique index is
+   skipped, unless `--dedupe-attendance` is passed, in which case only the
+   oldest row (lowest id) per employee/day is kept.
+
+`create_tables()` only creates indexes for brand new tables, so databases
+created before these indexes were added to the models need this script once.
+"""
+import os
+import sqlite3
+import sys
+from typing import List, Tuple
+
+from fix_db_schema import _get_database_url_from_env, get_sqlite_path
+
+
+# (index name, table, columns, unique) - keep in sync with __table_args__ in models.py
+INDEXES: List[Tuple[str, str, Tuple[str, ...], bool]] = [
+    ("uq_attendance_employee_date", "attendance", ("employee_id", "date"), True),
+    ("ix_attendance_date_status", "attendance", ("date", "status"), False),
+    ("ix_leave_requests_employee_status_requested", "leave_requests", ("employee_id", "status", "requested_date"), False),
+    ("ix_leave_requests_status_requested", "leave_requests", ("status", "requested_date"), False),
+    ("ix_payslips_employee_period", "payslips", ("employee_id", "pay_period_start", "pay_period_end"), False),
+    ("ix_payslips_employee_pay_date", "payslips", ("employee_id", "pay_date"), False),
+    ("ix_enrollments_employee_status_enrolled", "skill_module_enrollments", ("employee_id", "status", "enrolled_date"), False),
+    ("ix_enrollments_module_status", "skill_module_enrollments", ("module_id", "status"), False),
+]
+
+
+def index_ddl(name: str, table: str, columns: Tuple[str, ...], unique: bool) -> str:
+    """Build the CREATE INDEX statement for one index"""
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    return f"CREATE {kind} IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+
+
+def table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    cur = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    return cur.fetchone() is not None
+
+
+def count_attendance_duplicates(conn: sqlite3.Connection) -> int:
+    """Number of (employee_id, date) pairs that have more than one attendance row"""
+    cur = conn.execute(
+        "SELECT COUNT(*) FROM ("
+        " SELECT employee_id, date FROM attendance"
+        " GROUP BY employee_id, date HAVING COUNT(*) > 1"
+        ")"
+    )
+    return cur.fetchone()[0]
+
+
+def dedupe_attendance(conn: sqlite3.Connection) -> int:
+    """Delete all but the lowest-id attendance row per employee/day"""
+    cur = conn.execute(
+        "DELETE FROM attendance WHERE id NOT IN ("
+        " SELECT MIN(id) FROM attendance GROUP BY employee_id, date"
+        ")"
+    )
+    conn.commit()
+    return cur.rowcount
+
+
+def apply_indexes(conn: sqlite3.Connection, dedupe: bool = False) -> List[str]:
+    """
+    Create all indexes on an open connection.
+
+    Returns:
+        Names of the indexes that exist after the run
+    """
+    created = []
+    for name, table, columns, unique in INDEXES:
+        if not table_exists(conn, table):
+            print(f"[INFO] Table '{table}' does not exist, skipping {name}")
+            continue
+
+        if table == "attendance" and unique:
+            duplicates = count_attendance_duplicates(conn)
+            if duplicates and dedupe:
+                removed = dedupe_attendance(conn)
+                print(f"[OK] Removed {removed} duplicate attendance rows")
+            elif duplicates:
+                print(f"[WARN] {duplicates} employee/day pairs have duplicate attendance rows. "
+                      f"Skipping {name}; re-run with --dedupe-attendance to clean them up.")
+                continue
+
+        conn.execute(index_ddl(name, table, columns, unique))
+        created.append(name)
+        print(f"[OK] {name} on {table}({', '.join(columns)})")
+
+    conn.execute("ANALYZE")
+    conn.commit()
+    return created
+
+
+def main():
+    dedupe = "--dedupe-attendance" in sys.argv[1:]
+    db_url = _get_database_url_from_env()
+    try:
+        sqlite_path = get_sqlite_path(db_url)
+    except Exception as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    if not os.path.exists(sqlite_path):
+        print(f"[INFO] SQLite DB file does not exist at: {sqlite_path}")
+        print("Nothing to do. New databases get these indexes from create_tables().")
+        return
+
+    print(f"[INFO] Opening SQLite DB: {sqlite_path}")
+    conn = sqlite3.connect(sqlite_path)
+    try:
+        apply_indexes(conn, dedupe=dedupe)
+    except Exception as e:
+        print(f"[ERROR] Failed to create indexes: {e}")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
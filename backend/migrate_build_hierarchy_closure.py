@@ -0,0 +1,69 @@
+"""
+Create and backfill the `user_hierarchy_closure` table from `users.manager_id`.
+
+Usage:
+    python migrate_build_hierarchy_closure.py [--check]
+
+What it does:
+ - Creates any missing tables (including `user_hierarchy_closure` and its
+   indexes) through `create_tables()`.
+ - Recomputes every (ancestor, descendant, depth) row from `users.manager_id`
+   and replaces the table contents in one transaction. Safe to run repeatedly.
+ - `--check` only compares the stored rows with the recomputed ones and exits
+   with status 1 when they differ.
+
+The API keeps the table up to date for changes made through the employee
+endpoints and rebuilds it on startup when users are missing from it, so this
+script is only needed after editing `manager_id` outside the API.
+"""
+import sys
+
+from database import SessionLocal, create_tables
+from models import User, UserHierarchyClosure
+from services.hierarchy_service import HierarchyService
+
+
+def stored_rows(db) -> set:
+    return set(
+        db.query(
+            UserHierarchyClosure.ancestor_id,
+            UserHierarchyClosure.descendant_id,
+            UserHierarchyClosure.depth,
+        ).all()
+    )
+
+
+def expected_rows(db) -> set:
+    edges = dict(db.query(User.id, User.manager_id).all())
+    return {
+        (row["ancestor_id"], row["descendant_id"], row["depth"])
+        for row in HierarchyService.build_closure_rows(edges)
+    }
+
+
+def main():
+    check_only = "--check" in sys.argv[1:]
+    create_tables()
+
+    db = SessionLocal()
+    try:
+        if check_only:
+            stored, expected = stored_rows(db), expected_rows(db)
+            missing, extra = expected - stored, stored - expected
+            if missing or extra:
+                print(f"[WARN] Closure is stale: {len(missing)} missing rows, {len(extra)} extra rows")
+                sys.exit(1)
+            print(f"[OK] Closure is up to date ({len(stored)} rows)")
+            return
+
+        count = HierarchyService.rebuild(db)
+        print(f"[OK] Wrote {count} user_hierarchy_closure rows")
+    except Exception as e:
+        print(f"[ERROR] Failed to build user hierarchy closure: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Import resume screening results saved as JSON files into the database.
+
+Usage:
+    python migrate_import_screening_history.py [--dir PATH] [--dry-run]
+
+What it does:
+ - Creates any missing tables (including `resume_screening_runs` and
+   `resume_screening_run_results`) through `create_tables()`.
+ - Reads every `<analysis_id>.json` in RESUME_SCREENER_STORAGE_DIR (or
+   `--dir`) and stores it as a completed run with one row per candidate.
+   Hex analysis IDs written by older streaming runs are converted to the
+   same integer the API now uses, so existing links keep working.
+ - Reads `<analysis_id>.partial.jsonl` checkpoints of interrupted runs and
+   stores them as running runs, which can then be continued through the API.
+ - Runs already in the database are skipped, so it is safe to run repeatedly.
+
+The JSON files are left in place; delete them once the import is verified.
+"""
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from config import settings
+from database import SessionLocal, create_tables
+from services.screening_history_service import ScreeningHistoryService
+
+
+def read_json_run(path: Path):
+    """(header, results, completed) from a finished run file"""
+    with open(path, "r") as f:
+        data = json.load(f)
+    return data, data.get("results", []), True
+
+
+def read_partial_run(path: Path):
+    """(header, results, completed) from an interrupted run's checkpoint"""
+    records = []
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    if not records:
+        raise ValueError("empty checkpoint")
+    return records[0], records[1:], False
+
+
+def import_run(db, header: dict, results: list, completed: bool) -> bool:
+    """Store one run; returns False if it was already imported"""
+    analysis_id = ScreeningHistoryService.parse_analysis_id(str(header["analysis_id"]))
+    if analysis_id is None:
+        raise ValueError(f"invalid analysis_id {header['analysis_id']!r}")
+    if ScreeningHistoryService.get_run(db, analysis_id) is not None:
+        return False
+
+    timestamp = datetime.fromisoformat(header["timestamp"])
+    run = ScreeningHistoryService.create_run(
+        db,
+        job_id=header["job_id"],
+        job_title=header.get("job_title", ""),
+        analysis_id=analysis_id,
+        created_at=timestamp,
+        commit=False,
+    )
+    for analysis in results:
+        ScreeningHistoryService.add_result(db, run.id, analysis, commit=False)
+    db.commit()
+
+    if completed:
+        ScreeningHistoryService.complete_run(db, run, completed_at=timestamp)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import screening JSON files into the database")
+    parser.add_argument("--dir", default=settings.RESUME_SCREENER_STORAGE_DIR)
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be imported")
+    args = parser.parse_args()
+
+    storage_dir = Path(args.dir)
+    files = sorted(storage_dir.glob("*.json")) + sorted(storage_dir.glob("*.partial.jsonl"))
+    if not files:
+        print(f"[OK] No screening files found in {storage_dir}")
+        return
+
+    create_tables()
+    db = SessionLocal()
+    imported = skipped = failed = 0
+    try:
+        for path in files:
+            try:
+                reader = read_partial_run if path.name.endswith(".partial.jsonl") else read_json_run
+                header, results, completed = reader(path)
+                if args.dry_run:
+                    print(f"  would import {path.name}: {len(results)} results")
+                    imported += 1
+                    continue
+                if import_run(db, header, results, completed):
+                    imported += 1
+                else:
+                    skipped += 1
+            except Exception as e:
+                db.rollback()
+                failed += 1
+                print(f"[WARN] Could not import {path.name}: {e}")
+    finally:
+        db.close()
+
+    verb = "Would import" if args.dry_run else "Imported"
+    print(f"[OK] {verb} {imported} runs ({skipped} already imported, {failed} failed)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Float, Date, Enum
+from sqlalchemy import create_engine, Column, Integer, BigInteger, String, Text, DateTime, Boolean, ForeignKey, Float, Date, Enum, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 import enum
@@ -161,6 +161,19 @@ class User(Base):
     feedback_given = relationship("Feedback", foreign_keys="Feedback.given_by", back_populates="given_by_user")
     notifications = relationship("Notification", back_populates="user")
 
+# User Hierarchy Closure Model (every ancestor/descendant pair of the manager tree)
+class UserHierarchyClosure(Base):
+    __tablename__ = 'user_hierarchy_closure'
+
+    ancestor_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    descendant_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    depth = Column(Integer, nullable=False)  # 0 = self, 1 = direct report, 2 = skip-level, ...
+
+    __table_args__ = (
+        Index('ix_hierarchy_closure_ancestor_depth', 'ancestor_id', 'depth'),
+        Index('ix_hierarchy_closure_descendant_depth', 'descendant_id', 'depth'),
+    )
+
 # Job Listings Model
 class JobListing(Base):
     __tablename__ = 'job_listings'
@@ -271,6 +284,12 @@ class Attendance(Base):
     
     # Relationships
     employee = relationship("User", back_populates="attendance_records")
+    
+    # Indexes (punch-in/out and today-status look up one row per employee per day)
+    __table_args__ = (
+        Index('uq_attendance_employee_date', 'employee_id', 'date', unique=True),
+        Index('ix_attendance_date_status', 'date', 'status'),
+    )
 
 # Leave Requests Model
 class LeaveRequest(Base):
@@ -302,6 +321,12 @@ class LeaveRequest(Base):
     # Relationships
     employee = relationship("User", foreign_keys=[employee_id], back_populates="leave_requests")
     approver = relationship("User", foreign_keys=[approved_by])
+    
+    # Indexes (leave lists filter by employee/status and order by requested_date)
+    __table_args__ = (
+        Index('ix_leave_requests_employee_status_requested', 'employee_id', 'status', 'requested_date'),
+        Index('ix_leave_requests_status_requested', 'status', 'requested_date'),
+    )
 
 # Payslips Model
 class Payslip(Base):
@@ -343,6 +368,12 @@ class Payslip(Base):
     # Relationships
     employee = relationship("User", foreign_keys=[employee_id], back_populates="payslips")
     issued_by_user = relationship("User", foreign_keys=[issued_by])
+    
+    # Indexes (duplicate-period check and per-employee history ordered by pay_date)
+    __table_args__ = (
+        Index('ix_payslips_employee_period', 'employee_id', 'pay_period_start', 'pay_period_end'),
+        Index('ix_payslips_employee_pay_date', 'employee_id', 'pay_date'),
+    )
 
 # Goals and Performance Model
 class Goal(Base):
@@ -520,6 +551,50 @@ class ResumeScreeningResult(Base):
     # Relationships
     application = relationship("Application", back_populates="screening_result")
 
+# AI Resume Screening Runs (one row per screening request, results per candidate)
+class ResumeScreeningRun(Base):
+    __tablename__ = 'resume_screening_runs'
+    
+    id = Column(BigInteger, primary_key=True, autoincrement=False)  # analysis_id
+    job_id = Column(Integer, ForeignKey('job_listings.id'), nullable=False)
+    job_title = Column(String(200))
+    status = Column(String(20), nullable=False, default="running")  # running, completed
+    
+    total_analyzed = Column(Integer, default=0)
+    average_score = Column(Float)
+    top_candidate = Column(String(200))
+    
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at = Column(DateTime)
+    
+    # Relationships
+    results = relationship("ResumeScreeningRunResult", back_populates="run", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        Index('ix_resume_screening_runs_job_created', 'job_id', 'created_at', 'id'),
+        Index('ix_resume_screening_runs_created', 'created_at', 'id'),
+    )
+
+class ResumeScreeningRunResult(Base):
+    __tablename__ = 'resume_screening_run_results'
+    
+    id = Column(Integer, primary_key=True)
+    run_id = Column(BigInteger, ForeignKey('resume_screening_runs.id', ondelete='CASCADE'), nullable=False)
+    application_id = Column(Integer, ForeignKey('applications.id'))
+    candidate_name = Column(String(200))
+    overall_fit_score = Column(Float, default=0)
+    failed = Column(Boolean, default=False, nullable=False)
+    analysis = Column(Text, nullable=False)  # JSON: full analysis as returned by the model
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Relationships
+    run = relationship("ResumeScreeningRun", back_populates="results")
+    
+    __table_args__ = (
+        Index('ix_resume_screening_run_results_run_score', 'run_id', 'overall_fit_score'),
+        Index('ix_resume_screening_run_results_application', 'application_id'),
+    )
+
 # Performance Reports Model (for dashboard analytics)
 class PerformanceReport(Base):
     __tablename__ = 'performance_reports'
@@ -552,6 +627,64 @@ class PerformanceReport(Base):
     employee = relationship("User", foreign_keys=[employee_id])
     created_by_user = relationship("User", foreign_keys=[created_by])
 
+# AI Report Cache Model (generated report markdown keyed by a hash of its inputs)
+class AIReportCacheEntry(Base):
+    __tablename__ = 'ai_report_cache'
+    
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(64), unique=True, nullable=False)  # SHA-256 hex of the report inputs
+    employee_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    report_type = Column(String(50), nullable=False)
+    template = Column(String(50))
+    report_period_start = Column(Date, nullable=False)
+    report_period_end = Column(Date, nullable=False)
+    prompt_version = Column(String(20))
+    ai_model = Column(String(100))
+    
+    report_id = Column(String(50))
+    report_markdown = Column(Text, nullable=False)
+    
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_hit_at = Column(DateTime)
+    
+    __table_args__ = (
+        Index('ix_ai_report_cache_employee_created', 'employee_id', 'created_at'),
+    )
+
+# AI Resume Analysis Cache (one analysis per resume text + job description)
+class ResumeAnalysisCacheEntry(Base):
+    __tablename__ = 'resume_analysis_cache'
+    
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(64), unique=True, nullable=False)  # SHA-256 of the analysis inputs
+    resume_text_hash = Column(String(64), nullable=False)
+    job_description_hash = Column(String(64), nullable=False)
+    ai_model = Column(String(100))
+    prompt_version = Column(String(20))
+    
+    analysis = Column(Text, nullable=False)  # JSON
+    
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_hit_at = Column(DateTime)
+    
+    __table_args__ = (
+        Index('ix_resume_analysis_cache_job_description', 'job_description_hash'),
+    )
+
+
+class StoredFileDigest(Base):
+    __tablename__ = 'stored_file_digests'
+    
+    # Upload path as stored on the owning record (e.g. Policy.document_path)
+    path = Column(String(500), primary_key=True)
+    sha256 = Column(String(64), nullable=False)
+    # File size and mtime when hashed; a mismatch means the file changed
+    size = Column(BigInteger, nullable=False)
+    mtime = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 # Database setup
 def create_database(database_url="sqlite:///./hr_system.db"):
     """Create database and tables"""
@@ -698,6 +831,12 @@ class SkillModuleEnrollment(Base):
     # Relationships
     employee = relationship("User", back_populates="skill_enrollments")
     module = relationship("SkillModule", back_populates="enrollments")
+    
+    # Indexes (enrollment lists filter by employee/status and order by enrolled_date)
+    __table_args__ = (
+        Index('ix_enrollments_employee_status_enrolled', 'employee_id', 'status', 'enrolled_date'),
+        Index('ix_enrollments_module_status', 'module_id', 'status'),
+    )
 
 # Goal Categories Model (Master data for goal categorization)
 class GoalCategory(Base):
@@ -224,6 +224,8 @@ class HRDashboardResponse(BaseModel):
     total_employees: int
     total_departments: int
     total_active_applications: int
+    # When the figures were computed (served from a snapshot up to a few minutes old)
+    generated_at: Optional[datetime] = None
 
 
 class TeamMemberAttendance(BaseModel):
@@ -619,11 +621,12 @@ class AllAttendanceResponse(BaseModel):
     department_stats: List[DepartmentAttendanceStats]
     records: List[AttendanceRecordResponse]
     
-    # Pagination
-    total_records: int
-    page: int
+    # Pagination (cursor pagination: `page` is None, totals only with include_total)
+    total_records: Optional[int]
+    page: Optional[int]
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 # ============================================================================
@@ -0,0 +1,37 @@
+"""
+Admin Metrics API Routes
+Per-route SQL query statistics collected by utils/query_metrics.py
+"""
+from fastapi import APIRouter, Depends
+from utils.dependencies import require_hr
+from utils.principal_cache import Principal
+from utils.query_metrics import query_metrics
+
+router = APIRouter(prefix="/admin/metrics", tags=["Admin Metrics"])
+
+
+@router.get("/db", response_model=dict)
+async def get_db_metrics(current_user: Principal = Depends(require_hr)):
+    """
+    Per-route SQL statistics since startup or the last reset (HR only).
+
+    **Access**: HR only
+
+    **Returns** per route (`METHOD /path/template`):
+    - request count, total/mean/max statements and DB time
+    - histograms of statements and DB milliseconds per request
+    - slow statements (over SLOW_QUERY_MS) and requests flagged as likely N+1,
+      with the most often repeated statement shapes
+    """
+    return query_metrics.snapshot()
+
+
+@router.delete("/db", response_model=dict)
+async def reset_db_metrics(current_user: Principal = Depends(require_hr)):
+    """
+    Clear the collected per-route SQL statistics (HR only).
+
+    **Access**: HR only
+    """
+    query_metrics.reset()
+    return {"message": "Database metrics reset"}
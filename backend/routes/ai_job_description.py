@@ -26,8 +26,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from database import get_db
-from models import User, UserRole, JobListing
+from models import UserRole, JobListing
 from utils.dependencies import get_current_user
+from utils.principal_cache import Principal
 from schemas.ai_schemas import (
     JobDescriptionGenerateRequest,
     JobDescriptionGenerateResponse,
@@ -110,7 +111,7 @@ def get_jd_generator_service() -> JobDescriptionGeneratorService:
 )
 async def generate_job_description(
     request: JobDescriptionGenerateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -265,7 +266,7 @@ async def generate_job_description(
 async def improve_job_description(
     job_listing_id: int,
     improvements: list[str],
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -323,7 +324,7 @@ async def improve_job_description(
 @router.post("/extract-keywords")
 async def extract_keywords(
     job_description: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Extract SEO/ATS keywords from a job description
@@ -359,7 +360,7 @@ async def extract_keywords(
 
 @router.get("/status")
 async def get_jd_generator_status(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Get status of Job Description Generator service
@@ -15,6 +15,7 @@ from utils.dependencies import (
     require_manager,
     require_hr_or_manager
 )
+from utils.principal_cache import Principal
 from schemas.ai_performance_schemas import (
     AIReportGenerateRequest,
     AIReportResponse,
@@ -47,10 +48,10 @@ ai_report_service = AIPerformanceReportService()
     summary="Check AI Report Service Health",
     description="Check if AI performance report service and providers are available"
 )
-async def health_check():
+async def health_check(db: Session = Depends(get_db)):
     """
     Check health status of AI performance report service.
-    Returns provider availability status.
+    Returns provider availability status and report cache hit/miss counters.
     """
     try:
         provider_status = ai_report_service.ai_provider.health_check()
@@ -59,6 +60,7 @@ async def health_check():
             service="AI Performance Report",
             status="healthy" if provider_status["available_providers"] > 0 else "degraded",
             ai_provider_status=provider_status,
+            report_cache=ai_report_service.report_cache.stats(db),
             timestamp=datetime.now()
         )
     except Exception as e:
@@ -80,7 +82,7 @@ async def health_check():
 )
 async def generate_individual_report(
     request: AIReportGenerateRequest,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -100,6 +102,8 @@ async def generate_individual_report(
     - Optional period-over-period comparison
     - Custom metrics (HR only with custom template)
     - Weekly auto-save on Tuesdays (txt format)
+    - Cached: identical inputs (metrics, period, template) return the stored
+      report (`from_cache: true`); pass `force_refresh: true` to regenerate
     
     ### Report Includes:
     - Executive Summary
@@ -168,7 +172,8 @@ async def generate_individual_report(
             template=request.template,
             custom_metrics=[m.value for m in request.custom_metrics] if request.custom_metrics else None,
             include_team_comparison=request.include_team_comparison,
-            include_period_comparison=request.include_period_comparison
+            include_period_comparison=request.include_period_comparison,
+            force_refresh=request.force_refresh
         )
         
         return report
@@ -197,13 +202,15 @@ async def generate_my_report(
     template: ReportTemplateEnum = Query(default=ReportTemplateEnum.STANDARD_REVIEW),
     include_team_comparison: bool = Query(default=False),
     include_period_comparison: bool = Query(default=False),
-    current_user: Annotated[User, Depends(get_current_active_user)] = None,
+    force_refresh: bool = Query(default=False, description="Ignore a cached report and regenerate"),
+    current_user: Annotated[Principal, Depends(get_current_active_user)] = None,
     db: Session = Depends(get_db)
 ):
     """
     ## Generate My Performance Report (Shortcut)
     
     Quick endpoint for users to generate their own performance report.
+    Unchanged inputs return the cached report unless `force_refresh=true`.
     
     **Access**: All authenticated users
     """
@@ -217,7 +224,8 @@ async def generate_my_report(
             template=template,
             custom_metrics=None,  # Not allowed in this endpoint
             include_team_comparison=include_team_comparison,
-            include_period_comparison=include_period_comparison
+            include_period_comparison=include_period_comparison,
+            force_refresh=force_refresh
         )
         
         return report
@@ -241,7 +249,7 @@ async def generate_my_report(
 )
 async def generate_team_summary(
     request: TeamReportRequest,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db)
 ):
     """
@@ -322,7 +330,7 @@ async def generate_team_summary(
 )
 async def generate_team_comparative(
     request: TeamReportRequest,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db)
 ):
     """
@@ -397,7 +405,7 @@ async def generate_my_team_report(
     scope: ReportScopeEnum = Query(default=ReportScopeEnum.TEAM_SUMMARY),
     time_period: TimePeriodEnum = Query(default=TimePeriodEnum.LAST_90_DAYS),
     template: ReportTemplateEnum = Query(default=ReportTemplateEnum.STANDARD_REVIEW),
-    current_user: Annotated[User, Depends(require_manager)] = None,
+    current_user: Annotated[Principal, Depends(require_manager)] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -465,7 +473,7 @@ async def generate_my_team_report(
 )
 async def generate_organization_report(
     request: OrganizationReportRequest,
-    current_user: Annotated[User, Depends(require_hr)],
+    current_user: Annotated[Principal, Depends(require_hr)],
     db: Session = Depends(get_db)
 ):
     """
@@ -543,7 +551,7 @@ async def generate_organization_report(
 async def generate_company_wide_report(
     time_period: TimePeriodEnum = Query(default=TimePeriodEnum.CURRENT_QUARTER),
     template: ReportTemplateEnum = Query(default=ReportTemplateEnum.COMPREHENSIVE_REVIEW),
-    current_user: Annotated[User, Depends(require_hr)] = None,
+    current_user: Annotated[Principal, Depends(require_hr)] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -584,7 +592,7 @@ async def generate_company_wide_report(
     description="List all available report templates with descriptions"
 )
 async def get_templates(
-    current_user: Annotated[User, Depends(get_current_active_user)] = None
+    current_user: Annotated[Principal, Depends(get_current_active_user)] = None
 ):
     """
     ## Get Available Report Templates
@@ -652,7 +660,7 @@ async def get_templates(
     description="List all available metrics for custom reports (HR only)"
 )
 async def get_metrics(
-    current_user: Annotated[User, Depends(require_hr)] = None
+    current_user: Annotated[Principal, Depends(require_hr)] = None
 ):
     """
     ## Get Available Metrics (HR Only)
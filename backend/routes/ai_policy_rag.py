@@ -24,8 +24,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from database import get_db
-from models import User
 from utils.dependencies import get_current_user
+from utils.principal_cache import Principal
 from schemas.ai_schemas import (
     PolicyQuestionRequest,
     PolicyAnswerResponse,
@@ -33,7 +33,10 @@ from schemas.ai_schemas import (
     PolicyIndexStatusResponse,
     MessageResponse
 )
-from ai_services.policy_rag_service import PolicyRAGService
+from ai_services.policy_rag_service import (
+    PolicyRAGService,
+    get_policy_rag_service as get_shared_policy_rag_service,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(
@@ -45,25 +48,16 @@ router = APIRouter(
     }
 )
 
-# Singleton instance
-_policy_rag_service = None
-
-
 def get_policy_rag_service() -> PolicyRAGService:
-    """Get or create Policy RAG service instance"""
-    global _policy_rag_service
-    if _policy_rag_service is None:
-        try:
-            _policy_rag_service = PolicyRAGService()
-            # Try to load existing index
-            _policy_rag_service.load_index()
-        except Exception as e:
-            logger.error(f"Failed to initialize Policy RAG Service: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Policy RAG service unavailable: {str(e)}"
-            )
-    return _policy_rag_service
+    """Get the shared Policy RAG service instance"""
+    try:
+        return get_shared_policy_rag_service()
+    except Exception as e:
+        logger.error(f"Failed to initialize Policy RAG Service: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Policy RAG service unavailable: {str(e)}"
+        )
 
 
 @router.post(
@@ -93,7 +87,7 @@ def get_policy_rag_service() -> PolicyRAGService:
 )
 async def ask_policy_question(
     request: PolicyQuestionRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -148,7 +142,7 @@ async def ask_policy_question(
 
 @router.get("/suggestions", response_model=PolicySuggestionsResponse)
 async def get_policy_suggestions(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Get suggested policy questions
@@ -174,7 +168,7 @@ async def get_policy_suggestions(
 
 @router.get("/status", response_model=PolicyIndexStatusResponse)
 async def get_index_status(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Get status of the policy index
@@ -199,14 +193,15 @@ async def get_index_status(
 
 @router.post("/index/rebuild", response_model=MessageResponse)
 async def rebuild_index(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Rebuild the policy index from all uploaded policies
     
-    This endpoint triggers a full re-indexing of all policy documents
-    in the uploads/policies directory. Use this if the index gets corrupted
-    or when policies are manually added to the directory.
+    This endpoint syncs the index with all policy documents in the
+    uploads/policies directory. Files whose content is unchanged since they
+    were indexed are skipped, and documents whose files are gone are removed.
+    Use this when policies are manually added to the directory.
     
     **Access**: All authenticated users (auto-indexes on policy upload)
     **Note**: Usually not needed as policies are auto-indexed when uploaded
@@ -225,6 +220,8 @@ async def rebuild_index(
             total = result.get("total", 0)
             message = f"Successfully indexed {indexed} out of {total} policies"
             
+            if result.get("unchanged"):
+                message += f" ({result['unchanged']} unchanged)"
             if result.get("failed"):
                 message += f". Failed: {', '.join(result['failed'])}"
             
@@ -23,16 +23,16 @@ AI-powered resume analysis with permanent storage and intelligent matching
 """
 
 import logging
-import asyncio
 import json
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, status, BackgroundTasks
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from database import get_db
-from models import User, UserRole, JobListing, Application
+from models import UserRole, JobListing, Application
 from utils.dependencies import get_current_user
+from utils.principal_cache import Principal
 from schemas.ai_schemas import (
     ResumeScreeningRequest,
     ResumeScreeningResultResponse,
@@ -122,7 +122,7 @@ def get_resume_screener_service() -> ResumeScreenerService:
 async def screen_resumes(
     request: ResumeScreeningRequest,
     background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -153,12 +153,16 @@ async def screen_resumes(
     - `job_id` (required): Job listing ID to screen for
     - `resume_ids` (optional): Specific application IDs to screen (screens all if not provided)
     - `job_description` (optional): Override job description from listing
+    - `continue_analysis_id` (optional): Complete an interrupted screening run
+    - `force_refresh` (optional): Re-analyse resumes that were already analysed
+      against this job description
 
     **Response:**
     - Analysis ID for retrieving results later
     - Individual candidate scores and analysis
     - Overall statistics (average score, total analyzed)
     - Top candidate identification
+    - `served_from_cache`: analyses reused instead of calling Gemini
 
     **Error Handling:**
     - Validates job listing exists
@@ -167,7 +171,9 @@ async def screen_resumes(
     - Logs all errors for debugging
 
     **Access**: HR only
-    **Performance**: Typically 3-5 seconds per resume
+    **Performance**: Resumes are extracted and analysed concurrently
+    (`RESUME_SCREENER_MAX_WORKERS` extraction processes,
+    `RESUME_SCREENER_LLM_CONCURRENCY` analyses in flight)
     """
     # Check HR permission
     if current_user.role != UserRole.HR:
@@ -241,12 +247,18 @@ async def screen_resumes(
 
         # Screen resumes
         service = get_resume_screener_service()
-        result = service.screen_resumes(
-            resume_files=resume_files,
-            job_description=job_description,
-            job_id=request.job_id,
-            job_title=job.position,
-        )
+        try:
+            result = await service.screen_resumes(
+                db,
+                resume_files=resume_files,
+                job_description=job_description,
+                job_id=request.job_id,
+                job_title=job.position,
+                continue_analysis_id=request.continue_analysis_id,
+                force_refresh=request.force_refresh,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
         if not result.get("success"):
             raise HTTPException(
@@ -264,6 +276,7 @@ async def screen_resumes(
             average_score=result["average_score"],
             top_candidate=result.get("top_candidate"),
             analysis_id=int(result.get("analysis_id") or "0"),
+            served_from_cache=result["served_from_cache"],
         )
 
     except HTTPException:
@@ -278,7 +291,7 @@ async def screen_resumes(
 @router.get("/results/{analysis_id}", response_model=ResumeScreeningResultResponse)
 async def get_screening_results(
     analysis_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -295,7 +308,7 @@ async def get_screening_results(
 
     try:
         service = get_resume_screener_service()
-        results = service.get_screening_results(analysis_id)
+        results = service.get_screening_results(db, analysis_id)
 
         if not results:
             raise HTTPException(
@@ -326,13 +339,16 @@ async def get_screening_results(
 @router.get("/history")
 async def get_screening_history(
     job_id: Optional[int] = None,
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(50, ge=1, le=200, description="Runs per page"),
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Get history of all resume screening analyses
 
     Optionally filter by job_id to see screening history for a specific job.
+    Newest first; pass `next_cursor` back as `cursor` to get the next page.
 
     **Access**: HR only
     """
@@ -345,10 +361,20 @@ async def get_screening_history(
 
     try:
         service = get_resume_screener_service()
-        history = service.list_screening_history(job_id=job_id)
+        history, next_cursor, total = service.list_screening_history(
+            db, job_id=job_id, limit=limit, cursor=cursor
+        )
 
-        return {"success": True, "total": len(history), "history": history}
+        return {
+            "success": True,
+            "total": total,
+            "history": history,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
 
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving screening history: {e}")
         raise HTTPException(
@@ -359,17 +385,22 @@ async def get_screening_history(
 @router.post("/screen/stream")
 async def screen_resumes_stream(
     request: ResumeScreeningRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Screen resumes with real-time progress updates (Server-Sent Events)
 
     Returns a stream of progress updates as resumes are analyzed.
-    This provides better UX for long-running operations.
+    Resumes are screened concurrently and each result is sent as soon as it
+    finishes (completion order, not application order).
+
+    If the stream is interrupted, send the same request again with
+    `continue_analysis_id` (from the `start` event) to screen only the
+    applications that have no result yet.
 
     **Stream Format**: Server-Sent Events (SSE)
-    - `event: progress` - Progress update (% complete)
+    - `event: start` - Run started (analysis ID, total, already screened)
     - `event: result` - Individual resume analysis complete
     - `event: complete` - All resumes analyzed
     - `event: error` - Error occurred
@@ -436,88 +467,76 @@ async def screen_resumes_stream(
                 yield f"event: error\ndata: {json.dumps({'error': 'No valid resume files found'})}\n\n"
                 return
 
-            total = len(resume_files)
-            yield f"event: start\ndata: {json.dumps({'total': total, 'job_title': job.position})}\n\n"
-
-            # Screen resumes one by one with progress updates
             service = get_resume_screener_service()
-            results = []
-            total_score = 0
-
-            for idx, resume_file in enumerate(resume_files):
-                try:
-                    # Extract and analyze
-                    resume_text = service.extract_resume_text(resume_file["path"])
-                    analysis = service.analyze_resume(
-                        resume_text=resume_text,
-                        job_description=job_description,
-                        candidate_name=resume_file.get("candidate_name", "Unknown"),
-                    )
-
-                    if "application_id" in resume_file:
-                        analysis["application_id"] = resume_file["application_id"]
+            try:
+                run = service.start_screening_run(
+                    db, request.job_id, job.position, request.continue_analysis_id
+                )
+            except ValueError as e:
+                yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+                return
 
-                    results.append(analysis)
-                    total_score += analysis.get("overall_fit_score", 0)
+            pending = service.pending_resume_files(db, run, resume_files)
+            already_screened = len(resume_files) - len(pending)
+            total = len(resume_files)
+            yield f"""event: start\ndata: {
+                json.dumps(
+                    {
+                        "total": total,
+                        "job_title": job.position,
+                        "analysis_id": run.id,
+                        "already_screened": already_screened,
+                    }
+                )
+            }\n\n"""
 
-                    # Send individual result
-                    yield f"""event: result\ndata: {
+            # Results are sent in completion order; finished ones are stored
+            # so a disconnected client can continue with `continue_analysis_id`
+            completed = already_screened
+            served_from_cache = 0
+            async for analysis in service.iter_screening(
+                pending, job_description, request.force_refresh
+            ):
+                service.record_screening_result(db, run, analysis)
+                completed += 1
+                served_from_cache += bool(analysis.get("from_cache"))
+
+                if analysis.get("error"):
+                    yield f"""event: error\ndata: {
                         json.dumps(
                             {
-                                "candidate": analysis["candidate_name"],
-                                "score": analysis["overall_fit_score"],
-                                "progress": int((idx + 1) / total * 100),
+                                "candidate": analysis.get("candidate_name"),
+                                "application_id": analysis.get("application_id"),
+                                "error": analysis["error"],
                             }
                         )
                     }\n\n"""
+                    continue
 
-                    # Small delay for better UX
-                    await asyncio.sleep(0.1)
-
-                except Exception as e:
-                    logger.error(
-                        f"Error screening {resume_file.get('candidate_name')}: {e}"
+                # Send individual result
+                yield f"""event: result\ndata: {
+                    json.dumps(
+                        {
+                            "candidate": analysis["candidate_name"],
+                            "application_id": analysis.get("application_id"),
+                            "score": analysis["overall_fit_score"],
+                            "from_cache": analysis.get("from_cache", False),
+                            "progress": int(completed / total * 100),
+                        }
                     )
-                    yield f"""event: error\ndata: {
-                        json.dumps(
-                            {
-                                "candidate": resume_file.get("candidate_name"),
-                                "error": str(e),
-                            }
-                        )
-                    }\n\n"""
+                }\n\n"""
 
-            # Calculate final stats
-            average_score = total_score / len(results) if results else 0
-            top_candidate = None
-            if results:
-                top_result = max(results, key=lambda x: x.get("overall_fit_score", 0))
-                top_candidate = top_result.get("candidate_name")
-
-            # Save results
-            import uuid
-
-            analysis_id = uuid.uuid4().hex[:12]
-            screening_data = {
-                "analysis_id": analysis_id,
-                "job_id": request.job_id,
-                "job_title": job.position,
-                "timestamp": datetime.utcnow().isoformat(),
-                "total_analyzed": len(results),
-                "average_score": average_score,
-                "top_candidate": top_candidate,
-                "results": results,
-            }
-            service._save_screening_results(analysis_id, screening_data)
+            summary = service.complete_screening_run(db, run)
 
             # Send completion event
             yield f"""event: complete\ndata: {
                 json.dumps(
                     {
-                        "analysis_id": analysis_id,
-                        "total_analyzed": len(results),
-                        "average_score": round(average_score, 2),
-                        "top_candidate": top_candidate,
+                        "analysis_id": run.id,
+                        "total_analyzed": summary["total_analyzed"],
+                        "average_score": round(summary["average_score"], 2),
+                        "top_candidate": summary["top_candidate"],
+                        "served_from_cache": served_from_cache,
                     }
                 )
             }\n\n"""
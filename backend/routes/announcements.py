@@ -5,8 +5,8 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import Annotated, Optional
 from database import get_db
-from models import User
 from utils.dependencies import get_current_active_user, require_hr_or_manager
+from utils.principal_cache import Principal
 from services.announcement_service import AnnouncementService
 from schemas.announcement_schemas import (
     AnnouncementCreate,
@@ -57,7 +57,7 @@ router = APIRouter(prefix="/announcements", tags=["Announcements"])
     }
 )
 async def get_announcements(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
     include_expired: bool = Query(False, description="Include expired announcements"),
     include_inactive: bool = Query(False, description="Include inactive announcements (HR only)"),
@@ -126,7 +126,7 @@ async def get_announcements(
 )
 async def get_announcement(
     announcement_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -168,7 +168,7 @@ async def get_announcement(
 )
 async def create_announcement(
     announcement_data: AnnouncementCreate,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db)
 ):
     """
@@ -224,7 +224,7 @@ async def create_announcement(
 async def update_announcement(
     announcement_id: int,
     update_data: AnnouncementUpdate,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db)
 ):
     """
@@ -284,7 +284,7 @@ async def update_announcement(
 )
 async def delete_announcement(
     announcement_id: int,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db),
     hard_delete: bool = Query(False, description="Permanently delete (default: soft delete)")
 ):
@@ -343,7 +343,7 @@ async def delete_announcement(
     }
 )
 async def get_announcement_stats(
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db)
 ):
     """
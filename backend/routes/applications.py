@@ -1,8 +1,7 @@
 """
 API routes for job applications management
 """
-from fastapi import APIRouter, Depends, Query, UploadFile, File, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Query, UploadFile, File, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -11,8 +10,11 @@ import os
 
 from database import get_db
 from utils.dependencies import get_current_user, get_current_active_user, require_hr
+from utils.principal_cache import Principal
 from models import User, UserRole
 from services.application_service import ApplicationService
+from services.file_digest_service import FileDigestService
+from utils.file_download import file_download_response
 from services.auth_service import AuthService
 from pydantic_models import (
     CreateApplicationRequest,
@@ -58,7 +60,7 @@ async def get_current_user_optional(
 async def create_application(
     request: CreateApplicationRequest,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_current_user_optional)
+    current_user: Optional[Principal] = Depends(get_current_user_optional)
 ):
     """
     Create a new job application
@@ -87,7 +89,7 @@ def get_my_applications(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Get all applications for the current user
@@ -119,7 +121,7 @@ def get_my_applications(
 )
 def get_application_statistics(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_hr)
+    current_user: Principal = Depends(require_hr)
 ):
     """
     Get application statistics
@@ -150,7 +152,7 @@ def get_all_applications(
     source: Optional[str] = Query(None, description="Filter by source"),
     search: Optional[str] = Query(None, description="Search in applicant name/email"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_hr)
+    current_user: Principal = Depends(require_hr)
 ):
     """
     Get all applications (HR only)
@@ -196,7 +198,7 @@ def get_all_applications(
 def get_application(
     application_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Get application by ID
@@ -230,7 +232,7 @@ def update_application_status(
     application_id: int,
     request: UpdateApplicationStatusRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_hr)
+    current_user: Principal = Depends(require_hr)
 ):
     """
     Update application status (HR only)
@@ -261,7 +263,7 @@ async def upload_resume(
     application_id: int,
     file: UploadFile = File(..., description="Resume file (PDF, DOC, DOCX)"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Upload resume for an application
@@ -297,10 +299,11 @@ async def upload_resume(
     summary="Download resume",
     description="Download the resume file for an application"
 )
-def download_resume(
+async def download_resume(
     application_id: int,
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Download resume for an application
@@ -309,7 +312,8 @@ def download_resume(
     - HR: Can download any resume
     - Employees: Can only download their own resumes
     
-    Returns the resume file as a download
+    Returns the resume file as a download. Supports `If-None-Match`
+    (304 when unchanged) and `Range` requests (206).
     """
     # Get application
     application = ApplicationService.get_application_by_id(db, application_id)
@@ -337,8 +341,11 @@ def download_resume(
     
     # Return file
     filename = os.path.basename(application.resume_path)
-    return FileResponse(
+    sha256 = await FileDigestService.get_or_compute(db, application.resume_path)
+    return file_download_response(
+        request,
         path=application.resume_path,
+        sha256=sha256,
         filename=filename,
         media_type='application/octet-stream'
     )
@@ -353,7 +360,7 @@ def download_resume(
 def delete_application(
     application_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Delete an application
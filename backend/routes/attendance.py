@@ -6,8 +6,8 @@ from sqlalchemy.orm import Session
 from typing import Annotated, Optional
 from datetime import date, datetime
 from database import get_db
-from models import User
 from utils.dependencies import get_current_active_user, require_hr, require_manager, require_hr_or_manager
+from utils.principal_cache import Principal
 from services.attendance_service import AttendanceService
 from pydantic_models import (
     PunchInRequest, PunchInResponse, PunchOutRequest, PunchOutResponse,
@@ -24,7 +24,7 @@ router = APIRouter(prefix="/attendance", tags=["Attendance"])
 @router.post("/punch-in", response_model=PunchInResponse, status_code=status.HTTP_200_OK)
 async def punch_in(
     request: PunchInRequest,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -60,7 +60,7 @@ async def punch_in(
 @router.post("/punch-out", response_model=PunchOutResponse, status_code=status.HTTP_200_OK)
 async def punch_out(
     request: PunchOutRequest,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -91,7 +91,7 @@ async def punch_out(
 
 @router.get("/today", response_model=Optional[AttendanceRecordResponse], status_code=status.HTTP_200_OK)
 async def get_today_attendance(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -110,7 +110,7 @@ async def get_today_attendance(
 
 @router.get("/me", response_model=AttendanceHistoryResponse, status_code=status.HTTP_200_OK)
 async def get_my_attendance_history(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
     start_date: Optional[date] = Query(default=None, description="Start date (default: 30 days ago)"),
     end_date: Optional[date] = Query(default=None, description="End date (default: today)"),
@@ -154,7 +154,7 @@ async def get_my_attendance_history(
 
 @router.get("/me/summary", response_model=AttendanceSummaryResponse, status_code=status.HTTP_200_OK)
 async def get_my_attendance_summary(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
     month: Optional[int] = Query(default=None, ge=1, le=12, description="Month (1-12, default: current month)"),
     year: Optional[int] = Query(default=None, ge=2020, le=2100, description="Year (default: current year)")
@@ -183,9 +183,10 @@ async def get_my_attendance_summary(
 
 @router.get("/team", response_model=TeamAttendanceResponse, status_code=status.HTTP_200_OK)
 async def get_team_attendance(
-    current_user: Annotated[User, Depends(require_manager)],
+    current_user: Annotated[Principal, Depends(require_manager)],
     db: Session = Depends(get_db),
-    date: Optional[date] = Query(default=None, description="Target date (default: today)")
+    date: Optional[date] = Query(default=None, description="Target date (default: today)"),
+    include_indirect: bool = Query(default=False, description="Include reports of reports (whole subtree)")
 ):
     """
     **Get team attendance (Manager only)**
@@ -193,6 +194,7 @@ async def get_team_attendance(
     - **Manager View**: See entire team's attendance for a specific date
     - **Default**: Today's attendance
     - **Real-time**: Monitor team presence
+    - **Subtree**: `include_indirect=true` adds everyone below the manager
     
     **Access:** Managers only (must have team members)
     
@@ -210,7 +212,7 @@ async def get_team_attendance(
     target_date = date if date else datetime.now().date()
     
     records, total_members, present, absent, on_leave, wfh = AttendanceService.get_team_attendance(
-        db, current_user.id, target_date
+        db, current_user.id, target_date, include_indirect
     )
     
     return TeamAttendanceResponse(
@@ -226,7 +228,7 @@ async def get_team_attendance(
 
 @router.get("/all", response_model=AllAttendanceResponse, status_code=status.HTTP_200_OK)
 async def get_all_attendance(
-    current_user: Annotated[User, Depends(require_hr)],
+    current_user: Annotated[Principal, Depends(require_hr)],
     db: Session = Depends(get_db),
     date: Optional[date] = Query(default=None, description="Specific date"),
     start_date: Optional[date] = Query(default=None, description="Start date for range"),
@@ -235,7 +237,9 @@ async def get_all_attendance(
     team_id: Optional[int] = Query(default=None, description="Filter by team"),
     status: Optional[str] = Query(default=None, description="Filter by status"),
     page: int = Query(default=1, ge=1, description="Page number"),
-    page_size: int = Query(default=50, ge=1, le=100, description="Records per page")
+    page_size: int = Query(default=50, ge=1, le=100, description="Records per page"),
+    cursor: Optional[str] = Query(default=None, description="Cursor pagination: empty for the first page, then `next_cursor`"),
+    include_total: bool = Query(default=False, description="With `cursor`: also count all matches")
 ):
     """
     **Get all attendance records (HR only)**
@@ -253,6 +257,9 @@ async def get_all_attendance(
     - `team_id`: Filter by team
     - `status`: Filter by attendance status
     - Pagination: page, page_size
+    - Cursor pagination: `cursor` instead of `page` (empty for the first page,
+      then each response's `next_cursor` until it is null); totals only with
+      `include_total`
     
     **Returns:**
     - All attendance records matching filters
@@ -266,7 +273,7 @@ async def get_all_attendance(
     - Identify attendance trends
     - Export data for payroll
     """
-    records, total_count, dept_stats = AttendanceService.get_all_attendance(
+    records, total_count, dept_stats, next_cursor = AttendanceService.get_all_attendance(
         db,
         date,
         start_date,
@@ -275,7 +282,9 @@ async def get_all_attendance(
         team_id,
         status,
         page,
-        page_size
+        page_size,
+        cursor,
+        include_total
     )
     
     # Calculate overall statistics
@@ -291,7 +300,7 @@ async def get_all_attendance(
     on_leave = sum(1 for r in records if r.status == "leave")
     wfh = sum(1 for r in records if r.status == "wfh")
     
-    total_pages = math.ceil(total_count / page_size) if total_count > 0 else 1
+    total_pages = None if total_count is None else (math.ceil(total_count / page_size) if total_count > 0 else 1)
     
     return AllAttendanceResponse(
         date=target_date,
@@ -303,16 +312,17 @@ async def get_all_attendance(
         department_stats=dept_stats,
         records=records,
         total_records=total_count,
-        page=page,
+        page=page if cursor is None else None,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
     )
 
 
 @router.post("/mark", response_model=MarkAttendanceResponse, status_code=status.HTTP_200_OK)
 async def mark_attendance_manually(
     request: MarkAttendanceRequest,
-    current_user: Annotated[User, Depends(require_hr)],
+    current_user: Annotated[Principal, Depends(require_hr)],
     db: Session = Depends(get_db)
 ):
     """
@@ -357,7 +367,7 @@ async def mark_attendance_manually(
 @router.delete("/{attendance_id}", response_model=MessageResponse, status_code=status.HTTP_200_OK)
 async def delete_attendance_record(
     attendance_id: int,
-    current_user: Annotated[User, Depends(require_hr)],
+    current_user: Annotated[Principal, Depends(require_hr)],
     db: Session = Depends(get_db)
 ):
     """
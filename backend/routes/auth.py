@@ -88,7 +88,8 @@ async def require_hr_or_manager(
                 }
             }
         },
-        401: {"description": "Invalid credentials or user inactive"}
+        401: {"description": "Invalid credentials or user inactive"},
+        503: {"description": "Too many logins in progress, retry shortly"}
     }
 )
 async def login(
@@ -119,7 +120,7 @@ async def login(
     - Employee: `john.doe@company.com` / `password123`
     """
     # Authenticate user
-    user = AuthService.authenticate_user(db, login_data.email, login_data.password)
+    user = await AuthService.authenticate_user(db, login_data.email, login_data.password)
     
     if not user:
         raise HTTPException(
@@ -248,7 +249,7 @@ async def change_password(
     ### Response:
     - Success message if password changed
     """
-    success = AuthService.change_password(
+    success = await AuthService.change_password(
         db,
         current_user,
         password_data.current_password,
@@ -299,7 +300,7 @@ async def reset_password(
     ### Response:
     - Success message if password reset
     """
-    success = AuthService.reset_password(
+    success = await AuthService.reset_password(
         db,
         reset_data.employee_id,
         reset_data.new_password
@@ -16,7 +16,9 @@ from utils.dependencies import (
     require_manager,
     require_employee,
 )
+from utils.principal_cache import Principal
 from services.dashboard_service import DashboardService
+from services.hr_dashboard_snapshot import hr_dashboard_snapshot
 from pydantic_models import (
     HRDashboardResponse,
     ManagerDashboardResponse,
@@ -85,7 +87,7 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
     },
 )
 async def get_hr_dashboard(
-    current_user: Annotated[User, Depends(require_hr)], db: Session = Depends(get_db)
+    current_user: Annotated[Principal, Depends(require_hr)], db: Session = Depends(get_db)
 ):
     """
     ## HR Dashboard
@@ -97,10 +99,13 @@ async def get_hr_dashboard(
     - Active job applications
     - Overall statistics
 
+    Served from a snapshot refreshed in the background; `generated_at` says
+    when it was computed.
+
     **Access:** HR only
     """
     try:
-        dashboard_data = DashboardService.get_hr_dashboard_data(db)
+        dashboard_data = await hr_dashboard_snapshot.get()
         return dashboard_data
     except Exception as e:
         raise HTTPException(
@@ -163,7 +168,7 @@ async def get_hr_dashboard(
     },
 )
 async def get_manager_dashboard(
-    current_user: Annotated[User, Depends(require_manager)],
+    current_user: Annotated[Principal, Depends(require_manager)],
     db: Session = Depends(get_db),
 ):
     """
@@ -245,7 +250,7 @@ async def get_manager_dashboard(
     },
 )
 async def get_employee_dashboard(
-    current_user: Annotated[User, Depends(require_employee)],
+    current_user: Annotated[Principal, Depends(require_employee)],
     db: Session = Depends(get_db),
 ):
     """
@@ -283,7 +288,7 @@ async def get_employee_dashboard(
     responses={200: {"description": "Dashboard data retrieved successfully"}},
 )
 async def get_my_dashboard(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
 ):
     """
@@ -299,7 +304,7 @@ async def get_my_dashboard(
     """
     try:
         if current_user.role == UserRole.HR:
-            dashboard_data = DashboardService.get_hr_dashboard_data(db)
+            dashboard_data = await hr_dashboard_snapshot.get()
         elif current_user.role == UserRole.MANAGER:
             dashboard_data = DashboardService.get_manager_dashboard_data(
                 db, current_user
@@ -334,7 +339,7 @@ async def get_my_dashboard(
     description="Get performance metrics for the current user with optional date filtering",
 )
 async def get_my_performance(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
     start_date: Optional[date] = Query(default=None, description="Start date for performance data (optional)"),
     end_date: Optional[date] = Query(default=None, description="End date for performance data (optional, default: today)"),
@@ -385,7 +390,7 @@ async def get_my_performance(
 )
 async def get_employee_performance(
     employee_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
     months: int = Query(
         default=12, ge=1, le=24, description="Number of months of data to retrieve"
@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from typing import Optional, Union
 from database import get_db
-from models import User, UserRole
+from models import UserRole
 from schemas.department_schemas import (
     DepartmentCreate,
     DepartmentUpdate,
@@ -17,6 +17,7 @@ from schemas.department_schemas import (
 )
 from services.department_service import DepartmentService
 from utils.dependencies import get_current_user, require_hr, require_hr_or_manager
+from utils.principal_cache import Principal
 
 router = APIRouter(prefix="/departments", tags=["Departments"])
 
@@ -24,7 +25,7 @@ router = APIRouter(prefix="/departments", tags=["Departments"])
 @router.post("", response_model=DepartmentResponse, status_code=status.HTTP_201_CREATED)
 async def create_department(
     department_data: DepartmentCreate,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -49,7 +50,7 @@ async def get_departments(
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     include_inactive: bool = Query(False, description="Include inactive departments"),
     search: Optional[str] = Query(None, description="Search by name or code"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -83,7 +84,7 @@ async def get_departments(
 
 @router.get("/stats", response_model=DepartmentStatsResponse)
 async def get_department_stats(
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -108,7 +109,7 @@ async def get_department_stats(
 async def get_department(
     department_id: int,
     include_teams: bool = Query(False, description="Include team details"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -131,7 +132,7 @@ async def get_department(
 async def update_department(
     department_id: int,
     department_data: DepartmentUpdate,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -157,7 +158,7 @@ async def update_department(
 @router.delete("/{department_id}", response_model=MessageResponse)
 async def delete_department(
     department_id: int,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
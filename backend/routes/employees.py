@@ -5,7 +5,6 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from typing import Optional
 from database import get_db
-from models import User
 from schemas.employee_schemas import (
     EmployeeCreate,
     EmployeeUpdate,
@@ -16,6 +15,7 @@ from schemas.employee_schemas import (
 )
 from services.employee_service import EmployeeService
 from utils.dependencies import require_hr
+from utils.principal_cache import Principal
 import math
 
 router = APIRouter(prefix="/employees", tags=["Employee Management"])
@@ -24,7 +24,7 @@ router = APIRouter(prefix="/employees", tags=["Employee Management"])
 @router.post("", response_model=EmployeeResponse, status_code=status.HTTP_201_CREATED)
 async def create_employee(
     employee_data: EmployeeCreate,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -58,7 +58,7 @@ async def create_employee(
     
     **Returns**: Created employee details
     """
-    return EmployeeService.create_employee(db, employee_data)
+    return await EmployeeService.create_employee(db, employee_data)
 
 
 @router.get("", response_model=EmployeeListResponse)
@@ -70,7 +70,9 @@ async def get_employees(
     team_id: Optional[int] = Query(None, description="Filter by team"),
     role: Optional[str] = Query(None, description="Filter by role (employee/manager/hr)"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    current_user: User = Depends(require_hr),
+    cursor: Optional[str] = Query(None, description="Cursor pagination: empty for the first page, then `next_cursor`"),
+    include_total: bool = Query(False, description="With `cursor`: also count all matches"),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -86,6 +88,9 @@ async def get_employees(
     - `team_id`: Filter by team
     - `role`: Filter by role (employee/manager/hr)
     - `is_active`: Filter by active status (true/false)
+    - `cursor`: Use cursor pagination instead of `page` (pass it empty for
+      the first page, then each response's `next_cursor` until it is null)
+    - `include_total`: With `cursor`, also return `total`/`total_pages`
     
     **Returns**: Paginated list of employees (summary view)
     
@@ -96,7 +101,7 @@ async def get_employees(
     """
     skip = (page - 1) * page_size
     
-    employees, total = EmployeeService.get_all_employees(
+    employees, total, next_cursor = EmployeeService.get_all_employees(
         db=db,
         skip=skip,
         limit=page_size,
@@ -104,23 +109,26 @@ async def get_employees(
         department_id=department_id,
         team_id=team_id,
         role=role,
-        is_active=is_active
+        is_active=is_active,
+        cursor=cursor,
+        include_total=include_total
     )
     
-    total_pages = math.ceil(total / page_size) if total > 0 else 1
+    total_pages = None if total is None else (math.ceil(total / page_size) if total > 0 else 1)
     
     return EmployeeListResponse(
         employees=employees,
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/stats", response_model=EmployeeStatsResponse)
 async def get_employee_stats(
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -145,7 +153,7 @@ async def get_employee_stats(
 @router.get("/{employee_id}", response_model=EmployeeResponse)
 async def get_employee(
     employee_id: int,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -177,7 +185,7 @@ async def get_employee(
 async def update_employee(
     employee_id: int,
     employee_data: EmployeeUpdate,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -214,7 +222,7 @@ async def update_employee(
 @router.delete("/{employee_id}", response_model=MessageResponse)
 async def deactivate_employee(
     employee_id: int,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -6,8 +6,8 @@ from sqlalchemy.orm import Session
 from typing import Annotated, Optional
 from datetime import datetime
 from database import get_db
-from models import User
 from utils.dependencies import get_current_active_user, require_hr_or_manager, require_hr
+from utils.principal_cache import Principal
 from services.feedback_service import FeedbackService
 from schemas.feedback_schemas import (
     FeedbackCreate,
@@ -34,7 +34,7 @@ async def get_my_feedback(
     start_date: Optional[datetime] = Query(None, description="Filter by start date"),
     end_date: Optional[datetime] = Query(None, description="Filter by end date"),
     feedback_type: Optional[str] = Query(None, description="Filter by type"),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -78,7 +78,7 @@ async def get_employee_feedback(
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     feedback_type: Optional[str] = Query(None),
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -115,7 +115,7 @@ async def get_employee_feedback(
 async def get_feedback_given(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -151,7 +151,9 @@ async def get_all_feedback(
     employee_id: Optional[int] = Query(None, description="Filter by employee"),
     given_by: Optional[int] = Query(None, description="Filter by giver"),
     feedback_type: Optional[str] = Query(None, description="Filter by type"),
-    current_user: User = Depends(require_hr),
+    cursor: Optional[str] = Query(None, description="Cursor pagination: empty for the first page, then `next_cursor`"),
+    include_total: bool = Query(False, description="With `cursor`: also count all matches"),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -163,22 +165,29 @@ async def get_all_feedback(
     - `employee_id`: Show feedback for specific employee
     - `given_by`: Show feedback given by specific user
     - `feedback_type`: Filter by feedback type
+    
+    **Pagination**: `skip`/`limit`, or `cursor` (pass it empty for the first
+    page, then each response's `next_cursor` until it is null; `total` only
+    with `include_total`)
     """
     
-    feedback, total = FeedbackService.get_all_feedback(
+    feedback, total, next_cursor = FeedbackService.get_all_feedback(
         db=db,
         skip=skip,
         limit=limit,
         employee_id=employee_id,
         given_by=given_by,
-        feedback_type=feedback_type
+        feedback_type=feedback_type,
+        cursor=cursor,
+        include_total=include_total
     )
     
     return FeedbackListResponse(
         feedback=feedback,
         total=total,
-        page=skip // limit + 1,
-        page_size=limit
+        page=skip // limit + 1 if cursor is None else None,
+        page_size=limit,
+        next_cursor=next_cursor
     )
 
 
@@ -191,7 +200,7 @@ async def get_all_feedback(
 )
 async def get_feedback(
     feedback_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -215,7 +224,7 @@ async def get_feedback(
 )
 async def create_feedback(
     feedback_data: FeedbackCreate,
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -249,7 +258,7 @@ async def create_feedback(
 async def update_feedback(
     feedback_id: int,
     feedback_data: FeedbackUpdate,
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -274,7 +283,7 @@ async def update_feedback(
 )
 async def delete_feedback(
     feedback_id: int,
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -300,7 +309,7 @@ async def delete_feedback(
 )
 async def get_feedback_stats(
     employee_id: Optional[int] = Query(None, description="Stats for specific employee"),
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -8,8 +8,9 @@ from typing import Annotated, Optional
 from datetime import datetime, date
 
 from database import get_db
-from models import User, UserRole
+from models import UserRole
 from utils.dependencies import get_current_active_user, require_manager, require_hr_or_manager
+from utils.principal_cache import Principal
 from services.goal_service import GoalService
 from schemas.goal_schemas import (
     GoalCreate,
@@ -50,7 +51,7 @@ router = APIRouter(prefix="/goals", tags=["Goals & Task Management"])
 )
 async def create_goal(
     goal_data: GoalCreate,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -95,7 +96,7 @@ async def get_my_goals(
     priority: Optional[GoalPriorityEnum] = Query(None, description="Filter by priority"),
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     is_overdue: Optional[bool] = Query(None, description="Filter overdue goals only"),
-    current_user: Annotated[User, Depends(get_current_active_user)] = None,
+    current_user: Annotated[Principal, Depends(get_current_active_user)] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -153,7 +154,7 @@ async def get_team_goals(
     status: Optional[GoalStatusEnum] = Query(None),
     priority: Optional[GoalPriorityEnum] = Query(None),
     is_overdue: Optional[bool] = Query(None),
-    current_user: Annotated[User, Depends(require_manager)] = None,
+    current_user: Annotated[Principal, Depends(require_manager)] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -205,7 +206,7 @@ async def get_team_goals(
 )
 async def get_categories(
     include_inactive: bool = Query(False, description="Include inactive categories"),
-    current_user: Annotated[User, Depends(get_current_active_user)] = None,
+    current_user: Annotated[Principal, Depends(get_current_active_user)] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -232,7 +233,7 @@ async def get_categories(
 )
 async def get_templates(
     include_inactive: bool = Query(False, description="Include inactive templates"),
-    current_user: Annotated[User, Depends(get_current_active_user)] = None,
+    current_user: Annotated[Principal, Depends(get_current_active_user)] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -262,7 +263,7 @@ async def get_templates(
 )
 async def get_goal(
     goal_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -294,7 +295,7 @@ async def get_goal(
 async def update_goal(
     goal_id: int,
     update_data: GoalUpdate,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -332,7 +333,7 @@ async def update_goal(
 async def update_goal_status(
     goal_id: int,
     status_data: GoalStatusUpdate,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -365,7 +366,7 @@ async def update_goal_status(
 )
 async def delete_goal(
     goal_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -395,7 +396,7 @@ async def delete_goal(
 async def create_checkpoint(
     goal_id: int,
     checkpoint_data: CheckpointCreate,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -424,7 +425,7 @@ async def create_checkpoint(
 async def update_checkpoint(
     checkpoint_id: int,
     update_data: CheckpointUpdate,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -452,7 +453,7 @@ async def update_checkpoint(
 )
 async def delete_checkpoint(
     checkpoint_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -478,7 +479,7 @@ async def delete_checkpoint(
 async def add_comment(
     goal_id: int,
     comment_data: GoalCommentCreate,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -513,7 +514,7 @@ async def add_comment(
 )
 async def get_comments(
     goal_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -538,7 +539,7 @@ async def get_comments(
     description="Get comprehensive statistics about my goals"
 )
 async def get_my_goal_stats(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -569,7 +570,7 @@ async def get_my_goal_stats(
     description="Get team-wide goal statistics (Manager only)"
 )
 async def get_team_goal_stats(
-    current_user: Annotated[User, Depends(require_manager)],
+    current_user: Annotated[Principal, Depends(require_manager)],
     db: Session = Depends(get_db)
 ):
     """
@@ -606,7 +607,7 @@ async def get_team_goal_stats(
 )
 async def create_category(
     category_data: GoalCategoryCreate,
-    current_user: Annotated[User, Depends(require_manager)],
+    current_user: Annotated[Principal, Depends(require_manager)],
     db: Session = Depends(get_db)
 ):
     """
@@ -643,7 +644,7 @@ async def create_category(
 async def update_category(
     category_id: int,
     update_data: GoalCategoryUpdate,
-    current_user: Annotated[User, Depends(require_manager)],
+    current_user: Annotated[Principal, Depends(require_manager)],
     db: Session = Depends(get_db)
 ):
     """
@@ -673,7 +674,7 @@ async def update_category(
 )
 async def create_template(
     template_data: GoalTemplateCreate,
-    current_user: Annotated[User, Depends(require_manager)],
+    current_user: Annotated[Principal, Depends(require_manager)],
     db: Session = Depends(get_db)
 ):
     """
@@ -709,7 +710,7 @@ async def create_template(
 )
 async def get_template(
     template_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
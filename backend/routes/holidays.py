@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from typing import Optional
 from database import get_db
-from models import User, UserRole
+from models import UserRole
 from schemas.holiday_schemas import (
     HolidayCreate,
     HolidayUpdate,
@@ -16,6 +16,7 @@ from schemas.holiday_schemas import (
 )
 from services.holiday_service import HolidayService
 from utils.dependencies import get_current_user, require_hr, require_hr_or_manager
+from utils.principal_cache import Principal
 
 router = APIRouter(prefix="/holidays", tags=["Holidays"])
 
@@ -23,7 +24,7 @@ router = APIRouter(prefix="/holidays", tags=["Holidays"])
 @router.post("", response_model=HolidayResponse, status_code=status.HTTP_201_CREATED)
 async def create_holiday(
     holiday_data: HolidayCreate,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -50,7 +51,7 @@ async def get_holidays(
     holiday_type: Optional[str] = Query(None, description="Filter by type"),
     year: Optional[int] = Query(None, description="Filter by year"),
     upcoming_only: bool = Query(False, description="Show only upcoming holidays"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -92,7 +93,7 @@ async def get_holidays(
 async def get_upcoming_holidays(
     days_ahead: int = Query(90, ge=1, le=365, description="Days to look ahead"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -113,7 +114,7 @@ async def get_upcoming_holidays(
 
 @router.get("/stats", response_model=HolidayStatsResponse)
 async def get_holiday_stats(
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -136,7 +137,7 @@ async def get_holiday_stats(
 @router.get("/{holiday_id}", response_model=HolidayResponse)
 async def get_holiday(
     holiday_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -156,7 +157,7 @@ async def get_holiday(
 async def update_holiday(
     holiday_id: int,
     holiday_data: HolidayUpdate,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -177,7 +178,7 @@ async def update_holiday(
 @router.delete("/{holiday_id}", response_model=MessageResponse)
 async def delete_holiday(
     holiday_id: int,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -5,8 +5,8 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import Annotated, Optional
 from database import get_db
-from models import User
 from utils.dependencies import get_current_active_user, require_hr
+from utils.principal_cache import Principal
 from services.job_service import JobService
 from pydantic_models import (
     CreateJobRequest, UpdateJobRequest, JobListingResponse,
@@ -22,7 +22,7 @@ router = APIRouter(prefix="/jobs", tags=["Job Listings"])
              dependencies=[Depends(require_hr)])
 async def create_job(
     request: CreateJobRequest,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -47,7 +47,7 @@ async def create_job(
 
 @router.get("", response_model=JobListingsResponse, status_code=status.HTTP_200_OK)
 async def get_all_jobs(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
     department_id: Optional[int] = Query(default=None, description="Filter by department"),
     location: Optional[str] = Query(default=None, description="Filter by location"),
@@ -98,7 +98,7 @@ async def get_all_jobs(
 @router.get("/statistics", response_model=JobStatisticsResponse, status_code=status.HTTP_200_OK,
             dependencies=[Depends(require_hr)])
 async def get_job_statistics(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -119,7 +119,7 @@ async def get_job_statistics(
 @router.get("/{job_id}", response_model=JobListingResponse, status_code=status.HTTP_200_OK)
 async def get_job_by_id(
     job_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -141,7 +141,7 @@ async def get_job_by_id(
 async def update_job(
     job_id: int,
     request: UpdateJobRequest,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -167,7 +167,7 @@ async def update_job(
                dependencies=[Depends(require_hr)])
 async def delete_job(
     job_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -192,7 +192,7 @@ async def delete_job(
             dependencies=[Depends(require_hr)])
 async def get_job_applications(
     job_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -5,7 +5,6 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from typing import Optional
 from database import get_db
-from models import User
 from schemas.leave_schemas import (
     LeaveRequestCreate,
     LeaveRequestUpdate,
@@ -18,6 +17,7 @@ from schemas.leave_schemas import (
 )
 from services.leave_service import LeaveService
 from utils.dependencies import get_current_active_user, require_hr_or_manager
+from utils.principal_cache import Principal
 import math
 
 router = APIRouter(prefix="/leaves", tags=["Leave Management"])
@@ -26,7 +26,7 @@ router = APIRouter(prefix="/leaves", tags=["Leave Management"])
 @router.post("", response_model=LeaveRequestResponse, status_code=status.HTTP_201_CREATED)
 async def apply_for_leave(
     leave_data: LeaveRequestCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -59,7 +59,7 @@ async def get_my_leave_requests(
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     status: Optional[str] = Query(None, description="Filter by status (pending/approved/rejected)"),
     leave_type: Optional[str] = Query(None, description="Filter by leave type"),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -102,7 +102,8 @@ async def get_team_leave_requests(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    current_user: User = Depends(require_hr_or_manager),
+    include_indirect: bool = Query(False, description="Include reports of reports (whole subtree)"),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -114,6 +115,7 @@ async def get_team_leave_requests(
     - `page`: Page number (default: 1)
     - `page_size`: Items per page (default: 50, max: 100)
     - `status`: Filter by status (pending/approved/rejected)
+    - `include_indirect`: Also include indirect reports (default: false)
     
     **Returns**: Paginated list of team leave requests
     
@@ -126,7 +128,8 @@ async def get_team_leave_requests(
         manager_id=current_user.id,
         skip=skip,
         limit=page_size,
-        status_filter=status
+        status_filter=status,
+        include_indirect=include_indirect
     )
     
     total_pages = math.ceil(total / page_size) if total > 0 else 1
@@ -147,7 +150,9 @@ async def get_all_leave_requests(
     status: Optional[str] = Query(None, description="Filter by status"),
     leave_type: Optional[str] = Query(None, description="Filter by leave type"),
     employee_id: Optional[int] = Query(None, description="Filter by employee ID"),
-    current_user: User = Depends(require_hr_or_manager),
+    cursor: Optional[str] = Query(None, description="Cursor pagination: empty for the first page, then `next_cursor`"),
+    include_total: bool = Query(False, description="With `cursor`: also count all matches"),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -161,6 +166,9 @@ async def get_all_leave_requests(
     - `status`: Filter by status
     - `leave_type`: Filter by leave type
     - `employee_id`: Filter by employee ID
+    - `cursor`: Use cursor pagination instead of `page` (pass it empty for
+      the first page, then each response's `next_cursor` until it is null)
+    - `include_total`: With `cursor`, also return `total`/`total_pages`
     
     **Returns**: Paginated list of all leave requests
     
@@ -168,29 +176,32 @@ async def get_all_leave_requests(
     """
     skip = (page - 1) * page_size
     
-    leaves, total = LeaveService.get_all_leave_requests(
+    leaves, total, next_cursor = LeaveService.get_all_leave_requests(
         db=db,
         skip=skip,
         limit=page_size,
         status_filter=status,
         leave_type_filter=leave_type,
-        employee_id_filter=employee_id
+        employee_id_filter=employee_id,
+        cursor=cursor,
+        include_total=include_total
     )
     
-    total_pages = math.ceil(total / page_size) if total > 0 else 1
+    total_pages = None if total is None else (math.ceil(total / page_size) if total > 0 else 1)
     
     return LeaveListResponse(
         leaves=leaves,
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/balance/me", response_model=LeaveBalanceResponse)
 async def get_my_leave_balance(
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -212,7 +223,7 @@ async def get_my_leave_balance(
 @router.get("/balance/{employee_id}", response_model=LeaveBalanceResponse)
 async def get_employee_leave_balance(
     employee_id: int,
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -231,7 +242,7 @@ async def get_employee_leave_balance(
 @router.get("/{leave_id}", response_model=LeaveRequestResponse)
 async def get_leave_request(
     leave_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -251,7 +262,7 @@ async def get_leave_request(
 async def update_leave_request(
     leave_id: int,
     leave_data: LeaveRequestUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -280,7 +291,7 @@ async def update_leave_request(
 async def update_leave_status(
     leave_id: int,
     status_data: LeaveStatusUpdate,
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -308,7 +319,7 @@ async def update_leave_status(
 @router.delete("/{leave_id}", response_model=MessageResponse)
 async def cancel_leave_request(
     leave_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -331,7 +342,7 @@ async def cancel_leave_request(
 
 @router.get("/stats/summary", response_model=LeaveStatsResponse)
 async def get_leave_stats(
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
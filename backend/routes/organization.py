@@ -5,7 +5,6 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 from database import get_db
-from models import User
 from schemas.organization_schemas import (
     ManagerChainResponse,
     TeamHierarchyResponse,
@@ -16,13 +15,14 @@ from schemas.organization_schemas import (
 )
 from services.organization_service import OrganizationService
 from utils.dependencies import get_current_user
+from utils.principal_cache import Principal
 
 router = APIRouter(prefix="/organization", tags=["Organization/Hierarchy"])
 
 
 @router.get("/hierarchy", response_model=OrganizationHierarchyResponse)
 async def get_full_organization_hierarchy(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -44,7 +44,7 @@ async def get_full_organization_hierarchy(
 @router.get("/hierarchy/department/{department_id}", response_model=DepartmentHierarchyResponse)
 async def get_department_hierarchy(
     department_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -69,7 +69,7 @@ async def get_department_hierarchy(
 @router.get("/hierarchy/team/{team_id}", response_model=TeamHierarchyResponse)
 async def get_team_hierarchy(
     team_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -92,7 +92,7 @@ async def get_team_hierarchy(
 
 @router.get("/manager-chain/me", response_model=ManagerChainResponse)
 async def get_my_manager_chain(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -114,7 +114,7 @@ async def get_my_manager_chain(
 @router.get("/manager-chain/{user_id}", response_model=ManagerChainResponse)
 async def get_user_manager_chain(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -138,7 +138,7 @@ async def get_user_manager_chain(
 
 @router.get("/reporting-structure/me", response_model=ReportingStructureResponse)
 async def get_my_reporting_structure(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -161,7 +161,7 @@ async def get_my_reporting_structure(
 @router.get("/reporting-structure/{user_id}", response_model=ReportingStructureResponse)
 async def get_user_reporting_structure(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -186,7 +186,7 @@ async def get_user_reporting_structure(
 @router.get("/org-chart", response_model=OrgChartNode)
 async def get_organization_chart(
     root_user_id: Optional[int] = Query(None, description="Root user ID (defaults to CEO)"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
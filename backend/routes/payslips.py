@@ -1,20 +1,25 @@
 """
 Payslips routes - API endpoints for payslip management
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query, File, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Query, File, UploadFile, Request
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
+import json
 from typing import Annotated, Optional, List
 from database import get_db
-from models import User
 from utils.dependencies import get_current_active_user, require_hr
+from utils.principal_cache import Principal
 from services.payslip_service import PayslipService
+from services.file_digest_service import FileDigestService
+from utils.file_download import file_download_response
 from schemas.payslip_schemas import (
     PayslipCreate,
     PayslipUpdate,
     PayslipResponse,
     PayslipListResponse,
     PayslipGenerateRequest,
+    PayslipBulkGenerateRequest,
+    PayslipBulkGenerateResponse,
     PayslipStatsResponse,
     PayslipUploadResponse,
     MessageResponse
@@ -35,7 +40,7 @@ async def get_my_payslips(
     limit: int = Query(100, ge=1, le=500, description="Page size"),
     month: Optional[int] = Query(None, ge=1, le=12, description="Filter by month"),
     year: Optional[int] = Query(None, ge=2020, description="Filter by year"),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -76,7 +81,7 @@ async def get_employee_payslips(
     limit: int = Query(100, ge=1, le=500),
     month: Optional[int] = Query(None, ge=1, le=12),
     year: Optional[int] = Query(None, ge=2020),
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -115,7 +120,7 @@ async def get_all_payslips(
     employee_id: Optional[int] = Query(None, description="Filter by employee"),
     month: Optional[int] = Query(None, ge=1, le=12, description="Filter by month"),
     year: Optional[int] = Query(None, ge=2020, description="Filter by year"),
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -154,7 +159,7 @@ async def get_all_payslips(
 )
 async def get_payslip(
     payslip_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -178,7 +183,7 @@ async def get_payslip(
 )
 async def create_payslip(
     payslip_data: PayslipCreate,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -212,7 +217,7 @@ async def create_payslip(
 )
 async def generate_monthly_payslips(
     generate_data: PayslipGenerateRequest,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -236,6 +241,71 @@ async def generate_monthly_payslips(
     )
 
 
+@router.post(
+    "/generate/bulk",
+    response_model=PayslipBulkGenerateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Bulk Generate Monthly Payslips",
+    description="Set-based month-end payslip generation returning a summary (HR only)"
+)
+async def generate_monthly_payslips_bulk(
+    generate_data: PayslipBulkGenerateRequest,
+    stream: bool = Query(False, description="Stream NDJSON progress events per committed chunk"),
+    include_rows: bool = Query(False, description="Include created payslip rows in streamed chunk events"),
+    current_user: Principal = Depends(require_hr),
+    db: Session = Depends(get_db)
+):
+    """
+    Generate payslips for all active employees for a month in bulk.
+    
+    **Access**: HR only
+    
+    **Process**:
+    - Finds employees without a payslip for the period with a single anti-join
+    - Inserts payslips in chunks of `chunk_size`, committing each chunk
+    - Same salary rules as `/payslips/generate` (15% tax, 12% PF)
+    - Safe to re-run: existing payslips are skipped
+    
+    **Returns**: Run summary (counts, payout totals, duration). With `stream=true`
+    the response is `application/x-ndjson`: one `chunk` event per committed chunk
+    and a final `summary` event.
+    
+    **Streaming errors**: the anti-join runs before the stream starts, so setup
+    failures still return a 500. Once streaming has begun the `201` status is
+    already sent; an insert failure is then reported as a final
+    `{"type": "error", "detail": ...}` line (chunks committed before it are kept
+    and a re-run picks up the rest).
+    """
+    if not stream:
+        return PayslipService.generate_monthly_payslips_bulk(
+            db=db,
+            generate_data=generate_data,
+            issued_by_user_id=current_user.id
+        )
+    
+    events = PayslipService.iter_monthly_payslips_bulk(
+        db=db,
+        generate_data=generate_data,
+        issued_by_user_id=current_user.id,
+        include_rows=include_rows
+    )
+    
+    def event_stream():
+        try:
+            for event in events:
+                if event["type"] == "summary":
+                    event = {"type": "summary", "summary": event["summary"].model_dump(mode="json")}
+                yield json.dumps(event) + "\n"
+        except HTTPException as e:
+            yield json.dumps({"type": "error", "detail": e.detail}) + "\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/x-ndjson"
+    )
+
+
 @router.put(
     "/{payslip_id}",
     response_model=PayslipResponse,
@@ -246,7 +316,7 @@ async def generate_monthly_payslips(
 async def update_payslip(
     payslip_id: int,
     payslip_data: PayslipUpdate,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -272,7 +342,7 @@ async def update_payslip(
 )
 async def delete_payslip(
     payslip_id: int,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -294,7 +364,7 @@ async def delete_payslip(
 async def upload_payslip_document(
     payslip_id: int,
     file: UploadFile = File(..., description="Payslip PDF file"),
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -325,7 +395,8 @@ async def upload_payslip_document(
 )
 async def download_payslip_document(
     payslip_id: int,
-    current_user: User = Depends(get_current_active_user),
+    request: Request,
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -333,7 +404,8 @@ async def download_payslip_document(
     
     **Access**: Employee (own payslips) or HR (all payslips)
     
-    **Returns**: PDF file with proper content-type
+    **Returns**: PDF file with proper content-type. Supports `If-None-Match`
+    (304 when unchanged) and `Range` requests (206).
     """
     file_path = PayslipService.get_payslip_document_path(
         db=db,
@@ -341,8 +413,11 @@ async def download_payslip_document(
         current_user=current_user
     )
     
-    return FileResponse(
+    sha256 = await FileDigestService.get_or_compute(db, file_path)
+    return file_download_response(
+        request,
         path=file_path,
+        sha256=sha256,
         media_type="application/pdf",
         filename=f"payslip_{payslip_id}.pdf"
     )
@@ -356,7 +431,7 @@ async def download_payslip_document(
     description="Get payslip statistics (HR only)"
 )
 async def get_payslip_stats(
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -1,7 +1,7 @@
 """
 Policies routes - API endpoints for policies management with file upload/download
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, Request
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from typing import Annotated, Optional
@@ -9,7 +9,10 @@ from datetime import date
 from database import get_db
 from models import User
 from utils.dependencies import get_current_active_user, require_hr_or_manager
+from utils.principal_cache import Principal
 from services.policy_service import PolicyService
+from services.file_digest_service import FileDigestService
+from utils.file_download import file_download_response
 from schemas.policy_schemas import (
     PolicyCreate,
     PolicyUpdate,
@@ -37,7 +40,7 @@ router = APIRouter(prefix="/policies", tags=["Policies"])
     }
 )
 async def get_policies(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
     include_inactive: bool = Query(False, description="Include inactive policies (HR only)"),
     category: Optional[str] = Query(None, description="Filter by category"),
@@ -103,7 +106,7 @@ async def get_policies(
 )
 async def get_policy(
     policy_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -145,7 +148,7 @@ async def get_policy(
 )
 async def create_policy(
     policy_data: PolicyCreate,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db)
 ):
     """
@@ -202,7 +205,7 @@ async def create_policy(
 async def upload_policy_document(
     policy_id: int,
     file: UploadFile = File(..., description="PDF document to upload"),
-    current_user: Annotated[User, Depends(require_hr_or_manager)] = None,
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -260,13 +263,16 @@ async def upload_policy_document(
     description="Download the PDF document for a policy",
     responses={
         200: {"description": "Document downloaded successfully"},
+        206: {"description": "Requested byte range of the document"},
+        304: {"description": "Document unchanged (If-None-Match matched the ETag)"},
         404: {"description": "Policy or document not found"},
         401: {"description": "Not authenticated"}
     }
 )
 async def download_policy_document(
     policy_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    request: Request,
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -286,6 +292,7 @@ async def download_policy_document(
     - File is returned as application/pdf
     - Filename is preserved from original upload
     - Returns 404 if policy has no document attached
+    - Sends an ETag; `If-None-Match` returns 304 and `Range` returns part of the file
     """
     # Get document path
     file_path = PolicyService.get_policy_document_path(db, policy_id)
@@ -300,8 +307,11 @@ async def download_policy_document(
     filename = os.path.basename(file_path)
     
     # Return file
-    return FileResponse(
+    sha256 = await FileDigestService.get_or_compute(db, file_path)
+    return file_download_response(
+        request,
         path=file_path,
+        sha256=sha256,
         media_type="application/pdf",
         filename=filename
     )
@@ -324,7 +334,7 @@ async def download_policy_document(
 async def update_policy(
     policy_id: int,
     update_data: PolicyUpdate,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db)
 ):
     """
@@ -359,7 +369,7 @@ async def update_policy(
     - To update the PDF document, use PUT /{policy_id}/upload
     """
     # Update policy
-    policy = PolicyService.update_policy(
+    policy = await PolicyService.update_policy(
         db=db,
         policy_id=policy_id,
         update_data=update_data
@@ -389,7 +399,7 @@ async def update_policy(
 )
 async def delete_policy(
     policy_id: int,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db),
     hard_delete: bool = Query(False, description="Permanently delete (default: soft delete)")
 ):
@@ -418,7 +428,7 @@ async def delete_policy(
     - Hard delete also removes all acknowledgment records
     """
     # Delete policy
-    success = PolicyService.delete_policy(
+    success = await PolicyService.delete_policy(
         db=db,
         policy_id=policy_id,
         soft_delete=not hard_delete
@@ -450,7 +460,7 @@ async def delete_policy(
 )
 async def acknowledge_policy(
     policy_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db)
 ):
     """
@@ -513,7 +523,7 @@ async def acknowledge_policy(
 )
 async def get_policy_acknowledgments(
     policy_id: int,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0, description="Pagination offset"),
     limit: int = Query(100, ge=1, le=500, description="Maximum results")
@@ -586,7 +596,7 @@ async def get_policy_acknowledgments(
     }
 )
 async def get_policy_stats(
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db)
 ):
     """
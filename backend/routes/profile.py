@@ -3,7 +3,10 @@ Profile API Routes
 Endpoints for user profile management, documents, and team information
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+import mimetypes
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Request
 from sqlalchemy.orm import Session
 from typing import Annotated
 
@@ -14,7 +17,10 @@ from utils.dependencies import (
     require_manager,
     require_hr_or_manager,
 )
+from utils.principal_cache import Principal
 from services.profile_service import ProfileService
+from services.file_digest_service import FileDigestService
+from utils.file_download import file_download_response
 from pydantic_models import (
     ProfileResponse,
     UpdateProfileRequest,
@@ -66,7 +72,7 @@ router = APIRouter(prefix="/profile", tags=["Profile"])
     },
 )
 async def get_my_profile(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
 ):
     """
@@ -106,7 +112,7 @@ async def get_my_profile(
     },
 )
 async def get_my_documents(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
 ):
     """
@@ -137,7 +143,7 @@ async def get_my_documents(
     },
 )
 async def get_my_team(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
 ):
     """
@@ -172,7 +178,7 @@ async def get_my_team(
 )
 async def get_user_profile(
     user_id: int,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db),
 ):
     """
@@ -223,7 +229,7 @@ async def get_user_profile(
 )
 async def update_my_profile(
     profile_data: UpdateProfileRequest,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
 ):
     """
@@ -273,7 +279,7 @@ async def update_my_profile(
 )
 async def upload_profile_image(
     file: UploadFile = File(..., description="Profile image file (JPG, PNG, GIF)"),
-    current_user: Annotated[User, Depends(get_current_active_user)] = None,
+    current_user: Annotated[Principal, Depends(get_current_active_user)] = None,
     db: Session = Depends(get_db),
 ):
     """
@@ -291,7 +297,7 @@ async def upload_profile_image(
 
     **Use Case:** User updating their profile picture
     """
-    result = ProfileService.upload_profile_image(db, current_user.id, file)
+    result = await ProfileService.upload_profile_image(db, current_user.id, file)
     return result
 
 
@@ -310,7 +316,7 @@ async def upload_profile_image(
 async def upload_document(
     document_type: str = Form(..., description="Document type: 'aadhar' or 'pan'"),
     file: UploadFile = File(..., description="Document file (PDF, DOC, DOCX)"),
-    current_user: Annotated[User, Depends(get_current_active_user)] = None,
+    current_user: Annotated[Principal, Depends(get_current_active_user)] = None,
     db: Session = Depends(get_db),
 ):
     """
@@ -332,10 +338,56 @@ async def upload_document(
 
     **Use Case:** Employee document submission for HR records
     """
-    result = ProfileService.upload_document(db, current_user.id, document_type, file)
+    result = await ProfileService.upload_document(db, current_user.id, document_type, file)
     return result
 
 
+@router.get(
+    "/documents/{document_type}",
+    status_code=status.HTTP_200_OK,
+    summary="Download Document",
+    description="Download one of the current user's documents",
+    responses={
+        200: {"description": "Document file"},
+        206: {"description": "Requested byte range of the document"},
+        304: {"description": "Document unchanged (If-None-Match matched the ETag)"},
+        400: {"description": "Invalid document type"},
+        404: {"description": "Document not found"},
+        401: {"description": "Not authenticated"},
+    },
+)
+async def download_document(
+    document_type: str,
+    request: Request,
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
+    db: Session = Depends(get_db),
+):
+    """
+    ## Download Document
+
+    Download a document from the user's profile.
+
+    **Document Types:**
+    - `profile_image`: Profile image
+    - `aadhar`: Aadhar card
+    - `pan`: PAN card
+
+    **Access:** All authenticated users (own documents)
+
+    Sends an ETag; `If-None-Match` returns 304 and `Range` returns part of the file.
+    """
+    file_path = ProfileService.get_document_path(db, current_user.id, document_type)
+    sha256 = await FileDigestService.get_or_compute(db, file_path)
+    media_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+    return file_download_response(
+        request,
+        path=file_path,
+        sha256=sha256,
+        media_type=media_type,
+        filename=os.path.basename(file_path),
+    )
+
+
 @router.delete(
     "/documents/{document_type}",
     response_model=MessageResponse,
@@ -351,7 +403,7 @@ async def upload_document(
 )
 async def delete_document(
     document_type: str,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
 ):
     """
@@ -388,7 +440,7 @@ async def delete_document(
     },
 )
 async def get_my_manager(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
 ):
     """
@@ -428,7 +480,7 @@ async def get_my_manager(
 )
 async def get_team_by_manager(
     manager_id: int,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db),
 ):
     """
@@ -459,7 +511,7 @@ async def get_team_by_manager(
     },
 )
 async def get_my_profile_stats(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     db: Session = Depends(get_db),
 ):
     """
@@ -494,7 +546,7 @@ async def get_my_profile_stats(
 )
 async def get_user_profile_stats(
     user_id: int,
-    current_user: Annotated[User, Depends(require_hr_or_manager)],
+    current_user: Annotated[Principal, Depends(require_hr_or_manager)],
     db: Session = Depends(get_db),
 ):
     """
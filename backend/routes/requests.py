@@ -6,7 +6,6 @@ from sqlalchemy.orm import Session
 from typing import Optional
 
 from database import get_db
-from models import User
 from schemas.request_schemas import (
     RequestCreate,
     RequestUpdate,
@@ -18,6 +17,7 @@ from schemas.request_schemas import (
 )
 from services import request_service
 from utils.dependencies import get_current_user, require_hr, require_hr_or_manager
+from utils.principal_cache import Principal
 
 
 router = APIRouter(
@@ -35,7 +35,7 @@ router = APIRouter(
 )
 async def submit_request(
     request_data: RequestCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -68,7 +68,7 @@ async def get_my_requests(
     status: Optional[str] = Query(None, description="Filter by status (pending, approved, rejected)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -98,7 +98,7 @@ async def get_team_requests(
     employee_id: Optional[int] = Query(None, description="Filter by specific employee"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -132,13 +132,19 @@ async def get_all_requests(
     search: Optional[str] = Query(None, description="Search in employee name, subject, or description"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-    current_user: User = Depends(require_hr),
+    cursor: Optional[str] = Query(None, description="Cursor pagination: empty for the first page, then `next_cursor`"),
+    include_total: bool = Query(False, description="With `cursor`: also count all matches"),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
     Get all requests in the organization with advanced filtering.
     
     **Access**: HR only
+    
+    **Pagination**: `page`/`page_size`, or `cursor` (pass it empty for the
+    first page, then each response's `next_cursor` until it is null; totals
+    only with `include_total`)
     """
     return request_service.get_all_requests(
         db=db,
@@ -147,7 +153,9 @@ async def get_all_requests(
         employee_id=employee_id,
         search=search,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total
     )
 
 
@@ -158,7 +166,7 @@ async def get_all_requests(
     description="Get request statistics (scoped by role)"
 )
 async def get_request_statistics(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -184,7 +192,7 @@ async def get_request_statistics(
 )
 async def get_request_by_id(
     request_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -212,7 +220,7 @@ async def get_request_by_id(
 async def update_request(
     request_id: int,
     request_data: RequestUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -239,7 +247,7 @@ async def update_request(
 async def update_request_status(
     request_id: int,
     status_update: RequestStatusUpdate,
-    current_user: User = Depends(require_hr_or_manager),
+    current_user: Principal = Depends(require_hr_or_manager),
     db: Session = Depends(get_db)
 ):
     """
@@ -268,7 +276,7 @@ async def update_request_status(
 )
 async def delete_request(
     request_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
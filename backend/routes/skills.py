@@ -5,7 +5,6 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from typing import Optional
 from database import get_db
-from models import User
 from schemas.skill_schemas import (
     SkillModuleCreate,
     SkillModuleUpdate,
@@ -22,6 +21,7 @@ from schemas.skill_schemas import (
 )
 from services.skill_service import SkillService
 from utils.dependencies import get_current_active_user, require_hr
+from utils.principal_cache import Principal
 import math
 
 router = APIRouter(prefix="/skills", tags=["Skills/Modules Management"])
@@ -32,7 +32,7 @@ router = APIRouter(prefix="/skills", tags=["Skills/Modules Management"])
 @router.post("/modules", response_model=SkillModuleResponse, status_code=status.HTTP_201_CREATED)
 async def create_module(
     module_data: SkillModuleCreate,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -63,7 +63,7 @@ async def get_modules(
     category: Optional[str] = Query(None, description="Filter by category"),
     difficulty: Optional[str] = Query(None, description="Filter by difficulty level"),
     include_inactive: bool = Query(False, description="Include inactive modules"),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -109,7 +109,7 @@ async def get_modules(
 @router.get("/modules/{module_id}", response_model=SkillModuleResponse)
 async def get_module(
     module_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -129,7 +129,7 @@ async def get_module(
 async def update_module(
     module_id: int,
     module_data: SkillModuleUpdate,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -154,7 +154,7 @@ async def update_module(
 @router.delete("/modules/{module_id}", response_model=MessageResponse)
 async def delete_module(
     module_id: int,
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -180,7 +180,7 @@ async def delete_module(
 @router.post("/enroll", response_model=EnrollmentResponse, status_code=status.HTTP_201_CREATED)
 async def enroll_in_module(
     enrollment_data: EnrollmentCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -206,7 +206,7 @@ async def get_my_enrollments(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     status: Optional[str] = Query(None, description="Filter by status (not_started/pending/completed)"),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -243,7 +243,9 @@ async def get_all_enrollments(
     employee_id: Optional[int] = Query(None, description="Filter by employee ID"),
     module_id: Optional[int] = Query(None, description="Filter by module ID"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    current_user: User = Depends(require_hr),
+    cursor: Optional[str] = Query(None, description="Cursor pagination: empty for the first page, then `next_cursor`"),
+    include_total: bool = Query(False, description="With `cursor`: also count all matches"),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
@@ -257,6 +259,9 @@ async def get_all_enrollments(
     - `employee_id`: Filter by employee ID
     - `module_id`: Filter by module ID
     - `status`: Filter by status
+    - `cursor`: Use cursor pagination instead of `page` (pass it empty for
+      the first page, then each response's `next_cursor` until it is null)
+    - `include_total`: With `cursor`, also return `total`/`total_pages`
     
     **Returns**: Paginated list of all enrollments
     
@@ -264,23 +269,26 @@ async def get_all_enrollments(
     """
     skip = (page - 1) * page_size
     
-    enrollments, total = SkillService.get_all_enrollments(
+    enrollments, total, next_cursor = SkillService.get_all_enrollments(
         db=db,
         skip=skip,
         limit=page_size,
         employee_id_filter=employee_id,
         module_id_filter=module_id,
-        status_filter=status
+        status_filter=status,
+        cursor=cursor,
+        include_total=include_total
     )
     
-    total_pages = math.ceil(total / page_size) if total > 0 else 1
+    total_pages = None if total is None else (math.ceil(total / page_size) if total > 0 else 1)
     
     return EnrollmentListResponse(
         enrollments=enrollments,
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
     )
 
 
@@ -288,7 +296,7 @@ async def get_all_enrollments(
 async def update_enrollment_progress(
     enrollment_id: int,
     progress_data: EnrollmentProgressUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -317,7 +325,7 @@ async def update_enrollment_progress(
 async def mark_enrollment_complete(
     enrollment_id: int,
     complete_data: EnrollmentCompleteRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -345,7 +353,7 @@ async def mark_enrollment_complete(
 
 @router.get("/stats", response_model=SkillStatsResponse)
 async def get_skill_stats(
-    current_user: User = Depends(require_hr),
+    current_user: Principal = Depends(require_hr),
     db: Session = Depends(get_db)
 ):
     """
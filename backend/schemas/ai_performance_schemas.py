@@ -85,6 +85,10 @@ class AIReportGenerateRequest(BaseModel):
         default=False,
         description="Include comparison with previous period"
     )
+    force_refresh: bool = Field(
+        default=False,
+        description="Ignore a cached report for the same inputs and call the AI again"
+    )
     
     @field_validator('end_date')
     @classmethod
@@ -196,6 +200,7 @@ class AIReportResponse(BaseModel):
     # Metadata
     ai_model: str = "gemini-2.5-flash"
     generation_time_seconds: Optional[float] = None
+    from_cache: bool = Field(False, description="True when served from the report cache")
     
     # Storage info (for weekly saved reports)
     is_saved: bool = False
@@ -312,5 +317,6 @@ class HealthCheckResponse(BaseModel):
     service: str = "AI Performance Report"
     status: str
     ai_provider_status: Dict[str, Any]
+    report_cache: Optional[Dict[str, Any]] = None
     timestamp: datetime
 
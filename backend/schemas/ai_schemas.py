@@ -39,6 +39,7 @@ class PolicyAnswerResponse(BaseModel):
     answer: Optional[str] = None
     sources: Optional[List[Dict[str, str]]] = None
     question: Optional[str] = None
+    cached: bool = False
     error: Optional[str] = None
 
     class Config:
@@ -68,9 +69,13 @@ class PolicyIndexStatusResponse(BaseModel):
 
     indexed: bool
     total_vectors: Optional[int] = None
+    total_policies: Optional[int] = None
+    index_version: Optional[str] = None
     index_location: Optional[str] = None
     model: Optional[str] = None
     embedding_model: Optional[str] = None
+    embedding_cache: Optional[Dict[str, Any]] = None
+    answer_cache: Optional[Dict[str, Any]] = None
     message: Optional[str] = None
     error: Optional[str] = None
 
@@ -88,6 +93,16 @@ class ResumeScreeningRequest(BaseModel):
     resume_ids: Optional[List[int]] = Field(
         None, description="Application IDs to screen"
     )
+    continue_analysis_id: Optional[int] = Field(
+        None,
+        description="ID of an interrupted screening run to complete; "
+        "already screened applications are not analysed again",
+    )
+    force_refresh: bool = Field(
+        False,
+        description="Re-analyse every resume instead of reusing earlier analyses "
+        "of the same resume against the same job description",
+    )
 
     class Config:
         json_schema_extra = {
@@ -140,6 +155,7 @@ class ResumeAnalysisResponse(BaseModel):
     gaps: List[str] | None
     summary: str | None
     analysis_date: datetime
+    from_cache: Optional[bool] = None
 
 
 class ResumeScreeningResultResponse(BaseModel):
@@ -153,6 +169,7 @@ class ResumeScreeningResultResponse(BaseModel):
     average_score: float
     top_candidate: Optional[str] = None
     analysis_id: Optional[int] = None
+    served_from_cache: Optional[int] = None
     error: Optional[str] = None
 
 
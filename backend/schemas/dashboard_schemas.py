@@ -148,6 +148,7 @@ class HRDashboardResponse(BaseModel):
     total_employees: int
     total_departments: int
     total_active_applications: int
+    generated_at: Optional[datetime] = None
     
     class Config:
         json_schema_extra = {
@@ -168,10 +168,12 @@ class EmployeeListItem(BaseModel):
 class EmployeeListResponse(BaseModel):
     """Schema for paginated employee list"""
     employees: List[EmployeeListItem]
-    total: int
-    page: int
+    # Cursor pagination: `page` is None, totals only with include_total
+    total: Optional[int]
+    page: Optional[int]
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class EmployeeStatsResponse(BaseModel):
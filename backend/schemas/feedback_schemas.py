@@ -61,9 +61,11 @@ class FeedbackResponse(BaseModel):
 class FeedbackListResponse(BaseModel):
     """Schema for list of feedback"""
     feedback: List[FeedbackResponse]
-    total: int
-    page: int
+    # Cursor pagination: `page` is None, total only with include_total
+    total: Optional[int]
+    page: Optional[int]
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class FeedbackStatsResponse(BaseModel):
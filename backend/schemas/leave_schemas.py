@@ -115,10 +115,12 @@ class LeaveBalanceResponse(BaseModel):
 class LeaveListResponse(BaseModel):
     """Schema for paginated leave list"""
     leaves: List[LeaveRequestResponse]
-    total: int
-    page: int
+    # Cursor pagination: `page` is None, totals only with include_total
+    total: Optional[int]
+    page: Optional[int]
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class LeaveStatsResponse(BaseModel):
@@ -75,6 +75,7 @@ class ReportingStructureResponse(BaseModel):
     skip_level_manager: Optional[UserHierarchyNode]  # Manager's manager
     direct_reports: List[UserHierarchyNode]  # If user is a manager
     peers: List[UserHierarchyNode]  # Same manager
+    total_reports: int = 0  # Active direct and indirect reports
     
 
 
@@ -61,6 +61,11 @@ class PayslipGenerateRequest(BaseModel):
     pay_date: Optional[date] = Field(None, description="Payment date (defaults to last day of month)")
 
 
+class PayslipBulkGenerateRequest(PayslipGenerateRequest):
+    """Schema for set-based month-end payslip generation"""
+    chunk_size: int = Field(1000, ge=100, le=10000, description="Rows inserted (and committed) per batch")
+
+
 # Response Schemas
 class PayslipResponse(BaseModel):
     """Schema for payslip response"""
@@ -114,6 +119,22 @@ class PayslipListResponse(BaseModel):
     page_size: int
 
 
+class PayslipBulkGenerateResponse(BaseModel):
+    """Summary of a bulk payslip generation run"""
+    month: int
+    year: int
+    pay_period_start: date
+    pay_period_end: date
+    pay_date: date
+    total_active_employees: int
+    created_count: int
+    skipped_count: int
+    total_gross_payout: float
+    total_net_payout: float
+    chunks: int
+    duration_seconds: float
+
+
 class PayslipStatsResponse(BaseModel):
     """Schema for payslip statistics"""
     total_payslips: int
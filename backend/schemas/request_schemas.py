@@ -80,10 +80,12 @@ class RequestResponse(BaseModel):
 class RequestListResponse(BaseModel):
     """Schema for paginated request list"""
     requests: List[RequestResponse]
-    total: int
-    page: int
+    # Cursor pagination: `page` is None, totals only with include_total
+    total: Optional[int]
+    page: Optional[int]
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class RequestStatsResponse(BaseModel):
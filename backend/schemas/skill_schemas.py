@@ -155,10 +155,12 @@ class MyEnrollmentResponse(BaseModel):
 class EnrollmentListResponse(BaseModel):
     """Schema for paginated enrollment list"""
     enrollments: List[EnrollmentResponse]
-    total: int
-    page: int
+    # Cursor pagination: `page` is None, totals only with include_total
+    total: Optional[int]
+    page: Optional[int]
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class SkillStatsResponse(BaseModel):
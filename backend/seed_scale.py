@@ -0,0 +1,453 @@
+"""
+Generate a production-sized database for performance work.
+
+Usage (from the backend folder):
+    python seed_scale.py --reset
+    python seed_scale.py --reset --employees 2000 --years 1
+    python seed_scale.py --reset --database-url sqlite:///./scale.db --seed 7
+
+Unlike `seed_data.py` / `seed_comprehensive.py` (a few dozen hand-written rows
+added one object at a time), every table is bulk-inserted with Core
+`executemany` batches, so 10k employees with three years of attendance (about
+8M rows) load in minutes. The same `--seed` and `--end-date` always produce
+the same rows.
+
+Organisation:
+ - user 1 is the HR head and root of the org chart (hr.head@scale.example.com),
+ - each department has a head reporting to user 1 (dept1.head@scale.example.com, ...),
+ - each team has a manager reporting to its department head
+   (manager1@scale.example.com, ...), plus a few HR staff (hr1@scale.example.com, ...),
+ - everyone else is an employee in a team (employee1@scale.example.com, ...).
+All accounts use the password `pass123`.
+
+Attendance covers working days up to the day before `--end-date`, so punching
+in "today" still works. `--reset` drops and recreates every table first;
+without it the script refuses to write into a database that already has users.
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+
+from sqlalchemy import bindparam, create_engine, event, func, select
+
+from models import (
+    Base, Department, Team, User, UserRole, UserHierarchyClosure, JobListing,
+    Application, ApplicationStatus, Attendance, AttendanceStatus, LeaveRequest,
+    LeaveType, LeaveStatus, Payslip, Goal, GoalStatus, GoalCheckpoint,
+    GoalCategory, SkillModule, SkillModuleEnrollment, ModuleStatus, Feedback,
+    Holiday
+)
+from services.hierarchy_service import HierarchyService
+from utils.password_utils import hash_password
+from config import settings
+
+BATCH_SIZE = 20_000
+PASSWORD = "pass123"
+HR_STAFF = 5
+SKILL_MODULES = 40
+JOBS_PER_DEPARTMENT = 3
+
+ATTENDANCE_WEIGHTS = [
+    (AttendanceStatus.PRESENT, 78), (AttendanceStatus.WFH, 14),
+    (AttendanceStatus.LEAVE, 5), (AttendanceStatus.ABSENT, 3),
+]
+GOAL_CATEGORIES = ["Technical", "Leadership", "Communication", "Delivery", "Learning"]
+FEEDBACK_TYPES = ["positive", "constructive", "general"]
+FIRST_NAMES = ["Aarav", "Maya", "Noah", "Priya", "Liam", "Sara", "Omar", "Elena", "Ravi", "Grace"]
+LAST_NAMES = ["Sharma", "Johnson", "Khan", "Garcia", "Chen", "Patel", "Smith", "Rossi", "Iyer", "Brown"]
+
+
+def weighted(rng: random.Random, weights):
+    values, counts = zip(*weights)
+    return rng.choices(values, weights=counts)[0]
+
+
+class Loader:
+    """Batched Core inserts on one connection, with per-table row counts"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.counts = {}
+
+    def insert(self, model, rows) -> int:
+        """Insert an iterable of row dicts in batches; returns the row count"""
+        table = model.__table__
+        total = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= BATCH_SIZE:
+                self.conn.execute(table.insert(), batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            self.conn.execute(table.insert(), batch)
+            total += len(batch)
+        self.counts[table.name] = self.counts.get(table.name, 0) + total
+        return total
+
+
+def working_days(start: date, end: date):
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            yield day
+        day += timedelta(days=1)
+
+
+def build_users(args, rng: random.Random, password_hash: str, first_day: date):
+    """Users in id order (HR, department heads, managers, employees) and their teams"""
+    users = []
+    teams = []
+
+    def add_user(email, role, level, department_id, team_id, manager_id, job_role):
+        user_id = len(users) + 1
+        users.append({
+            "id": user_id,
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "email": email,
+            "phone": f"9{rng.randrange(10**8, 10**9)}",
+            "password_hash": password_hash,
+            "role": role,
+            "employee_id": f"SC{user_id:06d}",
+            "department_id": department_id,
+            "job_role": job_role,
+            "hierarchy_level": level,
+            "team_id": team_id,
+            "manager_id": manager_id,
+            "hire_date": first_day - timedelta(days=rng.randrange(0, 3650)),
+            "salary": float(rng.randrange(30, 250) * 1000),
+            "is_active": True,
+        })
+        return user_id
+
+    head_id = add_user("hr.head@scale.example.com", UserRole.HR, 1, 1, None, None, "Head of HR")
+    for n in range(1, HR_STAFF + 1):
+        add_user(f"hr{n}@scale.example.com", UserRole.HR, 4, 1, None, head_id, "HR Specialist")
+
+    department_heads = {}
+    for dept_id in range(1, args.departments + 1):
+        department_heads[dept_id] = add_user(
+            f"dept{dept_id}.head@scale.example.com", UserRole.MANAGER, 2, dept_id, None, head_id, "Department Head"
+        )
+
+    manager_number = 0
+    for dept_id in range(1, args.departments + 1):
+        for _ in range(args.teams_per_department):
+            manager_number += 1
+            team_id = len(teams) + 1
+            manager_id = add_user(
+                f"manager{manager_number}@scale.example.com", UserRole.MANAGER, 3, dept_id,
+                team_id, department_heads[dept_id], "Engineering Manager"
+            )
+            teams.append({
+                "id": team_id,
+                "name": f"Team {team_id}",
+                "description": f"Team {team_id} of department {dept_id}",
+                "department_id": dept_id,
+                "manager_id": manager_id,
+                "is_active": True,
+            })
+
+    employee_number = 0
+    while len(users) < args.employees:
+        employee_number += 1
+        team = teams[employee_number % len(teams)]
+        add_user(
+            f"employee{employee_number}@scale.example.com", UserRole.EMPLOYEE, rng.choice([5, 6, 7]),
+            team["department_id"], team["id"], team["manager_id"], "Software Engineer"
+        )
+
+    return users, teams
+
+
+def attendance_rows(rng: random.Random, employee_ids, first_day: date, last_day: date):
+    for day in working_days(first_day, last_day):
+        for employee_id in employee_ids:
+            status = weighted(rng, ATTENDANCE_WEIGHTS)
+            # executemany needs the same keys in every row
+            row = {
+                "employee_id": employee_id, "date": day, "status": status,
+                "check_in_time": None, "check_out_time": None, "hours_worked": None, "location": None,
+            }
+            if status in (AttendanceStatus.PRESENT, AttendanceStatus.WFH):
+                check_in = datetime.combine(day, dt_time(8, 30)) + timedelta(minutes=rng.randrange(0, 90))
+                check_out = check_in + timedelta(minutes=rng.randrange(420, 600))
+                row.update(
+                    check_in_time=check_in,
+                    check_out_time=check_out,
+                    hours_worked=round((check_out - check_in).seconds / 3600, 2),
+                    location="home" if status == AttendanceStatus.WFH else "office",
+                )
+            yield row
+
+
+def leave_rows(rng: random.Random, employee_ids, managers, first_day: date, last_day: date, per_year: int):
+    span = (last_day - first_day).days
+    count = max(1, per_year * span // 365)
+    for employee_id in employee_ids:
+        for _ in range(count):
+            start = first_day + timedelta(days=rng.randrange(span))
+            days = rng.randint(1, 5)
+            status = rng.choice(list(LeaveStatus))
+            requested = datetime.combine(start - timedelta(days=rng.randint(1, 20)), dt_time(10, 0))
+            yield {
+                "employee_id": employee_id,
+                "leave_type": rng.choice(list(LeaveType)),
+                "start_date": start,
+                "end_date": start + timedelta(days=days - 1),
+                "days_requested": days,
+                "subject": "Leave request",
+                "reason": "Personal",
+                "status": status,
+                "approved_by": managers.get(employee_id) if status != LeaveStatus.PENDING else None,
+                "approved_date": requested + timedelta(days=1) if status != LeaveStatus.PENDING else None,
+                "requested_date": requested,
+            }
+
+
+def payslip_rows(rng: random.Random, users, months: int, end_date: date):
+    year, month = end_date.year, end_date.month
+    periods = []
+    for _ in range(months):
+        # Months before the end date's month, newest first
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+        start = date(year, month, 1)
+        end = (date(year + month // 12, month % 12 + 1, 1)) - timedelta(days=1)
+        periods.append((start, end))
+
+    for user in users:
+        basic = round(user["salary"] / 12, 2)
+        for start, end in periods:
+            allowances = round(basic * 0.2, 2)
+            bonus = float(rng.choice([0, 0, 0, 500, 1000]))
+            gross = basic + allowances + bonus
+            tax, pf = round(gross * 0.15, 2), round(basic * 0.12, 2)
+            yield {
+                "employee_id": user["id"],
+                "pay_period_start": start,
+                "pay_period_end": end,
+                "pay_date": end,
+                "basic_salary": basic,
+                "allowances": allowances,
+                "bonus": bonus,
+                "gross_salary": gross,
+                "tax_deduction": tax,
+                "pf_deduction": pf,
+                "total_deductions": tax + pf,
+                "net_salary": round(gross - tax - pf, 2),
+                "issued_by": 1,
+            }
+
+
+def goal_rows(rng: random.Random, employee_ids, managers, per_employee: int, first_day: date, last_day: date):
+    span = (last_day - first_day).days
+    goal_id = 0
+    for employee_id in employee_ids:
+        for n in range(per_employee):
+            goal_id += 1
+            start = first_day + timedelta(days=rng.randrange(span))
+            status = rng.choice(list(GoalStatus))
+            target = start + timedelta(days=rng.randint(30, 120))
+            yield {
+                "id": goal_id,
+                "employee_id": employee_id,
+                "title": f"Goal {n + 1}",
+                "description": "Quarterly objective",
+                "category_id": rng.randint(1, len(GOAL_CATEGORIES)),
+                "priority": rng.choice(["low", "medium", "high"]),
+                "start_date": start,
+                "target_date": target,
+                "completion_date": target if status == GoalStatus.COMPLETED else None,
+                "status": status,
+                "progress_percentage": {GoalStatus.NOT_STARTED: 0.0, GoalStatus.COMPLETED: 100.0}.get(
+                    status, float(rng.randrange(10, 95))
+                ),
+                "is_personal": rng.random() < 0.3,
+                "assigned_by": managers.get(employee_id),
+            }
+
+
+def checkpoint_rows(rng: random.Random, goal_count: int, per_goal: int):
+    for goal_id in range(1, goal_count + 1):
+        for n in range(1, per_goal + 1):
+            completed = rng.random() < 0.5
+            yield {
+                "goal_id": goal_id,
+                "title": f"Checkpoint {n}",
+                "sequence_number": n,
+                "is_completed": completed,
+            }
+
+
+def feedback_rows(rng: random.Random, employee_ids, managers, per_employee: int, first_day: date, last_day: date):
+    span = (last_day - first_day).days
+    for employee_id in employee_ids:
+        given_by = managers.get(employee_id) or 1
+        for _ in range(per_employee):
+            yield {
+                "employee_id": employee_id,
+                "given_by": given_by,
+                "subject": "Feedback",
+                "description": "Regular check-in feedback",
+                "feedback_type": rng.choice(FEEDBACK_TYPES),
+                "rating": float(rng.randint(2, 5)),
+                "given_on": datetime.combine(first_day + timedelta(days=rng.randrange(span)), dt_time(15, 0)),
+            }
+
+
+def enrollment_rows(rng: random.Random, employee_ids, per_employee: int, first_day: date, last_day: date):
+    span = (last_day - first_day).days
+    for employee_id in employee_ids:
+        for module_id in rng.sample(range(1, SKILL_MODULES + 1), min(per_employee, SKILL_MODULES)):
+            status = rng.choice(list(ModuleStatus))
+            enrolled = first_day + timedelta(days=rng.randrange(span))
+            yield {
+                "employee_id": employee_id,
+                "module_id": module_id,
+                "status": status,
+                "progress_percentage": 100.0 if status == ModuleStatus.COMPLETED else float(rng.randrange(0, 90)),
+                "enrolled_date": enrolled,
+                "completed_date": enrolled + timedelta(days=30) if status == ModuleStatus.COMPLETED else None,
+                "target_completion_date": enrolled + timedelta(days=60),
+            }
+
+
+def application_rows(rng: random.Random, count: int, job_count: int, employee_ids, first_day: date, last_day: date):
+    span = (last_day - first_day).days
+    for n in range(1, count + 1):
+        referred = rng.random() < 0.2
+        yield {
+            "job_id": rng.randint(1, job_count),
+            "applicant_name": f"Applicant {n}",
+            "applicant_email": f"applicant{n}@candidates.example.com",
+            "source": "referral" if referred else rng.choice(["self-applied", "recruitment"]),
+            "referred_by": rng.choice(employee_ids) if referred else None,
+            "status": rng.choice(list(ApplicationStatus)),
+            "screening_score": round(rng.uniform(20, 95), 1),
+            "applied_date": datetime.combine(first_day + timedelta(days=rng.randrange(span)), dt_time(11, 0)),
+        }
+
+
+def seed(engine, args) -> dict:
+    """Generate and insert every table; returns rows inserted per table"""
+    rng = random.Random(args.seed)
+    end_date = args.end_date
+    first_day = end_date - timedelta(days=round(365 * args.years))
+    last_day = end_date - timedelta(days=1)
+    password_hash = hash_password(PASSWORD)
+
+    users, teams = build_users(args, rng, password_hash, first_day)
+    managers = {user["id"]: user["manager_id"] for user in users}
+    all_ids = [user["id"] for user in users]
+
+    with engine.begin() as conn:
+        loader = Loader(conn)
+        loader.insert(Department, (
+            {"id": d, "name": f"Department {d}", "code": f"D{d:03d}",
+             "description": f"Generated department {d}", "is_active": True}
+            for d in range(1, args.departments + 1)
+        ))
+        loader.insert(Team, teams)
+        loader.insert(User, users)
+        # Department heads are users, so they are set once both exist
+        departments = Department.__table__
+        conn.execute(
+            departments.update().where(departments.c.id == bindparam("dept_id")).values(head_id=bindparam("head_id")),
+            [{"dept_id": u["department_id"], "head_id": u["id"]} for u in users if u["hierarchy_level"] == 2],
+        )
+        loader.insert(UserHierarchyClosure, HierarchyService.build_closure_rows(managers))
+
+        loader.insert(GoalCategory, (
+            {"id": n, "name": name, "description": f"{name} goals", "created_by": 1}
+            for n, name in enumerate(GOAL_CATEGORIES, start=1)
+        ))
+        loader.insert(SkillModule, (
+            {"id": n, "name": f"Skill Module {n}", "category": rng.choice(["Technical", "Soft Skills", "Compliance"]),
+             "duration_hours": float(rng.randint(2, 40)), "difficulty_level": rng.choice(["beginner", "intermediate", "advanced"]),
+             "is_active": True}
+            for n in range(1, SKILL_MODULES + 1)
+        ))
+        job_count = loader.insert(JobListing, (
+            {"id": d * JOBS_PER_DEPARTMENT + n + 1, "position": f"Open Role {n + 1}", "department_id": d + 1,
+             "experience_required": f"{n + 1}+ years", "employment_type": "full-time", "location": "Remote",
+             "is_active": True, "posted_by": 1, "application_deadline": end_date + timedelta(days=30)}
+            for d in range(args.departments) for n in range(JOBS_PER_DEPARTMENT)
+        ))
+        loader.insert(Holiday, (
+            {"name": f"Holiday {n + 1}", "start_date": date(year, month, 1 + n), "end_date": date(year, month, 1 + n),
+             "holiday_type": "public", "is_mandatory": True, "is_active": True, "created_by": 1}
+            for year in range(first_day.year, end_date.year + 1) for n, month in enumerate([1, 5, 8, 10, 12])
+        ))
+
+        print(f"[INFO] Inserting attendance {first_day} .. {last_day}")
+        loader.insert(Attendance, attendance_rows(rng, all_ids, first_day, last_day))
+        loader.insert(LeaveRequest, leave_rows(rng, all_ids, managers, first_day, last_day, args.leaves_per_year))
+        loader.insert(Payslip, payslip_rows(rng, users, args.payslip_months, end_date))
+        goal_count = loader.insert(Goal, goal_rows(rng, all_ids, managers, args.goals, first_day, last_day))
+        loader.insert(GoalCheckpoint, checkpoint_rows(rng, goal_count, args.checkpoints))
+        loader.insert(Feedback, feedback_rows(rng, all_ids, managers, args.feedback, first_day, last_day))
+        loader.insert(SkillModuleEnrollment, enrollment_rows(rng, all_ids, args.enrollments, first_day, last_day))
+        loader.insert(Application, application_rows(rng, args.applications, job_count, all_ids, first_day, last_day))
+    return loader.counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate all tables first")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today(),
+                        help="Last day of generated history (default: today)")
+    parser.add_argument("--employees", type=int, default=10_000, help="Total users, including HR and managers")
+    parser.add_argument("--departments", type=int, default=20)
+    parser.add_argument("--teams-per-department", type=int, default=5)
+    parser.add_argument("--years", type=float, default=3, help="Years of attendance, leave and goal history")
+    parser.add_argument("--leaves-per-year", type=int, default=6)
+    parser.add_argument("--goals", type=int, default=4, help="Goals per user")
+    parser.add_argument("--checkpoints", type=int, default=3, help="Checkpoints per goal")
+    parser.add_argument("--feedback", type=int, default=4, help="Feedback entries per user")
+    parser.add_argument("--enrollments", type=int, default=3, help="Skill module enrollments per user")
+    parser.add_argument("--payslip-months", type=int, default=24)
+    parser.add_argument("--applications", type=int, default=5_000)
+    args = parser.parse_args()
+
+    minimum = 1 + HR_STAFF + args.departments * (args.teams_per_department + 1)
+    if args.employees < minimum:
+        parser.error(f"--employees must be at least {minimum} for this many departments and teams")
+
+    engine = create_engine(args.database_url)
+    if engine.dialect.name == "sqlite":
+        # Bulk load: the file is thrown away if the load fails anyway
+        @event.listens_for(engine, "connect")
+        def _fast_sqlite_load(dbapi_conn, _):
+            dbapi_conn.execute("PRAGMA synchronous=OFF")
+            dbapi_conn.execute("PRAGMA journal_mode=MEMORY")
+
+    if args.reset:
+        print(f"[INFO] Recreating all tables in {args.database_url}")
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        if conn.execute(select(func.count()).select_from(User.__table__)).scalar():
+            print("[ERROR] Database already has users; run with --reset to replace them")
+            sys.exit(1)
+
+    started = time.perf_counter()
+    counts = seed(engine, args)
+    elapsed = time.perf_counter() - started
+
+    print("\n" + "=" * 48)
+    for table, count in counts.items():
+        print(f"{table:<32} {count:>14,}")
+    print("=" * 48)
+    print(f"[OK] {sum(counts.values()):,} rows in {elapsed:.1f}s")
+    print(f"Logins (password {PASSWORD}): hr.head@scale.example.com, manager1@scale.example.com, employee1@scale.example.com")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ import logging
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, desc, extract
+from sqlalchemy import func, and_, or_, desc, extract, case, select
 from fastapi import HTTPException, status
 
 from models import (
@@ -39,11 +39,31 @@ from schemas.ai_performance_schemas import (
     OrganizationReportResponse,
 )
 from services.ai_provider_manager import AIProviderManager
+from services.ai_report_cache import ai_report_cache
 from utils.performance_prompt_templates import PerformancePromptTemplates
 import time
 
 logger = logging.getLogger(__name__)
 
+# Raw per-employee counts produced by _aggregate_member_metrics
+MEMBER_METRIC_KEYS = (
+    "total_goals",
+    "completed_goals",
+    "in_progress_goals",
+    "overdue_goals",
+    "completed_with_dates",
+    "on_time_goals",
+    "feedback_count",
+    "rated_feedback_count",
+    "rating_sum",
+    "positive_feedback",
+    "attendance_records",
+    "attended_records",
+    "training_completed",
+    "total_comments",
+    "blocker_comments",
+)
+
 
 class AIPerformanceReportService:
     """
@@ -54,6 +74,7 @@ class AIPerformanceReportService:
     def __init__(self):
         """Initialize service with AI provider"""
         self.ai_provider = AIProviderManager()
+        self.report_cache = ai_report_cache
         self.prompt_templates = PerformancePromptTemplates()
         self.reports_dir = os.path.join("storage", "ai_reports")
         os.makedirs(self.reports_dir, exist_ok=True)
@@ -830,8 +851,13 @@ class AIPerformanceReportService:
         custom_metrics: Optional[List[str]],
         include_team_comparison: bool,
         include_period_comparison: bool,
+        force_refresh: bool = False,
     ) -> AIReportResponse:
-        """Generate AI-powered individual performance report"""
+        """
+        Generate AI-powered individual performance report.
+        Reuses a cached report when the aggregated inputs are unchanged,
+        unless `force_refresh` is set.
+        """
 
         start_time = time.time()
 
@@ -862,24 +888,68 @@ class AIPerformanceReportService:
             logger.warning(f"Insufficient data for employee {employee_id}")
             # Still generate but with warning
 
-        # Build prompt
-        prompt = self.prompt_templates.get_individual_report_prompt(
-            employee_data=aggregated_data["employee"],
-            metrics_data=aggregated_data["metrics"],
-            time_period=period_label,
+        # Same inputs -> same key -> reuse the stored markdown. The key uses the
+        # primary model; the entry records the model that actually served it
+        cache_key = self.report_cache.make_key(
+            report_type="individual",
+            employee_id=employee_id,
+            period_start=period_start,
+            period_end=period_end,
+            period_label=period_label,
             template=template.value,
-            include_comparisons=(include_team_comparison or include_period_comparison),
-        )
+            metrics=sorted(
+                m.value if isinstance(m, MetricEnum) else m for m in selected_metrics
+            ),
+            include_team_comparison=include_team_comparison,
+            include_period_comparison=include_period_comparison,
+            employee=aggregated_data["employee"],
+            data=aggregated_data["metrics"],
+            prompt_version=self.prompt_templates.PROMPT_VERSION,
+            ai_model=self.ai_provider.providers[0]["model"],
+        )
+        cached = None if force_refresh else self.report_cache.get(db, cache_key)
+
+        if cached:
+            logger.info(f"Serving cached AI report for employee {employee_id}")
+            report_id = cached.report_id or self._generate_report_id()
+            report_markdown = cached.report_markdown
+            ai_model = cached.ai_model or self.ai_provider.providers[0]["model"]
+        else:
+            # Build prompt
+            prompt = self.prompt_templates.get_individual_report_prompt(
+                employee_data=aggregated_data["employee"],
+                metrics_data=aggregated_data["metrics"],
+                time_period=period_label,
+                template=template.value,
+                include_comparisons=(include_team_comparison or include_period_comparison),
+            )
 
-        # Generate report using AI
-        logger.info(f"Generating AI report for employee {employee_id}")
-        report_markdown = await self.ai_provider.generate_report(prompt)
+            # Generate report using AI
+            logger.info(f"Generating AI report for employee {employee_id}")
+            generation = await self.ai_provider.generate(prompt)
+            report_markdown = generation.text
+            ai_model = generation.model
+            report_id = self._generate_report_id()
+
+            self.report_cache.put(
+                db,
+                cache_key,
+                employee_id=employee_id,
+                report_type="individual",
+                template=template.value,
+                report_period_start=period_start,
+                report_period_end=period_end,
+                prompt_version=self.prompt_templates.PROMPT_VERSION,
+                ai_model=ai_model,
+                report_id=report_id,
+                report_markdown=report_markdown,
+            )
 
         generation_time = time.time() - start_time
 
         # Build response
         response = AIReportResponse(
-            report_id=self._generate_report_id(),
+            report_id=report_id,
             employee_id=employee_id,
             employee_name=aggregated_data["employee"]["name"],
             employee_email=aggregated_data["employee"]["email"],
@@ -894,7 +964,9 @@ class AIPerformanceReportService:
             ],
             report_markdown=report_markdown,
             data_summary=aggregated_data["data_summary"],
+            ai_model=ai_model,
             generation_time_seconds=round(generation_time, 2),
+            from_cache=cached is not None,
         )
 
         # Save if Tuesday (day 1 = Tuesday in Python)
@@ -1040,16 +1112,19 @@ class AIPerformanceReportService:
                 detail="No active team members found",
             )
 
-        # Aggregate team-level data
-        team_data = self._aggregate_team_data(
-            db, team, team_members, period_start, period_end
+        # Raw metrics for every member in one grouped pass
+        member_metrics = self._aggregate_member_metrics(
+            db, [m.id for m in team_members], period_start, period_end
         )
 
+        # Aggregate team-level data
+        team_data = self._aggregate_team_data(team, team_members, member_metrics)
+
         # Get individual member summaries
-        member_summaries = []
-        for member in team_members:
-            member_data = self._get_member_summary(db, member, period_start, period_end)
-            member_summaries.append(member_data)
+        member_summaries = [
+            self._build_member_summary(member, member_metrics[member.id])
+            for member in team_members
+        ]
 
         # Build prompt
         prompt = self.prompt_templates.get_team_summary_prompt(
@@ -1129,16 +1204,19 @@ class AIPerformanceReportService:
             db.query(User).filter(User.team_id == team_id, User.is_active == True).all()
         )
 
-        # Aggregate team data
-        team_data = self._aggregate_team_data(
-            db, team, team_members, period_start, period_end
+        # Raw metrics for every member in one grouped pass
+        member_metrics = self._aggregate_member_metrics(
+            db, [m.id for m in team_members], period_start, period_end
         )
 
+        # Aggregate team data
+        team_data = self._aggregate_team_data(team, team_members, member_metrics)
+
         # Get member summaries
-        member_summaries = []
-        for member in team_members:
-            member_data = self._get_member_summary(db, member, period_start, period_end)
-            member_summaries.append(member_data)
+        member_summaries = [
+            self._build_member_summary(member, member_metrics[member.id])
+            for member in team_members
+        ]
 
         # Sort by performance (goal completion rate)
         member_summaries.sort(key=lambda x: x.get("completion_rate", 0), reverse=True)
@@ -1191,146 +1269,205 @@ class AIPerformanceReportService:
         logger.info(f"Comparative report generated in {generation_time:.2f}s")
         return response
 
-    def _aggregate_team_data(
+    def _aggregate_member_metrics(
         self,
         db: Session,
-        team: Team,
-        members: List[User],
+        member_ids: List[int],
         start_date: date,
         end_date: date,
-    ) -> Dict[str, Any]:
-        """Aggregate team-level performance data"""
-
-        member_ids = [m.id for m in members]
+        member_filter=None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Raw goal, feedback, attendance, training and collaboration counts for
+        many employees in one pass: one grouped query (GROUP BY employee) per
+        metric family instead of one set of queries per member.
 
-        # Team goals
-        team_goals = (
-            db.query(Goal)
+        `member_filter` can be a SELECT of user ids to use in the IN clauses
+        instead of the literal id list (avoids huge parameter lists).
+        Employees without rows get zeros.
+        """
+        metrics = {
+            member_id: dict.fromkeys(MEMBER_METRIC_KEYS, 0) for member_id in member_ids
+        }
+        if not member_ids:
+            return metrics
+
+        ids = member_filter if member_filter is not None else member_ids
+        period_start = datetime.combine(start_date, datetime.min.time())
+        period_end = datetime.combine(end_date, datetime.max.time())
+
+        def count_if(condition):
+            return func.sum(case((condition, 1), else_=0))
+
+        # Goals started in the period
+        completed = Goal.status == GoalStatus.COMPLETED
+        completed_dated = and_(completed, Goal.completion_date.isnot(None))
+        goal_rows = (
+            db.query(
+                Goal.employee_id,
+                func.count(Goal.id),
+                count_if(completed),
+                count_if(Goal.status == GoalStatus.IN_PROGRESS),
+                count_if(and_(Goal.target_date < date.today(), ~completed)),
+                count_if(completed_dated),
+                count_if(and_(completed_dated, Goal.completion_date <= Goal.target_date)),
+            )
             .filter(
-                Goal.employee_id.in_(member_ids),
+                Goal.employee_id.in_(ids),
                 Goal.start_date >= start_date,
                 Goal.start_date <= end_date,
                 Goal.is_deleted == False,
             )
+            .group_by(Goal.employee_id)
             .all()
         )
+        for employee_id, total, done, in_progress, overdue, dated, on_time in goal_rows:
+            metrics[employee_id].update(
+                total_goals=total,
+                completed_goals=done,
+                in_progress_goals=in_progress,
+                overdue_goals=overdue,
+                completed_with_dates=dated,
+                on_time_goals=on_time,
+            )
 
-        total_goals = len(team_goals)
-        completed_goals = sum(1 for g in team_goals if g.status == GoalStatus.COMPLETED)
-        in_progress_goals = sum(
-            1 for g in team_goals if g.status == GoalStatus.IN_PROGRESS
-        )
-        overdue_goals = sum(
-            1
-            for g in team_goals
-            if g.target_date < date.today() and g.status != GoalStatus.COMPLETED
-        )
-
-        goal_completion_rate = (
-            (completed_goals / total_goals * 100) if total_goals > 0 else 0
-        )
-
-        # On-time rate
-        completed_with_dates = [
-            g
-            for g in team_goals
-            if g.status == GoalStatus.COMPLETED and g.completion_date
-        ]
-        on_time = sum(
-            1 for g in completed_with_dates if g.completion_date <= g.target_date
-        )
-        on_time_rate = (
-            (on_time / len(completed_with_dates) * 100) if completed_with_dates else 0
-        )
-
-        # Team feedback
-        team_feedback = (
-            db.query(Feedback)
+        # Feedback received
+        feedback_rows = (
+            db.query(
+                Feedback.employee_id,
+                func.count(Feedback.id),
+                func.count(Feedback.rating),
+                func.coalesce(func.sum(Feedback.rating), 0),
+                count_if(Feedback.feedback_type == "positive"),
+            )
             .filter(
-                Feedback.employee_id.in_(member_ids),
-                Feedback.given_on >= datetime.combine(start_date, datetime.min.time()),
-                Feedback.given_on <= datetime.combine(end_date, datetime.max.time()),
+                Feedback.employee_id.in_(ids),
+                Feedback.given_on >= period_start,
+                Feedback.given_on <= period_end,
             )
+            .group_by(Feedback.employee_id)
             .all()
         )
+        for employee_id, total, rated, rating_sum, positive in feedback_rows:
+            metrics[employee_id].update(
+                feedback_count=total,
+                rated_feedback_count=rated,
+                rating_sum=rating_sum,
+                positive_feedback=positive,
+            )
 
-        total_feedback = len(team_feedback)
-        rated_feedback = [f for f in team_feedback if f.rating is not None]
-        avg_rating = (
-            sum(f.rating for f in rated_feedback) / len(rated_feedback)
-            if rated_feedback
-            else 0
-        )
-        positive_feedback = sum(
-            1 for f in team_feedback if f.feedback_type == "positive"
-        )
-        positive_feedback_pct = (
-            (positive_feedback / total_feedback * 100) if total_feedback > 0 else 0
-        )
-
-        # Team attendance
-        team_attendance = (
-            db.query(Attendance)
+        # Attendance (present and WFH count as attended)
+        attendance_rows = (
+            db.query(
+                Attendance.employee_id,
+                func.count(Attendance.id),
+                count_if(
+                    Attendance.status.in_(
+                        [AttendanceStatus.PRESENT, AttendanceStatus.WFH]
+                    )
+                ),
+            )
             .filter(
-                Attendance.employee_id.in_(member_ids),
+                Attendance.employee_id.in_(ids),
                 Attendance.date >= start_date,
                 Attendance.date <= end_date,
             )
+            .group_by(Attendance.employee_id)
             .all()
         )
+        for employee_id, total, attended in attendance_rows:
+            metrics[employee_id].update(
+                attendance_records=total, attended_records=attended
+            )
 
-        total_records = len(team_attendance)
-        present_records = sum(
-            1
-            for a in team_attendance
-            if a.status in [AttendanceStatus.PRESENT, AttendanceStatus.WFH]
-        )
-        avg_attendance = (
-            (present_records / total_records * 100) if total_records > 0 else 0
-        )
-
-        # Team training
-        team_training = (
-            db.query(SkillModuleEnrollment)
+        # Training modules completed in the period
+        training_rows = (
+            db.query(
+                SkillModuleEnrollment.employee_id,
+                func.count(SkillModuleEnrollment.id),
+            )
             .filter(
-                SkillModuleEnrollment.employee_id.in_(member_ids),
+                SkillModuleEnrollment.employee_id.in_(ids),
                 SkillModuleEnrollment.status == ModuleStatus.COMPLETED,
-                SkillModuleEnrollment.completed_date
-                >= datetime.combine(start_date, datetime.min.time()),
-                SkillModuleEnrollment.completed_date
-                <= datetime.combine(end_date, datetime.max.time()),
+                SkillModuleEnrollment.completed_date >= period_start,
+                SkillModuleEnrollment.completed_date <= period_end,
             )
-            .count()
+            .group_by(SkillModuleEnrollment.employee_id)
+            .all()
         )
+        for employee_id, total in training_rows:
+            metrics[employee_id]["training_completed"] = total
 
-        # Team collaboration
-        team_comments = (
-            db.query(GoalComment)
+        # Collaboration: goal comments written by the member
+        comment_rows = (
+            db.query(
+                GoalComment.user_id,
+                func.count(GoalComment.id),
+                count_if(GoalComment.comment_type == "blocker"),
+            )
             .join(Goal)
             .filter(
-                GoalComment.user_id.in_(member_ids),
-                GoalComment.created_at
-                >= datetime.combine(start_date, datetime.min.time()),
-                GoalComment.created_at
-                <= datetime.combine(end_date, datetime.max.time()),
+                GoalComment.user_id.in_(ids),
+                GoalComment.created_at >= period_start,
+                GoalComment.created_at <= period_end,
             )
-            .count()
+            .group_by(GoalComment.user_id)
+            .all()
         )
+        for user_id, total, blockers in comment_rows:
+            metrics[user_id].update(total_comments=total, blocker_comments=blockers)
 
-        blockers = (
-            db.query(GoalComment)
-            .join(Goal)
-            .filter(
-                GoalComment.user_id.in_(member_ids),
-                GoalComment.comment_type == "blocker",
-                GoalComment.created_at
-                >= datetime.combine(start_date, datetime.min.time()),
-                GoalComment.created_at
-                <= datetime.combine(end_date, datetime.max.time()),
-            )
-            .count()
+        return metrics
+
+    @staticmethod
+    def _sum_member_metrics(member_metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add up per-member counts into group totals"""
+        totals = dict.fromkeys(MEMBER_METRIC_KEYS, 0)
+        for metrics in member_metrics:
+            for key in MEMBER_METRIC_KEYS:
+                totals[key] += metrics[key]
+        return totals
+
+    def _aggregate_team_data(
+        self,
+        team: Team,
+        members: List[User],
+        member_metrics: Dict[int, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Aggregate team-level performance data from per-member counts"""
+
+        totals = self._sum_member_metrics([member_metrics[m.id] for m in members])
+
+        total_goals = totals["total_goals"]
+        goal_completion_rate = (
+            (totals["completed_goals"] / total_goals * 100) if total_goals > 0 else 0
+        )
+        on_time_rate = (
+            (totals["on_time_goals"] / totals["completed_with_dates"] * 100)
+            if totals["completed_with_dates"]
+            else 0
         )
 
+        total_feedback = totals["feedback_count"]
+        avg_rating = (
+            totals["rating_sum"] / totals["rated_feedback_count"]
+            if totals["rated_feedback_count"]
+            else 0
+        )
+        positive_feedback_pct = (
+            (totals["positive_feedback"] / total_feedback * 100)
+            if total_feedback > 0
+            else 0
+        )
+
+        avg_attendance = (
+            (totals["attended_records"] / totals["attendance_records"] * 100)
+            if totals["attendance_records"] > 0
+            else 0
+        )
+
+        team_comments = totals["total_comments"]
+
         return {
             "team_name": team.name,
             "department_name": team.department.name
@@ -1339,9 +1476,9 @@ class AIPerformanceReportService:
             "manager_name": team.manager.name if team.manager else "Not assigned",
             "team_size": len(members),
             "total_goals": total_goals,
-            "completed_goals": completed_goals,
-            "in_progress_goals": in_progress_goals,
-            "overdue_goals": overdue_goals,
+            "completed_goals": totals["completed_goals"],
+            "in_progress_goals": totals["in_progress_goals"],
+            "overdue_goals": totals["overdue_goals"],
             "goal_completion_rate": goal_completion_rate,
             "avg_completion_rate": goal_completion_rate,  # Same as team rate
             "on_time_rate": on_time_rate,
@@ -1349,9 +1486,9 @@ class AIPerformanceReportService:
             "avg_rating": avg_rating,
             "positive_feedback_pct": positive_feedback_pct,
             "avg_attendance": avg_attendance,
-            "avg_training_completion": team_training,
+            "avg_training_completion": totals["training_completed"],
             "total_comments": team_comments,
-            "total_blockers": blockers,
+            "total_blockers": totals["blocker_comments"],
             "collaboration_score": "High"
             if team_comments > len(members) * 5
             else "Moderate"
@@ -1359,79 +1496,29 @@ class AIPerformanceReportService:
             else "Low",
         }
 
-    def _get_member_summary(
-        self, db: Session, member: User, start_date: date, end_date: date
+    def _build_member_summary(
+        self, member: User, metrics: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Get performance summary for a team member"""
-
-        # Goals
-        member_goals = (
-            db.query(Goal)
-            .filter(
-                Goal.employee_id == member.id,
-                Goal.start_date >= start_date,
-                Goal.start_date <= end_date,
-                Goal.is_deleted == False,
-            )
-            .all()
-        )
+        """Performance summary for a team member from their raw counts"""
 
-        total_goals = len(member_goals)
-        completed = sum(1 for g in member_goals if g.status == GoalStatus.COMPLETED)
-        overdue = sum(
-            1
-            for g in member_goals
-            if g.target_date < date.today() and g.status != GoalStatus.COMPLETED
-        )
+        total_goals = metrics["total_goals"]
+        completed = metrics["completed_goals"]
+        overdue = metrics["overdue_goals"]
         completion_rate = (completed / total_goals * 100) if total_goals > 0 else 0
 
-        # Feedback
-        member_feedback = (
-            db.query(Feedback)
-            .filter(
-                Feedback.employee_id == member.id,
-                Feedback.given_on >= datetime.combine(start_date, datetime.min.time()),
-                Feedback.given_on <= datetime.combine(end_date, datetime.max.time()),
-            )
-            .all()
-        )
-
-        feedback_count = len(member_feedback)
-        rated = [f for f in member_feedback if f.rating is not None]
-        avg_rating = sum(f.rating for f in rated) / len(rated) if rated else 0
-
-        # Attendance
-        member_attendance = (
-            db.query(Attendance)
-            .filter(
-                Attendance.employee_id == member.id,
-                Attendance.date >= start_date,
-                Attendance.date <= end_date,
-            )
-            .all()
+        feedback_count = metrics["feedback_count"]
+        avg_rating = (
+            metrics["rating_sum"] / metrics["rated_feedback_count"]
+            if metrics["rated_feedback_count"]
+            else 0
         )
 
-        total_att = len(member_attendance)
-        present = sum(
-            1
-            for a in member_attendance
-            if a.status in [AttendanceStatus.PRESENT, AttendanceStatus.WFH]
+        total_att = metrics["attendance_records"]
+        attendance_rate = (
+            (metrics["attended_records"] / total_att * 100) if total_att > 0 else 0
         )
-        attendance_rate = (present / total_att * 100) if total_att > 0 else 0
 
-        # Training
-        training_completed = (
-            db.query(SkillModuleEnrollment)
-            .filter(
-                SkillModuleEnrollment.employee_id == member.id,
-                SkillModuleEnrollment.status == ModuleStatus.COMPLETED,
-                SkillModuleEnrollment.completed_date
-                >= datetime.combine(start_date, datetime.min.time()),
-                SkillModuleEnrollment.completed_date
-                <= datetime.combine(end_date, datetime.max.time()),
-            )
-            .count()
-        )
+        training_completed = metrics["training_completed"]
 
         # Determine highlight and challenge
         highlight = ""
@@ -1470,6 +1557,8 @@ class AIPerformanceReportService:
             "avg_feedback_rating": avg_rating,
             "attendance_rate": attendance_rate,
             "training_completion": training_completed,
+            "total_comments": metrics["total_comments"],
+            "blocker_comments": metrics["blocker_comments"],
             "highlight": highlight,
             "challenge": challenge,
             "summary": f"{member.name} achieved {completion_rate:.1f}% goal completion with {avg_rating:.1f}/5.0 average feedback rating.",
@@ -1541,18 +1630,40 @@ class AIPerformanceReportService:
             )
             dept_name = None
 
+        # Active employees of these departments, then their metrics in one grouped pass
+        dept_ids = [d.id for d in departments]
+        in_scope = (User.department_id.in_(dept_ids), User.is_active == True)
+        employees = db.query(User.id, User.department_id).filter(*in_scope).all()
+        member_metrics = self._aggregate_member_metrics(
+            db,
+            [employee_id for employee_id, _ in employees],
+            period_start,
+            period_end,
+            member_filter=select(User.id).where(*in_scope),
+        )
+
+        metrics_by_department: Dict[int, List[Dict[str, Any]]] = {
+            dept_id: [] for dept_id in dept_ids
+        }
+        for employee_id, dept_id in employees:
+            metrics_by_department[dept_id].append(member_metrics[employee_id])
+
         # Aggregate organization data
         org_data = self._aggregate_organization_data(
-            db, departments, period_start, period_end
+            departments,
+            len(employees),
+            self._sum_member_metrics(list(member_metrics.values())),
         )
 
         # Get department summaries
-        department_summaries = []
-        for dept in departments:
-            dept_summary = self._get_department_summary(
-                db, dept, period_start, period_end
+        department_summaries = [
+            self._build_department_summary(
+                dept,
+                len(metrics_by_department[dept.id]),
+                self._sum_member_metrics(metrics_by_department[dept.id]),
             )
-            department_summaries.append(dept_summary)
+            for dept in departments
+        ]
 
         # Build prompt
         prompt = self.prompt_templates.get_organization_report_prompt(
@@ -1589,78 +1700,37 @@ class AIPerformanceReportService:
 
     def _aggregate_organization_data(
         self,
-        db: Session,
         departments: List[Department],
-        start_date: date,
-        end_date: date,
+        employee_count: int,
+        totals: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """Aggregate organization-level data"""
+        """Aggregate organization-level data from summed member counts"""
 
-        # Get all active employees in these departments
-        dept_ids = [d.id for d in departments]
-        all_employees = (
-            db.query(User)
-            .filter(User.department_id.in_(dept_ids), User.is_active == True)
-            .all()
-        )
-
-        employee_ids = [e.id for e in all_employees]
-
-        # Organization goals
-        org_goals = (
-            db.query(Goal)
-            .filter(
-                Goal.employee_id.in_(employee_ids),
-                Goal.start_date >= start_date,
-                Goal.start_date <= end_date,
-                Goal.is_deleted == False,
-            )
-            .all()
+        total_goals = totals["total_goals"]
+        completion_rate = (
+            (totals["completed_goals"] / total_goals * 100) if total_goals > 0 else 0
         )
 
-        total_goals = len(org_goals)
-        completed = sum(1 for g in org_goals if g.status == GoalStatus.COMPLETED)
-        completion_rate = (completed / total_goals * 100) if total_goals > 0 else 0
-
         # On-time rate
-        completed_with_dates = [
-            g
-            for g in org_goals
-            if g.status == GoalStatus.COMPLETED and g.completion_date
-        ]
-        on_time = sum(
-            1 for g in completed_with_dates if g.completion_date <= g.target_date
-        )
         on_time_rate = (
-            (on_time / len(completed_with_dates) * 100) if completed_with_dates else 0
+            (totals["on_time_goals"] / totals["completed_with_dates"] * 100)
+            if totals["completed_with_dates"]
+            else 0
         )
 
         # Average overdue per employee
-        overdue_goals = [
-            g
-            for g in org_goals
-            if g.target_date < date.today() and g.status != GoalStatus.COMPLETED
-        ]
-        avg_overdue = len(overdue_goals) / len(all_employees) if all_employees else 0
+        avg_overdue = totals["overdue_goals"] / employee_count if employee_count else 0
 
-        # Organization feedback
-        org_feedback = (
-            db.query(Feedback)
-            .filter(
-                Feedback.employee_id.in_(employee_ids),
-                Feedback.given_on >= datetime.combine(start_date, datetime.min.time()),
-                Feedback.given_on <= datetime.combine(end_date, datetime.max.time()),
-            )
-            .all()
+        total_feedback = totals["feedback_count"]
+        avg_rating = (
+            totals["rating_sum"] / totals["rated_feedback_count"]
+            if totals["rated_feedback_count"]
+            else 0
         )
 
-        total_feedback = len(org_feedback)
-        rated = [f for f in org_feedback if f.rating is not None]
-        avg_rating = sum(f.rating for f in rated) / len(rated) if rated else 0
-
         # Feedback frequency
         feedback_per_employee = (
-            total_feedback / len(all_employees) if all_employees else 0
+            total_feedback / employee_count if employee_count else 0
         )
         if feedback_per_employee >= 3:
             freq = "High"
@@ -1669,45 +1739,20 @@ class AIPerformanceReportService:
         else:
             freq = "Low"
 
-        # Organization attendance
-        org_attendance = (
-            db.query(Attendance)
-            .filter(
-                Attendance.employee_id.in_(employee_ids),
-                Attendance.date >= start_date,
-                Attendance.date <= end_date,
-            )
-            .all()
-        )
-
-        total_att = len(org_attendance)
-        present = sum(
-            1
-            for a in org_attendance
-            if a.status in [AttendanceStatus.PRESENT, AttendanceStatus.WFH]
+        attendance_rate = (
+            (totals["attended_records"] / totals["attendance_records"] * 100)
+            if totals["attendance_records"] > 0
+            else 0
         )
-        attendance_rate = (present / total_att * 100) if total_att > 0 else 0
 
-        # Training completion
-        training = (
-            db.query(SkillModuleEnrollment)
-            .filter(
-                SkillModuleEnrollment.employee_id.in_(employee_ids),
-                SkillModuleEnrollment.status == ModuleStatus.COMPLETED,
-                SkillModuleEnrollment.completed_date
-                >= datetime.combine(start_date, datetime.min.time()),
-                SkillModuleEnrollment.completed_date
-                <= datetime.combine(end_date, datetime.max.time()),
-            )
-            .count()
+        training_per_employee = (
+            totals["training_completed"] / employee_count if employee_count else 0
         )
-
-        training_per_employee = training / len(all_employees) if all_employees else 0
         training_completion_pct = training_per_employee * 10  # Rough estimate
 
         return {
             "org_name": "Company",  # Can be made dynamic
-            "total_employees": len(all_employees),
+            "total_employees": employee_count,
             "total_departments": len(departments),
             "total_goals": total_goals,
             "completion_rate": completion_rate,
@@ -1720,21 +1765,13 @@ class AIPerformanceReportService:
             "training_completion": min(training_completion_pct, 100),
         }
 
-    def _get_department_summary(
-        self, db: Session, department: Department, start_date: date, end_date: date
+    @staticmethod
+    def _build_department_summary(
+        department: Department, employee_count: int, totals: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Get summary for a department"""
+        """Summary for a department from its summed member counts"""
 
-        # Get department employees
-        dept_employees = (
-            db.query(User)
-            .filter(User.department_id == department.id, User.is_active == True)
-            .all()
-        )
-
-        employee_ids = [e.id for e in dept_employees]
-
-        if not employee_ids:
+        if not employee_count:
             return {
                 "name": department.name,
                 "employee_count": 0,
@@ -1745,72 +1782,21 @@ class AIPerformanceReportService:
                 "status": "no_data",
             }
 
-        # Department goals
-        dept_goals = (
-            db.query(Goal)
-            .filter(
-                Goal.employee_id.in_(employee_ids),
-                Goal.start_date >= start_date,
-                Goal.start_date <= end_date,
-                Goal.is_deleted == False,
-            )
-            .all()
-        )
-
-        total = len(dept_goals)
-        completed = sum(1 for g in dept_goals if g.status == GoalStatus.COMPLETED)
-        completion_rate = (completed / total * 100) if total > 0 else 0
-
-        # Department feedback
-        dept_feedback = (
-            db.query(Feedback)
-            .filter(
-                Feedback.employee_id.in_(employee_ids),
-                Feedback.given_on >= datetime.combine(start_date, datetime.min.time()),
-                Feedback.given_on <= datetime.combine(end_date, datetime.max.time()),
-                Feedback.rating.isnot(None),
-            )
-            .all()
-        )
+        total = totals["total_goals"]
+        completion_rate = (totals["completed_goals"] / total * 100) if total > 0 else 0
 
         avg_rating = (
-            sum(f.rating for f in dept_feedback) / len(dept_feedback)
-            if dept_feedback
+            totals["rating_sum"] / totals["rated_feedback_count"]
+            if totals["rated_feedback_count"]
             else 0
         )
 
-        # Department attendance
-        dept_attendance = (
-            db.query(Attendance)
-            .filter(
-                Attendance.employee_id.in_(employee_ids),
-                Attendance.date >= start_date,
-                Attendance.date <= end_date,
-            )
-            .all()
-        )
-
-        total_att = len(dept_attendance)
-        present = sum(
-            1
-            for a in dept_attendance
-            if a.status in [AttendanceStatus.PRESENT, AttendanceStatus.WFH]
-        )
-        attendance_rate = (present / total_att * 100) if total_att > 0 else 0
-
-        # Training
-        training = (
-            db.query(SkillModuleEnrollment)
-            .filter(
-                SkillModuleEnrollment.employee_id.in_(employee_ids),
-                SkillModuleEnrollment.status == ModuleStatus.COMPLETED,
-                SkillModuleEnrollment.completed_date
-                >= datetime.combine(start_date, datetime.min.time()),
-            )
-            .count()
+        total_att = totals["attendance_records"]
+        attendance_rate = (
+            (totals["attended_records"] / total_att * 100) if total_att > 0 else 0
         )
 
-        training_pct = (training / len(employee_ids) * 10) if employee_ids else 0
+        training_pct = totals["training_completed"] / employee_count * 10
 
         # Determine status
         if completion_rate >= 75 and avg_rating >= 4.0:
@@ -1824,7 +1810,7 @@ class AIPerformanceReportService:
 
         return {
             "name": department.name,
-            "employee_count": len(dept_employees),
+            "employee_count": employee_count,
             "completion_rate": completion_rate,
             "avg_rating": avg_rating,
             "attendance_rate": attendance_rate,
@@ -4,14 +4,28 @@ Handles multiple API keys with automatic fallback for reliability
 """
 import os
 import logging
+import threading
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-import google.generativeai as genai
+from google.ai import generativelanguage as glm
+from google.api_core.client_options import ClientOptions
+from google.api_core.retry import Retry
 from fastapi import HTTPException, status
 
+from services.ai_worker_pool import ai_worker_pool
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class GenerationResult:
+    """Generated text and the provider/model that actually served it"""
+    text: str
+    provider: str
+    model: str
+
+
 class AIProviderManager:
     """
     Manages Google Gemini API calls with multiple keys and automatic fallback.
@@ -38,8 +52,58 @@ class AIProviderManager:
             logger.error("No Google API keys configured!")
             raise ValueError("At least one GOOGLE_API_KEY must be configured")
         
+        # One API client per key; genai.configure() is process-global and racy
+        self._clients: Dict[str, glm.GenerativeServiceClient] = {}
+        self._clients_lock = threading.Lock()
+        self.worker_pool = ai_worker_pool
+        
         logger.info(f"AI Provider Manager initialized with {len([p for p in self.providers if p['key']])} available keys")
     
+    def _get_client(self, provider: Dict[str, Any]) -> glm.GenerativeServiceClient:
+        """Get (or create) the API client bound to this provider's key"""
+        with self._clients_lock:
+            client = self._clients.get(provider["name"])
+            if client is None:
+                client = glm.GenerativeServiceClient(
+                    client_options=ClientOptions(api_key=provider["key"])
+                )
+                self._clients[provider["name"]] = client
+            return client
+    
+    def _generate_sync(
+        self,
+        provider: Dict[str, Any],
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        timeout: float
+    ) -> str:
+        """Blocking Gemini call; runs on an AI worker thread"""
+        request = glm.GenerateContentRequest(
+            model=f"models/{provider['model']}",
+            contents=[glm.Content(role="user", parts=[glm.Part(text=prompt)])],
+            generation_config=glm.GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens,
+                top_p=0.95,
+                top_k=40
+            )
+        )
+        
+        # Bound the client's own retries by the same deadline so the thread frees up
+        response = self._get_client(provider).generate_content(
+            request=request,
+            timeout=timeout,
+            retry=Retry(timeout=timeout)
+        )
+        
+        # Extract text from the first candidate
+        if response.candidates:
+            text = "".join(part.text for part in response.candidates[0].content.parts)
+            if text:
+                return text
+        raise Exception("No text in response")
+    
     async def generate_report(
         self,
         prompt: str,
@@ -57,6 +121,22 @@ class AIProviderManager:
         Returns:
             Generated report as markdown string
             
+        Raises:
+            HTTPException: If all providers fail
+        """
+        result = await self.generate(prompt, temperature, max_tokens)
+        return result.text
+    
+    async def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2048
+    ) -> GenerationResult:
+        """
+        Same as generate_report, also returning which provider and model
+        served the call (a backup key after the primary failed, for example).
+        
         Raises:
             HTTPException: If all providers fail
         """
@@ -70,30 +150,19 @@ class AIProviderManager:
             try:
                 logger.info(f"Attempting to generate report with provider {i+1}: {provider['name']}")
                 
-                # Configure Gemini with current key
-                genai.configure(api_key=provider["key"])
-                
-                # Initialize model
-                model = genai.GenerativeModel(
-                    model_name=provider["model"],
-                    generation_config={
-                        "temperature": temperature,
-                        "max_output_tokens": max_tokens,
-                        "top_p": 0.95,
-                        "top_k": 40
-                    }
+                timeout = self.worker_pool.default_timeout
+                report = await self.worker_pool.run(
+                    provider["name"],
+                    self._generate_sync,
+                    provider,
+                    prompt,
+                    temperature,
+                    max_tokens,
+                    timeout,
+                    timeout=timeout
                 )
-                
-                # Generate content
-                response = model.generate_content(prompt)
-                
-                # Extract text from response
-                if hasattr(response, 'text'):
-                    report = response.text
-                    logger.info(f"Successfully generated report with provider {i+1} ({len(report)} chars)")
-                    return report
-                else:
-                    raise Exception("No text in response")
+                logger.info(f"Successfully generated report with provider {i+1} ({len(report)} chars)")
+                return GenerationResult(text=report, provider=provider["name"], model=provider["model"])
                 
             except Exception as e:
                 last_error = e
@@ -126,7 +195,8 @@ class AIProviderManager:
         status_info = {
             "total_providers": len(self.providers),
             "available_providers": 0,
-            "providers": []
+            "providers": [],
+            "worker_pool": self.worker_pool.stats()
         }
         
         for i, provider in enumerate(self.providers):
@@ -0,0 +1,118 @@
+"""
+AI Report Cache - Content-addressed store for generated performance reports
+
+A report is identified by a SHA-256 over everything that shapes it: the
+employee, period, template, selected metrics, the aggregated metrics payload,
+the prompt template version and the model. If none of those changed, the
+previously generated markdown is returned without calling the AI provider.
+Entries live in the `ai_report_cache` table so they survive restarts and are
+shared by all workers; hit/miss counters are per process.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import logging
+import threading
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from config import settings
+from models import AIReportCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class AIReportCache:
+    """Looks up and stores generated reports by input hash"""
+
+    def __init__(self, enabled: bool, max_age_days: int):
+        self.enabled = enabled
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Stable SHA-256 over the report inputs (dates and enums via str())"""
+        payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, db: Session, cache_key: str) -> Optional[AIReportCacheEntry]:
+        """Return a fresh entry for this key (and count the hit) or None"""
+        if not self.enabled:
+            return None
+
+        oldest = datetime.utcnow() - timedelta(days=self.max_age_days)
+        entry = (
+            db.query(AIReportCacheEntry)
+            .filter(
+                AIReportCacheEntry.cache_key == cache_key,
+                AIReportCacheEntry.created_at >= oldest,
+            )
+            .first()
+        )
+        if entry is None:
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        try:
+            entry.hit_count = (entry.hit_count or 0) + 1
+            entry.last_hit_at = datetime.utcnow()
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Could not record report cache hit: {str(e)}")
+        return entry
+
+    def put(self, db: Session, cache_key: str, **fields: Any) -> None:
+        """Store a generated report; replaces an expired entry with the same key"""
+        if not self.enabled:
+            return
+
+        try:
+            db.query(AIReportCacheEntry).filter(
+                AIReportCacheEntry.cache_key == cache_key
+            ).delete(synchronize_session=False)
+            db.add(AIReportCacheEntry(cache_key=cache_key, **fields))
+            db.commit()
+        except IntegrityError:
+            # Another request stored the same report first
+            db.rollback()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Could not store report in cache: {str(e)}")
+
+    def stats(self, db: Optional[Session] = None) -> Dict[str, Any]:
+        """Hit/miss counters for this process, plus stored entries if a session is given"""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        result = {
+            "enabled": self.enabled,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "max_age_days": self.max_age_days,
+        }
+        if db is not None:
+            result["entries"] = db.query(func.count(AIReportCacheEntry.id)).scalar() or 0
+        return result
+
+
+# Shared cache for the process
+ai_report_cache = AIReportCache(
+    enabled=settings.AI_REPORT_CACHE_ENABLED,
+    max_age_days=settings.AI_REPORT_CACHE_MAX_AGE_DAYS,
+)
@@ -0,0 +1,136 @@
+"""
+AI Worker Pool - Runs blocking AI provider calls off the event loop
+
+Provider SDK calls (e.g. Gemini `generate_content`) are synchronous. Awaiting
+them directly inside an `async def` route stalls every other request served
+by the same uvicorn worker. `AIWorkerPool.run` executes them in a shared,
+bounded thread pool with:
+
+ - a per-provider concurrency limit (extra callers wait on the event loop,
+   not in a thread),
+ - a timeout, after which the caller gets `AIWorkerTimeoutError`,
+ - cancellation: a call that has not started yet is dropped when the caller
+   times out or is cancelled. A call that is already running cannot be
+   interrupted from Python, so callers should also pass the same timeout to
+   the SDK; its provider slot is only released once the thread finishes.
+"""
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AIWorkerTimeoutError(Exception):
+    """Raised when a provider call does not finish within its timeout"""
+
+
+class AIWorkerPool:
+    """Bounded thread pool with per-provider concurrency limits"""
+
+    def __init__(
+        self,
+        max_workers: int,
+        per_provider_limit: int,
+        default_timeout: float,
+    ):
+        self.max_workers = max_workers
+        self.per_provider_limit = per_provider_limit
+        self.default_timeout = default_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="ai-worker"
+                )
+            return self._executor
+
+    def _get_semaphore(self, provider: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_provider_limit)
+            self._semaphores[provider] = semaphore
+        return semaphore
+
+    def _track(self, provider: str, delta: int) -> None:
+        with self._lock:
+            self._in_flight[provider] = self._in_flight.get(provider, 0) + delta
+
+    async def run(
+        self,
+        provider: str,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run `func(*args, **kwargs)` in the pool under `provider`'s limit.
+
+        Raises:
+            AIWorkerTimeoutError: If the call takes longer than `timeout`
+                (defaults to `AI_PROVIDER_TIMEOUT_SECONDS`)
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        semaphore = self._get_semaphore(provider)
+        await semaphore.acquire()
+
+        def release(_future) -> None:
+            self._track(provider, -1)
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                # Event loop already closed (shutdown); nothing is waiting
+                pass
+
+        try:
+            future = self._get_executor().submit(func, *args, **kwargs)
+        except Exception:
+            semaphore.release()
+            raise
+        self._track(provider, 1)
+        future.add_done_callback(release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise AIWorkerTimeoutError(
+                f"{provider} did not respond within {timeout:g}s"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool configuration and current in-flight calls per provider"""
+        with self._lock:
+            in_flight = dict(self._in_flight)
+        return {
+            "max_workers": self.max_workers,
+            "per_provider_limit": self.per_provider_limit,
+            "timeout_seconds": self.default_timeout,
+            "in_flight": in_flight,
+        }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and drop queued calls"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Shared pool for all AI services in this process
+ai_worker_pool = AIWorkerPool(
+    max_workers=settings.AI_WORKER_POOL_SIZE,
+    per_provider_limit=settings.AI_PROVIDER_MAX_CONCURRENCY,
+    default_timeout=settings.AI_PROVIDER_TIMEOUT_SECONDS,
+)
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 from datetime import datetime
 from models import Announcement, User, UserRole
+from utils.principal_cache import Principal
 from schemas.announcement_schemas import AnnouncementCreate, AnnouncementUpdate, AnnouncementResponse
 
 
@@ -53,7 +54,7 @@ class AnnouncementService:
     @staticmethod
     def get_announcements(
         db: Session,
-        current_user: User,
+        current_user: Principal,
         include_expired: bool = False,
         include_inactive: bool = False,
         skip: int = 0,
@@ -24,8 +24,9 @@ from datetime import datetime
 from typing import List, Optional, Tuple
 import logging
 import os
-import shutil
 from pathlib import Path
+from utils.file_upload import save_upload, remove_replaced_file, UploadTooLargeError
+from services.file_digest_service import FileDigestService
 
 logger = logging.getLogger(__name__)
 
@@ -335,17 +336,6 @@ class ApplicationService:
                 detail=f"Invalid file type. Allowed: {', '.join(ApplicationService.ALLOWED_EXTENSIONS)}",
             )
 
-        # Validate file size
-        file.file.seek(0, 2)  # Seek to end
-        file_size = file.file.tell()
-        file.file.seek(0)  # Reset to beginning
-
-        if file_size > ApplicationService.MAX_RESUME_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File too large. Maximum size: {ApplicationService.MAX_RESUME_SIZE / (1024 * 1024)}MB",
-            )
-
         # Ensure upload directory exists
         ApplicationService._ensure_upload_dir()
 
@@ -354,30 +344,50 @@ class ApplicationService:
         safe_filename = f"resume_{application_id}_{timestamp}{file_ext}"
         file_path = os.path.join(ApplicationService.UPLOAD_DIR, safe_filename)
 
-        # Delete old resume if exists
-        if application.resume_path and os.path.exists(application.resume_path):
-            try:
-                os.remove(application.resume_path)
-            except Exception as e:
-                logger.warning(f"Failed to delete old resume: {e}")
-
-        # Save file
+        # Stream file to disk, enforcing the size limit while copying
         try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            saved = await save_upload(file, file_path, ApplicationService.MAX_RESUME_SIZE)
+        except UploadTooLargeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"File too large. Maximum size: {ApplicationService.MAX_RESUME_SIZE / (1024 * 1024)}MB",
+            )
         except Exception as e:
             logger.error(f"Failed to save resume: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to save resume file",
             )
+        file_size = saved.size
+
+        old_path = application.resume_path
+        FileDigestService.forget(db, old_path)
+        FileDigestService.record(db, file_path, saved.sha256)
 
         # Update application
         application.resume_path = file_path
-        db.commit()
+        try:
+            db.commit()
+        except Exception:
+            # Clean up uploaded file if database update fails
+            db.rollback()
+            remove_replaced_file(file_path, old_path)
+            raise
+
+        # Delete old resume only once the new path is committed
+        remove_replaced_file(old_path, file_path)
 
         logger.info(f"Resume uploaded for application {application_id}: {file_path}")
 
+        # Extract the text now so screening runs reuse it instead of re-parsing
+        try:
+            from ai_services.resume_text_extractor import extract_in_process_pool
+
+            await extract_in_process_pool(file_path, content_hash=saved.sha256)
+        except Exception as e:
+            # Screening extracts it later; the upload itself succeeded
+            logger.warning(f"Failed to extract resume text for application {application_id}: {e}")
+
         return {
             "message": "Resume uploaded successfully",
             "resume_path": file_path,
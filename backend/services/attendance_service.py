@@ -2,9 +2,12 @@
 Business logic for attendance management
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, extract
+from sqlalchemy import func, and_, or_, extract, case
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from models import Attendance, User, Department, Team, AttendanceStatus, UserRole
+from services.hierarchy_service import HierarchyService
+from utils.pagination import paginate_keyset
 from pydantic_models import (
     PunchInRequest, PunchOutRequest, MarkAttendanceRequest,
     AttendanceRecordResponse, AttendanceSummaryResponse,
@@ -80,20 +83,7 @@ class AttendanceService:
         ).first()
         
         if existing_attendance:
-            if existing_attendance.check_in_time:
-                # Already punched in
-                return AttendanceService._map_attendance_to_response(existing_attendance), True
-            else:
-                # Update existing record (was marked absent or leave)
-                existing_attendance.check_in_time = current_time
-                existing_attendance.status = AttendanceStatus[request.status.value.upper()]
-                existing_attendance.location = request.location
-                if request.notes:
-                    existing_attendance.notes = request.notes
-                existing_attendance.updated_at = current_time
-                db.commit()
-                db.refresh(existing_attendance)
-                return AttendanceService._map_attendance_to_response(existing_attendance), False
+            return AttendanceService._punch_in_existing(db, existing_attendance, request, current_time)
         
         # Create new attendance record
         new_attendance = Attendance(
@@ -108,13 +98,48 @@ class AttendanceService:
         )
         
         db.add(new_attendance)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another request created today's row first (unique employee_id + date)
+            db.rollback()
+            existing_attendance = db.query(Attendance).filter(
+                Attendance.employee_id == user_id,
+                Attendance.date == today
+            ).first()
+            if not existing_attendance:
+                # Not the unique-row race (e.g. FK violation)
+                raise
+            return AttendanceService._punch_in_existing(db, existing_attendance, request, current_time)
         db.refresh(new_attendance)
         
         logger.info(f"User {user_id} punched in at {current_time}")
         
         return AttendanceService._map_attendance_to_response(new_attendance), False
     
+    @staticmethod
+    def _punch_in_existing(
+        db: Session,
+        existing_attendance: Attendance,
+        request: PunchInRequest,
+        current_time: datetime
+    ) -> Tuple[AttendanceRecordResponse, bool]:
+        """Punch in against a row that already exists for today"""
+        if existing_attendance.check_in_time:
+            # Already punched in
+            return AttendanceService._map_attendance_to_response(existing_attendance), True
+        
+        # Update existing record (was marked absent or leave)
+        existing_attendance.check_in_time = current_time
+        existing_attendance.status = AttendanceStatus[request.status.value.upper()]
+        existing_attendance.location = request.location
+        if request.notes:
+            existing_attendance.notes = request.notes
+        existing_attendance.updated_at = current_time
+        db.commit()
+        db.refresh(existing_attendance)
+        return AttendanceService._map_attendance_to_response(existing_attendance), False
+    
     @staticmethod
     def punch_out(db: Session, user_id: int, request: PunchOutRequest) -> Tuple[AttendanceRecordResponse, float]:
         """
@@ -316,10 +341,12 @@ class AttendanceService:
     def get_team_attendance(
         db: Session,
         manager_id: int,
-        target_date: Optional[date] = None
+        target_date: Optional[date] = None,
+        include_indirect: bool = False
     ) -> Tuple[List[TeamAttendanceRecord], int, int, int, int, int]:
         """
-        Get team attendance for a manager (today or specific date)
+        Get team attendance for a manager (today or specific date).
+        With include_indirect, covers everyone below the manager, not just direct reports.
         
         Returns:
             Tuple of (records, total_members, present, absent, on_leave, wfh)
@@ -328,7 +355,8 @@ class AttendanceService:
             target_date = date.today()
         
         # Get manager's team members
-        team_members = db.query(User).filter(User.manager_id == manager_id, User.is_active == True).all()
+        report_ids = HierarchyService.report_ids_subquery(manager_id, include_indirect)
+        team_members = db.query(User).filter(User.id.in_(report_ids), User.is_active == True).all()
         
         if not team_members:
             return [], 0, 0, 0, 0, 0
@@ -409,13 +437,18 @@ class AttendanceService:
         team_id: Optional[int] = None,
         status_filter: Optional[str] = None,
         page: int = 1,
-        page_size: int = 50
-    ) -> Tuple[List[AttendanceRecordResponse], int, List[DepartmentAttendanceStats]]:
+        page_size: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[AttendanceRecordResponse], Optional[int], List[DepartmentAttendanceStats], Optional[str]]:
         """
         Get all attendance records (HR only)
         
+        With `cursor` (empty for the first page) pages by keyset instead of
+        `page`; the total is only counted if `include_total`.
+        
         Returns:
-            Tuple of (attendance_records, total_count, department_stats)
+            Tuple of (attendance_records, total_count or None, department_stats, next_cursor or None)
         """
         # Determine date range
         if target_date:
@@ -452,11 +485,19 @@ class AttendanceService:
                 pass
         
         # Get total count
-        total_count = query.count()
+        total_count = query.count() if include_total or cursor is None else None
         
         # Apply pagination
-        offset = (page - 1) * page_size
-        records = query.order_by(Attendance.date.desc(), User.name).offset(offset).limit(page_size).all()
+        next_cursor = None
+        if cursor is not None:
+            records, next_cursor = paginate_keyset(
+                query,
+                [(Attendance.date, True), (User.name, False), (Attendance.id, True)],
+                cursor, page_size, scope="attendance"
+            )
+        else:
+            offset = (page - 1) * page_size
+            records = query.order_by(Attendance.date.desc(), User.name).offset(offset).limit(page_size).all()
         
         # Calculate department-wise statistics for the date range
         department_stats = AttendanceService._get_department_stats(db, start_date, end_date)
@@ -464,50 +505,58 @@ class AttendanceService:
         return (
             [AttendanceService._map_attendance_to_response(r, include_employee_details=True) for r in records],
             total_count,
-            department_stats
+            department_stats,
+            next_cursor
         )
     
     @staticmethod
     def _get_department_stats(db: Session, start_date: date, end_date: date) -> List[DepartmentAttendanceStats]:
-        """Calculate department-wise attendance statistics"""
-        departments = db.query(Department).filter(Department.is_active == True).all()
-        
-        stats = []
-        for dept in departments:
-            # Get all employees in department
-            employees = db.query(User).filter(
-                User.department_id == dept.id,
-                User.is_active == True
-            ).all()
-            
-            if not employees:
-                continue
-            
-            employee_ids = [e.id for e in employees]
-            
-            # Get attendance records for this department in date range
-            attendance_records = db.query(Attendance).filter(
-                Attendance.employee_id.in_(employee_ids),
+        """
+        Calculate department-wise attendance statistics
+
+        One grouped query: active departments joined to their active
+        employees (headcount) and those employees' attendance in the range
+        (status counts). Departments without active employees are skipped.
+        """
+        def status_count(attendance_status: AttendanceStatus):
+            return func.coalesce(
+                func.sum(case((Attendance.status == attendance_status, 1), else_=0)), 0
+            )
+
+        rows = db.query(
+            Department.id,
+            Department.name,
+            func.count(func.distinct(User.id)),
+            status_count(AttendanceStatus.PRESENT),
+            status_count(AttendanceStatus.ABSENT),
+            status_count(AttendanceStatus.LEAVE),
+            status_count(AttendanceStatus.WFH),
+        ).join(
+            User, and_(User.department_id == Department.id, User.is_active == True)
+        ).outerjoin(
+            Attendance, and_(
+                Attendance.employee_id == User.id,
                 Attendance.date >= start_date,
                 Attendance.date <= end_date
-            ).all()
-            
-            # Count by status
-            present = sum(1 for r in attendance_records if r.status == AttendanceStatus.PRESENT)
-            absent = sum(1 for r in attendance_records if r.status == AttendanceStatus.ABSENT)
-            on_leave = sum(1 for r in attendance_records if r.status == AttendanceStatus.LEAVE)
-            wfh = sum(1 for r in attendance_records if r.status == AttendanceStatus.WFH)
-            
+            )
+        ).filter(
+            Department.is_active == True
+        ).group_by(
+            Department.id, Department.name
+        ).order_by(Department.id).all()
+
+        working_days = (end_date - start_date).days + 1
+        stats = []
+        for dept_id, dept_name, total_employees, present, absent, on_leave, wfh in rows:
             # Calculate attendance percentage
-            working_days = (end_date - start_date).days + 1
-            expected_attendance = len(employees) * working_days
+            expected_attendance = total_employees * working_days
             actual_attendance = present + wfh
             attendance_percentage = round((actual_attendance / expected_attendance * 100), 2) if expected_attendance > 0 else 0
             
             stats.append(DepartmentAttendanceStats(
-                department_id=dept.id,
-                department_name=dept.name,
-                total_employees=len(employees),
+                department_id=dept_id,
+                department_name=dept_name,
+                total_employees=total_employees,
                 present=present,
                 absent=absent,
                 on_leave=on_leave,
@@ -4,8 +4,10 @@ Authentication service - Business logic for auth operations
 from typing import Optional, Tuple
 from sqlalchemy.orm import Session
 from models import User
-from utils.password_utils import hash_password, verify_password
+from utils.password_utils import password_needs_rehash
+from utils.password_hasher import password_hasher
 from utils.jwt_utils import create_access_token, create_refresh_token, verify_token
+from utils.principal_cache import Principal, principal_cache
 from pydantic_models import UserInfoResponse
 from config import settings
 
@@ -14,10 +16,14 @@ class AuthService:
     """Authentication service class"""
     
     @staticmethod
-    def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
         """
         Authenticate user with email and password
         
+        The bcrypt check runs in the password hasher pool. A stored hash made
+        with a cost other than BCRYPT_ROUNDS is replaced after a successful
+        check, so changing the cost takes effect as users log in.
+        
         Args:
             db: Database session
             email: User email
@@ -37,9 +43,13 @@ class AuthService:
             return None
         
         # Verify password
-        if not verify_password(password, user.password_hash):
+        if not await password_hasher.verify(password, user.password_hash):
             return None
         
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = await password_hasher.hash(password)
+            db.commit()
+        
         return user
     
     @staticmethod
@@ -131,7 +141,7 @@ class AuthService:
         return access_token, expires_in
     
     @staticmethod
-    def change_password(db: Session, user: User, current_password: str, new_password: str) -> bool:
+    async def change_password(db: Session, user: User, current_password: str, new_password: str) -> bool:
         """
         Change user password
         
@@ -145,17 +155,17 @@ class AuthService:
             True if successful, False otherwise
         """
         # Verify current password
-        if not verify_password(current_password, user.password_hash):
+        if not await password_hasher.verify(current_password, user.password_hash):
             return False
         
         # Hash and update new password
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await password_hasher.hash(new_password)
         db.commit()
         
         return True
     
     @staticmethod
-    def reset_password(db: Session, employee_id: int, new_password: str) -> bool:
+    async def reset_password(db: Session, employee_id: int, new_password: str) -> bool:
         """
         Reset user password (by HR/Manager)
         
@@ -173,7 +183,7 @@ class AuthService:
             return False
         
         # Hash and update password
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await password_hasher.hash(new_password)
         db.commit()
         
         return True
@@ -199,4 +209,51 @@ class AuthService:
         user = db.query(User).filter(User.id == user_id, User.is_active == True).first()
         
         return user
-
+    
+    @staticmethod
+    def get_current_principal(db: Session, token: str) -> Optional[Principal]:
+        """
+        Get the authenticated principal for an access token
+        
+        A token seen recently is answered from the principal cache without
+        verifying the signature again or querying the database; otherwise the
+        token is verified and only the principal's columns are loaded.
+        
+        Args:
+            db: Database session
+            token: JWT access token
+            
+        Returns:
+            Principal or None if the token is invalid or the user inactive
+        """
+        principal = principal_cache.get(token)
+        if principal is not None:
+            return principal
+        
+        payload = verify_token(token, token_type="access")
+        
+        if not payload:
+            return None
+        
+        user_id = payload.get("user_id")
+        generation = principal_cache.generation(user_id)
+        row = db.query(
+            User.id,
+            User.email,
+            User.name,
+            User.role,
+            User.is_active,
+            User.employee_id,
+            User.department_id,
+            User.team_id,
+            User.manager_id,
+            User.job_role,
+            User.hierarchy_level
+        ).filter(User.id == user_id, User.is_active == True).first()
+        
+        if not row:
+            return None
+        
+        principal = Principal(**row._asdict())
+        principal_cache.put(token, principal, payload["exp"], generation)
+        return principal
@@ -18,6 +18,7 @@ from pydantic_models import (
     GoalStats, EmployeeDashboardResponse, LeaveBalanceInfo, AttendanceInfo,
     HolidayInfo, PerformanceMetrics, MonthlyModulesCompleted
 )
+from utils.principal_cache import Principal
 
 
 class DashboardService:
@@ -50,8 +51,14 @@ class DashboardService:
         return None
     
     @staticmethod
-    def get_leave_balance(user: User) -> LeaveBalanceInfo:
+    def get_leave_balance(db: Session, user_id: int) -> LeaveBalanceInfo:
         """Get leave balance for a user"""
+        user = db.query(
+            User.casual_leave_balance,
+            User.sick_leave_balance,
+            User.annual_leave_balance,
+            User.wfh_balance
+        ).filter(User.id == user_id).one()
         return LeaveBalanceInfo(
             casual_leave=user.casual_leave_balance or 0,
             sick_leave=user.sick_leave_balance or 0,
@@ -260,11 +267,11 @@ class DashboardService:
     # ==================== Manager Dashboard Methods ====================
     
     @staticmethod
-    def get_manager_dashboard_data(db: Session, manager: User) -> ManagerDashboardResponse:
+    def get_manager_dashboard_data(db: Session, manager: Principal) -> ManagerDashboardResponse:
         """Get complete Manager dashboard data"""
         
         # Personal info
-        leave_balance = DashboardService.get_leave_balance(manager)
+        leave_balance = DashboardService.get_leave_balance(db, manager.id)
         today_attendance = DashboardService.get_today_attendance(db, manager.id)
         upcoming_holidays = DashboardService.get_upcoming_holidays(db, limit=5)
         learner_rank = DashboardService.calculate_learner_rank(db, manager.id)
@@ -460,10 +467,10 @@ class DashboardService:
     # ==================== Employee Dashboard Methods ====================
     
     @staticmethod
-    def get_employee_dashboard_data(db: Session, employee: User) -> EmployeeDashboardResponse:
+    def get_employee_dashboard_data(db: Session, employee: Principal) -> EmployeeDashboardResponse:
         """Get complete Employee dashboard data"""
         
-        leave_balance = DashboardService.get_leave_balance(employee)
+        leave_balance = DashboardService.get_leave_balance(db, employee.id)
         today_attendance = DashboardService.get_today_attendance(db, employee.id)
         upcoming_holidays = DashboardService.get_upcoming_holidays(db, limit=5)
         learning_goals = DashboardService._get_employee_goal_stats(db, employee.id)
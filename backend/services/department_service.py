@@ -1,7 +1,7 @@
 """
 Department Service - Business logic for department management
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
 from fastapi import HTTPException, status
 from models import Department, User, Team
@@ -12,7 +12,7 @@ from schemas.department_schemas import (
     DepartmentDetailResponse,
     DepartmentStatsResponse
 )
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -132,11 +132,17 @@ class DepartmentService:
         total = query.count()
         
         # Get paginated results
-        departments = query.order_by(Department.name).offset(skip).limit(limit).all()
+        departments = query.options(joinedload(Department.head)).order_by(
+            Department.name
+        ).offset(skip).limit(limit).all()
         
-        # Format responses
+        # Format responses, with the page's counts from two grouped queries
+        employee_counts, team_counts = DepartmentService._count_members(db, [d.id for d in departments])
         formatted_departments = [
-            DepartmentService._format_department_response(d, db) for d in departments
+            DepartmentService._format_department_response(
+                d, db, employee_counts.get(d.id, 0), team_counts.get(d.id, 0)
+            )
+            for d in departments
         ]
         
         return formatted_departments, total
@@ -294,25 +300,38 @@ class DepartmentService:
         )
     
     @staticmethod
-    def _format_department_response(department: Department, db: Session) -> DepartmentResponse:
-        """Format department model to response schema"""
-        # Get head details
-        head_name = None
-        if department.head_id:
-            head_user = db.query(User).filter(User.id == department.head_id).first()
-            head_name = head_user.name if head_user else None
+    def _count_members(db: Session, department_ids: List[int]) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """Active employee and team counts per department, one grouped query each"""
+        if not department_ids:
+            return {}, {}
         
-        # Count employees
-        employee_count = db.query(User).filter(
-            User.department_id == department.id,
+        employee_counts = dict(db.query(User.department_id, func.count(User.id)).filter(
+            User.department_id.in_(department_ids),
             User.is_active == True
-        ).count()
+        ).group_by(User.department_id).all())
         
-        # Count teams
-        team_count = db.query(Team).filter(
-            Team.department_id == department.id,
+        team_counts = dict(db.query(Team.department_id, func.count(Team.id)).filter(
+            Team.department_id.in_(department_ids),
             Team.is_active == True
-        ).count()
+        ).group_by(Team.department_id).all())
+        
+        return employee_counts, team_counts
+    
+    @staticmethod
+    def _format_department_response(
+        department: Department,
+        db: Session,
+        employee_count: Optional[int] = None,
+        team_count: Optional[int] = None
+    ) -> DepartmentResponse:
+        """Format department model to response schema (counts queried unless given)"""
+        # Head relationship: loaded with list pages, else lazily
+        head_name = department.head.name if department.head else None
+        
+        if employee_count is None or team_count is None:
+            employee_counts, team_counts = DepartmentService._count_members(db, [department.id])
+            employee_count = employee_counts.get(department.id, 0)
+            team_count = team_counts.get(department.id, 0)
         
         return DepartmentResponse(
             id=department.id,
@@ -333,23 +352,22 @@ class DepartmentService:
         # Get basic response
         basic_response = DepartmentService._format_department_response(department, db)
         
-        # Get teams
-        teams = db.query(Team).filter(
+        # Get teams with their managers
+        teams = db.query(Team).options(joinedload(Team.manager)).filter(
             Team.department_id == department.id,
             Team.is_active == True
         ).all()
         
+        # Active members per team in one grouped query
+        member_counts = dict(db.query(User.team_id, func.count(User.id)).filter(
+            User.team_id.in_([team.id for team in teams]),
+            User.is_active == True
+        ).group_by(User.team_id).all()) if teams else {}
+        
         teams_info = []
         for team in teams:
-            manager_name = None
-            if team.manager_id:
-                manager = db.query(User).filter(User.id == team.manager_id).first()
-                manager_name = manager.name if manager else None
-            
-            member_count = db.query(User).filter(
-                User.team_id == team.id,
-                User.is_active == True
-            ).count()
+            manager_name = team.manager.name if team.manager else None
+            member_count = member_counts.get(team.id, 0)
             
             teams_info.append({
                 "id": team.id,
@@ -1,7 +1,7 @@
 """
 Employee Service - Business logic for employee management (HR only)
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, extract, and_, or_
 from fastapi import HTTPException, status
 from models import User, Department, Team, UserRole
@@ -12,7 +12,10 @@ from schemas.employee_schemas import (
     EmployeeListItem,
     EmployeeStatsResponse
 )
-from utils.password_utils import hash_password
+from services.hierarchy_service import HierarchyService
+from utils.password_hasher import password_hasher
+from utils.principal_cache import principal_cache
+from utils.pagination import paginate_keyset
 from typing import List, Tuple, Optional
 from datetime import datetime, timedelta
 import logging
@@ -25,8 +28,15 @@ logger = logging.getLogger(__name__)
 class EmployeeService:
     """Service class for employee management operations (HR only)"""
     
+    # Loaded with list pages so list items need no per-row queries
+    LIST_ITEM_LOAD_OPTIONS = (
+        joinedload(User.department_obj),
+        joinedload(User.team_obj),
+        joinedload(User.manager),
+    )
+    
     @staticmethod
-    def create_employee(
+    async def create_employee(
         db: Session,
         employee_data: EmployeeCreate
     ) -> EmployeeResponse:
@@ -81,7 +91,7 @@ class EmployeeService:
                     )
             
             # Hash password
-            hashed_password = hash_password(employee_data.password)
+            hashed_password = await password_hasher.hash(employee_data.password)
             
             # Convert role string to UserRole enum
             role_map = {
@@ -117,6 +127,8 @@ class EmployeeService:
             )
             
             db.add(new_employee)
+            db.flush()
+            HierarchyService.add_user(db, new_employee.id, new_employee.manager_id)
             db.commit()
             db.refresh(new_employee)
             
@@ -156,9 +168,19 @@ class EmployeeService:
         department_id: Optional[int] = None,
         team_id: Optional[int] = None,
         role: Optional[str] = None,
-        is_active: Optional[bool] = None
-    ) -> Tuple[List[EmployeeListItem], int]:
-        """Get all employees with filters (HR only)"""
+        is_active: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[EmployeeListItem], Optional[int], Optional[str]]:
+        """
+        Get all employees with filters (HR only)
+
+        With `cursor` (empty for the first page) pages by keyset instead of
+        `skip`; the total is only counted if `include_total`.
+
+        Returns:
+            Tuple of (employees, total or None, next_cursor or None)
+        """
         query = db.query(User)
         
         # Search filter (name or email or employee_id)
@@ -196,17 +218,27 @@ class EmployeeService:
             query = query.filter(User.is_active == is_active)
         
         # Get total count
-        total = query.count()
+        total = query.count() if include_total or cursor is None else None
         
         # Get paginated results
-        employees = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
+        next_cursor = None
+        if cursor is not None:
+            employees, next_cursor = paginate_keyset(
+                query.options(*EmployeeService.LIST_ITEM_LOAD_OPTIONS),
+                [(User.created_at, True), (User.id, True)],
+                cursor, limit, scope="employees"
+            )
+        else:
+            employees = query.options(*EmployeeService.LIST_ITEM_LOAD_OPTIONS).order_by(
+                User.created_at.desc()
+            ).offset(skip).limit(limit).all()
         
         # Format responses
         formatted_employees = [
             EmployeeService._format_employee_list_item(e, db) for e in employees
         ]
         
-        return formatted_employees, total
+        return formatted_employees, total, next_cursor
     
     @staticmethod
     def update_employee(
@@ -274,6 +306,7 @@ class EmployeeService:
                         status_code=status.HTTP_404_NOT_FOUND,
                         detail=f"Manager with ID {employee_data.manager_id} not found"
                     )
+                HierarchyService.ensure_valid_manager(db, employee_id, employee_data.manager_id)
             
             # Update fields
             update_data = employee_data.dict(exclude_unset=True)
@@ -288,11 +321,17 @@ class EmployeeService:
                 }
                 update_data['role'] = role_map.get(update_data['role'].lower(), UserRole.EMPLOYEE)
             
+            previous_manager_id = employee.manager_id
             for field, value in update_data.items():
                 setattr(employee, field, value)
             
+            if 'manager_id' in update_data and employee.manager_id != previous_manager_id:
+                db.flush()
+                HierarchyService.move_user(db, employee.id, employee.manager_id)
+            
             db.commit()
             db.refresh(employee)
+            principal_cache.invalidate_user(employee_id)
             
             logger.info(f"Employee updated: {employee.name} ({employee_id})")
             
@@ -334,6 +373,7 @@ class EmployeeService:
         try:
             employee.is_active = False
             db.commit()
+            principal_cache.invalidate_user(employee_id)
             logger.info(f"Employee deactivated: {employee.name} ({employee_id})")
         except Exception as e:
             db.rollback()
@@ -476,26 +516,10 @@ class EmployeeService:
     @staticmethod
     def _format_employee_list_item(employee: User, db: Session) -> EmployeeListItem:
         """Format employee model to list item schema"""
-        # Get department name
-        department_name = None
-        if employee.department_id:
-            dept = db.query(Department).filter(Department.id == employee.department_id).first()
-            if dept:
-                department_name = dept.name
-        
-        # Get team name
-        team_name = None
-        if employee.team_id:
-            team = db.query(Team).filter(Team.id == employee.team_id).first()
-            if team:
-                team_name = team.name
-        
-        # Get manager name
-        manager_name = None
-        if employee.manager_id:
-            manager = db.query(User).filter(User.id == employee.manager_id).first()
-            if manager:
-                manager_name = manager.name
+        # Relationships: loaded with list pages (LIST_ITEM_LOAD_OPTIONS), else lazily
+        department_name = employee.department_obj.name if employee.department_obj else None
+        team_name = employee.team_obj.name if employee.team_obj else None
+        manager_name = employee.manager.name if employee.manager else None
         
         return EmployeeListItem(
             id=employee.id,
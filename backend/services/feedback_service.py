@@ -1,10 +1,12 @@
 """
 Feedback Service - Business logic for feedback management
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, extract, and_, or_
 from fastapi import HTTPException, status
 from models import Feedback, User
+from utils.principal_cache import Principal
+from utils.pagination import paginate_keyset
 from schemas.feedback_schemas import (
     FeedbackCreate,
     FeedbackUpdate,
@@ -21,6 +23,12 @@ logger = logging.getLogger(__name__)
 class FeedbackService:
     """Service class for feedback operations"""
     
+    # Loaded with list pages so formatting needs no per-row queries
+    RESPONSE_LOAD_OPTIONS = (
+        joinedload(Feedback.employee),
+        joinedload(Feedback.given_by_user),
+    )
+    
     @staticmethod
     def create_feedback(
         db: Session,
@@ -87,7 +95,7 @@ class FeedbackService:
     def get_feedback_by_id(
         db: Session,
         feedback_id: int,
-        current_user: User
+        current_user: Principal
     ) -> FeedbackResponse:
         """Get feedback by ID with access control"""
         feedback = db.query(Feedback).filter(Feedback.id == feedback_id).first()
@@ -111,7 +119,7 @@ class FeedbackService:
     def get_feedback_for_employee(
         db: Session,
         employee_id: int,
-        current_user: User,
+        current_user: Principal,
         skip: int = 0,
         limit: int = 100,
         start_date: Optional[datetime] = None,
@@ -156,7 +164,9 @@ class FeedbackService:
         total = query.count()
         
         # Get paginated results
-        feedback_list = query.order_by(Feedback.given_on.desc()).offset(skip).limit(limit).all()
+        feedback_list = query.options(*FeedbackService.RESPONSE_LOAD_OPTIONS).order_by(
+            Feedback.given_on.desc()
+        ).offset(skip).limit(limit).all()
         
         # Format responses
         formatted_feedback = [
@@ -176,7 +186,9 @@ class FeedbackService:
         query = db.query(Feedback).filter(Feedback.given_by == given_by_user_id)
         
         total = query.count()
-        feedback_list = query.order_by(Feedback.given_on.desc()).offset(skip).limit(limit).all()
+        feedback_list = query.options(*FeedbackService.RESPONSE_LOAD_OPTIONS).order_by(
+            Feedback.given_on.desc()
+        ).offset(skip).limit(limit).all()
         
         formatted_feedback = [
             FeedbackService._format_feedback_response(f, db) for f in feedback_list
@@ -191,9 +203,19 @@ class FeedbackService:
         limit: int = 100,
         employee_id: Optional[int] = None,
         given_by: Optional[int] = None,
-        feedback_type: Optional[str] = None
-    ) -> Tuple[List[FeedbackResponse], int]:
-        """Get all feedback (HR only)"""
+        feedback_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[FeedbackResponse], Optional[int], Optional[str]]:
+        """
+        Get all feedback (HR only)
+
+        With `cursor` (empty for the first page) pages by keyset instead of
+        `skip`; the total is only counted if `include_total`.
+
+        Returns:
+            Tuple of (feedback, total or None, next_cursor or None)
+        """
         query = db.query(Feedback)
         
         # Apply filters
@@ -204,21 +226,31 @@ class FeedbackService:
         if feedback_type:
             query = query.filter(Feedback.feedback_type == feedback_type)
         
-        total = query.count()
-        feedback_list = query.order_by(Feedback.given_on.desc()).offset(skip).limit(limit).all()
+        total = query.count() if include_total or cursor is None else None
+        next_cursor = None
+        if cursor is not None:
+            feedback_list, next_cursor = paginate_keyset(
+                query.options(*FeedbackService.RESPONSE_LOAD_OPTIONS),
+                [(Feedback.given_on, True), (Feedback.id, True)],
+                cursor, limit, scope="feedback"
+            )
+        else:
+            feedback_list = query.options(*FeedbackService.RESPONSE_LOAD_OPTIONS).order_by(
+                Feedback.given_on.desc()
+            ).offset(skip).limit(limit).all()
         
         formatted_feedback = [
             FeedbackService._format_feedback_response(f, db) for f in feedback_list
         ]
         
-        return formatted_feedback, total
+        return formatted_feedback, total, next_cursor
     
     @staticmethod
     def update_feedback(
         db: Session,
         feedback_id: int,
         feedback_data: FeedbackUpdate,
-        current_user: User
+        current_user: Principal
     ) -> FeedbackResponse:
         """Update feedback (only by person who gave it)"""
         feedback = db.query(Feedback).filter(Feedback.id == feedback_id).first()
@@ -261,7 +293,7 @@ class FeedbackService:
     def delete_feedback(
         db: Session,
         feedback_id: int,
-        current_user: User
+        current_user: Principal
     ) -> None:
         """Delete feedback (only by person who gave it or HR)"""
         feedback = db.query(Feedback).filter(Feedback.id == feedback_id).first()
@@ -344,7 +376,9 @@ class FeedbackService:
         by_type = {feedback_type: count for feedback_type, count in by_type_results}
         
         # Recent feedback
-        recent_query = query.order_by(Feedback.given_on.desc()).limit(5).all()
+        recent_query = query.options(*FeedbackService.RESPONSE_LOAD_OPTIONS).order_by(
+            Feedback.given_on.desc()
+        ).limit(5).all()
         recent_feedback = [
             FeedbackService._format_feedback_response(f, db) for f in recent_query
         ]
@@ -361,9 +395,9 @@ class FeedbackService:
     @staticmethod
     def _format_feedback_response(feedback: Feedback, db: Session) -> FeedbackResponse:
         """Format feedback model to response schema"""
-        # Get employee and giver details
-        employee = db.query(User).filter(User.id == feedback.employee_id).first()
-        giver = db.query(User).filter(User.id == feedback.given_by).first()
+        # Relationships: loaded with list pages (RESPONSE_LOAD_OPTIONS), else lazily
+        employee = feedback.employee
+        giver = feedback.given_by_user
         
         return FeedbackResponse(
             id=feedback.id,
@@ -0,0 +1,73 @@
+"""
+File Digest Service - Content hashes of uploaded files
+
+Uploads record the SHA-256 computed while streaming them to disk. Downloads
+use it as a strong ETag. Each digest is stored with the file's size and mtime
+when it was hashed, so a file changed or restored outside the API (and files
+uploaded before digests were recorded) is re-hashed on its next download.
+"""
+from sqlalchemy.orm import Session
+from models import StoredFileDigest
+from typing import Optional
+import asyncio
+import hashlib
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file's contents, read in blocks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FileDigestService:
+    """Service class for stored file content hashes"""
+
+    @staticmethod
+    def record(db: Session, path: str, sha256: str) -> None:
+        """Store the digest of a file that was just written (committed with the caller's changes)"""
+        stat = os.stat(path)
+        db.merge(
+            StoredFileDigest(
+                path=path, sha256=sha256, size=stat.st_size, mtime=stat.st_mtime
+            )
+        )
+
+    @staticmethod
+    def forget(db: Session, path: Optional[str]) -> None:
+        """Drop the digest of a deleted or replaced file"""
+        if path:
+            db.query(StoredFileDigest).filter(StoredFileDigest.path == path).delete(
+                synchronize_session=False
+            )
+
+    @staticmethod
+    def lookup(db: Session, path: str, stat: os.stat_result) -> Optional[str]:
+        """Stored digest if it still matches the file on disk"""
+        entry = db.query(StoredFileDigest).filter(StoredFileDigest.path == path).first()
+        if entry and entry.size == stat.st_size and entry.mtime == stat.st_mtime:
+            return entry.sha256
+        return None
+
+    @staticmethod
+    async def get_or_compute(db: Session, path: str) -> str:
+        """Digest of a file, hashing it (off the event loop) if none is stored"""
+        stat = os.stat(path)
+        sha256 = FileDigestService.lookup(db, path, stat)
+        if sha256 is not None:
+            return sha256
+
+        sha256 = await asyncio.to_thread(hash_file, path)
+        try:
+            FileDigestService.record(db, path, sha256)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Could not store digest for {path}: {str(e)}")
+        return sha256
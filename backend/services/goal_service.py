@@ -13,6 +13,7 @@ from models import (
     User, UserRole, Goal, GoalCheckpoint, GoalCategory, GoalTemplate,
     GoalComment, GoalHistory, GoalStatus, Notification
 )
+from utils.principal_cache import Principal
 
 
 class GoalService:
@@ -24,7 +25,7 @@ class GoalService:
     def create_goal(
         db: Session,
         goal_data: Dict[str, Any],
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """
         Create a new goal
@@ -167,7 +168,7 @@ class GoalService:
     def get_goal_by_id(
         db: Session,
         goal_id: int,
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """
         Get goal by ID with access control
@@ -213,7 +214,7 @@ class GoalService:
         db: Session,
         goal_id: int,
         update_data: Dict[str, Any],
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """
         Update goal
@@ -328,7 +329,7 @@ class GoalService:
     def delete_goal(
         db: Session,
         goal_id: int,
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, str]:
         """
         Soft delete goal
@@ -392,7 +393,7 @@ class GoalService:
     @staticmethod
     def get_my_goals(
         db: Session,
-        current_user: User,
+        current_user: Principal,
         skip: int = 0,
         limit: int = 100,
         status: Optional[str] = None,
@@ -449,7 +450,7 @@ class GoalService:
     @staticmethod
     def get_team_goals(
         db: Session,
-        current_user: User,
+        current_user: Principal,
         skip: int = 0,
         limit: int = 100,
         employee_id: Optional[int] = None,
@@ -527,7 +528,7 @@ class GoalService:
         db: Session,
         goal_id: int,
         checkpoint_data: Dict[str, Any],
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """Create new checkpoint for a goal"""
         goal = db.query(Goal).filter(
@@ -586,7 +587,7 @@ class GoalService:
         db: Session,
         checkpoint_id: int,
         update_data: Dict[str, Any],
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """Update checkpoint"""
         checkpoint = db.query(GoalCheckpoint).filter(
@@ -660,7 +661,7 @@ class GoalService:
     def delete_checkpoint(
         db: Session,
         checkpoint_id: int,
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, str]:
         """Delete checkpoint"""
         checkpoint = db.query(GoalCheckpoint).filter(
@@ -707,7 +708,7 @@ class GoalService:
         db: Session,
         goal_id: int,
         comment_data: Dict[str, Any],
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """Add comment to goal"""
         goal = db.query(Goal).filter(
@@ -764,7 +765,7 @@ class GoalService:
     def get_goal_comments(
         db: Session,
         goal_id: int,
-        current_user: User
+        current_user: Principal
     ) -> List[Dict[str, Any]]:
         """Get all comments for a goal"""
         goal = db.query(Goal).filter(Goal.id == goal_id).first()
@@ -795,7 +796,7 @@ class GoalService:
     @staticmethod
     def get_my_goal_stats(
         db: Session,
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """Get goal statistics for current user"""
         today = date.today()
@@ -893,7 +894,7 @@ class GoalService:
     @staticmethod
     def get_team_goal_stats(
         db: Session,
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """Get team goal statistics (Manager only)"""
         if current_user.role not in [UserRole.MANAGER, UserRole.HR, UserRole.ADMIN]:
@@ -1003,7 +1004,7 @@ class GoalService:
     def create_category(
         db: Session,
         category_data: Dict[str, Any],
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """Create goal category (Manager/HR only)"""
         if current_user.role not in [UserRole.MANAGER, UserRole.HR, UserRole.ADMIN]:
@@ -1057,7 +1058,7 @@ class GoalService:
         db: Session,
         category_id: int,
         update_data: Dict[str, Any],
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """Update goal category"""
         if current_user.role not in [UserRole.MANAGER, UserRole.HR, UserRole.ADMIN]:
@@ -1091,7 +1092,7 @@ class GoalService:
     def create_template(
         db: Session,
         template_data: Dict[str, Any],
-        current_user: User
+        current_user: Principal
     ) -> Dict[str, Any]:
         """Create goal template (Manager/HR only)"""
         if current_user.role not in [UserRole.MANAGER, UserRole.HR, UserRole.ADMIN]:
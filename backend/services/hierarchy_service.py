@@ -0,0 +1,201 @@
+"""
+Hierarchy Service - Maintains the user_hierarchy_closure table
+
+The closure table stores one row per (ancestor, descendant) pair of the
+manager tree, including a depth-0 row for every user. Manager chains, full
+subtrees and "all indirect reports" filters become single indexed queries
+instead of one query per hop over `User.manager_id`.
+
+Rows mirror `manager_id` for every user, active or not; callers filter on
+`User.is_active` where it matters. All writes run on the caller's session
+and are committed together with the change to `manager_id`.
+"""
+from sqlalchemy import func, insert, select, delete
+from sqlalchemy.orm import Session, aliased
+from fastapi import HTTPException, status
+from models import User, UserHierarchyClosure
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class HierarchyService:
+    """Service class for closure-table maintenance and hierarchy lookups"""
+
+    @staticmethod
+    def add_user(db: Session, user_id: int, manager_id: Optional[int]) -> None:
+        """
+        Insert closure rows for a newly created user (a leaf).
+        The user must already be flushed so it has an id.
+        """
+        db.execute(
+            insert(UserHierarchyClosure).values(
+                ancestor_id=user_id, descendant_id=user_id, depth=0
+            )
+        )
+        if manager_id:
+            db.execute(
+                insert(UserHierarchyClosure).from_select(
+                    ["ancestor_id", "descendant_id", "depth"],
+                    select(
+                        UserHierarchyClosure.ancestor_id,
+                        user_id,
+                        UserHierarchyClosure.depth + 1,
+                    ).where(UserHierarchyClosure.descendant_id == manager_id),
+                )
+            )
+
+    @staticmethod
+    def move_user(db: Session, user_id: int, new_manager_id: Optional[int]) -> None:
+        """
+        Re-parent a user and their whole subtree under `new_manager_id`
+        (or make it a root when None). Call `ensure_valid_manager` first.
+        """
+        subtree = select(UserHierarchyClosure.descendant_id).where(
+            UserHierarchyClosure.ancestor_id == user_id
+        )
+
+        # Drop every link from outside the subtree into it
+        db.execute(
+            delete(UserHierarchyClosure)
+            .where(UserHierarchyClosure.descendant_id.in_(subtree))
+            .where(UserHierarchyClosure.ancestor_id.not_in(subtree))
+            .execution_options(synchronize_session=False)
+        )
+
+        if new_manager_id:
+            # Cross product of the new manager's ancestors with the subtree
+            above = aliased(UserHierarchyClosure)
+            below = aliased(UserHierarchyClosure)
+            db.execute(
+                insert(UserHierarchyClosure).from_select(
+                    ["ancestor_id", "descendant_id", "depth"],
+                    select(
+                        above.ancestor_id,
+                        below.descendant_id,
+                        above.depth + below.depth + 1,
+                    ).where(
+                        above.descendant_id == new_manager_id,
+                        below.ancestor_id == user_id,
+                    ),
+                )
+            )
+
+    @staticmethod
+    def is_descendant(db: Session, ancestor_id: int, descendant_id: int) -> bool:
+        """True when `descendant_id` is `ancestor_id` or anywhere below it"""
+        row = (
+            db.query(UserHierarchyClosure.depth)
+            .filter(
+                UserHierarchyClosure.ancestor_id == ancestor_id,
+                UserHierarchyClosure.descendant_id == descendant_id,
+            )
+            .first()
+        )
+        return row is not None
+
+    @staticmethod
+    def ensure_valid_manager(db: Session, user_id: int, manager_id: Optional[int]) -> None:
+        """Reject a manager assignment that would create a reporting cycle"""
+        if manager_id and HierarchyService.is_descendant(db, user_id, manager_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"User {manager_id} reports to employee {user_id} and cannot be their manager",
+            )
+
+    @staticmethod
+    def get_ancestors(db: Session, user_id: int) -> List[Tuple[User, int]]:
+        """The user and all managers above them as (user, depth), nearest first"""
+        return (
+            db.query(User, UserHierarchyClosure.depth)
+            .join(UserHierarchyClosure, UserHierarchyClosure.ancestor_id == User.id)
+            .filter(UserHierarchyClosure.descendant_id == user_id)
+            .order_by(UserHierarchyClosure.depth)
+            .all()
+        )
+
+    @staticmethod
+    def report_ids_subquery(manager_id: int, include_indirect: bool = True):
+        """
+        SELECT of the ids reporting to `manager_id`, for use in `.in_()`.
+        Direct reports only unless `include_indirect` is set.
+        """
+        query = select(UserHierarchyClosure.descendant_id).where(
+            UserHierarchyClosure.ancestor_id == manager_id
+        )
+        if include_indirect:
+            return query.where(UserHierarchyClosure.depth >= 1)
+        return query.where(UserHierarchyClosure.depth == 1)
+
+    @staticmethod
+    def count_reports(db: Session, manager_id: int, active_only: bool = True) -> int:
+        """Number of direct and indirect reports of a manager"""
+        query = (
+            db.query(func.count(UserHierarchyClosure.descendant_id))
+            .filter(
+                UserHierarchyClosure.ancestor_id == manager_id,
+                UserHierarchyClosure.depth >= 1,
+            )
+        )
+        if active_only:
+            query = query.join(User, User.id == UserHierarchyClosure.descendant_id).filter(
+                User.is_active == True
+            )
+        return query.scalar() or 0
+
+    @staticmethod
+    def build_closure_rows(edges: Dict[int, Optional[int]]) -> List[Dict[str, int]]:
+        """
+        Compute closure rows from a {user_id: manager_id} map.
+        A manager loop is cut at the first repeated user and logged.
+        """
+        rows = []
+        for user_id in edges:
+            seen = {user_id}
+            rows.append({"ancestor_id": user_id, "descendant_id": user_id, "depth": 0})
+            depth = 0
+            current = edges.get(user_id)
+            while current is not None and current in edges:
+                if current in seen:
+                    logger.warning(f"Circular manager reference above user {user_id}")
+                    break
+                seen.add(current)
+                depth += 1
+                rows.append({"ancestor_id": current, "descendant_id": user_id, "depth": depth})
+                current = edges.get(current)
+        return rows
+
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """Recompute the whole closure table from users.manager_id and commit"""
+        edges = dict(db.query(User.id, User.manager_id).all())
+        rows = HierarchyService.build_closure_rows(edges)
+        try:
+            db.execute(delete(UserHierarchyClosure))
+            if rows:
+                db.execute(insert(UserHierarchyClosure), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        logger.info(f"Rebuilt user hierarchy closure: {len(rows)} rows for {len(edges)} users")
+        return len(rows)
+
+    @staticmethod
+    def ensure_built(db: Session) -> bool:
+        """
+        Rebuild when users exist without their depth-0 row, e.g. after seeding
+        or restoring a database that predates the table. Returns True if rebuilt.
+        """
+        users = db.query(func.count(User.id)).scalar() or 0
+        self_rows = (
+            db.query(func.count(UserHierarchyClosure.descendant_id))
+            .filter(UserHierarchyClosure.depth == 0)
+            .scalar()
+            or 0
+        )
+        if users == self_rows:
+            return False
+        HierarchyService.rebuild(db)
+        return True
@@ -1,7 +1,7 @@
 """
 Holiday Service - Business logic for holiday management
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, extract, and_, or_
 from fastapi import HTTPException, status
 from models import Holiday, User
@@ -125,7 +125,9 @@ class HolidayService:
         total = query.count()
         
         # Get paginated results
-        holidays = query.order_by(Holiday.start_date.asc()).offset(skip).limit(limit).all()
+        holidays = query.options(joinedload(Holiday.created_by_user)).order_by(
+            Holiday.start_date.asc()
+        ).offset(skip).limit(limit).all()
         
         # Format responses
         formatted_holidays = [
@@ -144,7 +146,7 @@ class HolidayService:
         today = date.today()
         end_date = today + timedelta(days=days_ahead)
         
-        holidays = db.query(Holiday).filter(
+        holidays = db.query(Holiday).options(joinedload(Holiday.created_by_user)).filter(
             and_(
                 Holiday.is_active == True,
                 Holiday.start_date >= today,
@@ -279,12 +281,8 @@ class HolidayService:
     @staticmethod
     def _format_holiday_response(holiday: Holiday, db: Session) -> HolidayResponse:
         """Format holiday model to response schema"""
-        # Get creator details
-        created_by_user = None
-        created_by_name = None
-        if holiday.created_by:
-            created_by_user = db.query(User).filter(User.id == holiday.created_by).first()
-            created_by_name = created_by_user.name if created_by_user else None
+        # Creator relationship: loaded with list pages, else lazily
+        created_by_name = holiday.created_by_user.name if holiday.created_by_user else None
         
         # Calculate duration
         duration_days = (holiday.end_date - holiday.start_date).days + 1
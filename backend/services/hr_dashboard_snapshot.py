@@ -0,0 +1,185 @@
+"""
+HR Dashboard Snapshot - Precomputed HR dashboard served from memory
+
+`DashboardService.get_hr_dashboard_data` runs a dozen aggregate queries. HR
+keeps the dashboard open all day, so the response is kept in memory as a
+snapshot with a `generated_at` timestamp:
+
+ - A committed transaction that wrote attendance, skill enrollments,
+   applications, users or departments marks the snapshot stale (session
+   events below, as for the org chart cache). This is cheap, so a burst of
+   punches costs one recompute.
+ - A background task recomputes a stale snapshot every
+   HR_DASHBOARD_REFRESH_SECONDS, but only while someone has read it recently.
+ - A reader gets the snapshot while it is younger than
+   HR_DASHBOARD_MAX_AGE_SECONDS (even if writes happened since). Otherwise the
+   dashboard is computed live, off the event loop, and becomes the new
+   snapshot.
+
+The snapshot is per process; each worker keeps its own.
+"""
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import SessionLocal
+from models import Application, Attendance, Department, SkillModuleEnrollment, User
+from pydantic_models import HRDashboardResponse
+from services.dashboard_service import DashboardService
+
+logger = logging.getLogger(__name__)
+
+# Models whose rows feed the HR dashboard
+HR_DASHBOARD_MODELS = (Attendance, SkillModuleEnrollment, Application, User, Department)
+
+# Session.info flag set during flush and consumed on commit/rollback
+HR_DASHBOARD_DIRTY_KEY = "hr_dashboard_dirty"
+
+
+class HRDashboardSnapshot:
+    """In-memory HR dashboard with staleness tracking and single-flight refresh"""
+
+    def __init__(self, enabled: bool, refresh_seconds: int, max_age_seconds: int):
+        self.enabled = enabled
+        self.refresh_seconds = refresh_seconds
+        self.max_age_seconds = max_age_seconds
+        self._data: Optional[HRDashboardResponse] = None
+        self._computed_at = 0.0
+        self._stale = True
+        self._last_read = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def mark_stale(self) -> None:
+        """Record that data shown on the dashboard changed"""
+        with self._lock:
+            self._stale = True
+
+    def _fresh_copy(self) -> Optional[HRDashboardResponse]:
+        with self._lock:
+            if self._data is None:
+                return None
+            if time.monotonic() - self._computed_at > self.max_age_seconds:
+                return None
+            return self._data
+
+    @staticmethod
+    def _compute() -> HRDashboardResponse:
+        db = SessionLocal()
+        try:
+            data = DashboardService.get_hr_dashboard_data(db)
+        finally:
+            db.close()
+        data.generated_at = datetime.utcnow()
+        return data
+
+    def refresh(self, force: bool = False) -> HRDashboardResponse:
+        """Recompute the dashboard in its own session (blocking)"""
+        with self._refresh_lock:
+            with self._lock:
+                stale = self._stale
+            # Another caller refreshed while we waited for the lock
+            current = self._fresh_copy()
+            if current is not None and not stale and not force:
+                return current
+
+            with self._lock:
+                self._stale = False
+            started = time.monotonic()
+            try:
+                data = self._compute()
+            except Exception:
+                self.mark_stale()
+                raise
+
+            with self._lock:
+                self._data = data
+                self._computed_at = started
+            return data
+
+    async def get(self) -> HRDashboardResponse:
+        """The snapshot if young enough, otherwise a live computation"""
+        if not self.enabled:
+            return await asyncio.to_thread(self._compute)
+
+        self._last_read = time.monotonic()
+        current = self._fresh_copy()
+        if current is not None:
+            return current
+        return await asyncio.to_thread(self.refresh)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            with self._lock:
+                needed = self._data is not None and (
+                    self._stale
+                    or time.monotonic() - self._computed_at > self.max_age_seconds / 2
+                )
+            # Nobody is looking at the dashboard; let the snapshot age out
+            if not needed or time.monotonic() - self._last_read > self.max_age_seconds:
+                continue
+            try:
+                await asyncio.to_thread(self.refresh, True)
+            except Exception as e:
+                logger.warning(f"HR dashboard refresh failed: {str(e)}")
+
+    def start(self) -> None:
+        """Start the background refresher (called on application startup)"""
+        if self.enabled and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._refresh_loop())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+# Shared snapshot for the process
+hr_dashboard_snapshot = HRDashboardSnapshot(
+    enabled=settings.HR_DASHBOARD_SNAPSHOT_ENABLED,
+    refresh_seconds=settings.HR_DASHBOARD_REFRESH_SECONDS,
+    max_age_seconds=settings.HR_DASHBOARD_MAX_AGE_SECONDS,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_hr_dashboard_dirty_on_flush(session, flush_context):
+    """Remember that this transaction wrote rows the dashboard aggregates"""
+    if session.info.get(HR_DASHBOARD_DIRTY_KEY):
+        return
+
+    for obj in itertools.chain(session.new, session.deleted, session.dirty):
+        if isinstance(obj, HR_DASHBOARD_MODELS):
+            session.info[HR_DASHBOARD_DIRTY_KEY] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_hr_dashboard_dirty_on_bulk(orm_execute_state):
+    """Catch ORM bulk UPDATE/DELETE (query.update()/delete()), which skip flush"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_arguments.get("mapper")
+    if mapper is not None and mapper.class_ in HR_DASHBOARD_MODELS:
+        orm_execute_state.session.info[HR_DASHBOARD_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_hr_dashboard_stale_on_commit(session):
+    if session.info.pop(HR_DASHBOARD_DIRTY_KEY, False):
+        hr_dashboard_snapshot.mark_stale()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_hr_dashboard_dirty_on_rollback(session):
+    session.info.pop(HR_DASHBOARD_DIRTY_KEY, None)
@@ -1,10 +1,12 @@
 """
 Leave Service - Business logic for leave management
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, extract, and_, or_
 from fastapi import HTTPException, status
 from models import User, LeaveRequest, LeaveType, LeaveStatus
+from services.hierarchy_service import HierarchyService
+from utils.pagination import paginate_keyset
 from schemas.leave_schemas import (
     LeaveRequestCreate,
     LeaveRequestUpdate,
@@ -23,6 +25,12 @@ logger = logging.getLogger(__name__)
 class LeaveService:
     """Service class for leave management operations"""
     
+    # Loaded with list pages so formatting needs no per-row queries
+    RESPONSE_LOAD_OPTIONS = (
+        joinedload(LeaveRequest.employee),
+        joinedload(LeaveRequest.approver),
+    )
+    
     @staticmethod
     def apply_for_leave(
         db: Session,
@@ -125,7 +133,9 @@ class LeaveService:
                 pass
         
         total = query.count()
-        leaves = query.order_by(LeaveRequest.requested_date.desc()).offset(skip).limit(limit).all()
+        leaves = query.options(*LeaveService.RESPONSE_LOAD_OPTIONS).order_by(
+            LeaveRequest.requested_date.desc()
+        ).offset(skip).limit(limit).all()
         
         formatted_leaves = [LeaveService._format_leave_response(l, db) for l in leaves]
         return formatted_leaves, total
@@ -136,17 +146,12 @@ class LeaveService:
         manager_id: int,
         skip: int = 0,
         limit: int = 100,
-        status_filter: Optional[str] = None
+        status_filter: Optional[str] = None,
+        include_indirect: bool = False
     ) -> Tuple[List[LeaveRequestResponse], int]:
-        """Get team leave requests (manager)"""
-        # Get all team members
-        team_members = db.query(User).filter(User.manager_id == manager_id).all()
-        team_member_ids = [m.id for m in team_members]
-        
-        if not team_member_ids:
-            return [], 0
-        
-        query = db.query(LeaveRequest).filter(LeaveRequest.employee_id.in_(team_member_ids))
+        """Get team leave requests (manager), optionally for the whole reporting subtree"""
+        report_ids = HierarchyService.report_ids_subquery(manager_id, include_indirect)
+        query = db.query(LeaveRequest).filter(LeaveRequest.employee_id.in_(report_ids))
         
         # Status filter
         if status_filter:
@@ -157,7 +162,9 @@ class LeaveService:
                 pass
         
         total = query.count()
-        leaves = query.order_by(LeaveRequest.requested_date.desc()).offset(skip).limit(limit).all()
+        leaves = query.options(*LeaveService.RESPONSE_LOAD_OPTIONS).order_by(
+            LeaveRequest.requested_date.desc()
+        ).offset(skip).limit(limit).all()
         
         formatted_leaves = [LeaveService._format_leave_response(l, db) for l in leaves]
         return formatted_leaves, total
@@ -169,9 +176,19 @@ class LeaveService:
         limit: int = 100,
         status_filter: Optional[str] = None,
         leave_type_filter: Optional[str] = None,
-        employee_id_filter: Optional[int] = None
-    ) -> Tuple[List[LeaveRequestResponse], int]:
-        """Get all leave requests (HR)"""
+        employee_id_filter: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[LeaveRequestResponse], Optional[int], Optional[str]]:
+        """
+        Get all leave requests (HR)
+
+        With `cursor` (empty for the first page) pages by keyset instead of
+        `skip`; the total is only counted if `include_total`.
+
+        Returns:
+            Tuple of (leaves, total or None, next_cursor or None)
+        """
         query = db.query(LeaveRequest)
         
         # Employee filter
@@ -194,11 +211,21 @@ class LeaveService:
             except KeyError:
                 pass
         
-        total = query.count()
-        leaves = query.order_by(LeaveRequest.requested_date.desc()).offset(skip).limit(limit).all()
+        total = query.count() if include_total or cursor is None else None
+        next_cursor = None
+        if cursor is not None:
+            leaves, next_cursor = paginate_keyset(
+                query.options(*LeaveService.RESPONSE_LOAD_OPTIONS),
+                [(LeaveRequest.requested_date, True), (LeaveRequest.id, True)],
+                cursor, limit, scope="leaves"
+            )
+        else:
+            leaves = query.options(*LeaveService.RESPONSE_LOAD_OPTIONS).order_by(
+                LeaveRequest.requested_date.desc()
+            ).offset(skip).limit(limit).all()
         
         formatted_leaves = [LeaveService._format_leave_response(l, db) for l in leaves]
-        return formatted_leaves, total
+        return formatted_leaves, total, next_cursor
     
     @staticmethod
     def get_leave_request_by_id(db: Session, leave_id: int) -> LeaveRequestResponse:
@@ -434,15 +461,9 @@ class LeaveService:
     @staticmethod
     def _format_leave_response(leave: LeaveRequest, db: Session) -> LeaveRequestResponse:
         """Format leave request to response schema"""
-        # Get employee name
-        employee = db.query(User).filter(User.id == leave.employee_id).first()
-        employee_name = employee.name if employee else None
-        
-        # Get approver name
-        approver_name = None
-        if leave.approved_by:
-            approver = db.query(User).filter(User.id == leave.approved_by).first()
-            approver_name = approver.name if approver else None
+        # Relationships: loaded with list pages (RESPONSE_LOAD_OPTIONS), else lazily
+        employee_name = leave.employee.name if leave.employee else None
+        approver_name = leave.approver.name if leave.approver else None
         
         return LeaveRequestResponse(
             id=leave.id,
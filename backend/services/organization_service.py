@@ -2,9 +2,12 @@
 Organization/Hierarchy Service - Business logic for org structure and hierarchy
 """
 
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from config import settings
 from models import User, Department, Team
+from services.hierarchy_service import HierarchyService
 from schemas.organization_schemas import (
     UserHierarchyNode,
     ManagerChainResponse,
@@ -14,11 +17,135 @@ from schemas.organization_schemas import (
     ReportingStructureResponse,
     OrgChartNode,
 )
-from typing import List, Optional
+from typing import Dict, List, Optional
+import itertools
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# User columns that appear in org chart nodes or shape the tree
+ORG_CHART_USER_FIELDS = (
+    "manager_id",
+    "team_id",
+    "department_id",
+    "is_active",
+    "name",
+    "email",
+    "job_role",
+    "role",
+    "profile_image_path",
+    "hierarchy_level",
+)
+
+# Session.info flag set during flush and consumed on commit/rollback
+ORG_CHART_DIRTY_KEY = "org_chart_dirty"
+
+
+class OrgChartSnapshot:
+    """In-memory copy of the active org: formatted nodes plus adjacency list"""
+
+    def __init__(
+        self,
+        nodes: Dict[int, UserHierarchyNode],
+        children: Dict[int, List[int]],
+        default_root_id: Optional[int],
+    ):
+        self.nodes = nodes
+        self.children = children
+        self.default_root_id = default_root_id
+        self.built_at = time.monotonic()
+
+
+class OrgChartCache:
+    """
+    Process-local org chart snapshot cache.
+
+    The snapshot is dropped when a committed transaction changed a field
+    that affects the chart (see the session event hooks below) and otherwise
+    expires after `ORG_CHART_CACHE_TTL_SECONDS`. A TTL of 0 disables caching.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[OrgChartSnapshot] = None
+        self._version = 0
+
+    def get(self) -> Optional[OrgChartSnapshot]:
+        snapshot = self._snapshot
+        ttl = settings.ORG_CHART_CACHE_TTL_SECONDS
+        if snapshot is None or ttl <= 0:
+            return None
+        if time.monotonic() - snapshot.built_at > ttl:
+            return None
+        return snapshot
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def store(self, snapshot: OrgChartSnapshot, version: int) -> None:
+        """Keep the snapshot unless an invalidation happened while it was built"""
+        with self._lock:
+            if version == self._version and settings.ORG_CHART_CACHE_TTL_SECONDS > 0:
+                self._snapshot = snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+
+
+org_chart_cache = OrgChartCache()
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_org_chart_dirty_on_flush(session, flush_context):
+    """Remember that this transaction changed users, departments or teams"""
+    if session.info.get(ORG_CHART_DIRTY_KEY):
+        return
+
+    for obj in itertools.chain(session.new, session.deleted):
+        if isinstance(obj, (User, Department, Team)):
+            session.info[ORG_CHART_DIRTY_KEY] = True
+            return
+
+    for obj in session.dirty:
+        if isinstance(obj, User):
+            attrs = inspect(obj).attrs
+            if any(attrs[field].history.has_changes() for field in ORG_CHART_USER_FIELDS):
+                session.info[ORG_CHART_DIRTY_KEY] = True
+                return
+        elif isinstance(obj, (Department, Team)) and session.is_modified(obj):
+            session.info[ORG_CHART_DIRTY_KEY] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_org_chart_dirty_on_bulk(orm_execute_state):
+    """Catch ORM bulk UPDATE/DELETE (query.update()/delete()), which skip flush"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_arguments.get("mapper")
+    if mapper is not None and mapper.class_ in (User, Department, Team):
+        orm_execute_state.session.info[ORG_CHART_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_org_chart_on_commit(session):
+    """
+    Drop the snapshot only once the change is committed, so a concurrent
+    request cannot load pre-commit rows under the new cache version.
+    """
+    if session.info.pop(ORG_CHART_DIRTY_KEY, False):
+        org_chart_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_org_chart_dirty_on_rollback(session):
+    session.info.pop(ORG_CHART_DIRTY_KEY, None)
+
 
 class OrganizationService:
     """Service class for organization hierarchy operations"""
@@ -37,32 +164,12 @@ class OrganizationService:
                 detail=f"User with ID {user_id} not found",
             )
 
-        # Build full chain
+        # Whole ancestor chain in one closure query; stop at the first inactive manager
         chain = []
-        current_user = user
-        visited_ids = set()  # Prevent infinite loops
-
-        while current_user:
-            # Add current user to chain
-            chain.append(OrganizationService._format_user_node(current_user, db))
-
-            # Check for circular reference
-            if current_user.id in visited_ids:
-                logger.warning(
-                    f"Circular reference detected in manager chain for user {user_id}"
-                )
-                break
-            visited_ids.add(current_user.id)
-
-            # Move to manager
-            if current_user.manager_id:
-                current_user = (
-                    db.query(User)
-                    .filter(User.id == current_user.manager_id, User.is_active == True)
-                    .first()
-                )
-            else:
+        for manager, depth in HierarchyService.get_ancestors(db, user_id):
+            if depth > 0 and not manager.is_active:
                 break
+            chain.append(OrganizationService._format_user_node(manager, db))
 
         # Extract specific levels
         employee = chain[0] if len(chain) > 0 else None
@@ -95,29 +202,22 @@ class OrganizationService:
         # Get employee and managers
         employee_node = OrganizationService._format_user_node(user, db)
 
+        # Manager and skip-level manager from one closure query
+        managers_by_depth = {
+            depth: manager
+            for manager, depth in HierarchyService.get_ancestors(db, user_id)
+            if 0 < depth <= 2
+        }
+
         direct_manager = None
-        if user.manager_id:
-            manager = (
-                db.query(User)
-                .filter(User.id == user.manager_id, User.is_active == True)
-                .first()
-            )
-            if manager:
-                direct_manager = OrganizationService._format_user_node(manager, db)
+        manager = managers_by_depth.get(1)
+        if manager and manager.is_active:
+            direct_manager = OrganizationService._format_user_node(manager, db)
 
         skip_level_manager = None
-        if user.manager_id:
-            manager = db.query(User).filter(User.id == user.manager_id).first()
-            if manager and manager.manager_id:
-                skip_level = (
-                    db.query(User)
-                    .filter(User.id == manager.manager_id, User.is_active == True)
-                    .first()
-                )
-                if skip_level:
-                    skip_level_manager = OrganizationService._format_user_node(
-                        skip_level, db
-                    )
+        skip_level = managers_by_depth.get(2)
+        if skip_level and skip_level.is_active:
+            skip_level_manager = OrganizationService._format_user_node(skip_level, db)
 
         # Get direct reports (if user is a manager)
         direct_reports_users = (
@@ -149,6 +249,7 @@ class OrganizationService:
             skip_level_manager=skip_level_manager,
             direct_reports=direct_reports,
             peers=peers,
+            total_reports=HierarchyService.count_reports(db, user_id),
         )
 
     @staticmethod
@@ -212,65 +313,142 @@ class OrganizationService:
         """
         Get organization chart as tree structure.
         If root_user_id is None, finds the CEO (user with no manager).
+
+        The whole active org is loaded in a single query and the tree is
+        assembled in memory; the snapshot is cached until a committed
+        user/department/team change invalidates it.
         """
-        if root_user_id:
-            root_user = (
-                db.query(User)
-                .filter(User.id == root_user_id, User.is_active == True)
-                .first()
-            )
+        snapshot = OrganizationService._get_org_chart_snapshot(db)
 
-            if not root_user:
+        if root_user_id:
+            if root_user_id not in snapshot.nodes:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"User with ID {root_user_id} not found",
                 )
         else:
-            # Find CEO (user with lowest hierarchy_level or no manager)
-            root_user = (
-                db.query(User)
-                .filter(User.is_active == True, User.manager_id.is_(None))
-                .order_by(User.hierarchy_level)
-                .first()
-            )
-
-            if not root_user:
+            if snapshot.default_root_id is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="No root user (CEO) found in organization",
                 )
+            root_user_id = snapshot.default_root_id
 
-        # Build tree recursively
-        return OrganizationService._build_org_tree(root_user, db, set())
+        # Trees are cheap to assemble from the snapshot; build one per request
+        return OrganizationService._build_org_tree(snapshot, root_user_id)
 
     @staticmethod
-    def _build_org_tree(user: User, db: Session, visited: set) -> OrgChartNode:
-        """Recursively build org chart tree"""
-        # Prevent circular references
-        if user.id in visited:
-            return OrgChartNode(
-                user=OrganizationService._format_user_node(user, db), children=[]
-            )
+    def _get_org_chart_snapshot(db: Session) -> OrgChartSnapshot:
+        """Return the cached org snapshot, loading it when missing or stale"""
+        snapshot = org_chart_cache.get()
+        if snapshot is not None:
+            return snapshot
 
-        visited.add(user.id)
+        version = org_chart_cache.version
+        snapshot = OrganizationService._load_org_chart_snapshot(db)
+        org_chart_cache.store(snapshot, version)
+        return snapshot
 
-        # Get direct reports
-        direct_reports = (
-            db.query(User)
-            .filter(User.manager_id == user.id, User.is_active == True)
+    @staticmethod
+    def _load_org_chart_snapshot(db: Session) -> OrgChartSnapshot:
+        """Load all active users with department/team names in one query"""
+        rows = (
+            db.query(
+                User.id,
+                User.name,
+                User.email,
+                User.job_role,
+                User.role,
+                User.profile_image_path,
+                User.hierarchy_level,
+                User.manager_id,
+                Department.name,
+                Team.name,
+            )
+            .outerjoin(Department, Department.id == User.department_id)
+            .outerjoin(Team, Team.id == User.team_id)
+            .filter(User.is_active == True)
+            .order_by(User.id)
             .all()
         )
 
-        # Build children recursively
-        children = [
-            OrganizationService._build_org_tree(report, db, visited.copy())
-            for report in direct_reports
-        ]
-
-        return OrgChartNode(
-            user=OrganizationService._format_user_node(user, db), children=children
+        nodes: Dict[int, UserHierarchyNode] = {}
+        manager_of: Dict[int, Optional[int]] = {}
+        levels: Dict[int, Optional[int]] = {}
+        for (
+            user_id,
+            name,
+            email,
+            job_role,
+            role,
+            profile_image,
+            hierarchy_level,
+            manager_id,
+            department_name,
+            team_name,
+        ) in rows:
+            nodes[user_id] = UserHierarchyNode(
+                id=user_id,
+                name=name,
+                email=email,
+                position=job_role,
+                department=department_name,
+                team=team_name,
+                role=role.value if role else "employee",
+                profile_image=profile_image,
+                hierarchy_level=hierarchy_level,
+            )
+            manager_of[user_id] = manager_id
+            levels[user_id] = hierarchy_level
+
+        # Adjacency list (only active managers, matching the per-node query it replaces)
+        children: Dict[int, List[int]] = {}
+        for user_id, manager_id in manager_of.items():
+            if manager_id is not None and manager_id in nodes:
+                children.setdefault(manager_id, []).append(user_id)
+
+        # CEO: no manager, lowest hierarchy_level (NULLs sort first, as in SQL)
+        roots = [user_id for user_id, manager_id in manager_of.items() if manager_id is None]
+        default_root_id = min(
+            roots,
+            key=lambda uid: (levels[uid] is not None, levels[uid] or 0, uid),
+            default=None,
         )
 
+        return OrgChartSnapshot(nodes, children, default_root_id)
+
+    @staticmethod
+    def _build_org_tree(snapshot: OrgChartSnapshot, root_id: int) -> OrgChartNode:
+        """Assemble the org chart tree below root_id from the snapshot"""
+        # Pre-order walk without recursion. Every user has a single manager,
+        # so the only node that can be reached twice is the root itself
+        # (circular manager reference); it is then emitted as a leaf.
+        order = []
+        visited = set()
+        stack = [root_id]
+        while stack:
+            user_id = stack.pop()
+            if user_id in visited:
+                continue
+            visited.add(user_id)
+            order.append(user_id)
+            stack.extend(reversed(snapshot.children.get(user_id, [])))
+
+        # Build bottom-up: every descendant is built before its manager
+        built: Dict[int, OrgChartNode] = {}
+        for user_id in reversed(order):
+            built[user_id] = OrgChartNode(
+                user=snapshot.nodes[user_id],
+                children=[
+                    built.pop(child_id)
+                    if child_id in built
+                    else OrgChartNode(user=snapshot.nodes[child_id], children=[])
+                    for child_id in snapshot.children.get(user_id, [])
+                ],
+            )
+
+        return built[root_id]
+
     @staticmethod
     def _build_department_hierarchy(
         department: Department, db: Session
@@ -5,20 +5,27 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, extract, and_
 from fastapi import HTTPException, status, UploadFile
 from models import Payslip, User
+from utils.principal_cache import Principal
 from schemas.payslip_schemas import (
     PayslipCreate,
     PayslipUpdate,
     PayslipResponse,
     PayslipGenerateRequest,
+    PayslipBulkGenerateRequest,
+    PayslipBulkGenerateResponse,
     PayslipStatsResponse,
     PayslipUploadResponse
 )
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 from calendar import monthrange
 import os
+import time
 import uuid
 import logging
+from config import settings
+from utils.file_upload import save_upload, remove_replaced_file, UploadTooLargeError
+from services.file_digest_service import FileDigestService
 
 logger = logging.getLogger(__name__)
 
@@ -143,13 +150,7 @@ class PayslipService:
             List of created payslips
         """
         try:
-            # Get first and last day of month
-            _, last_day = monthrange(generate_data.year, generate_data.month)
-            pay_period_start = date(generate_data.year, generate_data.month, 1)
-            pay_period_end = date(generate_data.year, generate_data.month, last_day)
-            
-            # Set pay date
-            pay_date = generate_data.pay_date if generate_data.pay_date else pay_period_end
+            pay_period_start, pay_period_end, pay_date = PayslipService._get_pay_period(generate_data)
             
             # Get all active employees
             active_employees = db.query(User).filter(User.is_active == True).all()
@@ -171,38 +172,15 @@ class PayslipService:
                     skipped_count += 1
                     continue
                 
-                # Use employee's base salary if available
-                basic_salary = employee.salary if hasattr(employee, 'salary') and employee.salary else 50000.0
-                
-                # Calculate standard deductions (simplified)
-                tax_rate = 0.15
-                pf_rate = 0.12
-                
-                gross_salary = basic_salary
-                tax_deduction = gross_salary * tax_rate
-                pf_deduction = basic_salary * pf_rate
-                total_deductions = tax_deduction + pf_deduction
-                net_salary = gross_salary - total_deductions
-                
-                # Create payslip
+                # Create payslip with standard deductions
                 new_payslip = Payslip(
                     employee_id=employee.id,
                     pay_period_start=pay_period_start,
                     pay_period_end=pay_period_end,
                     pay_date=pay_date,
-                    basic_salary=basic_salary,
-                    allowances=0.0,
-                    overtime_pay=0.0,
-                    bonus=0.0,
-                    gross_salary=gross_salary,
-                    tax_deduction=tax_deduction,
-                    pf_deduction=pf_deduction,
-                    insurance_deduction=0.0,
-                    other_deductions=0.0,
-                    total_deductions=total_deductions,
-                    net_salary=net_salary,
                     issued_by=issued_by_user_id,
-                    issued_at=datetime.utcnow()
+                    issued_at=datetime.utcnow(),
+                    **PayslipService._standard_salary_components(employee.salary)
                 )
                 
                 db.add(new_payslip)
@@ -226,11 +204,220 @@ class PayslipService:
                 detail=f"Failed to generate payslips: {str(e)}"
             )
     
+    @staticmethod
+    def generate_monthly_payslips_bulk(
+        db: Session,
+        generate_data: PayslipBulkGenerateRequest,
+        issued_by_user_id: int
+    ) -> PayslipBulkGenerateResponse:
+        """
+        Set-based month-end payslip generation
+        
+        Finds employees without a payslip for the period with a single
+        anti-join and inserts the missing payslips in chunks, without
+        refreshing or re-querying each row.
+        
+        Args:
+            db: Database session
+            generate_data: Generation request with month/year and chunk size
+            issued_by_user_id: ID of HR user
+            
+        Returns:
+            Summary of the run
+        """
+        summary = None
+        for event in PayslipService.iter_monthly_payslips_bulk(db, generate_data, issued_by_user_id):
+            if event["type"] == "summary":
+                summary = event["summary"]
+        return summary
+    
+    @staticmethod
+    def iter_monthly_payslips_bulk(
+        db: Session,
+        generate_data: PayslipBulkGenerateRequest,
+        issued_by_user_id: int,
+        include_rows: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Prepare the bulk generation and return an iterator that performs it,
+        yielding one event per committed chunk followed by a summary event.
+        
+        The pay period and the anti-join run eagerly when this is called, so
+        setup errors surface before any streamed response has started. Each
+        chunk is committed on its own so the SQLite write lock is released
+        between chunks. Re-running after a failure is safe because employees
+        that already have a payslip are excluded by the anti-join.
+        
+        Args:
+            db: Database session
+            generate_data: Generation request with month/year and chunk size
+            issued_by_user_id: ID of HR user
+            include_rows: Include the inserted rows in each chunk event
+            
+        Returns:
+            Iterator of {"type": "chunk", ...} events and one {"type": "summary", ...} event
+        """
+        started = time.perf_counter()
+        pay_period_start, pay_period_end, pay_date = PayslipService._get_pay_period(generate_data)
+        
+        total_active = db.query(func.count(User.id)).filter(User.is_active == True).scalar() or 0
+        
+        # Anti-join: active employees with no payslip for this exact period
+        pending_employees = db.query(User.id, User.salary).outerjoin(
+            Payslip,
+            and_(
+                Payslip.employee_id == User.id,
+                Payslip.pay_period_start == pay_period_start,
+                Payslip.pay_period_end == pay_period_end
+            )
+        ).filter(
+            User.is_active == True,
+            Payslip.id.is_(None)
+        ).order_by(User.id).all()
+        
+        return PayslipService._insert_payslip_chunks(
+            db=db,
+            generate_data=generate_data,
+            issued_by_user_id=issued_by_user_id,
+            period=(pay_period_start, pay_period_end, pay_date),
+            pending_employees=pending_employees,
+            total_active=total_active,
+            started=started,
+            include_rows=include_rows
+        )
+    
+    @staticmethod
+    def _insert_payslip_chunks(
+        db: Session,
+        generate_data: PayslipBulkGenerateRequest,
+        issued_by_user_id: int,
+        period: Tuple[date, date, date],
+        pending_employees: List[Tuple[int, Optional[float]]],
+        total_active: int,
+        started: float,
+        include_rows: bool
+    ) -> Iterator[Dict[str, Any]]:
+        """Insert prepared payslips chunk by chunk (generator behind iter_monthly_payslips_bulk)"""
+        pay_period_start, pay_period_end, pay_date = period
+        issued_at = datetime.utcnow()
+        created_count = 0
+        chunks = 0
+        total_gross = 0.0
+        total_net = 0.0
+        
+        try:
+            for offset in range(0, len(pending_employees), generate_data.chunk_size):
+                batch = pending_employees[offset:offset + generate_data.chunk_size]
+                mappings = [
+                    {
+                        "employee_id": employee_id,
+                        "pay_period_start": pay_period_start,
+                        "pay_period_end": pay_period_end,
+                        "pay_date": pay_date,
+                        "issued_by": issued_by_user_id,
+                        "issued_at": issued_at,
+                        "generated_date": issued_at,
+                        **PayslipService._standard_salary_components(salary)
+                    }
+                    for employee_id, salary in batch
+                ]
+                
+                db.bulk_insert_mappings(Payslip, mappings)
+                db.commit()
+                
+                chunks += 1
+                created_count += len(mappings)
+                total_gross += sum(m["gross_salary"] for m in mappings)
+                total_net += sum(m["net_salary"] for m in mappings)
+                
+                event = {"type": "chunk", "chunk": chunks, "created": len(mappings), "created_total": created_count}
+                if include_rows:
+                    event["payslips"] = [
+                        {
+                            "employee_id": m["employee_id"],
+                            "gross_salary": m["gross_salary"],
+                            "total_deductions": m["total_deductions"],
+                            "net_salary": m["net_salary"]
+                        }
+                        for m in mappings
+                    ]
+                yield event
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error in bulk payslip generation after {created_count} payslips: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to generate payslips ({created_count} created before the error): {str(e)}"
+            )
+        
+        duration = time.perf_counter() - started
+        logger.info(
+            f"Bulk generated {created_count} payslips for {generate_data.month}/{generate_data.year} "
+            f"in {chunks} chunks ({duration:.2f}s). Skipped: {total_active - len(pending_employees)}"
+        )
+        
+        yield {
+            "type": "summary",
+            "summary": PayslipBulkGenerateResponse(
+                month=generate_data.month,
+                year=generate_data.year,
+                pay_period_start=pay_period_start,
+                pay_period_end=pay_period_end,
+                pay_date=pay_date,
+                total_active_employees=total_active,
+                created_count=created_count,
+                skipped_count=max(0, total_active - len(pending_employees)),
+                total_gross_payout=round(total_gross, 2),
+                total_net_payout=round(total_net, 2),
+                chunks=chunks,
+                duration_seconds=round(duration, 3)
+            )
+        }
+    
+    @staticmethod
+    def _get_pay_period(generate_data: PayslipGenerateRequest) -> Tuple[date, date, date]:
+        """First day, last day and pay date for a generation request"""
+        _, last_day = monthrange(generate_data.year, generate_data.month)
+        pay_period_start = date(generate_data.year, generate_data.month, 1)
+        pay_period_end = date(generate_data.year, generate_data.month, last_day)
+        
+        # Pay date defaults to the last day of the month
+        pay_date = generate_data.pay_date if generate_data.pay_date else pay_period_end
+        return pay_period_start, pay_period_end, pay_date
+    
+    @staticmethod
+    def _standard_salary_components(salary: Optional[float]) -> Dict[str, float]:
+        """Salary components for generated payslips (simplified standard deductions)"""
+        # Use employee's base salary if available
+        basic_salary = salary if salary else 50000.0
+        
+        tax_rate = 0.15
+        pf_rate = 0.12
+        
+        gross_salary = basic_salary
+        tax_deduction = gross_salary * tax_rate
+        pf_deduction = basic_salary * pf_rate
+        total_deductions = tax_deduction + pf_deduction
+        
+        return {
+            "basic_salary": basic_salary,
+            "allowances": 0.0,
+            "overtime_pay": 0.0,
+            "bonus": 0.0,
+            "gross_salary": gross_salary,
+            "tax_deduction": tax_deduction,
+            "pf_deduction": pf_deduction,
+            "insurance_deduction": 0.0,
+            "other_deductions": 0.0,
+            "total_deductions": total_deductions,
+            "net_salary": gross_salary - total_deductions
+        }
+    
     @staticmethod
     def get_payslip_by_id(
         db: Session,
         payslip_id: int,
-        current_user: User
+        current_user: Principal
     ) -> PayslipResponse:
         """Get payslip by ID with access control"""
         payslip = db.query(Payslip).filter(Payslip.id == payslip_id).first()
@@ -254,7 +441,7 @@ class PayslipService:
     def get_payslips_for_employee(
         db: Session,
         employee_id: int,
-        current_user: User,
+        current_user: Principal,
         skip: int = 0,
         limit: int = 100,
         month: Optional[int] = None,
@@ -435,42 +622,34 @@ class PayslipService:
                 detail="Only PDF files are allowed for payslips"
             )
         
-        # Validate file size (max 5MB)
-        max_size = 5 * 1024 * 1024
-        file.file.seek(0, 2)
-        file_size = file.file.tell()
-        file.file.seek(0)
+        # Generate unique filename
+        file_extension = os.path.splitext(file.filename)[1]
+        unique_filename = f"payslip_{payslip_id}_{uuid.uuid4()}{file_extension}"
+        file_path = os.path.join(settings.UPLOAD_DIR, "payslips", unique_filename)
         
-        if file_size > max_size:
+        # Stream file to disk (max 5MB), enforcing the limit while copying
+        try:
+            saved = await save_upload(file, file_path, 5 * 1024 * 1024)
+        except UploadTooLargeError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File size exceeds 5MB limit"
             )
         
+        old_path = payslip.payslip_file_path
         try:
-            # Create upload directory if it doesn't exist
-            upload_dir = "uploads/payslips"
-            os.makedirs(upload_dir, exist_ok=True)
-            
-            # Generate unique filename
-            file_extension = os.path.splitext(file.filename)[1]
-            unique_filename = f"payslip_{payslip_id}_{uuid.uuid4()}{file_extension}"
-            file_path = os.path.join(upload_dir, unique_filename)
-            
-            # Delete old file if exists
-            if payslip.payslip_file_path and os.path.exists(payslip.payslip_file_path):
-                os.remove(payslip.payslip_file_path)
-                logger.info(f"Deleted old payslip file: {payslip.payslip_file_path}")
-            
-            # Save new file
-            with open(file_path, "wb") as buffer:
-                content = await file.read()
-                buffer.write(content)
+            FileDigestService.forget(db, old_path)
+            FileDigestService.record(db, file_path, saved.sha256)
             
             # Update database
             payslip.payslip_file_path = file_path
             db.commit()
             
+            # Delete old file now that the record points to the new one
+            if old_path and old_path != file_path:
+                remove_replaced_file(old_path, file_path)
+                logger.info(f"Deleted old payslip file: {old_path}")
+            
             logger.info(f"Uploaded payslip document for payslip ID {payslip_id}: {file_path}")
             
             return PayslipUploadResponse(
@@ -482,6 +661,8 @@ class PayslipService:
             
         except Exception as e:
             db.rollback()
+            # Nothing references the new file once the update is rolled back
+            remove_replaced_file(file_path, old_path)
             logger.error(f"Error uploading payslip document: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -489,7 +670,7 @@ class PayslipService:
             )
     
     @staticmethod
-    def get_payslip_document_path(db: Session, payslip_id: int, current_user: User) -> str:
+    def get_payslip_document_path(db: Session, payslip_id: int, current_user: Principal) -> str:
         """Get payslip document path for download"""
         payslip = db.query(Payslip).filter(Payslip.id == payslip_id).first()
         
@@ -8,19 +8,47 @@ from datetime import datetime
 from fastapi import UploadFile
 import os
 import uuid
+import asyncio
+import logging
 from models import Policy, PolicyAcknowledgment, User, UserRole
+from utils.principal_cache import Principal
 from schemas.policy_schemas import PolicyCreate, PolicyUpdate, PolicyResponse
 from config import settings
+from utils.file_upload import save_upload, remove_replaced_file, UploadTooLargeError
+from services.file_digest_service import FileDigestService
+
+logger = logging.getLogger(__name__)
 
 
 class PolicyService:
     """Policy service class"""
     
+    @staticmethod
+    def _sync_policy_index(policy: Policy, removed: bool = False) -> None:
+        """
+        Keep the Policy RAG index in line with a policy.
+
+        Active policies with a document are (re-)indexed; the index skips files
+        whose content is unchanged. Inactive or removed policies lose their
+        vectors. Failures are logged and never fail the policy operation.
+        """
+        try:
+            from ai_services.policy_rag_service import get_policy_rag_service
+            rag_service = get_policy_rag_service()
+            if not removed and policy.is_active and policy.document_path:
+                rag_service.index_policy_document(
+                    policy.document_path, policy.title, policy_id=policy.id
+                )
+            else:
+                rag_service.remove_policy_document(policy.id)
+        except Exception as e:
+            logger.warning(f"Failed to update RAG index for policy {policy.id}: {e}")
+    
     @staticmethod
     def create_policy(
         db: Session,
         policy_data: PolicyCreate,
-        created_by_user: User
+        created_by_user: Principal
     ) -> Policy:
         """
         Create a new policy
@@ -56,7 +84,7 @@ class PolicyService:
     @staticmethod
     def get_policies(
         db: Session,
-        current_user: User,
+        current_user: Principal,
         include_inactive: bool = False,
         category: Optional[str] = None,
         skip: int = 0,
@@ -119,7 +147,7 @@ class PolicyService:
         return db.query(Policy).filter(Policy.id == policy_id).first()
     
     @staticmethod
-    def update_policy(
+    async def update_policy(
         db: Session,
         policy_id: int,
         update_data: PolicyUpdate
@@ -150,10 +178,13 @@ class PolicyService:
         db.commit()
         db.refresh(policy)
         
+        if "is_active" in update_dict:
+            await asyncio.to_thread(PolicyService._sync_policy_index, policy)
+        
         return policy
     
     @staticmethod
-    def delete_policy(
+    async def delete_policy(
         db: Session,
         policy_id: int,
         soft_delete: bool = True
@@ -179,6 +210,7 @@ class PolicyService:
             policy.is_active = False
             policy.updated_at = datetime.utcnow()
             db.commit()
+            db.refresh(policy)
         else:
             # Hard delete: remove from database (also deletes file if exists)
             if policy.document_path and os.path.exists(policy.document_path):
@@ -186,6 +218,8 @@ class PolicyService:
             db.delete(policy)
             db.commit()
         
+        await asyncio.to_thread(PolicyService._sync_policy_index, policy, True)
+        
         return True
     
     @staticmethod
@@ -216,41 +250,38 @@ class PolicyService:
             return None, "Only PDF files are allowed", None
         
         # Create unique filename
-        file_extension = os.path.splitext(file.filename)[1]
-        unique_filename = f"{policy_id}_{uuid.uuid4().hex[:8]}_{file.filename}"
+        unique_filename = f"{policy_id}_{uuid.uuid4().hex[:8]}_{os.path.basename(file.filename)}"
         file_path = os.path.join(settings.UPLOAD_DIR, "policies", unique_filename)
         
-        # Read file content and check size
-        file_content = await file.read()
-        file_size = len(file_content)
-        
-        if file_size > settings.MAX_FILE_SIZE:
+        # Stream file to disk, enforcing the size limit while copying
+        try:
+            saved = await save_upload(file, file_path, settings.MAX_FILE_SIZE)
+        except UploadTooLargeError:
             return None, f"File size exceeds maximum allowed ({settings.MAX_FILE_SIZE_MB}MB)", None
+        file_size = saved.size
         
-        # Delete old file if exists
-        if policy.document_path and os.path.exists(policy.document_path):
-            os.remove(policy.document_path)
-        
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        old_path = policy.document_path
+        FileDigestService.forget(db, old_path)
+        FileDigestService.record(db, file_path, saved.sha256)
         
         # Update policy with file path
         policy.document_path = file_path
         policy.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(policy)
-        
-        # Auto-index policy for RAG (async, non-blocking)
         try:
-            from ai_services.policy_rag_service import PolicyRAGService
-            rag_service = PolicyRAGService()
-            rag_service.index_policy_document(file_path, policy.title)
-        except Exception as e:
-            # Log error but don't fail the upload
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to index policy {policy.id} for RAG: {e}")
+            db.commit()
+            db.refresh(policy)
+        except Exception:
+            # Clean up uploaded file if database update fails
+            db.rollback()
+            remove_replaced_file(file_path, old_path)
+            raise
+        
+        # Delete old file only once the new path is committed
+        remove_replaced_file(old_path, file_path)
+        
+        # Auto-index policy for RAG (replaces this policy's previous vectors).
+        # Embedding and the index write lock block, so keep them off the event loop
+        await asyncio.to_thread(PolicyService._sync_policy_index, policy)
         
         return policy, file_path, file_size
     
@@ -283,7 +314,7 @@ class PolicyService:
     def acknowledge_policy(
         db: Session,
         policy_id: int,
-        user: User
+        user: Principal
     ) -> Optional[PolicyAcknowledgment]:
         """
         Acknowledge policy by user
@@ -402,7 +433,7 @@ class PolicyService:
     def format_policy_response(
         policy: Policy,
         db: Session,
-        current_user: Optional[User] = None
+        current_user: Optional[Principal] = None
     ) -> PolicyResponse:
         """
         Format policy for response with additional fields
@@ -2,7 +2,6 @@
 Profile Service - Business logic for profile management
 """
 import os
-import shutil
 from datetime import datetime, date
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session, joinedload
@@ -15,11 +14,21 @@ from models import (
     LeaveRequest, LeaveStatus
 )
 from config import settings
+from utils.principal_cache import principal_cache
+from utils.file_upload import save_upload, remove_replaced_file, SavedUpload, UploadTooLargeError
+from services.file_digest_service import FileDigestService
 
 
 class ProfileService:
     """Service for profile-related operations"""
     
+    # Document types and the User columns holding their paths
+    DOCUMENT_FIELDS = {
+        "profile_image": "profile_image_path",
+        "aadhar": "aadhar_document_path",
+        "pan": "pan_document_path"
+    }
+    
     @staticmethod
     def get_user_profile(db: Session, user_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -123,13 +132,30 @@ class ProfileService:
         try:
             db.commit()
             db.refresh(user)
+            principal_cache.invalidate_user(user_id)
             return ProfileService.get_user_profile(db, user_id)
         except Exception as e:
             db.rollback()
             raise e
     
     @staticmethod
-    def upload_profile_image(
+    async def _save_upload(file: UploadFile, file_path: str) -> SavedUpload:
+        """Stream an upload to file_path, enforcing MAX_FILE_SIZE"""
+        try:
+            return await save_upload(file, file_path, settings.MAX_FILE_SIZE)
+        except UploadTooLargeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"File size exceeds maximum allowed ({settings.MAX_FILE_SIZE_MB}MB)"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to save file: {str(e)}"
+            )
+    
+    @staticmethod
+    async def upload_profile_image(
         db: Session,
         user_id: int,
         file: UploadFile
@@ -167,22 +193,13 @@ class ProfileService:
         filename = f"profile_{safe_name}_{timestamp}{file_ext}"
         file_path = os.path.join(settings.UPLOAD_DIR, "profiles", filename)
         
-        # Delete old profile image if exists
-        if user.profile_image_path and os.path.exists(user.profile_image_path):
-            try:
-                os.remove(user.profile_image_path)
-            except:
-                pass
-        
         # Save new file
-        try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to save file: {str(e)}"
-            )
+        saved = await ProfileService._save_upload(file, file_path)
+        
+        # Delete old image once the record points to the new one
+        old_path = user.profile_image_path
+        FileDigestService.forget(db, old_path)
+        FileDigestService.record(db, file_path, saved.sha256)
         
         # Update user record
         user.profile_image_path = file_path
@@ -198,6 +215,8 @@ class ProfileService:
             db.rollback()
             raise e
         
+        remove_replaced_file(old_path, file_path)
+        
         return {
             "message": "Profile image uploaded successfully",
             "document_type": "profile_image",
@@ -207,7 +226,7 @@ class ProfileService:
         }
     
     @staticmethod
-    def upload_document(
+    async def upload_document(
         db: Session,
         user_id: int,
         document_type: str,
@@ -258,23 +277,13 @@ class ProfileService:
         # Get the field name for this document type
         field_name = f"{document_type}_document_path"
         
-        # Delete old document if exists
-        old_path = getattr(user, field_name, None)
-        if old_path and os.path.exists(old_path):
-            try:
-                os.remove(old_path)
-            except:
-                pass
-        
         # Save new file
-        try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to save file: {str(e)}"
-            )
+        saved = await ProfileService._save_upload(file, file_path)
+        
+        # Delete old document once the record points to the new one
+        old_path = getattr(user, field_name, None)
+        FileDigestService.forget(db, old_path)
+        FileDigestService.record(db, file_path, saved.sha256)
         
         # Update user record
         setattr(user, field_name, file_path)
@@ -290,6 +299,8 @@ class ProfileService:
             db.rollback()
             raise e
         
+        remove_replaced_file(old_path, file_path)
+        
         return {
             "message": f"{document_type.upper()} document uploaded successfully",
             "document_type": document_type,
@@ -346,6 +357,36 @@ class ProfileService:
         
         return documents
     
+    @staticmethod
+    def get_document_path(db: Session, user_id: int, document_type: str) -> str:
+        """
+        Get the stored file of a user document for download
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            document_type: 'profile_image', 'aadhar' or 'pan'
+            
+        Returns:
+            File path
+        """
+        field_name = ProfileService.DOCUMENT_FIELDS.get(document_type)
+        if not field_name:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid document type. Allowed: {', '.join(ProfileService.DOCUMENT_FIELDS.keys())}"
+            )
+        
+        file_path = db.query(getattr(User, field_name)).filter(User.id == user_id).scalar()
+        
+        if not file_path or not os.path.exists(file_path):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{document_type} document not found"
+            )
+        
+        return file_path
+    
     @staticmethod
     def delete_document(
         db: Session,
@@ -372,11 +413,7 @@ class ProfileService:
             )
         
         # Map document types to field names
-        field_map = {
-            "profile_image": "profile_image_path",
-            "aadhar": "aadhar_document_path",
-            "pan": "pan_document_path"
-        }
+        field_map = ProfileService.DOCUMENT_FIELDS
         
         if document_type not in field_map:
             raise HTTPException(
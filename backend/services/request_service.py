@@ -1,7 +1,7 @@
 """
 Service layer for Team Requests management
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_, func, extract
 from typing import Optional, List, Dict
 from datetime import datetime, date
@@ -16,6 +16,13 @@ from schemas.request_schemas import (
     RequestListResponse,
     RequestStatsResponse
 )
+from utils.pagination import paginate_keyset
+
+# Loaded with list pages so _request_to_response needs no per-row queries
+RESPONSE_LOAD_OPTIONS = (
+    joinedload(Request.employee),
+    joinedload(Request.approver),
+)
 
 
 def create_request(db: Session, request_data: RequestCreate, employee_id: int) -> RequestResponse:
@@ -68,7 +75,7 @@ def get_my_requests(
     
     # Pagination
     offset = (page - 1) * page_size
-    requests = query.offset(offset).limit(page_size).all()
+    requests = query.options(*RESPONSE_LOAD_OPTIONS).offset(offset).limit(page_size).all()
     
     return RequestListResponse(
         requests=[_request_to_response(db, req) for req in requests],
@@ -127,7 +134,7 @@ def get_team_requests(
     
     # Pagination
     offset = (page - 1) * page_size
-    requests = query.offset(offset).limit(page_size).all()
+    requests = query.options(*RESPONSE_LOAD_OPTIONS).offset(offset).limit(page_size).all()
     
     return RequestListResponse(
         requests=[_request_to_response(db, req) for req in requests],
@@ -145,10 +152,15 @@ def get_all_requests(
     employee_id: Optional[int] = None,
     search: Optional[str] = None,
     page: int = 1,
-    page_size: int = 10
+    page_size: int = 10,
+    cursor: Optional[str] = None,
+    include_total: bool = True
 ) -> RequestListResponse:
     """
     Get all requests (HR only) with advanced filters
+
+    With `cursor` (empty for the first page) pages by keyset instead of
+    `page`; the total is only counted if `include_total`.
     """
     query = db.query(Request)
     
@@ -172,6 +184,23 @@ def get_all_requests(
             )
         )
     
+    if cursor is not None:
+        total = query.count() if include_total else None
+        # Same order as below, with id to make it total
+        requests, next_cursor = paginate_keyset(
+            query.options(*RESPONSE_LOAD_OPTIONS),
+            [(Request.status, False), (Request.submitted_date, True), (Request.id, True)],
+            cursor, page_size, scope="requests"
+        )
+        return RequestListResponse(
+            requests=[_request_to_response(db, req) for req in requests],
+            total=total,
+            page=None,
+            page_size=page_size,
+            total_pages=None if total is None else (total + page_size - 1) // page_size,
+            next_cursor=next_cursor
+        )
+    
     # Order by status (pending first), then by date
     query = query.order_by(
         Request.status.asc(),
@@ -183,7 +212,7 @@ def get_all_requests(
     
     # Pagination
     offset = (page - 1) * page_size
-    requests = query.offset(offset).limit(page_size).all()
+    requests = query.options(*RESPONSE_LOAD_OPTIONS).offset(offset).limit(page_size).all()
     
     return RequestListResponse(
         requests=[_request_to_response(db, req) for req in requests],
@@ -424,15 +453,9 @@ def _request_to_response(db: Session, request: Request) -> RequestResponse:
     """
     Convert Request model to RequestResponse schema
     """
-    # Get employee name
-    employee = db.query(User).filter(User.id == request.employee_id).first()
-    employee_name = employee.name if employee else None
-    
-    # Get approver name if approved
-    approver_name = None
-    if request.approved_by:
-        approver = db.query(User).filter(User.id == request.approved_by).first()
-        approver_name = approver.name if approver else None
+    # Relationships: loaded with list pages (RESPONSE_LOAD_OPTIONS), else lazily
+    employee_name = request.employee.name if request.employee else None
+    approver_name = request.approver.name if request.approver else None
     
     return RequestResponse(
         id=request.id,
@@ -0,0 +1,221 @@
+"""
+Screening History Service - Resume screening runs and results in the database
+
+Every screening request is a `ResumeScreeningRun` (its id is the analysis ID
+returned to clients) with one `ResumeScreeningRunResult` per candidate.
+Results are written as each analysis finishes, so a run that was cut short
+keeps its progress and can be continued. History is keyset-paginated on
+(created_at, id), newest first.
+"""
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+from models import ResumeScreeningRun, ResumeScreeningRunResult
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import base64
+import json
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class ScreeningHistoryService:
+    """Service class for persisting and querying resume screening runs"""
+
+    @staticmethod
+    def new_analysis_id() -> int:
+        """Random 48-bit analysis ID (same format the JSON files used)"""
+        return int(uuid.uuid4().hex[:12], 16)
+
+    @staticmethod
+    def parse_analysis_id(value: str) -> Optional[int]:
+        """Accept decimal IDs and the hex IDs older streaming runs returned"""
+        for base in (10, 16):
+            try:
+                return int(value, base)
+            except (TypeError, ValueError):
+                continue
+        return None
+
+    @staticmethod
+    def create_run(
+        db: Session,
+        job_id: int,
+        job_title: str = "",
+        analysis_id: Optional[int] = None,
+        created_at: Optional[datetime] = None,
+        commit: bool = True,
+    ) -> ResumeScreeningRun:
+        """Insert a run in 'running' state"""
+        run = ResumeScreeningRun(
+            id=analysis_id or ScreeningHistoryService.new_analysis_id(),
+            job_id=job_id,
+            job_title=job_title,
+            status="running",
+            created_at=created_at or datetime.utcnow(),
+        )
+        db.add(run)
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+        return run
+
+    @staticmethod
+    def get_run(db: Session, analysis_id: int) -> Optional[ResumeScreeningRun]:
+        return db.query(ResumeScreeningRun).filter(ResumeScreeningRun.id == analysis_id).first()
+
+    @staticmethod
+    def get_results(db: Session, analysis_id: int) -> List[Dict[str, Any]]:
+        """Candidate analyses of a run, best score first"""
+        rows = (
+            db.query(ResumeScreeningRunResult.analysis)
+            .filter(ResumeScreeningRunResult.run_id == analysis_id)
+            .order_by(
+                ResumeScreeningRunResult.overall_fit_score.desc(),
+                ResumeScreeningRunResult.id,
+            )
+            .all()
+        )
+        return [json.loads(row.analysis) for row in rows]
+
+    @staticmethod
+    def completed_application_ids(db: Session, analysis_id: int) -> set:
+        """Applications that already have a successful result in this run"""
+        rows = (
+            db.query(ResumeScreeningRunResult.application_id)
+            .filter(
+                ResumeScreeningRunResult.run_id == analysis_id,
+                ResumeScreeningRunResult.failed.is_(False),
+                ResumeScreeningRunResult.application_id.isnot(None),
+            )
+            .all()
+        )
+        return {row.application_id for row in rows}
+
+    @staticmethod
+    def add_result(
+        db: Session, analysis_id: int, analysis: Dict[str, Any], commit: bool = True
+    ) -> None:
+        """Store one candidate analysis; replaces an earlier result for the same application"""
+        application_id = analysis.get("application_id")
+        if application_id is not None:
+            db.query(ResumeScreeningRunResult).filter(
+                ResumeScreeningRunResult.run_id == analysis_id,
+                ResumeScreeningRunResult.application_id == application_id,
+            ).delete(synchronize_session=False)
+
+        db.add(
+            ResumeScreeningRunResult(
+                run_id=analysis_id,
+                application_id=application_id,
+                candidate_name=analysis.get("candidate_name"),
+                overall_fit_score=analysis.get("overall_fit_score") or 0,
+                failed=bool(analysis.get("error")),
+                analysis=json.dumps(analysis, default=str),
+            )
+        )
+        if commit:
+            db.commit()
+
+    @staticmethod
+    def complete_run(
+        db: Session, run: ResumeScreeningRun, completed_at: Optional[datetime] = None
+    ) -> ResumeScreeningRun:
+        """Compute the run summary from its stored results and mark it completed"""
+        total, average = (
+            db.query(
+                func.count(ResumeScreeningRunResult.id),
+                func.avg(ResumeScreeningRunResult.overall_fit_score),
+            )
+            .filter(ResumeScreeningRunResult.run_id == run.id)
+            .one()
+        )
+        top = (
+            db.query(ResumeScreeningRunResult.candidate_name)
+            .filter(ResumeScreeningRunResult.run_id == run.id)
+            .order_by(
+                ResumeScreeningRunResult.overall_fit_score.desc(),
+                ResumeScreeningRunResult.id,
+            )
+            .first()
+        )
+
+        run.total_analyzed = total or 0
+        run.average_score = average or 0
+        run.top_candidate = top.candidate_name if top else None
+        run.status = "completed"
+        run.completed_at = completed_at or datetime.utcnow()
+        db.commit()
+        return run
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, run_id: int) -> str:
+        raw = f"{created_at.isoformat()}|{run_id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """Raises ValueError for a malformed cursor"""
+        try:
+            created_at, run_id = (
+                base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+            )
+            return datetime.fromisoformat(created_at), int(run_id)
+        except Exception:
+            raise ValueError("Invalid cursor")
+
+    @staticmethod
+    def list_runs(
+        db: Session,
+        job_id: Optional[int] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], int]:
+        """
+        Completed runs, newest first, one page at a time.
+
+        Returns:
+            Tuple of (history page, next cursor or None, total matching runs)
+        """
+        query = db.query(ResumeScreeningRun).filter(ResumeScreeningRun.status == "completed")
+        if job_id is not None:
+            query = query.filter(ResumeScreeningRun.job_id == job_id)
+        total = query.with_entities(func.count(ResumeScreeningRun.id)).scalar() or 0
+
+        if cursor:
+            created_at, run_id = ScreeningHistoryService.decode_cursor(cursor)
+            query = query.filter(
+                or_(
+                    ResumeScreeningRun.created_at < created_at,
+                    and_(
+                        ResumeScreeningRun.created_at == created_at,
+                        ResumeScreeningRun.id < run_id,
+                    ),
+                )
+            )
+
+        runs = (
+            query.order_by(ResumeScreeningRun.created_at.desc(), ResumeScreeningRun.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        next_cursor = None
+        if len(runs) > limit:
+            runs = runs[:limit]
+            next_cursor = ScreeningHistoryService.encode_cursor(runs[-1].created_at, runs[-1].id)
+
+        history = [
+            {
+                "analysis_id": run.id,
+                "job_id": run.job_id,
+                "job_title": run.job_title or "",
+                "timestamp": run.created_at.isoformat(),
+                "total_analyzed": run.total_analyzed,
+                "average_score": run.average_score,
+                "top_candidate": run.top_candidate,
+            }
+            for run in runs
+        ]
+        return history, next_cursor, total
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
 from fastapi import HTTPException, status
 from models import User, SkillModule, SkillModuleEnrollment, ModuleStatus
+from utils.pagination import paginate_keyset
 from schemas.skill_schemas import (
     SkillModuleCreate,
     SkillModuleUpdate,
@@ -305,9 +306,19 @@ class SkillService:
         limit: int = 100,
         employee_id_filter: Optional[int] = None,
         module_id_filter: Optional[int] = None,
-        status_filter: Optional[str] = None
-    ) -> Tuple[List[EnrollmentResponse], int]:
-        """Get all enrollments (HR)"""
+        status_filter: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[EnrollmentResponse], Optional[int], Optional[str]]:
+        """
+        Get all enrollments (HR)
+
+        With `cursor` (empty for the first page) pages by keyset instead of
+        `skip`; the total is only counted if `include_total`.
+
+        Returns:
+            Tuple of (enrollments, total or None, next_cursor or None)
+        """
         query = db.query(SkillModuleEnrollment)
         
         # Employee filter
@@ -326,11 +337,19 @@ class SkillService:
             except KeyError:
                 pass
         
-        total = query.count()
-        enrollments = query.order_by(SkillModuleEnrollment.enrolled_date.desc()).offset(skip).limit(limit).all()
+        total = query.count() if include_total or cursor is None else None
+        next_cursor = None
+        if cursor is not None:
+            enrollments, next_cursor = paginate_keyset(
+                query,
+                [(SkillModuleEnrollment.enrolled_date, True), (SkillModuleEnrollment.id, True)],
+                cursor, limit, scope="enrollments"
+            )
+        else:
+            enrollments = query.order_by(SkillModuleEnrollment.enrolled_date.desc()).offset(skip).limit(limit).all()
         
         formatted_enrollments = [SkillService._format_enrollment_response(e, db) for e in enrollments]
-        return formatted_enrollments, total
+        return formatted_enrollments, total, next_cursor
     
     @staticmethod
     def update_enrollment_progress(
@@ -156,6 +156,12 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "skills: Skills/Modules API tests"
     )
+    config.addinivalue_line(
+        "markers", "admin_metrics: Admin Metrics API tests"
+    )
+    config.addinivalue_line(
+        "markers", "query_counts: SQL query count regression tests"
+    )
     config.addinivalue_line(
         "markers", "ai_jd: AI Job Description API tests"
     )
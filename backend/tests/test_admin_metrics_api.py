@@ -0,0 +1,97 @@
+"""
+Admin Metrics API Tests (Pytest)
+Run with: pytest backend/tests/test_admin_metrics_api.py -v
+"""
+import pytest
+import requests
+
+
+@pytest.mark.admin_metrics
+class TestAdminMetricsAPI:
+    """Test suite for Admin Metrics endpoints"""
+
+    def test_db_headers_on_response(self, api_base_url, employee_token):
+        """Test responses report their SQL statement count and DB time"""
+        if not employee_token:
+            pytest.skip("Employee token not available (database not seeded)")
+
+        response = requests.get(
+            f"{api_base_url}/profile/me",
+            headers={"Authorization": f"Bearer {employee_token}"}
+        )
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert int(response.headers["X-DB-Queries"]) >= 1
+        assert float(response.headers["X-DB-Time"]) >= 0
+
+    def test_get_db_metrics(self, api_base_url, hr_token):
+        """Test HR can get per-route SQL metrics"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+
+        headers = {"Authorization": f"Bearer {hr_token}"}
+        requests.get(f"{api_base_url}/departments", headers=headers)
+
+        response = requests.get(f"{api_base_url}/admin/metrics/db", headers=headers)
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        routes = response.json()["routes"]
+        assert "GET /api/v1/departments" in routes
+        route = routes["GET /api/v1/departments"]
+        assert route["requests"] >= 1
+        assert sum(route["queries_histogram"].values()) == route["requests"]
+
+    def test_db_metrics_include_streamed_body(self, api_base_url, hr_token):
+        """Test a streamed response records as many statements as the same work unstreamed"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+
+        headers = {"Authorization": f"Bearer {hr_token}"}
+        route = "POST /api/v1/payslips/generate/bulk"
+        periods = {3: "false", 4: "true"}  # month -> stream
+
+        def route_queries():
+            routes = requests.get(f"{api_base_url}/admin/metrics/db", headers=headers).json()["routes"]
+            return routes.get(route, {}).get("queries_total", 0)
+
+        def period_ids(month):
+            response = requests.get(
+                f"{api_base_url}/payslips?month={month}&year=2020&limit=500", headers=headers
+            )
+            return {p["id"] for p in response.json()["payslips"]}
+
+        existing_ids = {month: period_ids(month) for month in periods}
+        if any(existing_ids.values()):
+            pytest.skip("Payslips already exist for the test periods")
+
+        try:
+            recorded = {}
+            for month, stream in periods.items():
+                before = route_queries()
+                # Streamed, the inserts run while the body is sent, after the headers
+                response = requests.post(
+                    f"{api_base_url}/payslips/generate/bulk?stream={stream}",
+                    headers=headers,
+                    json={"month": month, "year": 2020, "chunk_size": 100}
+                )
+                assert response.status_code == 201, f"Expected 201, got {response.status_code}"
+                recorded[stream] = route_queries() - before
+
+            assert recorded["true"] == recorded["false"]
+        finally:
+            for month in periods:
+                for payslip_id in period_ids(month) - existing_ids[month]:
+                    requests.delete(f"{api_base_url}/payslips/{payslip_id}", headers=headers)
+
+    @pytest.mark.permissions
+    def test_get_db_metrics_employee_forbidden(self, api_base_url, employee_token):
+        """Test employee cannot get SQL metrics"""
+        if not employee_token:
+            pytest.skip("Employee token not available (database not seeded)")
+
+        response = requests.get(
+            f"{api_base_url}/admin/metrics/db",
+            headers={"Authorization": f"Bearer {employee_token}"}
+        )
+
+        assert response.status_code == 403, f"Expected 403, got {response.status_code}"
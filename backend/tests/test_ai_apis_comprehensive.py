@@ -38,7 +38,44 @@ class TestAIPerformanceReportsAPI:
         assert isinstance(data["status"], str), "'status' field must be a string"
         assert data["service"] in ["AI Performance Reports", "AI Performance Report"], \
             f"Expected service name 'AI Performance Report(s)', got '{data['service']}'"
-    
+
+    def test_performance_reports_health_worker_pool(self, api_base_url, hr_token):
+        """Test health endpoint reports the AI worker pool limits"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+
+        response = requests.get(
+            f"{api_base_url}/ai/performance-report/health",
+            headers={"Authorization": f"Bearer {hr_token}"}
+        )
+
+        assert response.status_code == 200, \
+            f"Health check failed with status code {response.status_code}: {response.text}"
+
+        pool = response.json()["ai_provider_status"]["worker_pool"]
+        assert pool["max_workers"] >= 1
+        assert pool["per_provider_limit"] >= 1
+        assert pool["timeout_seconds"] > 0
+        assert isinstance(pool["in_flight"], dict)
+
+    def test_performance_reports_health_report_cache(self, api_base_url, hr_token):
+        """Test health endpoint reports AI report cache counters"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+
+        response = requests.get(
+            f"{api_base_url}/ai/performance-report/health",
+            headers={"Authorization": f"Bearer {hr_token}"}
+        )
+
+        assert response.status_code == 200, \
+            f"Health check failed with status code {response.status_code}: {response.text}"
+
+        cache = response.json()["report_cache"]
+        for field in ("enabled", "hits", "misses", "hit_rate", "entries"):
+            assert field in cache, f"report_cache missing '{field}'"
+        assert cache["hits"] >= 0 and cache["misses"] >= 0
+
     def test_get_templates(self, api_base_url, hr_token):
         """Test get performance report templates"""
         if not hr_token:
@@ -451,7 +488,30 @@ class TestAIResumeScreenerAPI:
             for idx, item in enumerate(history):
                 assert isinstance(item, dict), \
                     f"History item at index {idx} must be a dictionary"
-    
+
+    def test_get_screening_history_pagination(self, api_base_url, hr_token):
+        """Test screening history returns a keyset cursor and rejects bad cursors"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+
+        response = requests.get(
+            f"{api_base_url}/ai/resume-screener/history",
+            params={"limit": 1},
+            headers={"Authorization": f"Bearer {hr_token}"}
+        )
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert len(data["history"]) <= 1
+        assert "next_cursor" in data and "has_more" in data
+        assert data["has_more"] == (data["next_cursor"] is not None)
+
+        response = requests.get(
+            f"{api_base_url}/ai/resume-screener/history",
+            params={"cursor": "not-a-cursor"},
+            headers={"Authorization": f"Bearer {hr_token}"}
+        )
+        assert response.status_code == 400, response.text
+
     def test_get_results_endpoint_exists(self, api_base_url, hr_token):
         """Test get screening results endpoint exists"""
         if not hr_token:
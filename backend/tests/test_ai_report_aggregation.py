@@ -0,0 +1,220 @@
+"""
+AI Report Aggregation Tests (Pytest)
+Run with: pytest backend/tests/test_ai_report_aggregation.py -v
+
+Runs in-process against a copy of the seeded database (DATABASE_URL). Known
+goals, feedback, attendance, training and comments are added for two
+members of a team in a period the seed data does not touch, and the team
+and department reports are checked against the values worked out by hand.
+Only the LLM call is replaced.
+"""
+import asyncio
+import sqlite3
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from config import settings
+from database import create_db_engine
+from models import (
+    Attendance, AttendanceStatus, Feedback, Goal, GoalComment, GoalStatus,
+    ModuleStatus, SkillModule, SkillModuleEnrollment, Team, User
+)
+from schemas.ai_performance_schemas import ReportTemplateEnum, TimePeriodEnum
+
+PERIOD_START = date(2019, 3, 1)
+PERIOD_END = date(2019, 3, 31)
+
+
+@pytest.fixture
+def report_db(tmp_path, monkeypatch):
+    """Session on a copy of the seeded SQLite database"""
+    prefix = "sqlite:///"
+    if not settings.DATABASE_URL.startswith(prefix):
+        pytest.skip("Aggregation tests need the SQLite database")
+    source = sqlite3.connect(settings.DATABASE_URL[len(prefix):])
+    target = sqlite3.connect(tmp_path / "hr.db")
+    try:
+        source.backup(target)
+    finally:
+        source.close()
+        target.close()
+
+    # The provider manager needs a key to start; no request is sent
+    monkeypatch.setenv("GOOGLE_API_KEY", settings.GOOGLE_API_KEY or "test-key")
+    engine = create_db_engine(f"{prefix}{tmp_path / 'hr.db'}", tuned=False)
+    db = sessionmaker(bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def report_service(monkeypatch):
+    from services.ai_performance_report_service import AIPerformanceReportService
+
+    service = AIPerformanceReportService()
+
+    async def fake_generate_report(prompt, temperature=0.7, max_tokens=2048):
+        return "report"
+
+    monkeypatch.setattr(service.ai_provider, "generate_report", fake_generate_report)
+    return service
+
+
+def _team_with_two_members(db):
+    """A team with at least two active members and no activity in the test period"""
+    for team in db.query(Team).order_by(Team.id):
+        members = (
+            db.query(User)
+            .filter(User.team_id == team.id, User.is_active == True)
+            .order_by(User.id)
+            .all()
+        )
+        if len(members) < 2:
+            continue
+        ids = [m.id for m in members]
+        if db.query(Goal).filter(
+            Goal.employee_id.in_(ids), Goal.start_date.between(PERIOD_START, PERIOD_END)
+        ).count():
+            continue
+        return team, members
+    pytest.skip("No team with two active members in the seeded database")
+
+
+def _add_activity(db, first, second):
+    """
+    first: 4 goals (1 on time, 1 late, 1 in progress, 1 not started), ratings
+    4 and 5, attended 3 of 4 days, 1 module, 2 comments (1 blocker).
+    second: 1 goal completed on time, rating 2, attended 1 of 2 days, 1 comment.
+    """
+    module = SkillModule(name="Aggregation test module")
+    db.add(module)
+
+    def goal(employee, title, status, target, completed=None):
+        row = Goal(
+            employee_id=employee.id, title=title, status=status,
+            start_date=PERIOD_START, target_date=target, completion_date=completed,
+        )
+        db.add(row)
+        return row
+
+    goal(first, "On time", GoalStatus.COMPLETED, date(2019, 3, 20), date(2019, 3, 15))
+    goal(first, "Late", GoalStatus.COMPLETED, date(2019, 3, 10), date(2019, 3, 25))
+    in_progress = goal(first, "In progress", GoalStatus.IN_PROGRESS, date(2019, 3, 31))
+    goal(first, "Not started", GoalStatus.NOT_STARTED, date(2019, 3, 31))
+    goal(second, "Done", GoalStatus.COMPLETED, date(2019, 3, 31), date(2019, 3, 30))
+    db.flush()
+
+    for employee, rating, feedback_type in (
+        (first, 4.0, "positive"), (first, 5.0, "positive"), (second, 2.0, "constructive")
+    ):
+        db.add(Feedback(
+            employee_id=employee.id, given_by=employee.id, subject="Review",
+            description="Review", feedback_type=feedback_type, rating=rating,
+            given_on=datetime(2019, 3, 6, 10, 0),
+        ))
+
+    for employee, day, status in (
+        (first, 4, AttendanceStatus.PRESENT), (first, 5, AttendanceStatus.WFH),
+        (first, 6, AttendanceStatus.ABSENT), (first, 7, AttendanceStatus.PRESENT),
+        (second, 4, AttendanceStatus.PRESENT), (second, 5, AttendanceStatus.ABSENT),
+    ):
+        db.add(Attendance(employee_id=employee.id, date=date(2019, 3, day), status=status))
+
+    db.add(SkillModuleEnrollment(
+        employee_id=first.id, module_id=module.id, status=ModuleStatus.COMPLETED,
+        completed_date=date(2019, 3, 10),
+    ))
+
+    for user, comment_type in ((first, "update"), (first, "blocker"), (second, "update")):
+        db.add(GoalComment(
+            goal_id=in_progress.id, user_id=user.id, comment="Note",
+            comment_type=comment_type, created_at=datetime(2019, 3, 12, 9, 0),
+        ))
+    db.commit()
+
+
+@pytest.mark.ai_performance
+class TestAIReportAggregation:
+    """Test suite for the grouped team and organisation report metrics"""
+
+    def test_team_summary_metrics(self, report_db, report_service):
+        """Test team totals and member summaries match the known activity"""
+        team, members = _team_with_two_members(report_db)
+        first, second = members[0], members[1]
+        _add_activity(report_db, first, second)
+
+        response = asyncio.run(report_service.generate_team_summary_report(
+            report_db, team.id, TimePeriodEnum.CUSTOM, PERIOD_START, PERIOD_END,
+            ReportTemplateEnum.STANDARD_REVIEW,
+        ))
+
+        team_data = response.team_data_summary
+        assert team_data["team_size"] == len(members)
+        assert team_data["total_goals"] == 5
+        assert team_data["completed_goals"] == 3
+        assert team_data["in_progress_goals"] == 1
+        assert team_data["overdue_goals"] == 2
+        assert team_data["goal_completion_rate"] == pytest.approx(60.0)
+        assert team_data["on_time_rate"] == pytest.approx(200 / 3)
+        assert team_data["total_feedback"] == 3
+        assert team_data["avg_rating"] == pytest.approx(11 / 3)
+        assert team_data["positive_feedback_pct"] == pytest.approx(200 / 3)
+        assert team_data["avg_attendance"] == pytest.approx(400 / 6)
+        assert team_data["avg_training_completion"] == 1
+        assert team_data["total_comments"] == 3
+        assert team_data["total_blockers"] == 1
+
+        reports = {r.employee_id: r for r in response.member_reports}
+        assert reports[first.id].key_metrics == {
+            "goal_completion": pytest.approx(50.0),
+            "feedback_rating": pytest.approx(4.5),
+            "attendance": pytest.approx(75.0),
+        }
+        assert reports[first.id].overall_status == "good"
+        assert reports[second.id].key_metrics == {
+            "goal_completion": pytest.approx(100.0),
+            "feedback_rating": pytest.approx(2.0),
+            "attendance": pytest.approx(50.0),
+        }
+        assert reports[second.id].overall_status == "needs_attention"
+        for member in members[2:]:
+            assert reports[member.id].key_metrics == {
+                "goal_completion": 0, "feedback_rating": 0, "attendance": 0
+            }
+
+    def test_department_report_metrics(self, report_db, report_service):
+        """Test department totals and summary match the known activity"""
+        team, members = _team_with_two_members(report_db)
+        _add_activity(report_db, members[0], members[1])
+        employees = report_db.query(User).filter(
+            User.department_id == team.department_id, User.is_active == True
+        ).count()
+
+        response = asyncio.run(report_service.generate_organization_report(
+            report_db, "department", team.department_id, TimePeriodEnum.CUSTOM,
+            PERIOD_START, PERIOD_END, ReportTemplateEnum.STANDARD_REVIEW,
+        ))
+
+        org_data = response.organization_data_summary
+        assert org_data["total_employees"] == employees
+        assert org_data["total_departments"] == 1
+        assert org_data["total_goals"] == 5
+        assert org_data["completion_rate"] == pytest.approx(60.0)
+        assert org_data["on_time_rate"] == pytest.approx(200 / 3)
+        assert org_data["avg_overdue"] == pytest.approx(2 / employees)
+        assert org_data["total_feedback"] == 3
+        assert org_data["avg_rating"] == pytest.approx(11 / 3)
+        assert org_data["attendance_rate"] == pytest.approx(400 / 6)
+        assert org_data["training_completion"] == pytest.approx(10 / employees)
+
+        (summary,) = response.department_summaries
+        assert summary["employee_count"] == employees
+        assert summary["completion_rate"] == pytest.approx(60.0)
+        assert summary["avg_rating"] == pytest.approx(11 / 3)
+        assert summary["attendance_rate"] == pytest.approx(400 / 6)
+        assert summary["status"] == "performing_well"
@@ -222,6 +222,20 @@ class TestAttendanceAPI:
         data = response.json()
         assert "records" in data
     
+    def test_get_team_attendance_include_indirect(self, api_base_url, manager_token):
+        """Test indirect reports widen the team attendance list"""
+        if not manager_token:
+            pytest.skip("Manager token not available (database not seeded)")
+        
+        headers = {"Authorization": f"Bearer {manager_token}"}
+        direct = requests.get(f"{api_base_url}/attendance/team", headers=headers)
+        subtree = requests.get(f"{api_base_url}/attendance/team?include_indirect=true", headers=headers)
+        
+        assert subtree.status_code == 200, f"Expected 200, got {subtree.status_code}"
+        data = subtree.json()
+        assert data["total_team_members"] >= direct.json()["total_team_members"]
+        assert len(data["records"]) == data["total_team_members"]
+    
     @pytest.mark.permissions
     def test_get_team_attendance_employee_forbidden(self, api_base_url, employee_token):
         """Test employee cannot access team attendance"""
@@ -23,7 +23,20 @@ class TestDashboardAPI:
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         data = response.json()
         assert "departments" in data or "total_employees" in data
-    
+
+    def test_hr_dashboard_snapshot_timestamp(self, api_base_url, hr_token):
+        """Test HR dashboard reports when its snapshot was computed"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+
+        headers = {"Authorization": f"Bearer {hr_token}"}
+        first = requests.get(f"{api_base_url}/dashboard/hr", headers=headers)
+        second = requests.get(f"{api_base_url}/dashboard/hr", headers=headers)
+
+        assert first.status_code == 200, f"Expected 200, got {first.status_code}"
+        assert first.json()["generated_at"] is not None
+        assert second.json()["generated_at"] >= first.json()["generated_at"]
+
     @pytest.mark.permissions
     def test_get_hr_dashboard_employee_forbidden(self, api_base_url, employee_token):
         """Test employee cannot access HR dashboard"""
@@ -178,6 +178,46 @@ class TestEmployeesAPI:
         assert "page" in data
         assert "total_pages" in data
     
+    def test_get_all_employees_cursor_pagination(self, api_base_url, hr_token):
+        """Test walking the employee list with cursors visits everyone once"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+        
+        headers = {"Authorization": f"Bearer {hr_token}"}
+        response = requests.get(
+            f"{api_base_url}/employees?page_size=3&cursor=&include_total=true",
+            headers=headers
+        )
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        data = response.json()
+        total = data["total"]
+        assert data["page"] is None
+        
+        seen = [e["id"] for e in data["employees"]]
+        while data["next_cursor"]:
+            response = requests.get(
+                f"{api_base_url}/employees?page_size=3&cursor={data['next_cursor']}",
+                headers=headers
+            )
+            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+            data = response.json()
+            assert data["total"] is None
+            seen.extend(e["id"] for e in data["employees"])
+        
+        assert len(seen) == len(set(seen)) == total
+    
+    def test_get_all_employees_invalid_cursor(self, api_base_url, hr_token):
+        """Test a malformed cursor is rejected"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+        
+        response = requests.get(
+            f"{api_base_url}/employees?cursor=not-a-cursor",
+            headers={"Authorization": f"Bearer {hr_token}"}
+        )
+        
+        assert response.status_code == 400, f"Expected 400, got {response.status_code}"
+    
     def test_search_employees(self, api_base_url, hr_token):
         """Test search employees"""
         if not hr_token:
@@ -397,7 +437,41 @@ class TestEmployeesAPI:
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         data = response.json()
         assert "message" in data
-    
+
+    def test_deactivated_employee_token_rejected(self, api_base_url, hr_token):
+        """Test a deactivated employee's existing token stops working immediately"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+
+        email = f"test.revoke.{uuid.uuid4().hex[:8]}@company.com"
+        create_response = requests.post(
+            f"{api_base_url}/employees",
+            headers={"Authorization": f"Bearer {hr_token}"},
+            json={"name": "Test for Token Revocation", "email": email, "password": "testpass123"}
+        )
+
+        if create_response.status_code != 201:
+            pytest.skip("Could not create employee for token revocation test")
+
+        test_id = create_response.json()["id"]
+        login = requests.post(
+            f"{api_base_url}/auth/login",
+            json={"email": email, "password": "testpass123"}
+        )
+        assert login.status_code == 200
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        # Authenticate once so the token is cached
+        assert requests.get(f"{api_base_url}/profile/me", headers=headers).status_code == 200
+
+        requests.delete(
+            f"{api_base_url}/employees/{test_id}",
+            headers={"Authorization": f"Bearer {hr_token}"}
+        )
+
+        response = requests.get(f"{api_base_url}/profile/me", headers=headers)
+        assert response.status_code == 401, f"Expected 401, got {response.status_code}"
+
     @pytest.mark.permissions
     def test_deactivate_employee_manager_forbidden(self, api_base_url, hr_token, manager_token):
         """Test Manager cannot deactivate employee"""
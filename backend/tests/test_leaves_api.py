@@ -158,6 +158,18 @@ class TestLeavesAPI:
         assert "leaves" in data
         assert "total" in data
     
+    def test_get_team_leave_requests_include_indirect(self, api_base_url, manager_token):
+        """Test indirect reports widen the team leave list"""
+        if not manager_token:
+            pytest.skip("Manager token not available (database not seeded)")
+        
+        headers = {"Authorization": f"Bearer {manager_token}"}
+        direct = requests.get(f"{api_base_url}/leaves/team", headers=headers)
+        subtree = requests.get(f"{api_base_url}/leaves/team?include_indirect=true", headers=headers)
+        
+        assert subtree.status_code == 200, f"Expected 200, got {subtree.status_code}"
+        assert subtree.json()["total"] >= direct.json()["total"]
+    
     @pytest.mark.permissions
     def test_get_team_leaves_employee_forbidden(self, api_base_url, employee_token):
         """Test employee cannot access team leaves"""
@@ -186,6 +198,21 @@ class TestLeavesAPI:
         assert "leaves" in data
         assert "total" in data
     
+    def test_get_all_leave_requests_cursor_matches_offset(self, api_base_url, hr_token):
+        """Test the first cursor page matches the first offset page"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+        
+        headers = {"Authorization": f"Bearer {hr_token}"}
+        by_page = requests.get(f"{api_base_url}/leaves/all?page_size=5", headers=headers).json()
+        response = requests.get(f"{api_base_url}/leaves/all?page_size=5&cursor=", headers=headers)
+        
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        by_cursor = response.json()
+        assert by_cursor["total"] is None
+        assert [l["id"] for l in by_cursor["leaves"]] == [l["id"] for l in by_page["leaves"]]
+        assert (by_cursor["next_cursor"] is not None) == (by_page["total"] > 5)
+    
     @pytest.mark.permissions
     def test_get_all_leaves_employee_forbidden(self, api_base_url, employee_token):
         """Test employee cannot access all leaves"""
@@ -0,0 +1,68 @@
+"""
+List Endpoint Query Count Tests (Pytest)
+Run with: pytest backend/tests/test_list_query_counts_api.py -v
+
+List pages load the users/departments/teams they show with the page, so the
+number of SQL statements (X-DB-Queries header) must not grow with the page size.
+"""
+import pytest
+import requests
+
+
+@pytest.mark.query_counts
+class TestListQueryCounts:
+    """Query count regression tests for list endpoints"""
+    
+    def _assert_constant_query_count(self, api_base_url, token, path, items_key, size_param="page_size"):
+        """One-row and full pages must run the same number of statements"""
+        if not token:
+            pytest.skip("Token not available (database not seeded)")
+        
+        headers = {"Authorization": f"Bearer {token}"}
+        separator = "&" if "?" in path else "?"
+        # Warm-up: the first request may load and cache the caller's principal
+        requests.get(f"{api_base_url}{path}{separator}{size_param}=1", headers=headers)
+        
+        counts = {}
+        for size in (1, 50):
+            response = requests.get(f"{api_base_url}{path}{separator}{size_param}={size}", headers=headers)
+            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+            counts[size] = (len(response.json()[items_key]), int(response.headers["X-DB-Queries"]))
+        
+        if counts[50][0] < 2:
+            pytest.skip(f"Not enough rows in {path} to compare page sizes")
+        assert counts[50][1] == counts[1][1], (
+            f"{path}: {counts[1][1]} queries for 1 row, {counts[50][1]} for {counts[50][0]} rows"
+        )
+    
+    def test_employees_list(self, api_base_url, hr_token):
+        """Test employee list formats manager/department/team without per-row queries"""
+        self._assert_constant_query_count(api_base_url, hr_token, "/employees", "employees")
+    
+    def test_employees_list_cursor(self, api_base_url, hr_token):
+        """Test cursor-paginated employee list query count"""
+        self._assert_constant_query_count(api_base_url, hr_token, "/employees?cursor=", "employees")
+    
+    def test_all_leave_requests(self, api_base_url, hr_token):
+        """Test all leave requests query count"""
+        self._assert_constant_query_count(api_base_url, hr_token, "/leaves/all", "leaves")
+    
+    def test_my_leave_requests(self, api_base_url, employee_token):
+        """Test my leave requests query count"""
+        self._assert_constant_query_count(api_base_url, employee_token, "/leaves/me", "leaves")
+    
+    def test_all_feedback(self, api_base_url, hr_token):
+        """Test all feedback query count"""
+        self._assert_constant_query_count(api_base_url, hr_token, "/feedback", "feedback", size_param="limit")
+    
+    def test_all_requests(self, api_base_url, hr_token):
+        """Test all team requests query count"""
+        self._assert_constant_query_count(api_base_url, hr_token, "/requests/all", "requests")
+    
+    def test_departments_list(self, api_base_url, hr_token):
+        """Test department list counts members with grouped queries"""
+        self._assert_constant_query_count(api_base_url, hr_token, "/departments", "departments")
+    
+    def test_holidays_list(self, api_base_url, employee_token):
+        """Test holiday list query count"""
+        self._assert_constant_query_count(api_base_url, employee_token, "/holidays", "holidays")
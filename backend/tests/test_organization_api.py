@@ -199,6 +199,164 @@ class TestOrganizationAPI:
         data = response.json()
         assert "user" in data
 
+    def test_organization_chart_children_match_direct_reports(self, api_base_url, employee_token):
+        """Test org chart children of the root are the root's direct reports"""
+        if not employee_token:
+            pytest.skip("Employee token not available (database not seeded)")
+
+        headers = {"Authorization": f"Bearer {employee_token}"}
+        chart = requests.get(f"{api_base_url}/organization/org-chart", headers=headers)
+        assert chart.status_code == 200, f"Expected 200, got {chart.status_code}"
+        root = chart.json()
+
+        structure = requests.get(
+            f"{api_base_url}/organization/reporting-structure/{root['user']['id']}",
+            headers=headers,
+        )
+        assert structure.status_code == 200, f"Expected 200, got {structure.status_code}"
+
+        chart_child_ids = sorted(child["user"]["id"] for child in root["children"])
+        direct_report_ids = sorted(u["id"] for u in structure.json()["direct_reports"])
+        assert chart_child_ids == direct_report_ids
+
+    def test_organization_chart_reflects_manager_change(self, api_base_url, hr_token, manager_token):
+        """Test the cached org chart is invalidated when an employee's manager changes"""
+        if not hr_token or not manager_token:
+            pytest.skip("Tokens not available (database not seeded)")
+
+        hr_headers = {"Authorization": f"Bearer {hr_token}"}
+        me = requests.get(
+            f"{api_base_url}/auth/me",
+            headers={"Authorization": f"Bearer {manager_token}"},
+        )
+        if me.status_code != 200:
+            pytest.skip("Could not get manager info")
+        manager_id = me.json()["id"]
+
+        # Warm the cache and pick a direct report of the manager
+        manager_chart = requests.get(
+            f"{api_base_url}/organization/org-chart?root_user_id={manager_id}",
+            headers=hr_headers,
+        )
+        assert manager_chart.status_code == 200
+        if not manager_chart.json()["children"]:
+            pytest.skip("Manager has no direct reports")
+        report_id = manager_chart.json()["children"][0]["user"]["id"]
+
+        root = requests.get(f"{api_base_url}/organization/org-chart", headers=hr_headers)
+        assert root.status_code == 200
+        root_id = root.json()["user"]["id"]
+        if root_id in (manager_id, report_id):
+            pytest.skip("Manager or report is the organization root")
+
+        move = requests.put(
+            f"{api_base_url}/employees/{report_id}",
+            headers=hr_headers,
+            json={"manager_id": root_id},
+        )
+        assert move.status_code == 200, f"Expected 200, got {move.status_code}"
+
+        try:
+            manager_chart = requests.get(
+                f"{api_base_url}/organization/org-chart?root_user_id={manager_id}",
+                headers=hr_headers,
+            )
+            assert report_id not in [c["user"]["id"] for c in manager_chart.json()["children"]]
+
+            root = requests.get(f"{api_base_url}/organization/org-chart", headers=hr_headers)
+            assert report_id in [c["user"]["id"] for c in root.json()["children"]]
+        finally:
+            requests.put(
+                f"{api_base_url}/employees/{report_id}",
+                headers=hr_headers,
+                json={"manager_id": manager_id},
+            )
+
+    def test_manager_chain_follows_manager_change(self, api_base_url, hr_token, manager_token):
+        """Test manager chain and reporting structure follow a manager change"""
+        if not hr_token or not manager_token:
+            pytest.skip("Tokens not available (database not seeded)")
+
+        hr_headers = {"Authorization": f"Bearer {hr_token}"}
+        me = requests.get(
+            f"{api_base_url}/auth/me",
+            headers={"Authorization": f"Bearer {manager_token}"},
+        )
+        if me.status_code != 200:
+            pytest.skip("Could not get manager info")
+        manager_id = me.json()["id"]
+
+        structure = requests.get(
+            f"{api_base_url}/organization/reporting-structure/{manager_id}",
+            headers=hr_headers,
+        )
+        assert structure.status_code == 200
+        data = structure.json()
+        if not data["direct_reports"]:
+            pytest.skip("Manager has no direct reports")
+        assert data["total_reports"] >= len(data["direct_reports"])
+        report_id = data["direct_reports"][0]["id"]
+
+        root = requests.get(f"{api_base_url}/organization/org-chart", headers=hr_headers)
+        root_id = root.json()["user"]["id"]
+        if root_id in (manager_id, report_id):
+            pytest.skip("Manager or report is the organization root")
+
+        move = requests.put(
+            f"{api_base_url}/employees/{report_id}",
+            headers=hr_headers,
+            json={"manager_id": root_id},
+        )
+        assert move.status_code == 200, f"Expected 200, got {move.status_code}"
+
+        try:
+            chain = requests.get(
+                f"{api_base_url}/organization/manager-chain/{report_id}",
+                headers=hr_headers,
+            ).json()["chain"]
+            assert [node["id"] for node in chain] == [report_id, root_id]
+        finally:
+            requests.put(
+                f"{api_base_url}/employees/{report_id}",
+                headers=hr_headers,
+                json={"manager_id": manager_id},
+            )
+
+        chain = requests.get(
+            f"{api_base_url}/organization/manager-chain/{report_id}",
+            headers=hr_headers,
+        ).json()["chain"]
+        assert [node["id"] for node in chain][:2] == [report_id, manager_id]
+
+    def test_manager_change_rejects_cycle(self, api_base_url, hr_token, manager_token):
+        """Test a manager cannot be placed under one of their own reports"""
+        if not hr_token or not manager_token:
+            pytest.skip("Tokens not available (database not seeded)")
+
+        hr_headers = {"Authorization": f"Bearer {hr_token}"}
+        me = requests.get(
+            f"{api_base_url}/auth/me",
+            headers={"Authorization": f"Bearer {manager_token}"},
+        )
+        if me.status_code != 200:
+            pytest.skip("Could not get manager info")
+        manager_id = me.json()["id"]
+
+        structure = requests.get(
+            f"{api_base_url}/organization/reporting-structure/{manager_id}",
+            headers=hr_headers,
+        ).json()
+        if not structure["direct_reports"]:
+            pytest.skip("Manager has no direct reports")
+        report_id = structure["direct_reports"][0]["id"]
+
+        response = requests.put(
+            f"{api_base_url}/employees/{manager_id}",
+            headers=hr_headers,
+            json={"manager_id": report_id},
+        )
+        assert response.status_code == 400, f"Expected 400, got {response.status_code}"
+
     @pytest.mark.permissions
     def test_hierarchy_requires_authentication(self, api_base_url):
         """Test hierarchy endpoints require authentication"""
@@ -2,6 +2,7 @@
 Payslips API Tests (Pytest)
 Run with: pytest backend/tests/test_payslips_api.py -v
 """
+import json
 import pytest
 import requests
 from datetime import datetime
@@ -328,6 +329,103 @@ class TestPayslipsAPI:
         
         assert response.status_code == 403, f"Expected 403, got {response.status_code}"
     
+    @staticmethod
+    def _period_payslip_ids(api_base_url, headers, month, year):
+        """IDs of all payslips for a pay period"""
+        response = requests.get(
+            f"{api_base_url}/payslips?month={month}&year={year}&limit=500",
+            headers=headers
+        )
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        return {p["id"] for p in response.json()["payslips"]}
+    
+    @staticmethod
+    def _delete_payslips(api_base_url, headers, payslip_ids):
+        for payslip_id in payslip_ids:
+            requests.delete(f"{api_base_url}/payslips/{payslip_id}", headers=headers)
+    
+    def test_bulk_generate_payslips(self, api_base_url, hr_token):
+        """Test HR can bulk generate payslips and a re-run skips existing ones"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+        
+        headers = {"Authorization": f"Bearer {hr_token}"}
+        generate_data = {"month": 1, "year": 2020, "chunk_size": 100}
+        existing_ids = self._period_payslip_ids(api_base_url, headers, 1, 2020)
+        
+        try:
+            response = requests.post(
+                f"{api_base_url}/payslips/generate/bulk",
+                headers=headers,
+                json=generate_data
+            )
+            
+            assert response.status_code == 201, f"Expected 201, got {response.status_code}"
+            data = response.json()
+            assert data["created_count"] + data["skipped_count"] == data["total_active_employees"]
+            
+            # Re-running for the same period creates nothing
+            rerun = requests.post(
+                f"{api_base_url}/payslips/generate/bulk",
+                headers=headers,
+                json=generate_data
+            )
+            
+            assert rerun.status_code == 201, f"Expected 201, got {rerun.status_code}"
+            assert rerun.json()["created_count"] == 0
+            assert rerun.json()["skipped_count"] == rerun.json()["total_active_employees"]
+        finally:
+            created_ids = self._period_payslip_ids(api_base_url, headers, 1, 2020) - existing_ids
+            self._delete_payslips(api_base_url, headers, created_ids)
+    
+    def test_bulk_generate_payslips_stream(self, api_base_url, hr_token):
+        """Test streamed bulk generation emits chunk events with rows and a final summary"""
+        if not hr_token:
+            pytest.skip("HR token not available (database not seeded)")
+        
+        headers = {"Authorization": f"Bearer {hr_token}"}
+        existing_ids = self._period_payslip_ids(api_base_url, headers, 2, 2020)
+        
+        try:
+            response = requests.post(
+                f"{api_base_url}/payslips/generate/bulk?stream=true&include_rows=true",
+                headers=headers,
+                json={"month": 2, "year": 2020, "chunk_size": 100}
+            )
+            
+            assert response.status_code == 201, f"Expected 201, got {response.status_code}"
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            events = [json.loads(line) for line in response.text.splitlines() if line.strip()]
+            
+            assert events[-1]["type"] == "summary"
+            summary = events[-1]["summary"]
+            chunk_events = [e for e in events if e["type"] == "chunk"]
+            assert all(e["type"] in ("chunk", "summary") for e in events)
+            assert len(chunk_events) == summary["chunks"]
+            assert sum(e["created"] for e in chunk_events) == summary["created_count"]
+            
+            rows = [row for e in chunk_events for row in e["payslips"]]
+            assert len(rows) == summary["created_count"]
+            for row in rows:
+                assert row["net_salary"] == pytest.approx(row["gross_salary"] - row["total_deductions"])
+        finally:
+            created_ids = self._period_payslip_ids(api_base_url, headers, 2, 2020) - existing_ids
+            self._delete_payslips(api_base_url, headers, created_ids)
+    
+    @pytest.mark.permissions
+    def test_bulk_generate_payslips_employee_forbidden(self, api_base_url, employee_token):
+        """Test employee cannot bulk generate payslips"""
+        if not employee_token:
+            pytest.skip("Employee token not available (database not seeded)")
+        
+        response = requests.post(
+            f"{api_base_url}/payslips/generate/bulk",
+            headers={"Authorization": f"Bearer {employee_token}"},
+            json={"month": 1, "year": 2020}
+        )
+        
+        assert response.status_code == 403, f"Expected 403, got {response.status_code}"
+    
     def test_delete_payslip(self, api_base_url, hr_token, employee_token):
         """Test HR can delete payslip"""
         if not hr_token or not employee_token:
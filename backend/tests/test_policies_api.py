@@ -207,7 +207,28 @@ class TestPoliciesAPI:
         data = response.json()
         assert "id" in data
         assert data["policy_id"] == policy_id
-    
+
+    def test_upload_policy_document_too_large(self, api_base_url, hr_token, policy_id):
+        """Test uploads over the size limit are rejected and not stored"""
+        if not hr_token or not policy_id:
+            pytest.skip("HR token or policy not available (database not seeded)")
+
+        oversized = b"%PDF-1.4\n" + b"0" * (11 * 1024 * 1024)
+        response = requests.post(
+            f"{api_base_url}/policies/{policy_id}/upload",
+            headers={"Authorization": f"Bearer {hr_token}"},
+            files={"file": ("too_large.pdf", oversized, "application/pdf")}
+        )
+
+        assert response.status_code == 400, f"Expected 400, got {response.status_code}"
+        assert "exceeds" in response.json()["detail"]
+
+        policy = requests.get(
+            f"{api_base_url}/policies/{policy_id}",
+            headers={"Authorization": f"Bearer {hr_token}"}
+        ).json()
+        assert policy["has_document"] is False
+
     def test_get_policy_acknowledgments(self, api_base_url, hr_token, policy_id):
         """Test HR can get policy acknowledgments"""
         if not hr_token or not policy_id:
@@ -0,0 +1,79 @@
+"""
+Policy RAG Index Tests (Pytest)
+Run with: pytest backend/tests/test_policy_rag_index.py -v
+
+Runs offline against a temporary index directory with the fake embedder;
+each service instance stands in for one worker process.
+"""
+import pytest
+
+from config import settings
+from ai_services import policy_rag_service
+from ai_services.policy_rag_service import PolicyRAGService, document_key
+
+
+@pytest.fixture
+def rag_settings(tmp_path, monkeypatch):
+    """Point the RAG service at a fresh index directory with offline embeddings"""
+    if not policy_rag_service.LANGCHAIN_AVAILABLE:
+        pytest.skip("LangChain libraries not installed")
+    # The chat model is created but never called
+    api_key = settings.GOOGLE_API_KEY or "test-key"
+    monkeypatch.setattr(settings, "GOOGLE_API_KEY", api_key)
+    monkeypatch.setenv("GOOGLE_API_KEY", api_key)
+    monkeypatch.setattr(settings, "POLICY_RAG_INDEX_DIR", str(tmp_path / "policy_index"))
+    monkeypatch.setattr(settings, "POLICY_RAG_FAKE_EMBEDDINGS", True)
+    monkeypatch.setattr(settings, "POLICY_RAG_EMBEDDING_CACHE_ENABLED", False)
+    return tmp_path
+
+
+def _write_policy(directory, name, text):
+    path = directory / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.ai_policy_rag
+class TestPolicyRAGIndex:
+    """Test suite for policy index writes from several workers"""
+
+    def test_writers_keep_each_others_policies(self, rag_settings):
+        """Test two workers indexing in turn both end up in the saved index"""
+        conduct_policy = _write_policy(rag_settings, "conduct.txt", "Treat colleagues with respect.")
+        leave_policy = _write_policy(rag_settings, "leave.txt", "Employees get 20 days of annual leave.")
+        travel_policy = _write_policy(rag_settings, "travel.txt", "Travel expenses are reimbursed monthly.")
+        assert PolicyRAGService().index_policy_document(conduct_policy, "Code of Conduct", policy_id=3)
+
+        worker_a = PolicyRAGService()
+        worker_b = PolicyRAGService()
+        assert worker_a.load_index()
+        assert worker_b.load_index()
+
+        assert worker_a.index_policy_document(leave_policy, "Leave Policy", policy_id=1)
+        # worker_b still holds the version without the leave policy
+        assert worker_b.index_policy_document(travel_policy, "Travel Policy", policy_id=2)
+
+        reader = PolicyRAGService()
+        assert reader.load_index()
+        assert set(reader.registry) == {document_key("", key) for key in (1, 2, 3)}
+        assert reader.vectorstore.index.ntotal == sum(
+            len(entry["chunk_ids"]) for entry in reader.registry.values()
+        )
+
+    def test_remove_keeps_other_workers_policies(self, rag_settings):
+        """Test a stale worker removing one policy keeps another worker's upload"""
+        leave_policy = _write_policy(rag_settings, "leave.txt", "Employees get 20 days of annual leave.")
+        travel_policy = _write_policy(rag_settings, "travel.txt", "Travel expenses are reimbursed monthly.")
+
+        worker_a = PolicyRAGService()
+        assert worker_a.index_policy_document(leave_policy, "Leave Policy", policy_id=1)
+        worker_b = PolicyRAGService()
+        worker_b.load_index()
+        assert worker_b.index_policy_document(travel_policy, "Travel Policy", policy_id=2)
+
+        # worker_a still holds the version without the travel policy
+        assert worker_a.remove_policy_document(1)
+
+        reader = PolicyRAGService()
+        assert reader.load_index()
+        assert set(reader.registry) == {document_key("", 2)}
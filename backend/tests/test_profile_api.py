@@ -98,6 +98,45 @@ class TestProfileAPI:
         data = response.json()
         assert isinstance(data, dict)
     
+    def test_download_document_conditional_and_range(self, api_base_url, employee_token):
+        """Test document download sends an ETag, answers 304 and serves byte ranges"""
+        if not employee_token:
+            pytest.skip("Employee token not available (database not seeded)")
+
+        headers = {"Authorization": f"Bearer {employee_token}"}
+        content = b"%PDF-1.4\n" + b"download test " * 100
+        upload = requests.post(
+            f"{api_base_url}/profile/upload-document",
+            headers=headers,
+            data={"document_type": "pan"},
+            files={"file": ("pan.pdf", content, "application/pdf")}
+        )
+        assert upload.status_code == 201, f"Expected 201, got {upload.status_code}"
+
+        url = f"{api_base_url}/profile/documents/pan"
+        response = requests.get(url, headers=headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.content == content
+        etag = response.headers["ETag"]
+
+        response = requests.get(url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304, f"Expected 304, got {response.status_code}"
+
+        response = requests.get(url, headers={**headers, "Range": "bytes=0-7"})
+        assert response.status_code == 206, f"Expected 206, got {response.status_code}"
+        assert response.content == content[:8]
+        assert response.headers["Content-Range"] == f"bytes 0-7/{len(content)}"
+
+        response = requests.get(url, headers={**headers, "Range": f"bytes={len(content)}-"})
+        assert response.status_code == 416, f"Expected 416, got {response.status_code}"
+
+        # A malformed range spec is ignored and the whole file is served
+        response = requests.get(url, headers={**headers, "Range": "bytes=500-100"})
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.content == content
+
+        requests.delete(url, headers=headers)
+
     def test_get_my_manager(self, api_base_url, employee_token):
         """Test get my manager"""
         if not employee_token:
@@ -39,6 +39,7 @@ def check_tags():
         "Departments",
         "Organization/Hierarchy",
         "Team Requests",
+        "Admin Metrics",
         "AI - Policy RAG",
         "AI - Resume Screener",
         "AI - Job Description Generator",
@@ -68,6 +69,7 @@ def check_tags():
         ("routes.skills", "skills_router", "Skills/Modules Management"),
         ("routes.requests", "requests_router", "Team Requests"),
         ("routes.goals", "goals_router", "Goals & Task Management"),
+        ("routes.admin_metrics", "admin_metrics_router", "Admin Metrics"),
     ]
     
     print("📋 Checking Standard Routes:")
@@ -7,7 +7,8 @@ from sqlalchemy.orm import Session
 from typing import Annotated
 from database import get_db
 from services.auth_service import AuthService
-from models import User, UserRole
+from models import UserRole
+from utils.principal_cache import Principal
 
 security = HTTPBearer()
 
@@ -15,18 +16,22 @@ security = HTTPBearer()
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Session = Depends(get_db)
-) -> User:
+) -> Principal:
     """
     Dependency to get current authenticated user from Bearer token
     
+    Returns a cached, read-only principal (id, email, name, role and
+    organisation columns) rather than the `User` row; load the row from
+    `db` when a route needs other columns or has to modify the user.
+    
     Raises:
         HTTPException: 401 if token is invalid or user not found
         
     Returns:
-        User: Current authenticated user
+        Principal: Current authenticated user
     """
     token = credentials.credentials
-    user = AuthService.get_current_user(db, token)
+    user = AuthService.get_current_principal(db, token)
     
     if not user:
         raise HTTPException(
@@ -39,8 +44,8 @@ async def get_current_user(
 
 
 async def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)]
-) -> User:
+    current_user: Annotated[Principal, Depends(get_current_user)]
+) -> Principal:
     """
     Dependency to ensure user is active
     
@@ -48,7 +53,7 @@ async def get_current_active_user(
         HTTPException: 403 if user is not active
         
     Returns:
-        User: Active user
+        Principal: Active user
     """
     if not current_user.is_active:
         raise HTTPException(
@@ -59,8 +64,8 @@ async def get_current_active_user(
 
 
 async def require_hr(
-    current_user: Annotated[User, Depends(get_current_active_user)]
-) -> User:
+    current_user: Annotated[Principal, Depends(get_current_active_user)]
+) -> Principal:
     """
     Dependency to ensure user is HR
     
@@ -68,7 +73,7 @@ async def require_hr(
         HTTPException: 403 if user is not HR
         
     Returns:
-        User: HR user
+        Principal: HR user
     """
     if current_user.role != UserRole.HR:
         raise HTTPException(
@@ -79,8 +84,8 @@ async def require_hr(
 
 
 async def require_manager(
-    current_user: Annotated[User, Depends(get_current_active_user)]
-) -> User:
+    current_user: Annotated[Principal, Depends(get_current_active_user)]
+) -> Principal:
     """
     Dependency to ensure user is Manager
     
@@ -88,7 +93,7 @@ async def require_manager(
         HTTPException: 403 if user is not Manager
         
     Returns:
-        User: Manager user
+        Principal: Manager user
     """
     if current_user.role != UserRole.MANAGER:
         raise HTTPException(
@@ -99,8 +104,8 @@ async def require_manager(
 
 
 async def require_hr_or_manager(
-    current_user: Annotated[User, Depends(get_current_active_user)]
-) -> User:
+    current_user: Annotated[Principal, Depends(get_current_active_user)]
+) -> Principal:
     """
     Dependency to ensure user is HR or Manager
     
@@ -108,7 +113,7 @@ async def require_hr_or_manager(
         HTTPException: 403 if user is neither HR nor Manager
         
     Returns:
-        User: HR or Manager user
+        Principal: HR or Manager user
     """
     if current_user.role not in [UserRole.HR, UserRole.MANAGER]:
         raise HTTPException(
@@ -119,8 +124,8 @@ async def require_hr_or_manager(
 
 
 async def require_employee(
-    current_user: Annotated[User, Depends(get_current_active_user)]
-) -> User:
+    current_user: Annotated[Principal, Depends(get_current_active_user)]
+) -> Principal:
     """
     Dependency to ensure user is Employee
     
@@ -128,7 +133,7 @@ async def require_employee(
         HTTPException: 403 if user is not Employee
         
     Returns:
-        User: Employee user
+        Principal: Employee user
     """
     if current_user.role != UserRole.EMPLOYEE:
         raise HTTPException(
@@ -0,0 +1,146 @@
+"""
+Download helper - Conditional and ranged file responses
+
+`file_download_response` serves an uploaded document with:
+
+ - a strong ETag (the file's SHA-256) and `If-None-Match` -> 304, so clients
+   that already have the file do not download it again,
+ - single `Range` requests (`bytes=a-b`, `bytes=a-`, `bytes=-n`) -> 206, with
+   `If-Range` support and 416 for ranges outside the file,
+ - the body streamed from disk in chunks (Starlette's FileResponse for full
+   files), never loaded into memory.
+
+Documents are private, so responses are `Cache-Control: private, no-cache`:
+clients keep a copy but revalidate it with the ETag on every use.
+"""
+from typing import Iterator, Optional, Tuple
+import os
+
+from fastapi import Request, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+CACHE_CONTROL = "private, no-cache"
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match comparison (weak comparison, as RFC 9110 requires)"""
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single byte range into inclusive (start, end) offsets
+
+    Returns:
+        (start, end), or None if the header is not a single, well-formed byte
+        range (the full file is then served, as RFC 9110 asks)
+
+    Raises:
+        ValueError: If the range lies outside the file (416)
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    start_text, sep, end_text = spec.strip().partition("-")
+    if not sep:
+        return None
+
+    if start_text == "":
+        # Suffix range: the last N bytes
+        if not end_text.isdigit():
+            return None
+        length = int(end_text)
+        if length == 0 or size == 0:
+            raise ValueError("Suffix range not satisfiable")
+        return max(size - length, 0), size - 1
+
+    if not start_text.isdigit() or (end_text and not end_text.isdigit()):
+        return None
+    start = int(start_text)
+    if end_text and int(end_text) < start:
+        return None
+    if start >= size:
+        raise ValueError("Range not satisfiable")
+    end = int(end_text) if end_text else size - 1
+    return start, min(end, size - 1)
+
+
+def _iter_file_range(path: str, start: int, end: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_download_response(
+    request: Request,
+    path: str,
+    sha256: str,
+    media_type: str,
+    filename: Optional[str] = None,
+) -> Response:
+    """
+    Response for downloading `path`, honouring If-None-Match, Range and If-Range
+
+    Args:
+        request: Incoming request (for the conditional/range headers)
+        path: File to serve
+        sha256: Content hash of the file, used as the ETag
+        media_type: Content-Type of the file
+        filename: Download filename (Content-Disposition), if any
+    """
+    etag = f'"{sha256}"'
+    size = os.path.getsize(path)
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": CACHE_CONTROL,
+    }
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={
+            "ETag": etag, "Cache-Control": CACHE_CONTROL
+        })
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{size}", **headers},
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _iter_file_range(path, start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers=headers,
+            )
+
+    # FileResponse sets Content-Disposition itself from `filename`
+    headers.pop("Content-Disposition", None)
+    return FileResponse(path, media_type=media_type, filename=filename, headers=headers)
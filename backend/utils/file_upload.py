@@ -0,0 +1,89 @@
+"""
+Streaming upload helper - Saves an UploadFile in fixed-size chunks
+
+`save_upload` copies the upload into a temporary file next to its destination
+one chunk at a time, so at most UPLOAD_CHUNK_SIZE bytes of it are held in
+memory. It stops as soon as the size limit is passed, computes the SHA-256 of
+the content while copying, and renames the finished file into place, so a
+partially written upload is never visible under its final name.
+"""
+from dataclasses import dataclass
+import hashlib
+import os
+import uuid
+
+from fastapi import UploadFile
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload is larger than the allowed size"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        super().__init__(f"File exceeds the {max_size} byte limit")
+
+
+@dataclass(frozen=True)
+class SavedUpload:
+    """Where an upload was stored, its size and its content hash"""
+
+    path: str
+    size: int
+    sha256: str
+
+
+async def save_upload(file: UploadFile, dest_path: str, max_size: int) -> SavedUpload:
+    """
+    Stream an uploaded file to `dest_path`
+
+    Args:
+        file: Uploaded file
+        dest_path: Final location; its directory is created if missing
+        max_size: Largest accepted size in bytes
+
+    Returns:
+        SavedUpload with the stored path, size and SHA-256
+
+    Raises:
+        UploadTooLargeError: If the upload is larger than `max_size`
+            (nothing is left on disk)
+    """
+    # The multipart parser already knows the size; reject before copying anything
+    if file.size is not None and file.size > max_size:
+        raise UploadTooLargeError(max_size)
+
+    os.makedirs(os.path.dirname(dest_path) or ".", exist_ok=True)
+    temp_path = f"{dest_path}.{uuid.uuid4().hex[:8]}.part"
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        await file.seek(0)
+        with open(temp_path, "wb") as out:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(max_size)
+                digest.update(chunk)
+                out.write(chunk)
+        os.replace(temp_path, dest_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return SavedUpload(path=dest_path, size=size, sha256=digest.hexdigest())
+
+
+def remove_replaced_file(old_path: str, new_path: str) -> None:
+    """Delete the file an upload replaced, ignoring files that are already gone"""
+    if old_path and old_path != new_path and os.path.exists(old_path):
+        try:
+            os.remove(old_path)
+        except OSError:
+            pass
@@ -0,0 +1,127 @@
+"""
+Keyset pagination - Opaque cursors over (sort key, id)
+
+OFFSET/LIMIT gets slower with every page (the database still walks past the
+skipped rows) and needs a COUNT over the whole filtered set for the totals.
+`paginate_keyset` instead continues after the last row of the previous page:
+
+    rows, next_cursor = paginate_keyset(
+        query,
+        [(LeaveRequest.requested_date, True), (LeaveRequest.id, True)],
+        cursor, limit, scope="leaves",
+    )
+
+The key list is the ordering, `(column, descending)` pairs ending with a
+unique column so the order is total. The cursor is the last row's key
+values, base64url-encoded JSON tagged with `scope` so a cursor from one list
+is rejected by another (400). `next_cursor` is None on the last page.
+
+NULL sorts as the largest value (`NULLS LAST` ascending, `NULLS FIRST`
+descending) on every database, and the leading key also gets a plain range
+bound so the database can seek in its index instead of scanning to the page.
+"""
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+import base64
+import binascii
+import enum
+import json
+
+from fastapi import HTTPException, status
+from sqlalchemy import Date, DateTime, Enum, and_, false, or_
+
+# (column, descending) pairs, the last one unique
+KeysetKeys = Sequence[Tuple[Any, bool]]
+
+
+def _encode_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.name
+    return value
+
+
+def _decode_value(column, value):
+    if value is None:
+        return None
+    column_type = column.type
+    if isinstance(column_type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column_type, Date):
+        return date.fromisoformat(value)
+    if isinstance(column_type, Enum) and column_type.enum_class is not None:
+        return column_type.enum_class[value]
+    return value
+
+
+def encode_cursor(scope: str, values: Sequence[Any]) -> str:
+    payload = json.dumps([scope, [_encode_value(v) for v in values]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, scope: str, keys: KeysetKeys) -> List[Any]:
+    """Key values from `cursor`; 400 if it is malformed or from another list"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_scope, values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if cursor_scope != scope or len(values) != len(keys):
+            raise ValueError(cursor_scope)
+        return [_decode_value(column, value) for (column, _), value in zip(keys, values)]
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def _order_by(column, descending: bool):
+    return column.desc().nulls_first() if descending else column.asc().nulls_last()
+
+
+def _after(column, descending: bool, value):
+    """Rows strictly after `value` in this key's order (NULL largest)"""
+    if value is None:
+        return column.isnot(None) if descending else false()
+    if descending:
+        return column < value
+    return or_(column > value, column.is_(None))
+
+
+def _equal(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def keyset_filter(keys: KeysetKeys, values: Sequence[Any]):
+    """WHERE clause for rows after `values` in the lexicographic key order"""
+    branches = []
+    for i, (column, descending) in enumerate(keys):
+        equal_prefix = [_equal(c, v) for (c, _), v in zip(keys[:i], values[:i])]
+        branches.append(and_(*equal_prefix, _after(column, descending, values[i])))
+    condition = or_(*branches)
+
+    # Redundant bound on the leading key that an index range scan can use
+    # (ascending keys have NULLs after every value, so there is no plain bound)
+    column, descending = keys[0]
+    if descending and values[0] is not None:
+        condition = and_(column <= values[0], condition)
+    return condition
+
+
+def paginate_keyset(query, keys: KeysetKeys, cursor: Optional[str], limit: int, scope: str):
+    """
+    Return (rows, next_cursor) for the page after `cursor` (the first page
+    if empty). `query` must select a single entity; the key columns are
+    added to it to build the next cursor.
+    """
+    columns = [column for column, _ in keys]
+    query = query.add_columns(*columns)
+    if cursor:
+        query = query.filter(keyset_filter(keys, decode_cursor(cursor, scope, keys)))
+    rows = query.order_by(*[_order_by(c, d) for c, d in keys]).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(scope, rows[-1][1:])
+    return [row[0] for row in rows], next_cursor
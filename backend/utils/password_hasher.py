@@ -0,0 +1,97 @@
+"""
+Password Hasher - Runs bcrypt hashing and verification off the event loop
+
+A bcrypt check costs hundreds of milliseconds of CPU. Calling it inside an
+`async def` route blocks every other request on the same uvicorn worker, so a
+burst of logins is served one at a time. `PasswordHasher` runs the work in a
+dedicated thread pool (bcrypt releases the GIL while hashing, so the threads
+use separate cores) and bounds the backlog: once PASSWORD_HASH_MAX_PENDING
+calls are queued or running, further callers get `PasswordHasherBusyError`
+(served as 503 with Retry-After) instead of piling up behind the queue.
+"""
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from config import settings
+from utils.password_utils import hash_password, verify_password
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when too many hashing calls are already queued"""
+
+
+class PasswordHasher:
+    """Bounded thread pool for bcrypt calls"""
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hasher"
+                )
+            return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHasherBusyError(
+                    f"{self._pending} password operations already pending"
+                )
+            self._pending += 1
+
+        def release(_future) -> None:
+            with self._lock:
+                self._pending -= 1
+
+        try:
+            future = self._get_executor().submit(func, *args)
+        except Exception:
+            release(None)
+            raise
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the configured cost"""
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash"""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and drop queued calls"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Shared hasher for the process
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
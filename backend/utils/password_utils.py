@@ -1,15 +1,19 @@
 """
 Password hashing and verification utilities using bcrypt directly
 """
+from typing import Optional
 import bcrypt
 
+from config import settings
 
-def hash_password(password: str) -> str:
+
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
     """
     Hash a password using bcrypt
     
     Args:
         password: Plain text password
+        rounds: bcrypt cost factor (defaults to BCRYPT_ROUNDS)
         
     Returns:
         Hashed password string
@@ -18,7 +22,7 @@ def hash_password(password: str) -> str:
     password_bytes = password.encode('utf-8')
     
     # Generate salt and hash password
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     
     # Return as string
@@ -43,3 +47,25 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     # Verify and return result
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
+
+def get_password_cost(hashed_password: str) -> Optional[int]:
+    """
+    Cost factor of a bcrypt hash ("$2b$12$..." -> 12)
+    
+    Args:
+        hashed_password: Hashed password from database
+        
+    Returns:
+        The cost, or None if the hash is not in bcrypt format
+    """
+    parts = hashed_password.split('$')
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash was made with a cost other than BCRYPT_ROUNDS
+    """
+    return get_password_cost(hashed_password) != settings.BCRYPT_ROUNDS
@@ -12,6 +12,9 @@ class PerformancePromptTemplates:
     Each prompt includes persona, context, data, instructions, format, and constraints.
     """
     
+    # Bump whenever prompt wording changes so cached reports are regenerated
+    PROMPT_VERSION = "1"
+    
     @staticmethod
     def get_individual_report_prompt(
         employee_data: Dict[str, Any],
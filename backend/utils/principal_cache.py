@@ -0,0 +1,141 @@
+"""
+Principal cache - Verified access tokens mapped to a lightweight user principal
+
+Authenticating a request used to mean verifying the JWT signature and loading
+the full `User` row every time. The cache keeps, per token (keyed by its
+SHA-256), an immutable `Principal` holding only the columns authorization and
+routes read. Entries expire after AUTH_PRINCIPAL_CACHE_TTL_SECONDS or when the
+token itself expires, whichever is first, and are dropped as soon as
+`EmployeeService` updates or deactivates the user.
+
+The cache is per process: with several workers, a change made through another
+worker is picked up when the entry expires.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+import hashlib
+import threading
+import time
+
+from config import settings
+from models import UserRole
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The authenticated user as seen by route dependencies"""
+
+    id: int
+    email: str
+    name: str
+    role: UserRole
+    is_active: bool
+    employee_id: Optional[str] = None
+    department_id: Optional[int] = None
+    team_id: Optional[int] = None
+    manager_id: Optional[int] = None
+    job_role: Optional[str] = None
+    hierarchy_level: Optional[int] = None
+
+
+def token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class PrincipalCache:
+    """Thread-safe LRU of token hash -> (principal, expiry) with per-user invalidation"""
+
+    def __init__(self, max_entries: int, ttl_seconds: int, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._keys_by_user: Dict[int, Set[str]] = {}
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Optional[Principal]:
+        if not self.enabled:
+            return None
+
+        key = token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            principal, expires_at = entry
+            if expires_at <= time.time():
+                self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return principal
+
+    def generation(self, user_id: int) -> int:
+        """Read before loading a user; pass to `put` so a concurrent invalidation wins"""
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def put(
+        self,
+        token: str,
+        principal: Principal,
+        token_expires_at: float,
+        generation: int,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        key = token_key(token)
+        expires_at = min(time.time() + self.ttl_seconds, token_expires_at)
+        with self._lock:
+            if self._generations.get(principal.id, 0) != generation:
+                return
+            self._entries[key] = (principal, expires_at)
+            self._entries.move_to_end(key)
+            self._keys_by_user.setdefault(principal.id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Forget every cached token of this user"""
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            for key in self._keys_by_user.pop(user_id, set()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            for user_id in self._keys_by_user:
+                self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _drop(self, key: str) -> None:
+        # Caller holds the lock
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[0].id
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+
+# Shared cache for the process
+principal_cache = PrincipalCache(
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+    enabled=settings.AUTH_PRINCIPAL_CACHE_ENABLED,
+)
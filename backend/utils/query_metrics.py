@@ -0,0 +1,227 @@
+"""
+Query metrics - Per-request SQL statement counts, DB time and slow/N+1 logging
+
+Engine event hooks time every statement. While a request is being served
+(`begin()` / `end()` around it in the HTTP middleware) its statements are
+also added to a `RequestQueryStats` held in a context variable, which is
+copied into the threadpool and `asyncio.to_thread` workers that run sync
+route code. From that the middleware sets `X-DB-Queries` / `X-DB-Time`
+headers and `query_metrics.record()` folds the request into per-route
+histograms served at `/api/v1/admin/metrics/db`.
+
+Streaming responses: the headers are sent before the body, so X-DB-Queries /
+X-DB-Time only cover statements run until the response was returned. Those
+run while the body streams are still added to the request's stats, and the
+middleware calls `record()` after the last chunk, so the route metrics
+include them.
+
+Logged as warnings:
+ - statements slower than SLOW_QUERY_MS, with the route that ran them,
+ - the same statement shape (parameters and IN-list lengths ignored) run
+   more than N_PLUS_ONE_THRESHOLD times in one request: a likely N+1.
+
+Metrics are per process.
+"""
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+import logging
+import re
+import threading
+import time
+
+from sqlalchemy import event
+
+from config import settings
+from database import engine
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds; the last bucket catches everything above
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+DB_TIME_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+# Repeated statement shapes kept per route in the metrics output
+MAX_SHAPES_PER_ROUTE = 5
+
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_SELECT_COLUMNS = re.compile(r"^SELECT .+? FROM ")
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with IN-list lengths and whitespace normalised"""
+    return _WHITESPACE.sub(" ", _IN_LIST.sub("(?)", statement)).strip()
+
+
+def _abbreviate(shape: str) -> str:
+    """Shape for logs and metrics output: the SELECT column list elided"""
+    return _SELECT_COLUMNS.sub("SELECT ... FROM ", shape, count=1)
+
+
+def _route_label(scope: dict) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None) or "<unmatched>"
+    return f"{scope.get('method', '')} {path}"
+
+
+@dataclass
+class RequestQueryStats:
+    """Statements run while serving one request"""
+
+    scope: dict
+    count: int = 0
+    duration: float = 0.0
+    slow: int = 0
+    shapes: Counter = field(default_factory=Counter)
+    repeated: List[str] = field(default_factory=list)
+
+    @property
+    def route(self) -> str:
+        # Resolved lazily: the router fills scope["route"] after the middleware starts
+        return _route_label(self.scope)
+
+
+def _bucket(value: float, bounds) -> str:
+    for bound in bounds:
+        if value <= bound:
+            return f"<={bound}"
+    return f">{bounds[-1]}"
+
+
+def _bucket_labels(bounds) -> List[str]:
+    return [f"<={b}" for b in bounds] + [f">{bounds[-1]}"]
+
+
+class _RouteMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.max_queries = 0
+        self.db_time_ms = 0.0
+        self.max_db_time_ms = 0.0
+        self.slow_queries = 0
+        self.n_plus_one_requests = 0
+        self.query_histogram = Counter()
+        self.db_time_histogram = Counter()
+        self.repeated_shapes = Counter()
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "queries_total": self.queries,
+            "queries_mean": round(self.queries / self.requests, 2) if self.requests else 0,
+            "queries_max": self.max_queries,
+            "db_time_ms_total": round(self.db_time_ms, 2),
+            "db_time_ms_mean": round(self.db_time_ms / self.requests, 2) if self.requests else 0,
+            "db_time_ms_max": round(self.max_db_time_ms, 2),
+            "slow_queries": self.slow_queries,
+            "n_plus_one_requests": self.n_plus_one_requests,
+            "queries_histogram": {b: self.query_histogram[b] for b in _bucket_labels(QUERY_COUNT_BUCKETS)},
+            "db_time_ms_histogram": {b: self.db_time_histogram[b] for b in _bucket_labels(DB_TIME_BUCKETS_MS)},
+            "repeated_statements": [
+                {"statement": _abbreviate(shape)[:300], "requests": n}
+                for shape, n in self.repeated_shapes.most_common(MAX_SHAPES_PER_ROUTE)
+            ],
+        }
+
+
+class QueryMetrics:
+    """Per-route aggregation of request query statistics"""
+
+    def __init__(self, enabled: bool, slow_query_ms: int, n_plus_one_threshold: int):
+        self.enabled = enabled
+        self.slow_query_seconds = slow_query_ms / 1000
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._current: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+        self._routes: Dict[str, _RouteMetrics] = {}
+        self._started_at = datetime.utcnow()
+        self._lock = threading.Lock()
+
+    def begin(self, scope: dict):
+        """Start collecting for a request; returns (stats, token for end())"""
+        stats = RequestQueryStats(scope=scope)
+        return stats, self._current.set(stats)
+
+    def end(self, token) -> None:
+        self._current.reset(token)
+
+    def observe(self, statement: str, elapsed: float) -> None:
+        """Account one executed statement (called from the engine hooks)"""
+        stats = self._current.get()
+        if elapsed >= self.slow_query_seconds:
+            route = stats.route if stats is not None else "<no request>"
+            logger.warning(
+                f"Slow query ({elapsed * 1000:.1f} ms) on {route}: {_abbreviate(statement_shape(statement))[:500]}"
+            )
+            if stats is not None:
+                stats.slow += 1
+        if stats is None:
+            return
+
+        stats.count += 1
+        stats.duration += elapsed
+        shape = statement_shape(statement)
+        stats.shapes[shape] += 1
+        if stats.shapes[shape] == self.n_plus_one_threshold + 1:
+            stats.repeated.append(shape)
+            logger.warning(
+                f"Possible N+1 on {stats.route}: statement repeated more than "
+                f"{self.n_plus_one_threshold} times: {_abbreviate(shape)[:500]}"
+            )
+
+    def record(self, stats: RequestQueryStats) -> None:
+        """Fold a finished request into its route's metrics"""
+        db_time_ms = stats.duration * 1000
+        with self._lock:
+            metrics = self._routes.get(stats.route)
+            if metrics is None:
+                metrics = self._routes[stats.route] = _RouteMetrics()
+            metrics.requests += 1
+            metrics.queries += stats.count
+            metrics.max_queries = max(metrics.max_queries, stats.count)
+            metrics.db_time_ms += db_time_ms
+            metrics.max_db_time_ms = max(metrics.max_db_time_ms, db_time_ms)
+            metrics.slow_queries += stats.slow
+            metrics.query_histogram[_bucket(stats.count, QUERY_COUNT_BUCKETS)] += 1
+            metrics.db_time_histogram[_bucket(db_time_ms, DB_TIME_BUCKETS_MS)] += 1
+            if stats.repeated:
+                metrics.n_plus_one_requests += 1
+                metrics.repeated_shapes.update(stats.repeated)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            routes = {route: m.to_dict() for route, m in sorted(self._routes.items())}
+        return {
+            "since": self._started_at.isoformat(timespec="seconds"),
+            "slow_query_ms": self.slow_query_seconds * 1000,
+            "n_plus_one_threshold": self.n_plus_one_threshold,
+            "routes": routes,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+            self._started_at = datetime.utcnow()
+
+
+# Shared metrics for the process
+query_metrics = QueryMetrics(
+    enabled=settings.QUERY_METRICS_ENABLED,
+    slow_query_ms=settings.SLOW_QUERY_MS,
+    n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD,
+)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started_at", None)
+    if started is not None and query_metrics.enabled:
+        query_metrics.observe(statement, time.perf_counter() - started)